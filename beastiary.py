@@ -3,95 +3,28 @@
 Beastiary utility - generates documentation for all monsters in the game.
 """
 
-import os
 import sys
-import importlib
-import inspect
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from monsters.base import Monster
+from monsters.monster_prototype import MONSTER_PROTOTYPES
 
 
-def get_all_monster_classes():
-    """Get all monster classes from the monsters directory."""
-    monsters = []
-    
-    # Path to monsters directory
-    monsters_path = Path(__file__).parent / 'src' / 'monsters'
-    
-    # Find all Python files in the monsters directory
-    for file_path in monsters_path.glob('*.py'):
-        if file_path.name.startswith('__') or file_path.name == 'base.py' or file_path.name == 'factory.py' or file_path.name == 'pool.py':
-            continue
-            
-        # Build the module path
-        module_name = f"monsters.{file_path.stem}"
-        
-        try:
-            # Import the module
-            module = importlib.import_module(module_name)
-            
-            # Find all Monster subclasses in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, Monster) and 
-                    obj != Monster and
-                    not name.startswith('_')):
-                    
-                    # Try to instantiate to get properties
-                    try:
-                        # Create temporary instance at 0,0 to extract properties
-                        instance = obj(0, 0)
-                        
-                        # Get the class docstring for description
-                        description = ""
-                        if obj.__doc__:
-                            # Clean up the docstring
-                            description = obj.__doc__.strip()
-                            # Remove any leading/trailing quotes
-                            description = description.replace('"""', '').strip()
-                        
-                        # If no docstring, try to get from module docstring
-                        if not description and module.__doc__:
-                            mod_doc = module.__doc__.strip()
-                            # Extract first line after module declaration
-                            lines = mod_doc.split('\n')
-                            for line in lines:
-                                if line and not line.startswith('"""'):
-                                    description = line.strip()
-                                    if description.endswith('.'):
-                                        description = description[:-1]
-                                    break
-                        
-                        monsters.append({
-                            'name': instance.name,
-                            'description': description,
-                            'instance': instance,
-                            'class': obj
-                        })
-                    except Exception as e:
-                        print(f"Warning: Could not instantiate {name}: {e}")
-                        
-        except ImportError as e:
-            print(f"Warning: Could not import {module_name}: {e}")
-    
-    # Sort monsters alphabetically by name
-    monsters.sort(key=lambda x: x['name'].lower())
-    return monsters
+def get_all_monsters():
+    """Get the prototype of every monster in the monster table, sorted by name."""
+    return sorted(MONSTER_PROTOTYPES.values(), key=lambda prototype: prototype.name.lower())
 
 
-def format_monster(monster_data):
-    """Format a monster for the beastiary."""
-    instance = monster_data['instance']
-    description = monster_data['description']
+def format_monster(monster):
+    """Format a monster prototype for the beastiary."""
+    description = monster.description
     
     lines = []
     
     # Monster name
-    lines.append(f"### {instance.name}")
+    lines.append(f"### {monster.name}")
     
     # Description (if available)
     if description:
@@ -101,24 +34,27 @@ def format_monster(monster_data):
     
     # Core stats
     stats_parts = []
-    stats_parts.append(f"**HP:** {instance.stats.max_hp}")
-    stats_parts.append(f"**Attack:** {instance.stats.attack}")
-    stats_parts.append(f"**Defense:** {instance.stats.defense}")
-    stats_parts.append(f"**XP Value:** {instance.xp_value}")
+    stats_parts.append(f"**HP:** {monster.hp}")
+    stats_parts.append(f"**Attack:** {monster.attack}")
+    stats_parts.append(f"**Defense:** {monster.defense}")
+    stats_parts.append(f"**XP Value:** {monster.xp_value}")
     
     lines.append(" | ".join(stats_parts))
     
     # Advanced stats if they differ from defaults
     advanced_stats = []
     
-    if instance.stats.evade != 0.05:  # Default evade is 5%
-        advanced_stats.append(f"**Evade:** {instance.stats.evade:.0%}")
+    if monster.evade != 0.05:  # Default evade is 5%
+        advanced_stats.append(f"**Evade:** {monster.evade:.0%}")
     
-    if instance.stats.crit != 0.05:  # Default crit is 5%
-        advanced_stats.append(f"**Crit:** {instance.stats.crit:.0%}")
+    if monster.crit != 0.05:  # Default crit is 5%
+        advanced_stats.append(f"**Crit:** {monster.crit:.0%}")
     
-    if instance.stats.crit_multiplier != 2.0:  # Default crit multiplier is 2x
-        advanced_stats.append(f"**Crit Multiplier:** {instance.stats.crit_multiplier}x")
+    if monster.crit_multiplier != 2.0:  # Default crit multiplier is 2x
+        advanced_stats.append(f"**Crit Multiplier:** {monster.crit_multiplier}x")
+    
+    if monster.attack_range > 1:  # Ranged attacker
+        advanced_stats.append(f"**Range:** {monster.attack_range}")
     
     if advanced_stats:
         lines.append(" | ".join(advanced_stats))
@@ -126,16 +62,16 @@ def format_monster(monster_data):
     # Traits, weaknesses, and resistances
     combat_traits = []
     
-    if instance.attack_traits:
-        trait_names = [trait.name for trait in instance.attack_traits]
+    if monster.attack_traits:
+        trait_names = [trait.name for trait in monster.attack_traits]
         combat_traits.append(f"**Attacks:** {', '.join(trait_names)}")
     
-    if instance.resistances:
-        resist_names = [resist.name for resist in instance.resistances]
+    if monster.resistances:
+        resist_names = [resist.name for resist in monster.resistances]
         combat_traits.append(f"**Resists:** {', '.join(resist_names)}")
     
-    if instance.weaknesses:
-        weak_names = [weak.name for weak in instance.weaknesses]
+    if monster.weaknesses:
+        weak_names = [weak.name for weak in monster.weaknesses]
         combat_traits.append(f"**Weak to:** {', '.join(weak_names)}")
     
     if combat_traits:
@@ -145,7 +81,7 @@ def format_monster(monster_data):
     
     # Visual representation
     lines.append("")
-    lines.append(f"**Appearance:** `{instance.character}` (in game)")
+    lines.append(f"**Appearance:** `{monster.char}` (in game)")
     
     return '\n'.join(lines)
 
@@ -162,7 +98,7 @@ def generate_beastiary():
     output.append("")
     
     # Get all monsters
-    monsters = get_all_monster_classes()
+    monsters = get_all_monsters()
     
     if not monsters:
         output.append("No monsters found!")
@@ -171,7 +107,7 @@ def generate_beastiary():
         output.append("## Table of Contents")
         output.append("")
         for monster in monsters:
-            output.append(f"- [{monster['name']}](#{monster['name'].lower().replace(' ', '-')})")
+            output.append(f"- [{monster.name}](#{monster.name.lower().replace(' ', '-')})")
         output.append("")
         output.append("---")
         output.append("")
@@ -199,23 +135,23 @@ def generate_beastiary():
     
     if monsters:
         # Calculate some interesting stats
-        avg_hp = sum(m['instance'].stats.max_hp for m in monsters) / len(monsters)
-        avg_attack = sum(m['instance'].stats.attack for m in monsters) / len(monsters)
-        avg_defense = sum(m['instance'].stats.defense for m in monsters) / len(monsters)
-        avg_xp = sum(m['instance'].xp_value for m in monsters) / len(monsters)
+        avg_hp = sum(m.hp for m in monsters) / len(monsters)
+        avg_attack = sum(m.attack for m in monsters) / len(monsters)
+        avg_defense = sum(m.defense for m in monsters) / len(monsters)
+        avg_xp = sum(m.xp_value for m in monsters) / len(monsters)
         
-        weakest = min(monsters, key=lambda m: m['instance'].stats.max_hp)
-        strongest = max(monsters, key=lambda m: m['instance'].stats.max_hp)
-        most_valuable = max(monsters, key=lambda m: m['instance'].xp_value)
+        weakest = min(monsters, key=lambda m: m.hp)
+        strongest = max(monsters, key=lambda m: m.hp)
+        most_valuable = max(monsters, key=lambda m: m.xp_value)
         
         output.append(f"**Average HP:** {avg_hp:.1f}")
         output.append(f"**Average Attack:** {avg_attack:.1f}")
         output.append(f"**Average Defense:** {avg_defense:.1f}")
         output.append(f"**Average XP Value:** {avg_xp:.1f}")
         output.append("")
-        output.append(f"**Weakest Monster:** {weakest['name']} ({weakest['instance'].stats.max_hp} HP)")
-        output.append(f"**Strongest Monster:** {strongest['name']} ({strongest['instance'].stats.max_hp} HP)")
-        output.append(f"**Most Valuable:** {most_valuable['name']} ({most_valuable['instance'].xp_value} XP)")
+        output.append(f"**Weakest Monster:** {weakest.name} ({weakest.hp} HP)")
+        output.append(f"**Strongest Monster:** {strongest.name} ({strongest.hp} HP)")
+        output.append(f"**Most Valuable:** {most_valuable.name} ({most_valuable.xp_value} XP)")
         
         # Trait Statistics
         output.append("")
@@ -228,20 +164,18 @@ def generate_beastiary():
         all_weaknesses = {}
         
         for monster in monsters:
-            instance = monster['instance']
-            
             # Count attack traits
-            for trait in instance.attack_traits:
+            for trait in monster.attack_traits:
                 trait_name = trait.name
                 all_attack_traits[trait_name] = all_attack_traits.get(trait_name, 0) + 1
             
             # Count resistances
-            for trait in instance.resistances:
+            for trait in monster.resistances:
                 trait_name = trait.name
                 all_resistances[trait_name] = all_resistances.get(trait_name, 0) + 1
             
             # Count weaknesses
-            for trait in instance.weaknesses:
+            for trait in monster.weaknesses:
                 trait_name = trait.name
                 all_weaknesses[trait_name] = all_weaknesses.get(trait_name, 0) + 1
         
@@ -282,9 +216,9 @@ def generate_beastiary():
         output.append(f"  - Unique attack traits: {len(all_attack_traits)}")
         output.append(f"  - Unique resistances: {len(all_resistances)}")
         output.append(f"  - Unique weaknesses: {len(all_weaknesses)}")
-        output.append(f"  - Monsters with attack traits: {sum(1 for m in monsters if m['instance'].attack_traits)}/{len(monsters)}")
-        output.append(f"  - Monsters with resistances: {sum(1 for m in monsters if m['instance'].resistances)}/{len(monsters)}")
-        output.append(f"  - Monsters with weaknesses: {sum(1 for m in monsters if m['instance'].weaknesses)}/{len(monsters)}")
+        output.append(f"  - Monsters with attack traits: {sum(1 for m in monsters if m.attack_traits)}/{len(monsters)}")
+        output.append(f"  - Monsters with resistances: {sum(1 for m in monsters if m.resistances)}/{len(monsters)}")
+        output.append(f"  - Monsters with weaknesses: {sum(1 for m in monsters if m.weaknesses)}/{len(monsters)}")
     
     # Write to file
     docs_path = Path(__file__).parent / 'docs'
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Level generation benchmark - measures levels generated per second for floors 1-10.
+
+Also usable as a library for bulk-generating floors for analysis:
+
+    from benchmark_generation import generate_levels
+    for level in generate_levels(5, 1000, seed=42):
+        ...
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from level.level import Level
+from items.pool import item_pool
+
+
+def generate_levels(level_number, count, seed=None):
+    """Generate `count` independent levels for a floor, yielding each one."""
+    if seed is not None:
+        random.seed(seed)
+
+    for _ in range(count):
+        # Each level is an independent sample, so forget game-wide item uniqueness
+        item_pool.game_spawned_accessories.clear()
+        yield Level(level_number)
+
+
+def benchmark_level_generation(count=50, floors=range(1, 11), seed=0):
+    """Time full Level construction for each floor.
+
+    Returns a dict mapping floor number to levels generated per second.
+    """
+    results = {}
+    for level_number in floors:
+        start = time.perf_counter()
+        for _ in generate_levels(level_number, count, seed):
+            pass
+        elapsed = time.perf_counter() - start
+        results[level_number] = count / elapsed
+    return results
+
+
+def main():
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description="Benchmark level generation throughput.")
+    parser.add_argument('--count', type=int, default=50, help="levels to generate per floor")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for each floor")
+    args = parser.parse_args()
+
+    results = benchmark_level_generation(count=args.count, seed=args.seed)
+
+    print(f"{'Floor':>5}  {'Levels/sec':>10}")
+    for level_number, levels_per_second in results.items():
+        print(f"{level_number:>5}  {levels_per_second:>10.1f}")
+
+    total_levels = args.count * len(results)
+    total_time = sum(args.count / rate for rate in results.values())
+    print(f"{'All':>5}  {total_levels / total_time:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,8 @@ def build_executable():
         "--onefile",
         "--name=seven-day-roguelike",
         "--add-data=src:src",
+        # Item classes are imported lazily through the item manifest
+        "--collect-submodules=items",
         "src/main.py"
     ]
     
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Damage table - expected damage and turns-to-kill for player builds against every monster.
+
+Stats not given on the command line come from a new player. Also usable as a library:
+
+    from damage_table import matchup_table
+    table = matchup_table(attack=range(3, 12), defense=[0, 2, 4])
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from combat import CombatantSnapshot, ExpectedDamage
+from monsters.pool import get_monster_pool
+from player import Player
+
+
+def matchup_table(level=None, **stat_values):
+    """Evaluate a grid of builds against the monster pool (or one floor's monsters)."""
+    model = ExpectedDamage()
+    base = CombatantSnapshot.from_player(Player(0, 0))
+    builds = model.build_grid(base, **stat_values)
+    monsters = [monster_class(0, 0) for monster_class in get_monster_pool().get_monster_classes(level)]
+    return model.matchups(builds, monsters)
+
+
+def main():
+    """Print the table for the builds given on the command line."""
+    parser = argparse.ArgumentParser(description="Expected damage and turns-to-kill against each monster.")
+    parser.add_argument('--level', type=int, help="only monsters that can spawn on this floor")
+    parser.add_argument('--hp', type=int, nargs='+', help="player HP values to try")
+    parser.add_argument('--attack', type=int, nargs='+', help="player attack values to try")
+    parser.add_argument('--defense', type=int, nargs='+', help="player defense values to try")
+    parser.add_argument('--evade', type=float, nargs='+', help="player evade chances to try")
+    parser.add_argument('--crit', type=float, nargs='+', help="player crit chances to try")
+    args = parser.parse_args()
+
+    stat_values = {name: getattr(args, name) for name in ('hp', 'attack', 'defense', 'evade', 'crit')
+                   if getattr(args, name) is not None}
+    table = matchup_table(args.level, **stat_values)
+
+    for row, build in enumerate(table.builds):
+        print(f"HP {build.hp}  ATK {build.attack}  DEF {build.defense}  "
+              f"EVA {build.evade:.0%}  CRIT {build.crit:.0%}")
+        print(f"  {'Monster':<14}{'Dmg/turn':>9}{'To kill':>9}{'Taken/turn':>11}{'To die':>9}  Winner")
+        for column, name in enumerate(table.monster_names):
+            winner = "player" if table.player_wins[row, column] else "monster"
+            print(f"  {name:<14}{table.damage_per_turn[row, column]:>9.2f}{table.turns_to_kill[row, column]:>9.1f}"
+                  f"{table.damage_taken_per_turn[row, column]:>11.2f}{table.turns_to_die[row, column]:>9.1f}"
+                  f"  {winner}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Item manifest generator - regenerates src/items/manifest.py from the item packages.
+
+Run this after adding, renaming or moving an item class.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from items.registry import build_item_manifest, render_item_manifest
+
+
+def generate_item_manifest():
+    """Scan the item packages and write the item manifest."""
+    manifest = build_item_manifest()
+    manifest_path = Path(__file__).parent / 'src' / 'items' / 'manifest.py'
+    with open(manifest_path, 'w') as f:
+        f.write(render_item_manifest(manifest))
+
+    print(f"Item manifest generated successfully at: {manifest_path}")
+    print(f"Total item classes: {len(manifest)}")
+    return manifest_path
+
+
+if __name__ == "__main__":
+    generate_item_manifest()
@@ -3,99 +3,35 @@
 Grimoire utility - generates documentation for all items in the game.
 """
 
-import os
 import sys
-import importlib
-import inspect
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from items.consumable import Consumable
-from items.weapons.base import Weapon
-from items.armor.base import Armor
-from items.accessories.accessory import Accessory
-from items.pickups.pickup import Pickup
+from items.registry import get_item_class_names, load_item_class
 
 
-def get_all_classes_from_module(module_path, base_class):
-    """Get all classes from a module that inherit from base_class."""
-    classes = []
-    
-    # Convert module path to import path
-    import_path = module_path.replace('/', '.').replace('\\', '.')
-    if import_path.startswith('src.'):
-        import_path = import_path[4:]  # Remove 'src.' prefix
-    
-    try:
-        module = importlib.import_module(import_path)
-        for name, obj in inspect.getmembers(module):
-            if (inspect.isclass(obj) and 
-                issubclass(obj, base_class) and 
-                obj != base_class and
-                not name.startswith('_')):
-                classes.append(obj)
-    except ImportError as e:
-        pass
-    
-    return classes
-
-
-def get_all_items_of_type(base_path, base_class):
-    """Get all items of a specific type from the file system."""
+def get_all_items_of_type(item_type):
+    """Get all items of a specific type from the item manifest."""
     items = []
     
-    # Find all Python files in the directory
-    for root, dirs, files in os.walk(base_path):
-        # Skip __pycache__ directories
-        if '__pycache__' in root:
+    for class_name in get_item_class_names(item_type):
+        cls = load_item_class(class_name)
+        
+        # Create temporary instance at 0,0 to extract properties
+        try:
+            instance = cls(0, 0)
+        except Exception:
+            # Some classes might need special parameters
             continue
-            
-        for file in files:
-            if file.endswith('.py') and not file.startswith('__'):
-                # Build the module path
-                full_path = os.path.join(root, file)
-                rel_path = os.path.relpath(full_path, Path(__file__).parent)
-                module_path = rel_path[:-3]  # Remove .py extension
-                
-                # Get classes from this module
-                classes = get_all_classes_from_module(module_path, base_class)
-                
-                for cls in classes:
-                    # Try to instantiate to get properties
-                    try:
-                        # Create temporary instance at 0,0 to extract properties
-                        instance = cls(0, 0)
-                        items.append({
-                            'name': instance.name,
-                            'description': instance.description,
-                            'class': cls,
-                            'instance': instance
-                        })
-                    except Exception as e:
-                        # Some classes might need special parameters
-                        # Try with minimal parameters
-                        try:
-                            if base_class == Weapon:
-                                instance = cls(0, 0)
-                            elif base_class == Armor:
-                                instance = cls(0, 0)
-                            elif base_class == Consumable:
-                                instance = cls(0, 0)
-                            elif base_class == Accessory:
-                                instance = cls(0, 0)
-                            else:
-                                continue
-                                
-                            items.append({
-                                'name': instance.name,
-                                'description': instance.description,
-                                'class': cls,
-                                'instance': instance
-                            })
-                        except:
-                            pass
+        
+        items.append({
+            'name': instance.name,
+            'description': instance.description,
+            'class': cls,
+            'instance': instance
+        })
     
     # Sort items alphabetically by name
     items.sort(key=lambda x: x['name'].lower())
@@ -367,9 +303,6 @@ def generate_grimoire():
     """Generate the grimoire documentation."""
     output = []
     
-    # Get source path
-    src_path = Path(__file__).parent / 'src'
-    
     # Generate consumables section
     output.append("# GRIMOIRE")
     output.append("Complete catalog of all items in the game")
@@ -378,7 +311,7 @@ def generate_grimoire():
     output.append("-" * 50)
     output.append("")
     
-    consumables = get_all_items_of_type(src_path / 'items' / 'consumables', Consumable)
+    consumables = get_all_items_of_type('consumable')
     for item in consumables:
         output.append(format_consumable(item))
         output.append("")
@@ -389,7 +322,7 @@ def generate_grimoire():
     output.append("-" * 50)
     output.append("")
     
-    weapons = get_all_items_of_type(src_path / 'items' / 'weapons', Weapon)
+    weapons = get_all_items_of_type('weapon')
     for item in weapons:
         output.append(format_weapon(item))
         output.append("")
@@ -400,7 +333,7 @@ def generate_grimoire():
     output.append("-" * 50)
     output.append("")
     
-    armor = get_all_items_of_type(src_path / 'items' / 'armor', Armor)
+    armor = get_all_items_of_type('armor')
     for item in armor:
         output.append(format_armor(item))
         output.append("")
@@ -411,7 +344,7 @@ def generate_grimoire():
     output.append("-" * 50)
     output.append("")
     
-    accessories = get_all_items_of_type(src_path / 'items' / 'accessories', Accessory)
+    accessories = get_all_items_of_type('accessory')
     for item in accessories:
         output.append(format_accessory(item))
         output.append("")
@@ -422,7 +355,7 @@ def generate_grimoire():
     output.append("-" * 50)
     output.append("")
     
-    pickups = get_all_items_of_type(src_path / 'items' / 'pickups', Pickup)
+    pickups = get_all_items_of_type('pickup')
     for item in pickups:
         output.append(format_pickup(item))
         output.append("")
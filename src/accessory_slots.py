@@ -0,0 +1,75 @@
+"""
+The player's accessory slots, as a list that reports changes.
+"""
+
+
+class AccessorySlots(list):
+    """A list of equipped accessories (None for an empty slot) that calls on_change when mutated.
+
+    Behaves exactly like a regular list; the player uses on_change to know
+    when its compiled stat pipeline is out of date.
+    """
+
+    __slots__ = ('on_change',)
+
+    def __init__(self, accessories=(), on_change=None):
+        super().__init__(accessories)
+        self.on_change = on_change
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+    def append(self, accessory):
+        super().append(accessory)
+        self._changed()
+
+    def extend(self, accessories):
+        super().extend(accessories)
+        self._changed()
+
+    def insert(self, index, accessory):
+        super().insert(index, accessory)
+        self._changed()
+
+    def remove(self, accessory):
+        super().remove(accessory)
+        self._changed()
+
+    def pop(self, *args):
+        accessory = super().pop(*args)
+        self._changed()
+        return accessory
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._changed()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, accessories):
+        result = super().__iadd__(accessories)
+        self._changed()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._changed()
+        return result
+
+    def copy(self):
+        return list(self)
@@ -0,0 +1,33 @@
+"""
+Camera for showing a window of a map that may be larger than the screen.
+"""
+
+from constants import VIEWPORT_WIDTH, VIEWPORT_HEIGHT
+
+
+class Camera:
+    """A viewport-sized window onto the map, kept centered on a target where possible."""
+
+    def __init__(self, width=VIEWPORT_WIDTH, height=VIEWPORT_HEIGHT):
+        """Initialize the camera at the map origin."""
+        self.width = width
+        self.height = height
+        self.x = 0  # Map coordinates of the top-left corner of the view
+        self.y = 0
+
+    def center_on(self, x, y, map_width, map_height):
+        """Move the view to center on (x, y) without showing space past the map edges."""
+        self.x = max(0, min(x - self.width // 2, map_width - self.width))
+        self.y = max(0, min(y - self.height // 2, map_height - self.height))
+
+    def get_bounds(self):
+        """Get the map region in view as (x1, y1, x2, y2), with x2 and y2 exclusive."""
+        return self.x, self.y, self.x + self.width, self.y + self.height
+
+    def to_screen(self, x, y):
+        """Convert map coordinates to console coordinates, or None if out of view."""
+        screen_x = x - self.x
+        screen_y = y - self.y
+        if 0 <= screen_x < self.width and 0 <= screen_y < self.height:
+            return screen_x, screen_y
+        return None
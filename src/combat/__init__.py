@@ -0,0 +1,21 @@
+"""
+Combat resolution exports.
+"""
+
+from .combatant_snapshot import CombatantSnapshot
+from .combatant_arrays import CombatantArrays
+from .attack_outcome import AttackOutcome
+from .attack_outcome_batch import AttackOutcomeBatch
+from .combat_resolver import CombatResolver
+from .matchup_table import MatchupTable
+from .expected_damage import ExpectedDamage
+from .floor_estimate import FloorEstimate
+from .floor_difficulty import FloorDifficulty
+from .duel_results import DuelResults
+from .duel_simulator import DuelSimulator
+from .loadout import Loadout
+from .loadout_optimizer import LoadoutOptimizer
+
+__all__ = ['CombatantSnapshot', 'CombatantArrays', 'AttackOutcome', 'AttackOutcomeBatch', 'CombatResolver',
+           'MatchupTable', 'ExpectedDamage', 'FloorEstimate', 'FloorDifficulty',
+           'DuelResults', 'DuelSimulator', 'Loadout', 'LoadoutOptimizer']
@@ -0,0 +1,31 @@
+"""
+Outcome records produced by the combat resolver.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class AttackOutcome:
+    """What happened in one attack, for the game to apply.
+
+    At most one of missed, evaded, absorbed and dodged is set; if none is, the
+    attack landed for damage.
+    """
+
+    missed: bool = False          # The attacker missed outright (base or blinded miss chance)
+    evaded: bool = False          # The defender evaded before damage was worked out
+    critical: bool = False
+    absorbed: bool = False        # The defender's shields took the hit
+    dodged: bool = False          # The player dodged after shields (monster attacks only)
+    damage: int = 0               # HP the defender loses
+    trait_interaction: Optional[str] = None  # "weakness", "resistance" or None
+    statuses: Tuple[Tuple[str, int], ...] = ()  # (status, amount) to apply to the defender
+    attacker_spent: Tuple[str, ...] = ()  # Attacker status counters to reduce by one
+    defender_spent: Tuple[str, ...] = ()  # Defender status counters to reduce by one
+
+    @property
+    def landed(self):
+        """Check if the attack hit the defender (possibly for 0 damage from shields)."""
+        return not (self.missed or self.evaded or self.absorbed or self.dodged)
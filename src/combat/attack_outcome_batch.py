@@ -0,0 +1,57 @@
+"""
+Outcomes of a batch of attacks, as columns of NumPy arrays.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+import numpy as np
+
+from .attack_outcome import AttackOutcome
+
+
+# trait_interaction codes
+NO_INTERACTION = 0
+WEAKNESS = 1
+RESISTANCE = -1
+
+
+@dataclass
+class AttackOutcomeBatch:
+    """Columns of AttackOutcome for N attacks; trait_interaction is coded as WEAKNESS/RESISTANCE/0."""
+
+    missed: np.ndarray
+    evaded: np.ndarray
+    critical: np.ndarray
+    absorbed: np.ndarray
+    dodged: np.ndarray
+    damage: np.ndarray
+    trait_interaction: np.ndarray
+    statuses: Dict[str, np.ndarray] = field(default_factory=dict)  # status -> amount applied
+    attacker_spent: Dict[str, np.ndarray] = field(default_factory=dict)  # status -> reduced by one
+    defender_spent: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.damage)
+
+    @property
+    def landed(self):
+        """Mask of attacks that hit the defender."""
+        return ~(self.missed | self.evaded | self.absorbed | self.dodged)
+
+    def __getitem__(self, index):
+        """Get one attack's outcome as an AttackOutcome."""
+        interaction = {WEAKNESS: 'weakness', RESISTANCE: 'resistance'}.get(int(self.trait_interaction[index]))
+        return AttackOutcome(
+            missed=bool(self.missed[index]),
+            evaded=bool(self.evaded[index]),
+            critical=bool(self.critical[index]),
+            absorbed=bool(self.absorbed[index]),
+            dodged=bool(self.dodged[index]),
+            damage=int(self.damage[index]),
+            trait_interaction=interaction,
+            statuses=tuple((name, int(amounts[index])) for name, amounts in self.statuses.items()
+                           if amounts[index]),
+            attacker_spent=tuple(name for name, spent in self.attacker_spent.items() if spent[index]),
+            defender_spent=tuple(name for name, spent in self.defender_spent.items() if spent[index]),
+        )
@@ -0,0 +1,287 @@
+"""
+Side-effect-free attack resolution for the player and monsters.
+"""
+
+import random
+
+import numpy as np
+
+import trait_damage
+from status_effects import StatusEffects
+from traits import Trait
+from .attack_outcome import AttackOutcome
+from .attack_outcome_batch import AttackOutcomeBatch, NO_INTERACTION, WEAKNESS, RESISTANCE
+
+
+class CombatResolver:
+    """Works out attacks between CombatantSnapshots and returns what happened.
+
+    The resolver never touches entities, messages or events: the game applies
+    the returned outcome. Rolls are drawn from the given rng in the order the
+    rules need them (pass the random module to share the game's sequence).
+    resolve_batch applies the same rules to arrays of matchups with a NumPy
+    Generator, for simulations.
+    """
+
+    BASE_MISS_CHANCE = 0.05
+    MAX_MISS_CHANCE = 0.95
+    # Aspect multipliers for attack traits against weaknesses and resistances (see trait_damage)
+    WEAKNESS_MULTIPLIER = trait_damage.WEAKNESS_MULTIPLIER
+    RESISTANCE_MULTIPLIER = trait_damage.RESISTANCE_MULTIPLIER
+    PLAYER_WEAKNESS_MULTIPLIER = trait_damage.PLAYER_WEAKNESS_MULTIPLIER
+    # Statuses applied by elemental traits the defender does not resist, as (status, amount, chance)
+    ELEMENTAL_STATUSES = {
+        Trait.ICE: ('stun', 3, 0.25),
+        Trait.FIRE: ('burn', 4, 0.5),
+        Trait.HOLY: ('blinded', 3, 0.5),
+        Trait.DARK: ('frightened', 2, 1.0),
+        Trait.POISON: ('poison', 2, 1.0),
+    }
+
+    def resolve(self, attacker, defender, rng=random):
+        """Resolve one attack between snapshots; returns an AttackOutcome."""
+        if attacker.is_player:
+            return self._resolve_player_attack(attacker, defender, rng)
+        return self._resolve_monster_attack(attacker, defender, rng)
+
+    def _resolve_player_attack(self, attacker, defender, rng):
+        """Resolve the player attacking a monster."""
+        spent = ('frightened',) if attacker.frightened > 0 else ()
+        miss_chance = min(self.MAX_MISS_CHANCE, self.BASE_MISS_CHANCE + attacker.blinded / 100.0)
+        if rng.random() < miss_chance:
+            return AttackOutcome(missed=True, attacker_spent=spent)
+        if rng.random() < defender.evade:
+            return AttackOutcome(evaded=True, attacker_spent=spent)
+
+        modifier = StatusEffects.FRIGHTENED_ATTACK_MODIFIER if attacker.frightened > 0 else 0
+        damage = max(1, attacker.attack + modifier)
+        # Blinded attackers cannot crit
+        critical = attacker.blinded == 0 and rng.random() < attacker.crit
+        if critical:
+            damage = int(damage * attacker.crit_multiplier)
+        damage = self._aspect_damage(damage, attacker, defender)
+        for multiplier in attacker.damage_multipliers:
+            damage = int(damage * multiplier)
+        interaction = self.get_trait_interaction(attacker.attack_traits, defender.weakness_mask,
+                                                 defender.resistance_mask)
+
+        if defender.shields > 0:
+            return AttackOutcome(critical=critical, absorbed=True, trait_interaction=interaction,
+                                 attacker_spent=spent, defender_spent=('shields',))
+        return AttackOutcome(
+            critical=critical,
+            damage=self._defended_damage(damage, attacker.attack_traits, defender),
+            trait_interaction=interaction,
+            statuses=self.roll_statuses(attacker.attack_traits, defender.status_resistance_mask, rng),
+            attacker_spent=spent,
+        )
+
+    def _resolve_monster_attack(self, attacker, defender, rng):
+        """Resolve a monster attacking the player."""
+        if rng.random() < defender.evade:
+            return AttackOutcome(evaded=True)
+
+        damage = attacker.attack
+        critical = rng.random() < attacker.crit
+        if critical:
+            damage = int(damage * attacker.crit_multiplier)
+        damage = self._aspect_damage(damage, attacker, defender)
+        interaction = self.get_trait_interaction(attacker.attack_traits, defender.weakness_mask,
+                                                 defender.resistance_mask)
+
+        if defender.shields > 0:
+            return AttackOutcome(critical=critical, absorbed=True, trait_interaction=interaction,
+                                 defender_spent=('shields',))
+        # Off-guard and immobilized are used up by any attack that gets past shields
+        spent = tuple(name for name in ('off_guard', 'immobilized') if getattr(defender, name) > 0)
+        evade = 0.0 if defender.immobilized > 0 else defender.evade
+        if rng.random() < evade:
+            return AttackOutcome(critical=critical, dodged=True, trait_interaction=interaction,
+                                 defender_spent=spent)
+        return AttackOutcome(
+            critical=critical,
+            damage=self._defended_damage(damage, attacker.attack_traits, defender),
+            trait_interaction=interaction,
+            statuses=self.roll_statuses(attacker.attack_traits, defender.status_resistance_mask, rng),
+            defender_spent=spent,
+        )
+
+    def _aspect_damage(self, damage, attacker, defender):
+        """Scale damage by the attacker's traits against the defender's weaknesses and resistances."""
+        multiplier = self.aspect_multiplier(attacker.attack_traits, defender.weakness_mask,
+                                            defender.resistance_mask)
+        return int(damage * multiplier)
+
+    def _defended_damage(self, damage, attack_traits, defender):
+        """Get the HP a defender loses to damage, after its own trait handling and defense."""
+        if defender.is_player:
+            damage = self.player_trait_damage(damage, attack_traits, defender.weakness_mask,
+                                              defender.resistance_mask)
+        else:
+            damage = self.monster_trait_damage(damage, attack_traits, defender.weakness_mask,
+                                               defender.resistance_mask)
+        return max(1, damage - defender.defense)
+
+    # The trait damage rules, shared with entities taking damage outside combat
+    aspect_multiplier = staticmethod(trait_damage.aspect_multiplier)
+    get_trait_interaction = staticmethod(trait_damage.get_trait_interaction)
+    monster_trait_damage = staticmethod(trait_damage.monster_trait_damage)
+    player_trait_damage = staticmethod(trait_damage.player_trait_damage)
+
+    def roll_statuses(self, attack_traits, resistance_mask, rng=random):
+        """Roll the elemental statuses attack traits inflict; returns ((status, amount), ...) in trait order."""
+        statuses = []
+        for trait in attack_traits:
+            # Only apply if the target is not resistant to this trait
+            if trait & resistance_mask or trait not in self.ELEMENTAL_STATUSES:
+                continue
+            status, amount, chance = self.ELEMENTAL_STATUSES[trait]
+            if chance >= 1.0 or rng.random() < chance:
+                statuses.append((status, amount))
+        return tuple(statuses)
+
+    def resolve_batch(self, attackers, defenders, rng):
+        """Resolve one attack per matchup between CombatantArrays; returns an AttackOutcomeBatch.
+
+        attackers must all be players or all monsters. rng is a numpy.random.Generator.
+        """
+        count = max(len(attackers), len(defenders))
+        rolls = rng.random((3, count), dtype=np.float32)
+        if attackers.is_player:
+            return self._resolve_player_attack_batch(attackers, defenders, rolls, rng)
+        return self._resolve_monster_attack_batch(attackers, defenders, rolls, rng)
+
+    def _resolve_player_attack_batch(self, attackers, defenders, rolls, rng):
+        """Resolve the player attacking monsters, for arrays of matchups."""
+        count = rolls.shape[1]
+        missed = rolls[0] < self.miss_chance_batch(attackers)
+        evaded = ~missed & (rolls[1] < defenders.evade)
+        hit = ~missed & ~evaded
+        critical = hit & (attackers.blinded == 0) & (rolls[2] < attackers.crit)
+
+        absorbed = hit & (defenders.shields > 0)
+        landed = hit & ~absorbed
+        return AttackOutcomeBatch(
+            missed=missed,
+            evaded=evaded,
+            critical=critical,
+            absorbed=absorbed,
+            dodged=np.zeros(count, dtype=bool),
+            damage=np.where(landed, self.hit_damage_batch(attackers, defenders, critical), 0),
+            trait_interaction=np.where(hit, self._trait_interaction_batch(attackers, defenders), NO_INTERACTION),
+            statuses=self._roll_statuses_batch(attackers.attack_traits, defenders.status_resistance_mask,
+                                               landed, rng),
+            attacker_spent={'frightened': np.broadcast_to(attackers.frightened > 0, (count,)).copy()},
+            defender_spent={'shields': absorbed},
+        )
+
+    def _resolve_monster_attack_batch(self, attackers, defenders, rolls, rng):
+        """Resolve monsters attacking the player, for arrays of matchups."""
+        count = rolls.shape[1]
+        evaded = rolls[0] < defenders.evade
+        critical = ~evaded & (rolls[1] < attackers.crit)
+
+        absorbed = ~evaded & (defenders.shields > 0)
+        reached = ~evaded & ~absorbed
+        evade = np.where(defenders.immobilized > 0, 0.0, defenders.evade)
+        dodged = reached & (rolls[2] < evade)
+        landed = reached & ~dodged
+        return AttackOutcomeBatch(
+            missed=np.zeros(count, dtype=bool),
+            evaded=evaded,
+            critical=critical,
+            absorbed=absorbed,
+            dodged=dodged,
+            damage=np.where(landed, self.hit_damage_batch(attackers, defenders, critical), 0),
+            trait_interaction=np.where(~evaded, self._trait_interaction_batch(attackers, defenders),
+                                       NO_INTERACTION),
+            statuses=self._roll_statuses_batch(attackers.attack_traits, defenders.status_resistance_mask,
+                                               landed, rng),
+            defender_spent={
+                'shields': absorbed,
+                'off_guard': reached & (defenders.off_guard > 0),
+                'immobilized': reached & (defenders.immobilized > 0),
+            },
+        )
+
+    def miss_chance_batch(self, attackers):
+        """Get the chance of each attacker missing outright (monsters never do)."""
+        if not attackers.is_player:
+            return np.zeros(len(attackers))
+        return np.minimum(self.MAX_MISS_CHANCE, self.BASE_MISS_CHANCE + attackers.blinded / 100.0)
+
+    def hit_damage_batch(self, attackers, defenders, critical):
+        """Get the HP each defender loses to an attack that lands; critical is a mask or a bool."""
+        damage = attackers.attack
+        if attackers.is_player:
+            frightened = np.where(attackers.frightened > 0, StatusEffects.FRIGHTENED_ATTACK_MODIFIER, 0)
+            damage = np.maximum(1, damage + frightened)
+        damage = np.where(critical, (damage * attackers.crit_multiplier).astype(np.int64), damage)
+        damage = self._aspect_damage_batch(damage, attackers, defenders)
+        for column in range(attackers.damage_multipliers.shape[1]):
+            damage = (damage * attackers.damage_multipliers[:, column]).astype(np.int64)
+        return self._defended_damage_batch(damage, attackers.attack_traits, defenders)
+
+    def _aspect_damage_batch(self, damage, attackers, defenders):
+        """Batch form of _aspect_damage."""
+        traits = attackers.attack_traits
+        weak = (traits & defenders.weakness_mask[:, None]) != 0
+        resistant = (traits & defenders.resistance_mask[:, None]) != 0
+        factors = np.where(weak, self.WEAKNESS_MULTIPLIER, np.where(resistant, self.RESISTANCE_MULTIPLIER, 1.0))
+        return (damage * factors.prod(axis=1)).astype(np.int64)
+
+    def _trait_interaction_batch(self, attackers, defenders):
+        """Batch form of get_trait_interaction, as WEAKNESS/RESISTANCE/NO_INTERACTION codes."""
+        attack_mask = np.bitwise_or.reduce(attackers.attack_traits, axis=1)
+        weak = (attack_mask & defenders.weakness_mask) != 0
+        resistant = (attack_mask & defenders.resistance_mask) != 0
+        return np.where(weak & ~resistant, WEAKNESS, np.where(resistant & ~weak, RESISTANCE, NO_INTERACTION))
+
+    def status_damage_batch(self, amount, trait, defenders):
+        """Get the HP defenders lose to a burn or poison tick of amount (take_damage_with_traits)."""
+        return self._defended_damage_batch(amount, np.array([[int(trait)]]), defenders)
+
+    def _defended_damage_batch(self, damage, traits, defenders):
+        """Batch form of _defended_damage, for (N, T) or (1, T) attack traits."""
+        weakness_mask, resistance_mask = defenders.weakness_mask, defenders.resistance_mask
+        if defenders.is_player:
+            for column in range(traits.shape[1]):
+                bits = traits[:, column]
+                damage = np.where(bits & resistance_mask, (damage * self.RESISTANCE_MULTIPLIER).astype(np.int64),
+                                  np.where(bits & weakness_mask,
+                                           (damage * self.PLAYER_WEAKNESS_MULTIPLIER).astype(np.int64), damage))
+        else:
+            attack_mask = np.bitwise_or.reduce(traits, axis=1)
+            resistance_hits = attack_mask & resistance_mask
+            weakness_hits = attack_mask & weakness_mask
+            # With both, the first interacting trait in attack order decides. Traits may be one
+            # (1, T) row for the whole batch, so they are spread to one row per matchup first.
+            matchups = np.broadcast_shapes(attack_mask.shape, resistance_mask.shape, weakness_mask.shape)[0]
+            rows = np.broadcast_to(traits, (matchups, traits.shape[1]))
+            interacting = (rows & (resistance_hits | weakness_hits)[:, None]) != 0
+            first = np.take_along_axis(rows, interacting.argmax(axis=1)[:, None], axis=1)[:, 0]
+            resisted = np.where(resistance_hits & weakness_hits, first & resistance_hits, resistance_hits) != 0
+            factor = np.where(resisted, self.RESISTANCE_MULTIPLIER,
+                              np.where(weakness_hits != 0, self.WEAKNESS_MULTIPLIER, 1.0))
+            damage = (damage * factor).astype(np.int64)
+        return np.maximum(1, damage - defenders.defense)
+
+    def _roll_statuses_batch(self, attack_traits, resistance_mask, landed, rng):
+        """Batch form of roll_statuses; returns {status: total amount applied} arrays for statuses that can apply."""
+        count = len(landed)
+        amounts = {}
+        for column in range(attack_traits.shape[1]):
+            bits = attack_traits[:, column]
+            unresisted = (bits & resistance_mask) == 0
+            rolls = None
+            for trait, (status, amount, chance) in self.ELEMENTAL_STATUSES.items():
+                inflicts = unresisted & (bits == int(trait))
+                if not inflicts.any():
+                    continue
+                applies = landed & inflicts
+                if chance < 1.0:
+                    if rolls is None:
+                        rolls = rng.random(count, dtype=np.float32)
+                    applies &= rolls < chance
+                amounts[status] = amounts.get(status, 0) + applies * amount
+        return amounts
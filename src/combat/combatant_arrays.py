@@ -0,0 +1,75 @@
+"""
+Combatant snapshots as columns of NumPy arrays, for resolving many attacks at once.
+"""
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+from .combatant_snapshot import CombatantSnapshot
+
+
+@dataclass
+class CombatantArrays:
+    """One side of a batch of matchups: each field of CombatantSnapshot as an array.
+
+    attack_traits is an (N, T) array of trait bits, in attack order and padded
+    with 0; damage_multipliers is (N, M), padded with 1.0. A batch of length 1
+    is broadcast against the other side.
+    """
+
+    is_player: bool
+    attack: np.ndarray
+    defense: np.ndarray
+    evade: np.ndarray
+    crit: np.ndarray
+    crit_multiplier: np.ndarray
+    attack_traits: np.ndarray
+    weakness_mask: np.ndarray
+    resistance_mask: np.ndarray
+    status_resistance_mask: np.ndarray
+    damage_multipliers: np.ndarray
+    frightened: np.ndarray
+    blinded: np.ndarray
+    shields: np.ndarray
+    immobilized: np.ndarray
+    off_guard: np.ndarray
+    hp: np.ndarray
+
+    def __len__(self):
+        # Columns of length 1 are broadcast, so the longest column sets the batch size
+        return max(len(getattr(self, field.name)) for field in fields(self) if field.name != 'is_player')
+
+    def take(self, indices):
+        """Get the rows at indices (e.g. to pair every build with every monster)."""
+        columns = {field.name: getattr(self, field.name)[indices] for field in fields(self)
+                   if field.name != 'is_player'}
+        return CombatantArrays(is_player=self.is_player, **columns)
+
+    @classmethod
+    def from_snapshots(cls, snapshots):
+        """Stack snapshots, which must all be of players or all of monsters."""
+        snapshots = list(snapshots)
+        if not snapshots:
+            raise ValueError("at least one snapshot is needed")
+        is_player = snapshots[0].is_player
+        if any(snapshot.is_player != is_player for snapshot in snapshots):
+            raise ValueError("snapshots mix players and monsters")
+
+        columns = {}
+        for field in fields(CombatantSnapshot):
+            if field.name in ('is_player', 'attack_traits', 'damage_multipliers'):
+                continue
+            values = [getattr(snapshot, field.name) for snapshot in snapshots]
+            dtype = np.float64 if field.type is float else np.int64
+            columns[field.name] = np.array(values, dtype=dtype)
+
+        trait_width = max(1, max(len(snapshot.attack_traits) for snapshot in snapshots))
+        columns['attack_traits'] = np.zeros((len(snapshots), trait_width), dtype=np.int64)
+        multiplier_width = max(len(snapshot.damage_multipliers) for snapshot in snapshots)
+        columns['damage_multipliers'] = np.ones((len(snapshots), multiplier_width), dtype=np.float64)
+        for row, snapshot in enumerate(snapshots):
+            traits = [int(trait) for trait in snapshot.attack_traits]
+            columns['attack_traits'][row, :len(traits)] = traits
+            columns['damage_multipliers'][row, :len(snapshot.damage_multipliers)] = snapshot.damage_multipliers
+        return cls(is_player=is_player, **columns)
@@ -0,0 +1,93 @@
+"""
+Read-only snapshot of the stats a combatant brings to an attack.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from traits import Trait, traits_to_mask
+
+
+@dataclass(frozen=True)
+class CombatantSnapshot:
+    """Combat stats and status counters of a player or monster at one moment.
+
+    Taking a snapshot only reads the entity (status counters are copied, not
+    consumed), so resolving attacks between snapshots never changes the game.
+    """
+
+    is_player: bool
+    attack: int
+    defense: int
+    evade: float
+    crit: float
+    crit_multiplier: float
+    attack_traits: Tuple[Trait, ...] = ()
+    weakness_mask: int = 0
+    resistance_mask: int = 0
+    # The entity's own resistances, which are what block elemental statuses
+    status_resistance_mask: int = 0
+    # Multipliers on damage dealt to the current target, from accessories like PunishTheWeak
+    damage_multipliers: Tuple[float, ...] = ()
+    frightened: int = 0
+    blinded: int = 0
+    shields: int = 0
+    immobilized: int = 0
+    off_guard: int = 0
+    # Current HP, for working out how long a fight lasts
+    hp: int = 0
+
+    @classmethod
+    def from_player(cls, player, target=None):
+        """Snapshot the player's total (equipment-inclusive) stats, attacking target if given."""
+        damage_multipliers = ()
+        if target is not None:
+            damage_multipliers = tuple(
+                accessory.get_damage_multiplier_vs_target(target)
+                for accessory in player.equipped_accessories()
+                if hasattr(accessory, 'get_damage_multiplier_vs_target')
+            )
+        return cls(
+            is_player=True,
+            attack=player.get_total_attack(),
+            defense=player.get_total_defense(),
+            evade=player.get_total_evade(),
+            crit=player.get_total_crit(),
+            crit_multiplier=player.get_total_crit_multiplier(),
+            attack_traits=tuple(player.get_total_attack_traits()),
+            weakness_mask=player.get_total_weakness_mask(),
+            resistance_mask=player.get_total_resistance_mask(),
+            status_resistance_mask=traits_to_mask(player.resistances),
+            damage_multipliers=damage_multipliers,
+            hp=player.hp,
+            **_status_counters(player.status_effects)
+        )
+
+    @classmethod
+    def from_monster(cls, monster):
+        """Snapshot a monster's stats."""
+        return cls(
+            is_player=False,
+            attack=monster.attack,
+            defense=monster.defense,
+            evade=monster.evade,
+            crit=monster.crit,
+            crit_multiplier=monster.crit_multiplier,
+            attack_traits=tuple(monster.attack_traits),
+            weakness_mask=monster.weakness_mask,
+            resistance_mask=monster.resistance_mask,
+            status_resistance_mask=monster.resistance_mask,
+            hp=monster.hp,
+            **_status_counters(monster.status_effects)
+        )
+
+
+def _status_counters(status_effects):
+    """Get the status counters that affect an attack, without consuming any."""
+    return {
+        'frightened': status_effects.frightened,
+        'blinded': status_effects.blinded,
+        'shields': status_effects.shields,
+        'immobilized': status_effects.immobilized,
+        'off_guard': status_effects.off_guard,
+    }
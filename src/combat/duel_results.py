@@ -0,0 +1,30 @@
+"""
+Outcomes of a batch of simulated duels.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class DuelResults:
+    """Per-fight results from DuelSimulator, as arrays of length N."""
+
+    player_won: np.ndarray   # The monster died first
+    finished: np.ndarray     # Someone died within DuelSimulator.MAX_TURNS
+    turns: np.ndarray        # Player turns the fight lasted
+    player_hp: np.ndarray    # Player HP left at the end
+    monster_hp: np.ndarray   # Monster HP left at the end
+
+    def __len__(self):
+        return len(self.player_won)
+
+    @property
+    def win_rate(self):
+        """Fraction of fights the player won."""
+        return float(self.player_won.mean())
+
+    def hp_lost(self, start_hp):
+        """Get the HP the player lost in each fight, starting from start_hp."""
+        return start_hp - self.player_hp
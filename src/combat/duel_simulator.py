@@ -0,0 +1,144 @@
+"""
+Monte Carlo duels between a player build and a monster, many fights at a time.
+"""
+
+from dataclasses import replace
+
+import numpy as np
+
+from traits import Trait
+from turn_scheduler import TurnScheduler
+from .combat_resolver import CombatResolver
+from .combatant_arrays import CombatantArrays
+from .combatant_snapshot import CombatantSnapshot
+from .duel_results import DuelResults
+
+
+# Status counters CombatantArrays carries; burn, poison and stun are only tracked here
+SNAPSHOT_STATUSES = ('frightened', 'blinded', 'shields', 'immobilized', 'off_guard')
+NO_STATUS = np.zeros(1, dtype=np.int64)
+
+
+class DuelSimulator:
+    """Fights one build against one monster N times at once, drawing every roll as an array.
+
+    Each turn follows Game.update: the player's turn starts (stun may skip it,
+    then burn and poison tick through take_damage_with_traits) and the player
+    attacks, then the monster takes the actions TurnScheduler gives it that
+    turn, each starting the same way. Attacks are resolved with
+    CombatResolver.resolve_batch, and fights that have ended are dropped from
+    the arrays. Weapon on-hit effects and accessory status immunities are not
+    simulated.
+    """
+
+    STUN_SKIP_CHANCE = 0.5
+    # Fights still going after this many turns end undecided
+    MAX_TURNS = 1000
+
+    def __init__(self, resolver=None):
+        """Initialize with the resolver whose rules to follow."""
+        self.resolver = resolver or CombatResolver()
+
+    def simulate(self, build, monster, fights, rng=None):
+        """Fight a player snapshot against a monster fights times; returns DuelResults.
+
+        rng is a numpy.random.Generator (a fresh one by default).
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        player = CombatantArrays.from_snapshots([build])
+        foe = CombatantArrays.from_snapshots([CombatantSnapshot.from_monster(monster)])
+        player_state = self._initial_state(player, fights)
+        foe_state = self._initial_state(foe, fights)
+        delay = TurnScheduler().action_delay(monster)
+
+        results = DuelResults(
+            player_won=np.zeros(fights, dtype=bool),
+            finished=np.zeros(fights, dtype=bool),
+            turns=np.full(fights, self.MAX_TURNS),
+            player_hp=np.zeros(fights, dtype=np.int64),
+            monster_hp=np.zeros(fights, dtype=np.int64),
+        )
+        fight_ids = np.arange(fights)
+        for turn in range(1, self.MAX_TURNS + 1):
+            acting = self._start_turn(player, player_state, rng, player_state['hp'] > 0)
+            self._attack(player, player_state, foe, foe_state, acting, rng)
+
+            time = turn * TurnScheduler.TURN_TIME
+            for _ in range(time // delay - (time - TurnScheduler.TURN_TIME) // delay):
+                going = (player_state['hp'] > 0) & (foe_state['hp'] > 0)
+                acting = self._start_turn(foe, foe_state, rng, going)
+                self._attack(foe, foe_state, player, player_state, acting, rng)
+
+            ended = (player_state['hp'] <= 0) | (foe_state['hp'] <= 0)
+            if ended.any():
+                ids = fight_ids[ended]
+                results.finished[ids] = True
+                results.player_won[ids] = foe_state['hp'][ended] <= 0
+                results.turns[ids] = turn
+                results.player_hp[ids] = np.maximum(player_state['hp'][ended], 0)
+                results.monster_hp[ids] = np.maximum(foe_state['hp'][ended], 0)
+                going = ~ended
+                fight_ids = fight_ids[going]
+                for state in (player_state, foe_state):
+                    for name in state:
+                        state[name] = state[name][going]
+            if not len(fight_ids):
+                break
+
+        # Undecided fights keep the HP they were left on
+        results.player_hp[fight_ids] = player_state['hp']
+        results.monster_hp[fight_ids] = foe_state['hp']
+        return results
+
+    @staticmethod
+    def _initial_state(combatant, fights):
+        """Get each fight's copy of a combatant's HP and status counters.
+
+        Counters are only added once they become non-zero; a missing counter is 0
+        in every fight.
+        """
+        state = {'hp': np.full(fights, combatant.hp[0], dtype=np.int64)}
+        for name in SNAPSHOT_STATUSES:
+            if getattr(combatant, name)[0] > 0:
+                state[name] = np.full(fights, getattr(combatant, name)[0], dtype=np.int64)
+        return state
+
+    def _start_turn(self, combatant, state, rng, going):
+        """Roll stun and tick burn and poison for fights where it is the combatant's turn.
+
+        Returns the mask of fights where the combatant gets to act.
+        """
+        acting = going
+        if 'stun' in state:
+            skips = acting & (state['stun'] > 0) & (rng.random(len(acting), dtype=np.float32) < self.STUN_SKIP_CHANCE)
+            state['stun'] -= skips
+            acting = acting & ~skips
+        for name, trait in (('burn', Trait.FIRE), ('poison', Trait.POISON)):
+            if name in state:
+                ticks = acting & (state[name] > 0)
+                damage = self.resolver.status_damage_batch(state[name], trait, self._current(combatant, state))
+                state['hp'] -= np.where(ticks, damage, 0)
+                state[name] -= ticks
+        # Burn and poison can kill before the combatant acts
+        return acting & (state['hp'] > 0)
+
+    def _attack(self, attacker, attacker_state, defender, defender_state, acting, rng):
+        """Resolve one attack in every fight where acting is set and apply the outcome."""
+        outcome = self.resolver.resolve_batch(self._current(attacker, attacker_state),
+                                              self._current(defender, defender_state), rng)
+        defender_state['hp'] -= np.where(acting, outcome.damage, 0)
+        for name, amounts in outcome.statuses.items():
+            applied = np.where(acting, amounts, 0)
+            if name in defender_state:
+                defender_state[name] += applied
+            elif applied.any():
+                defender_state[name] = applied
+        for state, spent in ((attacker_state, outcome.attacker_spent), (defender_state, outcome.defender_spent)):
+            for name, mask in spent.items():
+                if name in state:
+                    state[name] -= acting & mask
+
+    @staticmethod
+    def _current(combatant, state):
+        """Get the combatant's arrays with each fight's current HP and status counters."""
+        return replace(combatant, hp=state['hp'], **{name: state.get(name, NO_STATUS) for name in SNAPSHOT_STATUSES})
@@ -0,0 +1,151 @@
+"""
+Closed-form expected damage and fight length between combatants.
+"""
+
+import itertools
+from dataclasses import replace
+
+import numpy as np
+
+from .combat_resolver import CombatResolver
+from .combatant_arrays import CombatantArrays
+from .combatant_snapshot import CombatantSnapshot
+from .matchup_table import MatchupTable
+
+
+class ExpectedDamage:
+    """Works out expected damage per swing and swings to kill without rolling any dice.
+
+    Follows the CombatResolver rules (miss, evade, crit, aspect and trait
+    multipliers, defense with its minimum of 1, shields) for whole
+    CombatantArrays at once. Status counters other than shields are taken to
+    stay at their snapshot values for the whole fight, and the elemental
+    statuses hits inflict are not counted.
+    """
+
+    def __init__(self, resolver=None):
+        """Initialize with the resolver whose rules to follow."""
+        self.resolver = resolver or CombatResolver()
+
+    def hit_chances(self, attackers, defenders):
+        """Get the chance a swing gets past miss and evade, and the chance it then lands.
+
+        Only the player dodges after shields (unless immobilized), so the second
+        chance is 1 for attacks on monsters.
+        """
+        reach = (1.0 - self.resolver.miss_chance_batch(attackers)) * (1.0 - defenders.evade)
+        if attackers.is_player:
+            land = np.ones_like(reach)
+        else:
+            land = 1.0 - np.where(defenders.immobilized > 0, 0.0, defenders.evade)
+        return reach, np.broadcast_to(land, reach.shape)
+
+    @staticmethod
+    def crit_chance(attackers):
+        """Get each attacker's chance to crit (blinded players cannot)."""
+        if attackers.is_player:
+            return np.where(attackers.blinded == 0, attackers.crit, 0.0)
+        return attackers.crit
+
+    def per_swing(self, attackers, defenders):
+        """Get the expected HP each defender loses per swing, once its shields are used up."""
+        return self.per_swing_moments(attackers, defenders)[0]
+
+    def per_swing_moments(self, attackers, defenders):
+        """Get the mean and variance of the HP each defender loses per swing, once its shields are used up."""
+        reach, land = self.hit_chances(attackers, defenders)
+        crit = self.crit_chance(attackers)
+        normal = self.resolver.hit_damage_batch(attackers, defenders, False)
+        critical = self.resolver.hit_damage_batch(attackers, defenders, True)
+        mean = reach * land * (crit * critical + (1.0 - crit) * normal)
+        square = reach * land * (crit * critical ** 2 + (1.0 - crit) * normal ** 2)
+        return mean, square - mean ** 2
+
+    def swings_to_kill(self, attackers, defenders):
+        """Get the expected number of swings each attacker needs to bring its defender to 0 HP.
+
+        Each shield takes one swing that gets past miss and evade; inf if the
+        attacker can never land a hit.
+        """
+        return self.fight_length(attackers, defenders)[0]
+
+    def fight_length(self, attackers, defenders):
+        """Get the mean and variance of the number of swings each attacker needs to kill its defender.
+
+        Every hit needs a geometric number of swings to land, and every shield
+        one to get past miss and evade; both are inf if the attacker can never
+        land a hit.
+        """
+        reach, land = self.hit_chances(attackers, defenders)
+        hits, hits_variance = self.hit_count_moments(defenders.hp,
+                                                     self.resolver.hit_damage_batch(attackers, defenders, False),
+                                                     self.resolver.hit_damage_batch(attackers, defenders, True),
+                                                     self.crit_chance(attackers))
+        chance = reach * land
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = defenders.shields / reach + hits / chance
+            variance = (defenders.shields * (1.0 - reach) / reach ** 2
+                        + hits * (1.0 - chance) / chance ** 2 + hits_variance / chance ** 2)
+        return np.where(chance > 0, mean, np.inf), np.where(chance > 0, variance, np.inf)
+
+    @classmethod
+    def hits_to_kill(cls, hp, normal, critical, crit):
+        """Get the expected number of hits to deal hp damage, each critical with chance crit."""
+        return cls.hit_count_moments(hp, normal, critical, crit)[0]
+
+    @staticmethod
+    def hit_count_moments(hp, normal, critical, crit):
+        """Get the mean and variance of the number of hits to deal hp damage, each critical with chance crit.
+
+        Solved exactly by stepping up through HP, with N(h) = 1 + N(h - damage) and N(h <= 0) = 0:
+        E[h] = 1 + crit * E[h - critical] + (1 - crit) * E[h - normal], and likewise
+        for E[N(h)^2]. Grids of builds repeat the same few cases, so each distinct one is solved once.
+        """
+        columns = np.broadcast_arrays(np.atleast_1d(hp), normal, critical, crit)
+        codes = [np.unique(column, return_inverse=True)[1].ravel() for column in columns]
+        keys = np.ravel_multi_index(codes, [code.max() + 1 for code in codes])
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        hp, normal, critical, crit = (column[first] for column in columns)
+        hp = np.maximum(hp, 0)
+
+        rows = np.arange(len(first))
+        expected = np.zeros((int(hp.max()) + 1, len(first)))
+        square = np.zeros_like(expected)
+        for remaining in range(1, len(expected)):
+            after_normal = np.maximum(remaining - normal, 0), rows
+            after_critical = np.maximum(remaining - critical, 0), rows
+            expected[remaining] = 1.0 + crit * expected[after_critical] + (1.0 - crit) * expected[after_normal]
+            square[remaining] = (1.0 + 2.0 * (expected[remaining] - 1.0)
+                                 + crit * square[after_critical] + (1.0 - crit) * square[after_normal])
+        mean = expected[hp, rows]
+        return mean[inverse], (square[hp, rows] - mean ** 2)[inverse]
+
+    def matchups(self, builds, monsters):
+        """Evaluate every player build (snapshots) against every monster; returns a MatchupTable."""
+        players = CombatantArrays.from_snapshots(builds)
+        foes = CombatantArrays.from_snapshots([CombatantSnapshot.from_monster(monster) for monster in monsters])
+        player_rows = np.repeat(np.arange(len(builds)), len(monsters))
+        monster_rows = np.tile(np.arange(len(monsters)), len(builds))
+        players, foes = players.take(player_rows), foes.take(monster_rows)
+
+        shape = (len(builds), len(monsters))
+        # Monster actions per player turn (see TurnScheduler)
+        actions = np.array([monster.speed / 100.0 for monster in monsters])
+        return MatchupTable(
+            builds=list(builds),
+            monster_names=[monster.name for monster in monsters],
+            damage_per_turn=self.per_swing(players, foes).reshape(shape),
+            turns_to_kill=self.swings_to_kill(players, foes).reshape(shape),
+            damage_taken_per_turn=self.per_swing(foes, players).reshape(shape) * actions,
+            turns_to_die=self.swings_to_kill(foes, players).reshape(shape) / actions,
+        )
+
+    @staticmethod
+    def build_grid(base, **stat_values):
+        """Get a copy of base for every combination of stat values.
+
+        e.g. build_grid(base, attack=range(3, 12), defense=[0, 2, 4]) gives 27 builds.
+        """
+        names = list(stat_values)
+        return [replace(base, **dict(zip(names, values)))
+                for values in itertools.product(*stat_values.values())]
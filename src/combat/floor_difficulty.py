@@ -0,0 +1,91 @@
+"""
+Expected difficulty of each floor for a player build.
+"""
+
+import math
+
+import numpy as np
+
+from constants import MAX_LEVELS, MONSTER_COUNT_RANGES
+from monsters.pool import get_monster_pool
+from .combatant_arrays import CombatantArrays
+from .combatant_snapshot import CombatantSnapshot
+from .expected_damage import ExpectedDamage
+from .floor_estimate import FloorEstimate
+
+
+class FloorDifficulty:
+    """Estimates HP loss, XP and the chance of dying on each floor for a build.
+
+    Each floor is taken on alone from the build's HP: MONSTER_COUNT_RANGES
+    monsters, each drawn from the pool's spawn distribution for the floor and
+    fought to the death one after another, with the monster swinging every turn
+    of its fight (speed / 100 times). Fight lengths and HP losses come from
+    ExpectedDamage, and the floor's total HP loss is taken to be normally
+    distributed to get the chance of dying. Healing, levelling up and loot are
+    not counted.
+    """
+
+    def __init__(self, pool=None, model=None):
+        """Initialize with a MonsterPool (the game's by default) and an ExpectedDamage model."""
+        if pool is None:
+            pool = get_monster_pool()
+        self.pool = pool
+        self.model = model or ExpectedDamage()
+
+    def spawn_matrix(self, floors):
+        """Get each floor's chance of spawning each pool monster, as (floors, monsters), and the classes."""
+        classes = self.pool.get_monster_classes()
+        matrix = np.zeros((len(floors), len(classes)))
+        for row, floor in enumerate(floors):
+            distribution = self.pool.get_level_monster_distribution(floor)
+            matrix[row] = [distribution.get(monster_class.__name__, 0.0) for monster_class in classes]
+        return matrix, classes
+
+    def fight_hp_loss(self, build, monsters):
+        """Get the mean and variance of the HP build loses while killing each monster."""
+        player = CombatantArrays.from_snapshots([build]).take(np.zeros(len(monsters), dtype=int))
+        foes = CombatantArrays.from_snapshots([CombatantSnapshot.from_monster(monster) for monster in monsters])
+        turns, turns_variance = self.model.fight_length(player, foes)
+        damage, damage_variance = self.model.per_swing_moments(foes, player)
+
+        actions = np.array([monster.speed / 100.0 for monster in monsters])
+        swings, swings_variance = turns * actions, turns_variance * actions ** 2
+        with np.errstate(invalid='ignore'):
+            mean = swings * damage
+            variance = swings * damage_variance + swings_variance * damage ** 2
+        # A fight the player cannot win always ends in death
+        unwinnable = ~np.isfinite(turns)
+        return np.where(unwinnable, np.inf, mean), np.where(unwinnable, 0.0, variance)
+
+    def estimate(self, build, floors=range(1, MAX_LEVELS + 1)):
+        """Estimate every floor for a player snapshot; returns a FloorEstimate."""
+        floors = list(floors)
+        spawn, classes = self.spawn_matrix(floors)
+        monsters = [monster_class(0, 0) for monster_class in classes]
+        loss, loss_variance = self.fight_hp_loss(build, monsters)
+        xp = np.array([monster.xp_value for monster in monsters], dtype=np.float64)
+
+        fewest, most = np.array([MONSTER_COUNT_RANGES[min(floor, MAX_LEVELS)] for floor in floors]).T
+        count = (fewest + most) / 2.0
+        count_variance = ((most - fewest + 1) ** 2 - 1) / 12.0
+
+        # Mix each monster's fight over the floor's spawn chances (monsters that never spawn add nothing)
+        spawns = spawn > 0
+        fight_mean = np.where(spawns, spawn * loss, 0.0).sum(axis=1)
+        fight_square = np.where(spawns, spawn * (loss_variance + loss ** 2), 0.0).sum(axis=1)
+        with np.errstate(invalid='ignore'):
+            hp_loss = count * fight_mean
+            hp_loss_variance = count * (fight_square - fight_mean ** 2) + count_variance * fight_mean ** 2
+            margin = (build.hp - hp_loss) / np.sqrt(hp_loss_variance * 2.0)
+        survival = 0.5 * (1.0 + np.array([math.erf(value) for value in margin]))
+        death_chance = np.where(np.isfinite(hp_loss), 1.0 - np.nan_to_num(survival, nan=0.0), 1.0)
+
+        return FloorEstimate(
+            floors=np.array(floors),
+            monster_count=count,
+            hp_loss=hp_loss,
+            hp_loss_std=np.sqrt(hp_loss_variance),
+            xp=count * (spawn @ xp),
+            death_chance=death_chance,
+        )
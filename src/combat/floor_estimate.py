@@ -0,0 +1,19 @@
+"""
+Per-floor difficulty estimates produced by FloorDifficulty.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class FloorEstimate:
+    """Expected values for each floor, as arrays aligned with floors."""
+
+    floors: np.ndarray
+    monster_count: np.ndarray   # Expected monsters placed on the floor
+    hp_loss: np.ndarray         # Expected HP lost clearing the floor
+    hp_loss_std: np.ndarray     # Standard deviation of the HP lost
+    xp: np.ndarray              # Expected XP from clearing the floor
+    death_chance: np.ndarray    # Chance the HP lost reaches the build's HP
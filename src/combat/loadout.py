@@ -0,0 +1,23 @@
+"""
+A complete set of equipment chosen by LoadoutOptimizer.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Tuple
+
+
+@dataclass(frozen=True)
+class Loadout:
+    """A weapon, an armor and up to accessory_slots accessories, with how they scored."""
+
+    weapon: Any
+    armor: Any
+    accessories: Tuple[Any, ...]
+    score: float
+    damage: float        # Expected damage dealt per turn to the target
+    effective_hp: float  # HP counted in the target's hits on an unarmored player
+
+    @property
+    def items(self):
+        """Get every item in the loadout, skipping empty slots."""
+        return [item for item in (self.weapon, self.armor, *self.accessories) if item is not None]
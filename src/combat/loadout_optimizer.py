@@ -0,0 +1,317 @@
+"""
+Search over carried, equipped and shop equipment for the best loadout.
+"""
+
+import itertools
+from collections import Counter
+from dataclasses import replace
+
+import numpy as np
+
+from stat_modifiers import ModifierKind, get_item_modifiers, get_stat_definition
+from stat_modifiers.registry import MAX_CHANCE
+from traits import Trait, traits_to_mask
+from .combatant_arrays import CombatantArrays
+from .combatant_snapshot import CombatantSnapshot
+from .expected_damage import ExpectedDamage
+from .loadout import Loadout
+
+
+# Opponent used when no monster is given: hits for 10 and has no defenses
+TRAINING_DUMMY = CombatantSnapshot(is_player=False, attack=10, defense=0, evade=0.0, crit=0.0,
+                                   crit_multiplier=1.0, hp=1)
+TRAITS = tuple(Trait)
+# Stats the player's combat snapshot is worked out from: the columns of a
+# contribution row's added (FLAT) and multiplied (MULTIPLIER) modifiers
+STATS = ('attack', 'defense', 'evade', 'crit', 'crit_multiplier', 'attack_multiplier', 'defense_multiplier')
+ATTACK, DEFENSE, EVADE, CRIT, CRIT_MULTIPLIER, ATTACK_MULTIPLIER, DEFENSE_MULTIPLIER = range(len(STATS))
+COLUMNS = {stat: column for column, stat in enumerate(STATS)}
+
+
+class LoadoutOptimizer:
+    """Finds the weapon, armor and accessories that maximize a weighted objective.
+
+    The objective is damage_weight times the expected damage dealt per turn plus
+    hp_weight times the effective HP against the target, both from
+    ExpectedDamage. The search runs in two passes:
+
+    1. Every weapon/armor pair is equipped once, and each accessory's
+       StatModifiers are evaluated in that pair's context into a memoized
+       row. Every accessory combination is then scored at once: each stat is
+       its base plus the FLAT modifiers, times the MULTIPLIER ones, finished
+       as the stat registry finishes it, then FINAL modifiers (cleanup
+       accessories like Anaglyph) run in the order the items are worn.
+    2. Only the best exact_candidates estimates survive, and each is equipped
+       for real and scored from CombatantSnapshot.from_player. Modifiers that
+       depend on the other accessories (GravePact with a trait-granting
+       accessory, conditions) and FLAT modifiers listed after a MULTIPLIER on
+       the same stat are only estimated in pass 1, and counted exactly for the
+       loadout returned.
+
+    The player's equipment is always restored afterwards.
+    """
+
+    EXACT_CANDIDATES = 32
+
+    def __init__(self, model=None, exact_candidates=EXACT_CANDIDATES):
+        """Initialize with the damage model to score loadouts with."""
+        self.model = model or ExpectedDamage()
+        self.exact_candidates = exact_candidates
+
+    @staticmethod
+    def candidates(player, shop=None):
+        """Get the (weapons, armors, accessories) that are equipped, carried or for sale in shop."""
+        items = [player.weapon, player.armor, *player.accessories, *player.inventory]
+        if shop is not None:
+            items.extend(shop.inventory)
+        slots = {'weapon': [], 'armor': [], 'accessory': []}
+        seen = set()
+        for item in items:
+            slot = getattr(item, 'equipment_slot', None)
+            if slot in slots and id(item) not in seen:
+                seen.add(id(item))
+                slots[slot].append(item)
+        return slots['weapon'], slots['armor'], slots['accessory']
+
+    def optimize(self, player, shop=None, monster=None, damage_weight=1.0, hp_weight=0.0):
+        """Get the best Loadout for fighting monster (a training dummy if None)."""
+        weapons, armors, accessories = self.candidates(player, shop)
+        target = TRAINING_DUMMY if monster is None else CombatantSnapshot.from_monster(monster)
+        foe = CombatantArrays.from_snapshots([target])
+        weights = (damage_weight, hp_weight)
+        saved = (player.weapon, player.armor, player.accessories)
+        try:
+            shortlist = self._shortlist(player, weapons or [None], armors or [None], accessories,
+                                        monster, foe, weights)
+            best = None
+            for weapon, armor, chosen in shortlist:
+                loadout = self._evaluate(player, weapon, armor, chosen, monster, foe, weights)
+                if best is None or loadout.score > best.score:
+                    best = loadout
+            return best
+        finally:
+            player.weapon, player.armor, player.accessories = saved
+
+    def _evaluate(self, player, weapon, armor, accessories, monster, foe, weights):
+        """Score one loadout exactly by equipping it."""
+        self._equip(player, weapon, armor, accessories)
+        build = CombatantArrays.from_snapshots([CombatantSnapshot.from_player(player, monster)])
+        damage, effective_hp = self._objectives(build, foe)
+        return Loadout(weapon=weapon, armor=armor, accessories=tuple(accessories),
+                       score=float(self._score(damage, effective_hp, weights)[0]),
+                       damage=float(damage[0]), effective_hp=float(effective_hp[0]))
+
+    def _shortlist(self, player, weapons, armors, accessories, monster, foe, weights):
+        """Estimate every loadout from memoized contributions; get the best as (weapon, armor, accessories)."""
+        combos = self._accessory_combinations(len(accessories), player.accessory_slots)
+        self._equip(player, None, None, [])
+        naked = CombatantArrays.from_snapshots([CombatantSnapshot.from_player(player, monster)])
+        own = self._own_stats(player)
+        compiled = {id(item): self._compile(item) for item in (*weapons, *armors, *accessories) if item is not None}
+
+        pairs = list(itertools.product(weapons, armors))
+        sums = {}  # Accessory rows -> their totals over every combination
+        scores, pair_ids, combo_ids = [], [], []
+        for pair_id, (weapon, armor) in enumerate(pairs):
+            self._equip(player, weapon, armor, [])
+            fixed, finals = [own], []
+            for item in (weapon, armor):
+                if item is not None:
+                    row, item_finals = self._item_stats(player, item, compiled[id(item)], None)
+                    fixed.append(row)
+                    finals.extend((None, columns, apply) for columns, apply in item_finals)
+            fixed = self._stack(fixed)
+            rows = []
+            for index, accessory in enumerate(accessories):
+                self._equip(player, weapon, armor, [accessory])
+                row, item_finals = self._item_stats(player, accessory, compiled[id(accessory)], monster)
+                rows.append(row)
+                finals.extend((index, columns, apply) for columns, apply in item_finals)
+            rows.append(self._empty_stats())  # Filler for unused slots
+            rows = self._stack(rows)
+            key = b''.join(column.tobytes() for column in rows)
+            if key not in sums:
+                sums[key] = self._combination_sums(rows, combos)
+            self._equip(player, weapon, armor, [])
+            build = self._combine(player, naked, fixed, sums[key], combos, finals)
+            score = self._score(*self._objectives(build, foe, [bool(weight) for weight in weights]), weights)
+
+            keep = min(self.exact_candidates, len(score))
+            best = np.argpartition(-score, keep - 1)[:keep]
+            scores.append(score[best])
+            pair_ids.append(np.full(keep, pair_id))
+            combo_ids.append(best)
+
+        scores, pair_ids, combo_ids = (np.concatenate(values) for values in (scores, pair_ids, combo_ids))
+        keep = min(self.exact_candidates, len(scores))
+        best = np.argsort(-scores, kind='stable')[:keep]
+        return [(*pairs[pair_ids[index]],
+                 [accessories[slot] for slot in combos[combo_ids[index]] if slot < len(accessories)])
+                for index in best]
+
+    @staticmethod
+    def _combination_sums(rows, combos):
+        """Total the accessory contribution rows over each combination of accessories."""
+        added, multiplied, damage, trait_counts, weakness, resistance = rows
+        return (added[combos].sum(axis=1), multiplied[combos].prod(axis=1), damage[combos],
+                trait_counts[combos].sum(axis=1), np.bitwise_or.reduce(weakness[combos], axis=1),
+                np.bitwise_or.reduce(resistance[combos], axis=1))
+
+    def _combine(self, player, naked, fixed, sums, combos, finals):
+        """Get the CombatantArrays of the player wearing a weapon/armor pair and each accessory combination.
+
+        finals are the (accessory index or None for the pair, stat columns, apply)
+        FINAL modifiers, in the order the items are worn.
+        """
+        # Each stat's base plus FLAT modifiers, times its MULTIPLIER modifiers
+        total = (fixed[0].sum(axis=0) + sums[0]) * (fixed[1].prod(axis=0) * sums[1])
+        trait_counts = fixed[3].sum(axis=0) + sums[3]
+        weakness = np.bitwise_or.reduce(fixed[4]) | sums[4]
+        resistance = np.bitwise_or.reduce(fixed[5]) | sums[5]
+
+        # Finished as the stat registry finishes them (attack and defense scaled by their multipliers)
+        finished = [total[:, column] for column in range(len(STATS))]
+        finished[ATTACK] = np.maximum(1, np.trunc(total[:, ATTACK] * total[:, ATTACK_MULTIPLIER])).astype(np.int64)
+        finished[DEFENSE] = np.trunc(total[:, DEFENSE] * total[:, DEFENSE_MULTIPLIER]).astype(np.int64)
+        finished[EVADE] = np.minimum(MAX_CHANCE, total[:, EVADE])
+        finished[CRIT] = np.minimum(MAX_CHANCE, total[:, CRIT])
+        for index, columns, apply in finals:
+            # FINAL modifiers are written for single values, so each runs once per distinct input
+            rows = np.arange(len(combos)) if index is None else np.flatnonzero((combos == index).any(axis=1))
+            inputs = np.stack([finished[column][rows] for column in columns], axis=1)
+            _, first, inverse = np.unique(inputs, axis=0, return_index=True, return_inverse=True)
+            outputs = np.array([apply(player, *(finished[column][row].item() for column in columns))
+                                for row in rows[first]])
+            for position, column in enumerate(columns):
+                finished[column][rows] = outputs[inverse.reshape(-1), position]
+
+        return replace(
+            naked,
+            attack=finished[ATTACK],
+            defense=finished[DEFENSE],
+            evade=finished[EVADE],
+            crit=finished[CRIT],
+            crit_multiplier=finished[CRIT_MULTIPLIER],
+            attack_traits=self._trait_columns(trait_counts),
+            weakness_mask=weakness & ~resistance,
+            resistance_mask=resistance & ~weakness,
+            damage_multipliers=sums[2],
+        )
+
+    def _objectives(self, builds, foe, needed=(True, True)):
+        """Get each build's expected damage per turn and effective HP against foe (0 where not needed)."""
+        damage = effective_hp = np.zeros(len(builds))
+        if needed[0]:
+            damage = self.model.per_swing(builds, foe)
+        if needed[1]:
+            taken = self.model.per_swing(foe, builds)
+            unarmored = replace(builds, defense=np.zeros(1, dtype=np.int64), evade=np.zeros(1),
+                                weakness_mask=np.zeros(1, dtype=np.int64),
+                                resistance_mask=np.zeros(1, dtype=np.int64))
+            raw = self.model.per_swing(foe, unarmored)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                effective_hp = np.where(taken > 0, builds.hp * raw / taken, np.inf)
+        return damage, effective_hp
+
+    @staticmethod
+    def _score(damage, effective_hp, weights):
+        """Weigh the objectives together (a zero weight drops its objective, even if infinite)."""
+        score = np.zeros(np.shape(damage))
+        for weight, objective in zip(weights, (damage, effective_hp)):
+            if weight:
+                score = score + weight * objective
+        return score
+
+    @staticmethod
+    def _equip(player, weapon, armor, accessories):
+        """Put a loadout on the player directly, without touching the inventory or firing events."""
+        player.weapon = weapon
+        player.armor = armor
+        player.accessories = list(accessories) + [None] * (player.accessory_slots - len(accessories))
+
+    @staticmethod
+    def _accessory_combinations(count, slots):
+        """Get every choice of up to slots accessories as rows of indices, padded with count (no accessory)."""
+        combos = [combo + (count,) * (slots - size)
+                  for size in range(min(slots, count) + 1)
+                  for combo in itertools.combinations(range(count), size)]
+        return np.array(combos, dtype=np.intp).reshape(len(combos), slots)
+
+    @staticmethod
+    def _own_stats(player):
+        """Get the player's own stats (each stat's base value) as a contribution row."""
+        return ([get_stat_definition(stat).base(player) for stat in STATS], [1.0] * len(STATS), 1.0,
+                _trait_counts(player.attack_traits),
+                traits_to_mask(player.weaknesses), traits_to_mask(player.resistances))
+
+    @staticmethod
+    def _compile(item):
+        """Get what about an item does not depend on who wears it.
+
+        That is its StatModifiers of the stats combat uses, as (stat columns,
+        kind, value, condition), and its trait counts and masks.
+        """
+        modifiers = [([COLUMNS[stat] for stat in modifier.stats], modifier.kind, modifier.value, modifier.condition)
+                     for modifier in get_item_modifiers(item) if all(stat in COLUMNS for stat in modifier.stats)]
+        return modifiers, (_trait_counts(item.get_attack_traits()), item.get_weakness_mask(), item.get_resistance_mask())
+
+    @staticmethod
+    def _item_stats(player, item, compiled, monster):
+        """Get what an item's combat modifiers add to the player's stats, as worn by the player right now.
+
+        Returns the contribution row and the item's FINAL modifiers as
+        (stat columns, apply). Modifiers whose condition does not hold right
+        now are left out.
+        """
+        modifiers, traits = compiled
+        added, multiplied = [0.0] * len(STATS), [1.0] * len(STATS)
+        finals = []
+        for columns, kind, value, condition in modifiers:
+            if condition is not None and not condition(player):
+                continue
+            if kind is ModifierKind.FINAL:
+                finals.append((columns, value))
+                continue
+            value = value(player) if callable(value) else value
+            if kind is ModifierKind.MULTIPLIER:
+                multiplied[columns[0]] *= value
+            else:
+                added[columns[0]] += value
+        damage_multiplier = 1.0
+        if monster is not None and hasattr(item, 'get_damage_multiplier_vs_target'):
+            damage_multiplier = item.get_damage_multiplier_vs_target(monster)
+        return (added, multiplied, damage_multiplier, *traits), finals
+
+    @staticmethod
+    def _empty_stats():
+        """Get the contribution of an empty accessory slot."""
+        return [0.0] * len(STATS), [1.0] * len(STATS), 1.0, [0] * len(TRAITS), 0, 0
+
+    @staticmethod
+    def _stack(rows):
+        """Turn contribution rows into (added, multiplied, damage multiplier, trait counts, weakness, resistance) arrays."""
+        columns = list(zip(*rows))
+        return (np.array(columns[0], dtype=np.float64), np.array(columns[1], dtype=np.float64),
+                np.array(columns[2], dtype=np.float64), np.array(columns[3], dtype=np.int64),
+                np.array(columns[4], dtype=np.int64), np.array(columns[5], dtype=np.int64))
+
+    @staticmethod
+    def _trait_columns(counts):
+        """Turn per-trait counts into an attack_traits array, one column per copy of a trait.
+
+        Rows keep their duplicates (aspect multipliers apply once per copy) but
+        are grouped by trait rather than in equipment order, and may have 0
+        gaps, which never interact.
+        """
+        columns = [np.where(counts[:, column] > repeat, int(trait), 0)
+                   for column, trait in enumerate(TRAITS)
+                   for repeat in range(int(counts[:, column].max()))]
+        if not columns:
+            return np.zeros((len(counts), 1), dtype=np.int64)
+        return np.stack(columns, axis=1)
+
+
+def _trait_counts(traits):
+    """Count how many times each trait appears in traits."""
+    counts = Counter(traits)
+    return [counts[member] for member in TRAITS]
@@ -0,0 +1,31 @@
+"""
+Expected fight statistics for a grid of player builds against monsters.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from .combatant_snapshot import CombatantSnapshot
+
+
+@dataclass
+class MatchupTable:
+    """Expected values for each (build, monster) pair, as (builds, monsters) arrays.
+
+    Turns are player turns: the player swings once a turn and a monster
+    speed / 100 times.
+    """
+
+    builds: List[CombatantSnapshot]
+    monster_names: List[str]
+    damage_per_turn: np.ndarray        # HP the player takes off the monster per turn
+    turns_to_kill: np.ndarray          # Turns for the player to kill the monster
+    damage_taken_per_turn: np.ndarray  # HP the monster takes off the player per turn
+    turns_to_die: np.ndarray           # Turns for the monster to kill the player
+
+    @property
+    def player_wins(self):
+        """Mask of matchups where the player is expected to kill the monster first."""
+        return self.turns_to_kill <= self.turns_to_die
@@ -6,7 +6,11 @@ Game constants and configuration values.
 SCREEN_WIDTH = 80
 SCREEN_HEIGHT = 58
 
-# Map dimensions  
+# Map viewport (the part of the screen above the UI panel)
+VIEWPORT_WIDTH = SCREEN_WIDTH
+VIEWPORT_HEIGHT = 43
+
+# Default map dimensions; maps larger than the viewport scroll with the camera
 MAP_WIDTH = 80
 MAP_HEIGHT = 43
 
@@ -17,6 +21,38 @@ UI_HEIGHT = 8
 TITLE = "Devil's Den"
 MAX_LEVELS = 10
 
+# Monster activation: dormant monsters wake when the player comes within
+# WAKE_RADIUS (even through walls) or a noise is made within its radius
+WAKE_RADIUS = 2
+ATTACK_NOISE_RADIUS = 6
+
+# Monster activity: awake monsters take turns, and the scent map is updated,
+# only within ACTIVE_RADIUS tiles of the player (a square, whatever the viewport).
+# Scent fades below ScentMap.THRESHOLD about 21 tiles from the player, so no
+# monster further out could still be chasing it.
+ACTIVE_RADIUS = 24
+
+# Number of monsters placed on each floor, as (fewest, most)
+MONSTER_COUNT_RANGES = {
+    1: (2, 4),      # Few monsters to introduce combat
+    2: (4, 8),
+    3: (4, 8),
+    4: (6, 12),
+    5: (6, 12),
+    6: (6, 12),
+    7: (8, 16),
+    8: (8, 16),
+    9: (12, 20),    # Swarm level
+    10: (1, 1),     # Just the boss
+}
+
+# Optional respawn mode: every RESPAWN_WAVE_INTERVAL player turns a floor spawns
+# a wave of RESPAWN_WAVE_SIZE (fewest, most) dormant monsters out of the player's
+# view, while fewer than the floor's most monsters (above) are alive
+RESPAWN_WAVES = False
+RESPAWN_WAVE_INTERVAL = 150
+RESPAWN_WAVE_SIZE = (1, 3)
+
 # Colors (RGB tuples)
 COLOR_WHITE = (255, 255, 255)
 COLOR_BLACK = (0, 0, 0)
@@ -4,6 +4,12 @@ Enchantments package for the roguelike game.
 
 from .enchantment_type import EnchantmentType
 from .enchantment import Enchantment
+from .enchantment_bonus import (
+    EnchantmentBonus,
+    ENCHANTMENT_BONUS_TABLE,
+    get_enchantment_bonus_vector,
+    sum_enchantment_bonuses
+)
 from .utils import (
     get_random_weapon_enchantment,
     get_random_armor_enchantment,
@@ -11,6 +17,7 @@ from .utils import (
     get_armor_enchantment_by_type,
     get_random_enchantment,
     get_enchantment_by_type,
+    get_enchantment_from_code,
     should_spawn_with_enchantment,
     should_armor_spawn_with_enchantment,
     WEAPON_ENCHANT_CHANCE,
@@ -20,12 +27,17 @@ from .utils import (
 __all__ = [
     'EnchantmentType',
     'Enchantment',
+    'EnchantmentBonus',
+    'ENCHANTMENT_BONUS_TABLE',
+    'get_enchantment_bonus_vector',
+    'sum_enchantment_bonuses',
     'get_random_weapon_enchantment',
     'get_random_armor_enchantment',
     'get_weapon_enchantment_by_type',
     'get_armor_enchantment_by_type',
     'get_random_enchantment',
     'get_enchantment_by_type',
+    'get_enchantment_from_code',
     'should_spawn_with_enchantment',
     'should_armor_spawn_with_enchantment',
     'WEAPON_ENCHANT_CHANCE',
@@ -3,95 +3,118 @@ Enchantment class for the roguelike game.
 """
 
 from .enchantment_type import EnchantmentType
-from traits import Trait
+from .enchantment_bonus import ENCHANTMENT_BONUS_TABLE
+from traits import Trait, FrozenTraitList
+
+# Serialization order for enchantment codes - only ever append new entries
+ENCHANTMENT_TYPES = tuple(EnchantmentType)
+TARGET_TYPES = ("weapon", "armor")
 
 
 class Enchantment:
-    """Represents an enchantment that can be applied to weapons or armor."""
-    
-    def __init__(self, enchantment_type, target_type="weapon"):
-        self.type = enchantment_type
-        self.target_type = target_type  # "weapon" or "armor"
-        if target_type == "weapon":
-            self.name = enchantment_type.get_weapon_label()
-        else:
-            self.name = enchantment_type.get_armor_label()
-        self.attack_traits = self._get_attack_traits()
-        self.resistances = self._get_resistances()
+    """Represents an enchantment that can be applied to weapons or armor.
+    
+    Enchantments are immutable flyweights: there is exactly one instance per
+    (enchantment type, target type), so constructing one returns the shared
+    instance instead of allocating a new object.
+    """
+    
+    __slots__ = ('type', 'target_type', 'name', 'attack_traits', 'resistances')
+    
+    _interned = {}
+    
+    def __new__(cls, enchantment_type, target_type="weapon"):
+        key = (enchantment_type, target_type)
+        enchantment = cls._interned.get(key)
+        if enchantment is None:
+            enchantment = super().__new__(cls)
+            set_attr = object.__setattr__
+            set_attr(enchantment, 'type', enchantment_type)
+            set_attr(enchantment, 'target_type', target_type)  # "weapon" or "armor"
+            if target_type == "weapon":
+                set_attr(enchantment, 'name', enchantment_type.get_weapon_label())
+            else:
+                set_attr(enchantment, 'name', enchantment_type.get_armor_label())
+            set_attr(enchantment, 'attack_traits', FrozenTraitList(enchantment._get_attack_traits()))
+            set_attr(enchantment, 'resistances', FrozenTraitList(enchantment._get_resistances()))
+            cls._interned[key] = enchantment
+        return enchantment
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Enchantment instances are immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("Enchantment instances are immutable")
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (Enchantment.from_code, (self.to_code(),))
+    
+    def __repr__(self):
+        return f"Enchantment({self.type}, {self.target_type!r})"
+    
+    def to_code(self):
+        """Serialize this enchantment as a small integer."""
+        return ENCHANTMENT_TYPES.index(self.type) * len(TARGET_TYPES) + TARGET_TYPES.index(self.target_type)
+    
+    @classmethod
+    def from_code(cls, code):
+        """Get the enchantment for a code produced by to_code."""
+        type_index, target_index = divmod(code, len(TARGET_TYPES))
+        return cls(ENCHANTMENT_TYPES[type_index], TARGET_TYPES[target_index])
     
     def get_weapon_attack_bonus(self):
         """Get the attack bonus when applied to weapons."""
-        if self.type == EnchantmentType.QUALITY:
-            return 3
-        elif self.type == EnchantmentType.BALANCED:
-            return 0  # Defense bonus, not attack
-        return 0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "weapon"].attack
     
     def get_armor_attack_bonus(self):
         """Get the attack bonus when applied to armor."""
-        if self.type == EnchantmentType.BALANCED:
-            return 1  # Spiked armor gives attack
-        return 0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "armor"].attack
     
     def get_weapon_defense_bonus(self):
         """Get the defense bonus when applied to weapons."""
-        if self.type == EnchantmentType.BALANCED:
-            return 1  # Bolstered weapon gives defense
-        return 0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "weapon"].defense
     
     def get_armor_defense_bonus(self):
         """Get the defense bonus when applied to armor."""
-        if self.type == EnchantmentType.QUALITY:
-            return 3
-        return 0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "armor"].defense
     
     def get_weapon_fov_bonus(self):
         """Get the FOV bonus when applied to weapons."""
-        if self.type == EnchantmentType.GLOWING:
-            return 3
-        return 0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "weapon"].fov
     
     def get_armor_fov_bonus(self):
-        """Get the FOV bonus when applied to armor."""  
-        if self.type == EnchantmentType.GLOWING:
-            return 3
-        return 0
+        """Get the FOV bonus when applied to armor."""
+        return ENCHANTMENT_BONUS_TABLE[self.type, "armor"].fov
     
     def get_weapon_attack_multiplier_bonus(self):
         """Get the attack multiplier bonus when applied to weapons."""
-        if self.type == EnchantmentType.SHINY:
-            return 0.25  # 25% bonus = 1.25x damage
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "weapon"].attack_multiplier
     
     def get_armor_defense_multiplier_bonus(self):
         """Get the defense multiplier bonus when applied to armor."""
-        if self.type == EnchantmentType.SHINY:
-            return 0.25  # 25% bonus = 1.25x defense
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "armor"].defense_multiplier
     
     def get_xp_multiplier_bonus(self):
         """Get the XP multiplier bonus (same for weapon/armor)."""
-        if self.type == EnchantmentType.GILDED:
-            return 0.05  # 5% bonus
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, self.target_type].xp_multiplier
     
     def get_health_aspect_bonus(self):
         """Get the health aspect bonus (same for weapon/armor)."""
-        if self.type == EnchantmentType.BLESSED:
-            return 0.10  # 10% bonus
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, self.target_type].health_aspect
     
     def get_weapon_crit_bonus(self):
         """Get the crit chance bonus when applied to weapons."""
-        if self.type == EnchantmentType.RENDING:
-            return 0.05  # 5% crit chance bonus
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "weapon"].crit
     
     def get_armor_evade_bonus(self):
         """Get the evade chance bonus when applied to armor."""
-        if self.type == EnchantmentType.SHADOW:
-            return 0.05  # 5% evade chance bonus
-        return 0.0
+        return ENCHANTMENT_BONUS_TABLE[self.type, "armor"].evade
     
     def _get_attack_traits(self):
         """Get the attack traits provided by this enchantment."""
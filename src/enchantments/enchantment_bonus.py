@@ -0,0 +1,78 @@
+"""
+Precomputed enchantment bonus table for the roguelike game.
+"""
+
+from typing import NamedTuple
+from .enchantment_type import EnchantmentType
+
+
+class EnchantmentBonus(NamedTuple):
+    """Fixed bonus vector an enchantment grants to the item it is applied to.
+
+    Field names match the bonus_type strings used by get_enchantment_bonus.
+    Multiplier fields are additive on top of the item's own multiplier.
+    """
+    attack: int = 0
+    defense: int = 0
+    fov: int = 0
+    health_aspect: float = 0.0
+    attack_multiplier: float = 0.0
+    defense_multiplier: float = 0.0
+    xp_multiplier: float = 0.0
+    crit: float = 0.0
+    crit_multiplier: float = 0.0
+    evade: float = 0.0
+
+    def plus(self, other):
+        """Return the element-wise sum of two bonus vectors."""
+        return EnchantmentBonus(*[a + b for a, b in zip(self, other)])
+
+
+NO_BONUS = EnchantmentBonus()
+
+# Bonuses granted regardless of whether the enchantment is on a weapon or armor
+_SHARED_BONUSES = {
+    EnchantmentType.GLOWING: EnchantmentBonus(fov=3),
+    EnchantmentType.GILDED: EnchantmentBonus(xp_multiplier=0.05),  # 5% bonus
+    EnchantmentType.BLESSED: EnchantmentBonus(health_aspect=0.10),  # 10% bonus
+}
+
+_WEAPON_BONUSES = {
+    EnchantmentType.QUALITY: EnchantmentBonus(attack=3),
+    EnchantmentType.SHINY: EnchantmentBonus(attack_multiplier=0.25),  # 1.25x damage
+    EnchantmentType.BALANCED: EnchantmentBonus(defense=1),  # Bolstered weapon gives defense
+    EnchantmentType.RENDING: EnchantmentBonus(crit=0.05),  # 5% crit chance bonus
+}
+
+_ARMOR_BONUSES = {
+    EnchantmentType.QUALITY: EnchantmentBonus(defense=3),
+    EnchantmentType.SHINY: EnchantmentBonus(defense_multiplier=0.25),  # 1.25x defense
+    EnchantmentType.BALANCED: EnchantmentBonus(attack=1),  # Spiked armor gives attack
+    EnchantmentType.SHADOW: EnchantmentBonus(evade=0.05),  # 5% evade chance bonus
+}
+
+
+def _build_table():
+    table = {}
+    for enchantment_type in EnchantmentType:
+        shared = _SHARED_BONUSES.get(enchantment_type, NO_BONUS)
+        table[enchantment_type, "weapon"] = shared.plus(_WEAPON_BONUSES.get(enchantment_type, NO_BONUS))
+        table[enchantment_type, "armor"] = shared.plus(_ARMOR_BONUSES.get(enchantment_type, NO_BONUS))
+    return table
+
+
+# (EnchantmentType, target_type) -> EnchantmentBonus, computed once at import
+ENCHANTMENT_BONUS_TABLE = _build_table()
+
+
+def get_enchantment_bonus_vector(enchantment_type, target_type):
+    """Get the bonus vector for an enchantment type applied to "weapon" or "armor"."""
+    return ENCHANTMENT_BONUS_TABLE[enchantment_type, target_type]
+
+
+def sum_enchantment_bonuses(enchantments, target_type):
+    """Sum the bonus vectors of a list of enchantments applied to the given target."""
+    total = NO_BONUS
+    for enchantment in enchantments:
+        total = total.plus(ENCHANTMENT_BONUS_TABLE[enchantment.type, target_type])
+    return total
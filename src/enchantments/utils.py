@@ -10,19 +10,19 @@ from .enchantment import Enchantment
 WEAPON_ENCHANT_CHANCE = 0.25
 ARMOR_ENCHANT_CHANCE = 0.25
 
+# Shared enchantment flyweights, built once at import
+WEAPON_ENCHANTMENTS = tuple(Enchantment(e, "weapon") for e in EnchantmentType if e.can_enchant_weapon)
+ARMOR_ENCHANTMENTS = tuple(Enchantment(e, "armor") for e in EnchantmentType if e.can_enchant_armor)
+
 
 def get_random_weapon_enchantment():
     """Get a random enchantment for weapons."""
-    weapon_enchantments = [e for e in EnchantmentType if e.can_enchant_weapon]
-    enchantment_type = random.choice(weapon_enchantments)
-    return Enchantment(enchantment_type, "weapon")
+    return random.choice(WEAPON_ENCHANTMENTS)
 
 
 def get_random_armor_enchantment():
     """Get a random enchantment for armor."""
-    armor_enchantments = [e for e in EnchantmentType if e.can_enchant_armor]
-    enchantment_type = random.choice(armor_enchantments)
-    return Enchantment(enchantment_type, "armor")
+    return random.choice(ARMOR_ENCHANTMENTS)
 
 
 def get_weapon_enchantment_by_type(enchantment_type):
@@ -49,6 +49,11 @@ def get_enchantment_by_type(enchantment_type):
     return get_weapon_enchantment_by_type(enchantment_type)
 
 
+def get_enchantment_from_code(code):
+    """Get the shared enchantment for a code produced by Enchantment.to_code."""
+    return Enchantment.from_code(code)
+
+
 def should_spawn_with_enchantment():
     """Check if a weapon should spawn with an enchantment."""
     return random.random() < WEAPON_ENCHANT_CHANCE
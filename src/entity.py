@@ -4,9 +4,10 @@ Base Entity class for Player and Monster.
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
-from traits import Trait
+from traits import Trait, TraitList, traits_to_mask
 from status_effects import StatusEffects
 from stats import Stats, StatType
+from trait_damage import monster_trait_damage
 
 
 @dataclass
@@ -23,6 +24,24 @@ class Entity:
     resistances: List[Trait] = field(default_factory=list)
     status_effects: StatusEffects = field(default_factory=StatusEffects)
     
+    def __post_init__(self):
+        # Keep trait lists as TraitLists so their bitmasks stay cached
+        self.attack_traits = TraitList(self.attack_traits)
+        self.weaknesses = TraitList(self.weaknesses)
+        self.resistances = TraitList(self.resistances)
+    
+    @property
+    def attack_mask(self):
+        return traits_to_mask(self.attack_traits)
+    
+    @property
+    def weakness_mask(self):
+        return traits_to_mask(self.weaknesses)
+    
+    @property
+    def resistance_mask(self):
+        return traits_to_mask(self.resistances)
+    
     @property
     def max_hp(self):
         return self.stats.get_stat(StatType.MAX_HP)
@@ -103,20 +122,8 @@ class Entity:
     
     def take_damage_with_traits(self, damage: int, attack_traits: Optional[List[Trait]] = None) -> int:
         """Take damage with trait consideration for resistances/weaknesses."""
-        if attack_traits is None:
-            attack_traits = []
-        
-        # Check for trait interactions - only apply ONE weakness or resistance
-        final_damage = damage
-        has_applied_modifier = False
-        
-        for trait in attack_traits:
-            if not has_applied_modifier and trait in self.resistances:
-                final_damage = int(final_damage * 0.5)  # 50% damage if resistant
-                has_applied_modifier = True
-            elif not has_applied_modifier and trait in self.weaknesses:
-                final_damage = int(final_damage * 1.5)  # 150% damage if weak (nerfed from 200%)
-                has_applied_modifier = True
+        # Only ONE weakness or resistance applies
+        final_damage = monster_trait_damage(damage, attack_traits or [], self.weakness_mask, self.resistance_mask)
         
         # Apply normal damage calculation
         actual_damage = max(1, final_damage - self.stats.get_stat(StatType.DEFENSE))
@@ -138,7 +145,9 @@ class Entity:
         self.x += dx
         self.y += dy
     
-    def render(self, console, fov) -> None:
-        """Render the entity on the console."""
+    def render(self, console, fov, camera=None) -> None:
+        """Render the entity on the console, offset by the camera if given."""
         if fov[self.x, self.y]:
-            console.print(self.x, self.y, self.character, fg=self.color)
\ No newline at end of file
+            position = camera.to_screen(self.x, self.y) if camera else (self.x, self.y)
+            if position:
+                console.print(*position, self.character, fg=self.color)
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""
+Player stats for hypothetical equipment, worked out without changing the player.
+"""
+
+import inspect
+import random
+from types import FunctionType
+
+from items.armor.base import Armor
+from items.equipment import Equipment
+from items.weapons.base import Weapon
+from stat_modifiers import STAT_DEFINITIONS, ModifierKind, get_item_modifiers, get_stat_definition
+from stat_modifiers.stat_pipeline import compile_modifiers, compile_step
+from stat_totals import StatTotals
+from traits import traits_to_mask
+
+
+# Bonus getters defined by these classes only read the item (unless enchantment bonuses are overridden)
+PLAIN_GETTER_CLASSES = (Equipment, Weapon, Armor)
+
+
+class EquipmentPreview:
+    """Works out the get_total_* stats the player would have with different equipment.
+
+    Each loadout gets a stand-in for the player that wears the hypothetical
+    equipment and reads everything else from the real player. The stand-in
+    runs Player's own methods against a pipeline of the loadout's
+    StatModifiers, applied in the same order and with the same finishes as
+    StatPipeline, so every registered stat matches equipping the items. The
+    player, its event subscriptions and its status effects are never touched,
+    and conditional bonuses (GravePact, SOSArmor) see the swapped loadout.
+
+    Each item's modifiers are evaluated once per preview: constants and the
+    plain bonus getters (which ignore the player) become numbers then, and
+    are reused by every loadout the item is in, as are the stats' base
+    values. Comparing a whole inventory therefore only re-runs the swapped
+    item, conditional and player-dependent modifiers, and FINAL ones. Make a
+    new preview when the player's stats or items change (e.g. once per frame).
+    """
+
+    # (item class, getter name) -> whether that getter ignores the player
+    _plain_getters = {}
+
+    def __init__(self, player):
+        """Initialize a preview of player's equipment."""
+        self.player = player
+        self._compiled_items = {}  # item -> (steps by stat, finals, traits), see _compile
+        self._bases = {}  # stat -> its base value for the player
+        self._current = None
+
+    def current(self):
+        """Get the StatTotals for the equipment the player is wearing."""
+        if self._current is None:
+            self._current = self.with_equipment(self.player.weapon, self.player.armor, self.player.accessories)
+        return self._current
+
+    def with_item(self, item, slot=None):
+        """Get the StatTotals if item were equipped in place of what is in its slot.
+
+        slot picks the accessory slot to put an accessory in; by default it goes
+        in the first empty one, and None is returned if all are full (the game
+        asks which to replace). Items that cannot be equipped give None too.
+        """
+        weapon, armor, accessories = self.player.weapon, self.player.armor, list(self.player.accessories)
+        equipment_slot = getattr(item, 'equipment_slot', None)
+        if equipment_slot == 'weapon':
+            weapon = item
+        elif equipment_slot == 'armor':
+            armor = item
+        elif equipment_slot == 'accessory':
+            if slot is None:
+                if None not in accessories:
+                    return None
+                slot = accessories.index(None)
+            accessories[slot] = item
+        else:
+            return None
+        return self.with_equipment(weapon, armor, accessories)
+
+    def describe_change(self, item, slot=None):
+        """Describe how equipping item would change the player's stats, like "+3 ATK / -1 DEF"."""
+        totals = self.with_item(item, slot)
+        return totals.describe_change(self.current()) if totals is not None else ""
+
+    def with_equipment(self, weapon, armor, accessories):
+        """Get the StatTotals for any weapon, armor and list of accessory slots (None for empty)."""
+        # Some items roll their bonuses (GamblersVest); previews must not move the game's random state
+        state = random.getstate()
+        try:
+            return self._totals(weapon, armor, accessories)
+        finally:
+            random.setstate(state)
+
+    def _totals(self, weapon, armor, accessories):
+        """Work out the StatTotals for a loadout."""
+        player = self.player
+        view = _EquipmentView(player, weapon, armor, list(accessories))
+        compiled = []
+        for item in (weapon, armor, *accessories):
+            if item is not None:
+                if item not in self._compiled_items:
+                    self._compiled_items[item] = self._compile(item)
+                compiled.append(self._compiled_items[item])
+        pipeline = view._stat_pipeline = _LoadoutPipeline(compiled, self._bases)
+        stats = {stat: pipeline.evaluate(stat, view) for stat in STAT_DEFINITIONS}
+
+        # Traits as Player totals them
+        attack_traits = list(player.attack_traits)
+        weaknesses, resistances = list(player.weaknesses), list(player.resistances)
+        for _, _, (item_attack_traits, item_weaknesses, item_resistances) in compiled:
+            attack_traits.extend(item_attack_traits)
+            weaknesses.extend(item_weaknesses)
+            resistances.extend(item_resistances)
+        weakness_mask, resistance_mask = traits_to_mask(weaknesses), traits_to_mask(resistances)
+
+        return StatTotals(
+            attack=stats['attack'],
+            defense=stats['defense'],
+            fov=stats['fov'],
+            health_aspect=stats['health_aspect'],
+            attack_multiplier=stats['attack_multiplier'],
+            defense_multiplier=stats['defense_multiplier'],
+            xp_multiplier=stats['xp_multiplier'],
+            evade=stats['evade'],
+            crit=stats['crit'],
+            crit_multiplier=stats['crit_multiplier'],
+            attack_traits=tuple(attack_traits),
+            weaknesses=tuple(weakness for weakness in weaknesses if weakness not in resistances),
+            resistances=tuple(resistance for resistance in resistances if resistance not in weaknesses),
+            attack_trait_mask=traits_to_mask(attack_traits),
+            weakness_mask=weakness_mask & ~resistance_mask,
+            resistance_mask=resistance_mask & ~weakness_mask,
+            stats=stats,
+        )
+
+    def _compile(self, item):
+        """Evaluate what an item can once for the whole preview.
+
+        Returns (steps by stat, finals, traits). Each step is (multiply,
+        number, None) for a value worked out now, or (multiply, None,
+        value(player)) for one that must be worked out per loadout. Numbers
+        that leave every total as it is (adding 0, multiplying by 1) are
+        dropped. Items lacking trait getters add no traits.
+        """
+        steps, finals = {}, []
+        for modifier in get_item_modifiers(item):
+            if modifier.kind is ModifierKind.FINAL:
+                finals.append(modifier)
+                continue
+            stat, = modifier.stats
+            multiply, value = modifier.kind is ModifierKind.MULTIPLIER, modifier.value
+            if modifier.condition is None and (not callable(value) or self._ignores_player(item, value)):
+                number = value(self.player) if callable(value) else value
+                if number == (1 if multiply else 0) and self._keeps_type(stat, number):
+                    continue
+                step = (multiply, number, None)
+            else:
+                step = (multiply, None, compile_step(modifier)[1])
+            steps.setdefault(stat, []).append(step)
+        traits = tuple(tuple(_traits(item, getter)) for getter in ('get_attack_traits', 'get_weaknesses',
+                                                                   'get_resistances'))
+        return steps, compile_modifiers(finals)[1], traits
+
+    def _keeps_type(self, stat, number):
+        """Check whether stat's total has number's type already, so adding or multiplying by it cannot change it.
+
+        Int numbers never change a total's type; float ones need a float base
+        (totals only turn from int to float).
+        """
+        if type(number) is int:
+            return True
+        if type(number) is not float or stat not in STAT_DEFINITIONS:
+            return False
+        if stat not in self._bases:
+            self._bases[stat] = get_stat_definition(stat).base(self.player)
+        return type(self._bases[stat]) is float
+
+    @classmethod
+    def _ignores_player(cls, item, value):
+        """Check whether a modifier's value is one of item's plain bonus getters."""
+        if getattr(value, '__self__', None) is not item or not hasattr(value, '__func__'):
+            return False
+        key = (type(item), value.__name__)
+        if key not in cls._plain_getters:
+            cls._plain_getters[key] = (getattr(key[0], '_default_enchantment_bonus', True)
+                                       and _defining_class(key[0], key[1]) in PLAIN_GETTER_CLASSES)
+        return cls._plain_getters[key]
+
+
+class _LoadoutPipeline:
+    """A loadout's stats from its items' evaluated steps, in StatPipeline's order; each is worked out once."""
+
+    def __init__(self, compiled, bases):
+        self._steps = {}  # stat -> the steps of every item, in item order
+        for steps, _, _ in compiled:
+            for stat, item_steps in steps.items():
+                if stat in self._steps:
+                    self._steps[stat] = self._steps[stat] + item_steps
+                else:
+                    self._steps[stat] = item_steps
+        self._bases = bases  # stat -> base value, shared by a preview's loadouts
+        self._finals = [final for _, finals, _ in compiled for final in finals]
+        # Stats the FINAL modifiers rewrite, in the order they are first worked out
+        self._final_stats = tuple(dict.fromkeys(stat for stats, _ in self._finals for stat in stats))
+        self._before_finals = {}
+        self._totals = {}
+
+    def evaluate(self, stat, player):
+        """Work out a stat for player."""
+        if stat not in self._totals:
+            if stat not in self._final_stats:
+                self._totals[stat] = self.before_finals(stat, player)
+            else:
+                values = {name: self.before_finals(name, player) for name in self._final_stats}
+                for stats, apply in self._finals:
+                    values.update(zip(stats, apply(player, values)))
+                self._totals.update(values)
+        return self._totals[stat]
+
+    def before_finals(self, stat, player):
+        """Work out a stat without its FINAL modifiers."""
+        if stat not in self._before_finals:
+            definition = get_stat_definition(stat)
+            if stat not in self._bases:
+                self._bases[stat] = definition.base(player)
+            total = self._run_steps(stat, self._bases[stat], player)
+            if definition.finish is not None:
+                total = definition.finish(total, player)
+            self._before_finals[stat] = total
+        return self._before_finals[stat]
+
+    def bonus(self, stat, player):
+        """Get what the modifiers add to a stat on their own (its steps run from 0)."""
+        return self._run_steps(stat, 0, player)
+
+    def _run_steps(self, stat, total, player):
+        """Run a stat's steps over total."""
+        for multiply, number, value in self._steps.get(stat, ()):
+            if value is not None:
+                number = value(player)
+            total = total * number if multiply else total + number
+        return total
+
+
+class _EquipmentView:
+    """The player as seen wearing other equipment; everything else is read from the player.
+
+    Player methods are bound to the view, so get_total_attack_traits and the
+    like see the view's equipment. Setting attributes only changes the view.
+    """
+
+    # (player class, name) -> the plain function Player defines for it, or None
+    _functions = {}
+
+    def __init__(self, player, weapon, armor, accessories):
+        self._player = player
+        self.weapon = weapon
+        self.armor = armor
+        self.accessories = accessories
+        self._stat_pipeline = None
+
+    def __getattr__(self, name):
+        key = (type(self._player), name)
+        function = self._functions.get(key, False)
+        if function is False:
+            attribute = inspect.getattr_static(key[0], name, None)
+            function = self._functions[key] = attribute if isinstance(attribute, FunctionType) else None
+        # Keep what was found so later lookups skip __getattr__ (a view lasts for one preview)
+        value = self.__dict__[name] = getattr(self._player, name) if function is None else function.__get__(self)
+        return value
+
+
+def _traits(item, getter):
+    """Get the traits one of item's trait getters lists, or none if it has no such getter."""
+    method = getattr(item, getter, None)
+    return method() if method is not None else ()
+
+
+def _defining_class(item_class, name):
+    """Get the class in item_class's MRO that defines attribute name."""
+    return next((klass for klass in item_class.__mro__ if name in vars(klass)), None)
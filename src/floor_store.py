@@ -0,0 +1,138 @@
+"""
+Floor store for keeping visited floors and bases so they can be revisited.
+"""
+
+import os
+import pickle
+import tempfile
+import zlib
+from collections import OrderedDict
+
+
+class FloorStore:
+    """Keeps visited areas (Level or Base) in memory up to a byte budget.
+
+    Areas are keyed by ('floor', number) or ('base', number). When the
+    estimated size of the areas held in memory goes over the budget, the least
+    recently stored ones are spilled to compressed snapshots on disk. Taking an
+    area back restores it exactly, whether it was in memory or on disk.
+    """
+
+    DEFAULT_MEMORY_BUDGET = 1024 * 1024
+
+    # Rough in-memory cost of one monster or item (object, stats, status effects)
+    ENTITY_BYTES = 2048
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, spill_dir=None):
+        """Initialize an empty store; spill_dir defaults to a temporary directory."""
+        self.memory_budget = memory_budget
+        self._spill_dir = spill_dir
+        self._temp_dir = None  # Created on first spill when no spill_dir is given
+        self._in_memory = OrderedDict()  # key -> (area, estimated bytes)
+        self._on_disk = {}  # key -> snapshot path
+        self.memory_bytes = 0
+        self.spills = 0
+        self.restores = 0
+
+    @staticmethod
+    def floor_key(floor_number):
+        """Get the store key for a dungeon floor."""
+        return ('floor', floor_number)
+
+    @staticmethod
+    def base_key(base_number):
+        """Get the store key for a base."""
+        return ('base', base_number)
+
+    def __contains__(self, key):
+        return key in self._in_memory or key in self._on_disk
+
+    def __len__(self):
+        return len(self._in_memory) + len(self._on_disk)
+
+    def put(self, key, area):
+        """Store an area, spilling older areas to disk if over the memory budget."""
+        self.discard(key)
+        size = self.estimate_bytes(area)
+        self._in_memory[key] = (area, size)
+        self.memory_bytes += size
+
+        # Always keep the newest area in memory, even if it alone is over budget
+        while self.memory_bytes > self.memory_budget and len(self._in_memory) > 1:
+            self._spill_oldest()
+
+    def take(self, key):
+        """Remove and return a stored area, or None if it was never stored."""
+        if key in self._in_memory:
+            area, size = self._in_memory.pop(key)
+            self.memory_bytes -= size
+            return area
+
+        path = self._on_disk.pop(key, None)
+        if path is None:
+            return None
+        with open(path, 'rb') as snapshot:
+            area = pickle.loads(zlib.decompress(snapshot.read()))
+        os.remove(path)
+        self.restores += 1
+        return area
+
+    def discard(self, key):
+        """Forget a stored area, if any."""
+        if key in self._in_memory:
+            _, size = self._in_memory.pop(key)
+            self.memory_bytes -= size
+        path = self._on_disk.pop(key, None)
+        if path is not None:
+            os.remove(path)
+
+    def clear(self):
+        """Forget every stored area."""
+        for key in list(self._in_memory) + list(self._on_disk):
+            self.discard(key)
+
+    def is_on_disk(self, key):
+        """Check if an area has been spilled to disk."""
+        return key in self._on_disk
+
+    def _spill_oldest(self):
+        """Write the least recently stored in-memory area to disk."""
+        key, (area, size) = self._in_memory.popitem(last=False)
+        self.memory_bytes -= size
+
+        path = os.path.join(self._get_spill_dir(), f"{key[0]}_{key[1]}.snapshot")
+        with open(path, 'wb') as snapshot:
+            snapshot.write(zlib.compress(pickle.dumps(area, pickle.HIGHEST_PROTOCOL)))
+        self._on_disk[key] = path
+        self.spills += 1
+
+    def _get_spill_dir(self):
+        """Get the directory snapshots are written to, creating it if needed."""
+        if self._spill_dir is not None:
+            os.makedirs(self._spill_dir, exist_ok=True)
+            return self._spill_dir
+        if self._temp_dir is None:
+            # Removed automatically when the store is garbage collected or at exit
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="floors-")
+        return self._temp_dir.name
+
+    @classmethod
+    def estimate_bytes(cls, area):
+        """Estimate the memory held by an area: map arrays, cached FOV and entities."""
+        size = area.tiles.nbytes + area.explored.nbytes + area.fov.nbytes
+        # FOV map holds transparent, walkable and fov flags, one byte each per tile
+        size += 3 * area.tiles.size
+        size += area.fov_cache.nbytes
+        size += cls.ENTITY_BYTES * (len(area.monsters) + len(area.items))
+        return size
+
+    def get_stats(self):
+        """Get counts of stored areas and disk traffic."""
+        return {
+            'in_memory': len(self._in_memory),
+            'on_disk': len(self._on_disk),
+            'memory_bytes': self.memory_bytes,
+            'memory_budget': self.memory_budget,
+            'spills': self.spills,
+            'restores': self.restores,
+        }
@@ -5,19 +5,29 @@ Main Game class - handles the core game loop and state management.
 import tcod
 import tcod.event
 
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, TILE_WALL, COLOR_GREEN, COLOR_YELLOW
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, TITLE, COLOR_GREEN, COLOR_YELLOW, ATTACK_NOISE_RADIUS, ACTIVE_RADIUS
 from items.factory import create_random_item_for_level
 import random
-from player import Player
-from level.level import Level
-from level.base import Base
-from level_manager import LevelManager
+from level.tile_types import TILE_WALKABLE
 from ui import UI
-from traits import Trait
+from traits import traits_to_mask
 from event_emitter import EventEmitter
 from event_type import EventType
 from event_context import ConsumeContext, AttackContext, DeathContext, FloorContext
 from shop_manager import ShopManager
+from world_prefetcher import WorldPrefetcher
+from camera import Camera
+from combat import CombatResolver, CombatantSnapshot
+
+
+# Message shown after the target's name when an attack inflicts a status
+STATUS_MESSAGES = {
+    'stun': "become stunned!",
+    'burn': "start burning!",
+    'blinded': "become blinded!",
+    'frightened': "become frightened!",
+    'poison': "become poisoned!",
+}
 
 
 class Game:
@@ -28,24 +38,17 @@ class Game:
         # Set up the console
         self.console = tcod.console.Console(SCREEN_WIDTH, SCREEN_HEIGHT, order="F")
         
-        # Initialize level manager and game state
-        self.level_manager = LevelManager()
-        self.level = self.level_manager.get_current_area()
+        # World creation is deferred until a game starts (or the world is first
+        # accessed); the next world is prefetched in the background from the menu
+        self.world_prefetcher = WorldPrefetcher()
+        self._level_manager = None
+        self._level = None
+        self._player = None
         
-        # Place player at stairs up position (or first room if no stairs)
-        if hasattr(self.level, 'stairs_up_pos') and self.level.stairs_up_pos:
-            start_x, start_y = self.level.stairs_up_pos
-        elif len(self.level.rooms) > 0:
-            start_x, start_y = self.level.rooms[0].center()
-        else:
-            start_x, start_y = 10, 10
-        
-        self.player = Player(x=start_x, y=start_y)
         self.ui = UI()
         self.shop_manager = ShopManager()  # Initialize shop manager
-        
-        # Initialize FOV for starting position
-        self.level.update_fov(self.player.x, self.player.y, self.player.get_total_fov())
+        self.camera = Camera()  # Window of the map shown above the UI panel
+        self.combat_resolver = CombatResolver()
         
         # Game state flags
         self.running = True
@@ -66,6 +69,49 @@ class Game:
         # ESC quit confirmation tracking
         self.esc_pressed_once = False
     
+    @property
+    def level_manager(self):
+        """The level manager, creating the world on first access."""
+        if self._level_manager is None:
+            self._load_world()
+        return self._level_manager
+    
+    @level_manager.setter
+    def level_manager(self, level_manager):
+        self._level_manager = level_manager
+    
+    @property
+    def level(self):
+        """The current area, creating the world on first access."""
+        if self._level is None:
+            self._load_world()
+        return self._level
+    
+    @level.setter
+    def level(self, level):
+        self._level = level
+    
+    @property
+    def player(self):
+        """The player, creating the world on first access."""
+        if self._player is None:
+            self._load_world()
+        return self._player
+    
+    @player.setter
+    def player(self, player):
+        self._player = player
+    
+    def _load_world(self):
+        """Fill in any missing world state from the prefetcher."""
+        level_manager, player = self.world_prefetcher.take()
+        if self._level_manager is None:
+            self._level_manager = level_manager
+        if self._level is None:
+            self._level = self._level_manager.get_current_area()
+        if self._player is None:
+            self._player = player
+    
     def run(self):
         """Main game loop."""
         # Create the tcod context for rendering
@@ -78,6 +124,10 @@ class Game:
         ) as context:
             
             while self.running:
+                # Generate the next world while the menu is up so 'N' starts instantly
+                if self.game_state == 'MENU':
+                    self.world_prefetcher.start()
+                
                 # Reset player action flag
                 self.player_acted_this_frame = False
                 
@@ -343,53 +393,21 @@ class Game:
     
     def calculate_aspect_damage_multiplier(self, attack_traits, target_weaknesses, target_resistances):
         """Calculate damage multiplier based on aspects vs weaknesses/resistances."""
-        multiplier = 1.0
-        
-        for trait in attack_traits:
-            if trait in target_weaknesses:
-                multiplier *= 1.5  # 1.5x damage for weakness
-            elif trait in target_resistances:
-                multiplier *= 0.5  # 0.5x damage for resistance
-        
-        return multiplier
+        return CombatResolver.aspect_multiplier(
+            attack_traits, traits_to_mask(target_weaknesses), traits_to_mask(target_resistances)
+        )
     
     def apply_elemental_status_effects(self, attack_traits, target):
         """Apply status effects based on elemental attack traits."""
-        from traits import Trait
-        import random
-        
-        for trait in attack_traits:
-            # Only apply if target is not resistant to this trait
-            if trait not in target.resistances:
-                if trait == Trait.ICE:
-                    if random.random() < 0.25:  # 25% chance
-                        if target.status_effects.apply_status('stun', 3, target):
-                            entity_name = target.name if hasattr(target, 'name') else 'You'
-                            self.ui.add_message(f"{entity_name} become stunned!")
-                        
-                elif trait == Trait.FIRE:
-                    if random.random() < 0.5:  # 50% chance
-                        if target.status_effects.apply_status('burn', 4, target):
-                            entity_name = target.name if hasattr(target, 'name') else 'You'
-                            self.ui.add_message(f"{entity_name} start burning!")
-                        
-                elif trait == Trait.HOLY:
-                    if random.random() < 0.5:  # 50% chance
-                        if target.status_effects.apply_status('blinded', 3, target):
-                            entity_name = target.name if hasattr(target, 'name') else 'You'
-                            self.ui.add_message(f"{entity_name} become blinded!")
-                        
-                elif trait == Trait.DARK:
-                    # DARK always applies (100% chance)
-                    if target.status_effects.apply_status('frightened', 2, target):
-                        entity_name = target.name if hasattr(target, 'name') else 'You'
-                        self.ui.add_message(f"{entity_name} become frightened!")
-                    
-                elif trait == Trait.POISON:
-                    # POISON always applies (100% chance)
-                    if target.status_effects.apply_status('poison', 2, target):
-                        entity_name = target.name if hasattr(target, 'name') else 'You'
-                        self.ui.add_message(f"{entity_name} become poisoned!")
+        statuses = self.combat_resolver.roll_statuses(attack_traits, traits_to_mask(target.resistances), random)
+        self.apply_status_effects(statuses, target)
+    
+    def apply_status_effects(self, statuses, target):
+        """Apply (status, amount) pairs from an attack outcome to its target."""
+        for status, amount in statuses:
+            if target.status_effects.apply_status(status, amount, target):
+                entity_name = target.name if hasattr(target, 'name') else 'You'
+                self.ui.add_message(f"{entity_name} {STATUS_MESSAGES[status]}")
     
     def process_status_effects_turn_start(self, entity):
         """Process status effects at the start of an entity's turn."""
@@ -408,40 +426,22 @@ class Game:
     
     def player_attack_monster(self, monster):
         """Player attacks a monster."""
-        # Apply status effect modifiers to attack
-        attack_modifier = self.player.status_effects.get_attack_modifier()
-        miss_chance_increase = self.player.status_effects.get_miss_chance_increase()
-        can_crit = self.player.status_effects.can_crit()
+        # Fighting wakes dormant monsters nearby
+        self.level.make_noise(monster.x, monster.y, ATTACK_NOISE_RADIUS)
         
-        # Check for miss (including blinded effect)
-        base_miss_chance = 0.05  # 5% base miss chance
-        total_miss_chance = min(0.95, base_miss_chance + (miss_chance_increase / 100.0))
+        attacker = CombatantSnapshot.from_player(self.player, target=monster)
+        outcome = self.combat_resolver.resolve(attacker, CombatantSnapshot.from_monster(monster), random)
+        self.spend_statuses(self.player, outcome.attacker_spent)
+        self.spend_statuses(monster, outcome.defender_spent)
         
-        if random.random() < total_miss_chance:
-            if miss_chance_increase > 0:
+        event_emitter = EventEmitter()
+        if outcome.missed or outcome.evaded:
+            if outcome.missed and attacker.blinded > 0:
                 self.ui.add_message(f"You attack {monster.name} blindly and miss!")
             else:
                 self.ui.add_message(f"You try to attack {monster.name} and miss!")
             
             # Emit miss event
-            event_emitter = EventEmitter()
-            context = AttackContext(
-                player=self.player,
-                attacker=self.player,
-                defender=monster,
-                damage=0,
-                is_critical=False,
-                is_miss=True
-            )
-            event_emitter.emit(EventType.MISS, context)
-            return
-        
-        # Check for evade
-        if random.random() < monster.evade:
-            self.ui.add_message(f"You try to attack {monster.name} and miss!")
-            
-            # Emit miss event
-            event_emitter = EventEmitter()
             context = AttackContext(
                 player=self.player,
                 attacker=self.player,
@@ -453,42 +453,16 @@ class Game:
             event_emitter.emit(EventType.MISS, context)
             return
         
-        # Calculate base damage (with frightened modifier)
-        damage = self.player.get_total_attack() + attack_modifier
-        damage = max(1, damage)  # Ensure minimum 1 damage
-        
-        # Check for critical hit (blocked by blinded)
-        is_crit = can_crit and random.random() < self.player.get_total_crit()
-        if is_crit:
-            damage = int(damage * self.player.get_total_crit_multiplier())
+        if outcome.critical:
             self.player.crit_count += 1
         
-        # Apply aspect damage multipliers (after crit calculation)
-        player_traits = self.player.get_total_attack_traits()
-        aspect_multiplier = self.calculate_aspect_damage_multiplier(
-            player_traits, monster.weaknesses, monster.resistances
-        )
-        damage = int(damage * aspect_multiplier)
-        
-        # Apply accessory damage bonuses (like PunishTheWeak)
-        for accessory in self.player.equipped_accessories():
-            if hasattr(accessory, 'get_damage_multiplier_vs_target'):
-                accessory_multiplier = accessory.get_damage_multiplier_vs_target(monster)
-                damage = int(damage * accessory_multiplier)
-        
-        # Check if weakness was exploited or resistance was applied
-        weakness_exploited = any(trait in monster.weaknesses for trait in player_traits)
-        resistance_applied = any(trait in monster.resistances for trait in player_traits)
-        
-        # Check if shields absorb the attack
-        if monster.status_effects.absorb_attack():
-            actual_damage = 0
+        if outcome.absorbed:
             self.ui.add_message(f"The {monster.name}'s shields absorb the attack!")
         else:
-            actual_damage = monster.take_damage_with_traits(damage, player_traits)
+            monster.hp = max(0, monster.hp - outcome.damage)
             
-            # Apply elemental status effects if monster is not resistant to the trait
-            self.apply_elemental_status_effects(player_traits, monster)
+            # Apply elemental status effects the monster did not resist
+            self.apply_status_effects(outcome.statuses, monster)
             
             # Apply weapon on-hit effects
             if self.player.weapon and hasattr(self.player.weapon, 'on_hit'):
@@ -496,47 +470,28 @@ class Game:
                 if hit_message:
                     self.ui.add_message(hit_message)
         
-        # Add weakness/resistance messages first if applicable
-        if weakness_exploited and not resistance_applied:
-            self.ui.add_message("Weakness exploited!")
-        elif resistance_applied and not weakness_exploited:
-            self.ui.add_message("Resistant!")
-        # If both apply, don't add any extra message
+        self.add_trait_interaction_message(outcome.trait_interaction)
         
         # Create appropriate message
-        if is_crit:
-            message = f"You critical hit on the {monster.name} for {actual_damage}!"
+        if outcome.critical:
+            message = f"You critical hit on the {monster.name} for {outcome.damage}!"
         else:
-            message = f"You attack the {monster.name} for {actual_damage}!"
+            message = f"You attack the {monster.name} for {outcome.damage}!"
         
         self.ui.add_message(message)
         
         # Emit player attack event
-        event_emitter = EventEmitter()
-        trait_interaction = None
-        if weakness_exploited and not resistance_applied:
-            trait_interaction = "weakness"
-        elif resistance_applied and not weakness_exploited:
-            trait_interaction = "resistance"
-        
         context = AttackContext(
             player=self.player,
             attacker=self.player,
             defender=monster,
-            damage=actual_damage,
-            is_critical=is_crit,
+            damage=outcome.damage,
+            is_critical=outcome.critical,
             is_miss=False,
-            trait_interaction=trait_interaction
+            trait_interaction=outcome.trait_interaction
         )
         event_emitter.emit(EventType.PLAYER_ATTACK_MONSTER, context)
-        
-        # Emit trait-specific events
-        if is_crit:
-            event_emitter.emit(EventType.CRITICAL_HIT, context)
-        if weakness_exploited and not resistance_applied:
-            event_emitter.emit(EventType.WEAKNESS_HIT, context)
-        elif resistance_applied and not weakness_exploited:
-            event_emitter.emit(EventType.RESISTANCE_HIT, context)
+        self.emit_attack_trait_events(event_emitter, outcome, context)
         
         # Check if monster died
         if not monster.is_alive():
@@ -581,14 +536,21 @@ class Game:
     
     def monster_attack_player(self, monster):
         """Monster attacks the player."""
-        # Check for evade
-        if random.random() < self.player.get_total_evade():
-            self.ui.add_message(f"The {monster.name} tries to attack you and misses!")
+        outcome = self.combat_resolver.resolve(
+            CombatantSnapshot.from_monster(monster), CombatantSnapshot.from_player(self.player), random
+        )
+        self.spend_statuses(self.player, outcome.defender_spent)
+        
+        event_emitter = EventEmitter()
+        if outcome.evaded or outcome.dodged:
             self.player.dodge_count += 1
+            if outcome.evaded:
+                self.ui.add_message(f"The {monster.name} tries to attack you and misses!")
+            else:
+                self.ui.add_message("You dodged the attack!")
             
             # Emit successful dodge event
-            event_emitter = EventEmitter()
-            context = AttackContext(
+            dodge_context = AttackContext(
                 player=self.player,
                 attacker=monster,
                 defender=self.player,
@@ -596,104 +558,39 @@ class Game:
                 is_critical=False,
                 is_miss=True
             )
-            event_emitter.emit(EventType.SUCCESSFUL_DODGE, context)
-            return
-        
-        # Calculate base damage
-        damage = monster.attack
-        
-        # Check for critical hit
-        is_crit = random.random() < monster.crit
-        if is_crit:
-            damage = int(damage * monster.crit_multiplier)
-        
-        # Apply aspect damage multipliers (after crit calculation)
-        monster_traits = monster.attack_traits
-        player_weaknesses = self.player.get_total_weaknesses()
-        player_resistances = self.player.get_total_resistances()
-        aspect_multiplier = self.calculate_aspect_damage_multiplier(
-            monster_traits, player_weaknesses, player_resistances
-        )
-        damage = int(damage * aspect_multiplier)
-        
-        # Check if weakness was exploited or resistance was applied
-        weakness_exploited = any(trait in player_weaknesses for trait in monster_traits)
-        resistance_applied = any(trait in player_resistances for trait in monster_traits)
-        
-        # Check if shields absorb the attack
-        if self.player.status_effects.absorb_attack():
-            actual_damage = 0
+            event_emitter.emit(EventType.SUCCESSFUL_DODGE, dodge_context)
+            if outcome.evaded:
+                return
+        elif outcome.absorbed:
             self.ui.add_message("Your shields absorb the attack!")
         else:
-            # Apply status effect modifiers to defense and evade
-            effective_defense = self.player.status_effects.get_effective_defense(self.player.get_total_defense())
-            effective_evade = self.player.status_effects.get_effective_evade(self.player.get_total_evade())
+            self.player.hp = max(0, self.player.hp - outcome.damage)
             
-            # Check for evade first
-            if random.random() < effective_evade:
-                actual_damage = 0
-                self.player.dodge_count += 1
-                self.ui.add_message("You dodged the attack!")
-                
-                # Emit successful dodge event
-                event_emitter = EventEmitter()
-                dodge_context = AttackContext(
-                    player=self.player,
-                    attacker=monster,
-                    defender=self.player,
-                    damage=0,
-                    is_critical=False,
-                    is_miss=True
-                )
-                event_emitter.emit(EventType.SUCCESSFUL_DODGE, dodge_context)
-            else:
-                # Apply damage with traits
-                actual_damage = self.player.take_damage_with_traits(damage, monster_traits)
-                
-                # Apply elemental status effects if player is not resistant to the trait
-                self.apply_elemental_status_effects(monster_traits, self.player)
+            # Apply elemental status effects the player did not resist
+            self.apply_status_effects(outcome.statuses, self.player)
         
-        # Add weakness/resistance messages first if applicable
-        if weakness_exploited and not resistance_applied:
-            self.ui.add_message("Weakness exploited!")
-        elif resistance_applied and not weakness_exploited:
-            self.ui.add_message("Resistant!")
-        # If both apply, don't add any extra message
+        self.add_trait_interaction_message(outcome.trait_interaction)
         
         # Create appropriate message
-        if is_crit:
-            message = f"The {monster.name} critical hits you for {actual_damage}!"
+        if outcome.critical:
+            message = f"The {monster.name} critical hits you for {outcome.damage}!"
         else:
-            message = f"The {monster.name} attacks you for {actual_damage}!"
+            message = f"The {monster.name} attacks you for {outcome.damage}!"
         
         self.ui.add_message(message)
         
         # Emit monster attack event
-        event_emitter = EventEmitter()
-        trait_interaction = None
-        if weakness_exploited and not resistance_applied:
-            trait_interaction = "weakness"
-        elif resistance_applied and not weakness_exploited:
-            trait_interaction = "resistance"
-        
         attack_context = AttackContext(
             player=self.player,
             attacker=monster,
             defender=self.player,
-            damage=actual_damage,
-            is_critical=is_crit,
+            damage=outcome.damage,
+            is_critical=outcome.critical,
             is_miss=False,
-            trait_interaction=trait_interaction
+            trait_interaction=outcome.trait_interaction
         )
         event_emitter.emit(EventType.MONSTER_ATTACK_PLAYER, attack_context)
-        
-        # Emit trait-specific events
-        if is_crit:
-            event_emitter.emit(EventType.CRITICAL_HIT, attack_context)
-        if weakness_exploited and not resistance_applied:
-            event_emitter.emit(EventType.WEAKNESS_HIT, attack_context)
-        elif resistance_applied and not weakness_exploited:
-            event_emitter.emit(EventType.RESISTANCE_HIT, attack_context)
+        self.emit_attack_trait_events(event_emitter, outcome, attack_context)
         
         # Check if player died
         if not self.player.is_alive():
@@ -701,46 +598,91 @@ class Game:
             self.ui.add_message(death_message)
             self.game_state = 'DEAD'
     
+    def spend_statuses(self, entity, statuses):
+        """Use up one turn of each named status counter, as reported by an attack outcome."""
+        for status in statuses:
+            entity.status_effects.remove_status(status, 1)
+    
+    def add_trait_interaction_message(self, trait_interaction):
+        """Show whether an attack exploited a weakness or hit a resistance (nothing if both or neither)."""
+        if trait_interaction == 'weakness':
+            self.ui.add_message("Weakness exploited!")
+        elif trait_interaction == 'resistance':
+            self.ui.add_message("Resistant!")
+    
+    def emit_attack_trait_events(self, event_emitter, outcome, context):
+        """Emit the critical hit and weakness/resistance events for an attack that was not missed."""
+        if outcome.critical:
+            event_emitter.emit(EventType.CRITICAL_HIT, context)
+        if outcome.trait_interaction == 'weakness':
+            event_emitter.emit(EventType.WEAKNESS_HIT, context)
+        elif outcome.trait_interaction == 'resistance':
+            event_emitter.emit(EventType.RESISTANCE_HIT, context)
+    
     def process_monster_turns(self):
-        """Process AI turns for all monsters."""
-        for monster in self.level.monsters:
-            if monster.is_alive():
-                # Process status effects at turn start
-                should_skip_turn = self.process_status_effects_turn_start(monster)
-                if not should_skip_turn:
-                    self.monster_take_turn(monster)
+        """Advance one player turn and process AI turns for monsters whose action time has come.
+        
+        Dormant monsters are woken first if the player is near or in view; until then
+        they are not scheduled, so they cost nothing. Every awake monster's status
+        effects tick when its action comes due, but only those within ACTIVE_RADIUS
+        of the player, which is also the region the scent map is updated over, run
+        their AI. Floors in respawn mode then get any wave that has come due.
+        """
+        self.level.wake_monsters_around_player(self.player.x, self.player.y)
+        x1, y1 = self.player.x - ACTIVE_RADIUS, self.player.y - ACTIVE_RADIUS
+        x2, y2 = self.player.x + ACTIVE_RADIUS + 1, self.player.y + ACTIVE_RADIUS + 1
+        self.level.update_scent(self.player.x, self.player.y, (x1, y1, x2, y2))
+        
+        def act(monster):
+            if not monster.is_alive():
+                return False  # Dead monsters leave the schedule
+            # Process status effects at turn start, wherever the monster is
+            should_skip_turn = self.process_status_effects_turn_start(monster)
+            # Only monsters in the active region around the player act
+            if not should_skip_turn and x1 <= monster.x < x2 and y1 <= monster.y < y2:
+                self.monster_take_turn(monster)
+            return monster.is_alive()
+        
+        self.level.scheduler.advance(act)
+        self.level.spawn_wave_if_due()
     
     def monster_take_turn(self, monster):
         """Process a single monster's turn."""
+        step = None
+        
+        # Ranged monsters attack from anywhere in range that the player can see
+        if monster.attack_range > 1 and self.level.in_firing_range(
+                monster.x, monster.y, self.player.x, self.player.y, monster.attack_range):
+            monster.has_seen_player = True
+            self.monster_attack_player(monster)
+            return
+        
         # Check if monster can see player
         if monster.can_see_player(self.player.x, self.player.y, self.level.fov):
             monster.has_seen_player = True
-            monster.target_x = self.player.x
-            monster.target_y = self.player.y
-            monster.turns_since_seen_player = 0
-        elif monster.has_seen_player:
-            # Continue tracking for a few turns even if player goes out of sight
-            monster.turns_since_seen_player += 1
-            if monster.turns_since_seen_player > 5:
-                monster.has_seen_player = False
-                monster.target_x = None
-                monster.target_y = None
-        
-        # If monster knows where player is, move toward them
-        if monster.has_seen_player and monster.target_x is not None:
-            # Simple AI: move directly toward target
+            
+            # Simple AI: move directly toward the player
             dx = 0
             dy = 0
             
-            if monster.x < monster.target_x:
+            if monster.x < self.player.x:
                 dx = 1
-            elif monster.x > monster.target_x:
+            elif monster.x > self.player.x:
                 dx = -1
                 
-            if monster.y < monster.target_y:
+            if monster.y < self.player.y:
                 dy = 1
-            elif monster.y > monster.target_y:
+            elif monster.y > self.player.y:
                 dy = -1
+            step = (dx, dy)
+        elif monster.has_seen_player:
+            # Out of sight: follow the player's scent until the trail goes cold
+            step = self.level.scent.follow(monster.x, monster.y)
+            if step is None:
+                monster.has_seen_player = False
+        
+        if step is not None:
+            dx, dy = step
             
             # Try to move toward player
             new_x = monster.x + dx
@@ -750,7 +692,7 @@ class Game:
             if new_x == self.player.x and new_y == self.player.y:
                 self.monster_attack_player(monster)
             # Otherwise try to move there
-            elif self.level.tiles[new_x, new_y] != TILE_WALL and not self.level.is_position_occupied(new_x, new_y):  # Not a wall and not occupied
+            elif TILE_WALKABLE[self.level.tiles[new_x, new_y]] and not self.level.is_position_occupied(new_x, new_y):  # Not a wall and not occupied
                 monster.move(dx, dy)
     
     def update(self):
@@ -843,40 +785,31 @@ class Game:
             event_emitter.unsubscribe(event_type, equipment.on_event)
     
     def ascend_level(self):
-        """Move to the previous level up."""
-        if self.current_level > 1:
-            self.current_level -= 1
-            self.level = Level(level_number=self.current_level)
-            # Place player at stairs down position
-            stairs_down_x, stairs_down_y = self.level.get_stairs_down_position()
-            self.player.x = stairs_down_x
-            self.player.y = stairs_down_y
-            # Update FOV for new level
+        """Move back to the area above, restored as it was left."""
+        result = self.level_manager.transition_up(self.player)
+        
+        if isinstance(result, tuple) and result[0]:  # Success with message
+            success, message = result
+            self.level = self.level_manager.get_current_area()
+            self.current_level = self.level_manager.get_current_floor_number()
+            
+            # Add transition message
+            if message:
+                self.ui.add_message(message)
+            
+            # Update FOV for restored area
             self.level.update_fov(self.player.x, self.player.y, self.player.get_total_fov())
             # Set flag to prevent immediate transition back
             self.just_changed_level = True
     
     def start_new_game(self):
         """Start a new game from the main menu."""
-        # Initialize level manager and game state
-        self.level_manager = LevelManager()
+        # Take the prefetched world (level manager, player placed with FOV computed)
+        self.level_manager, self.player = self.world_prefetcher.take()
         self.level = self.level_manager.get_current_area()
         self.current_level = self.level_manager.get_current_floor_number()
         self.highest_floor_reached = 1
         
-        # Place player at stairs up position (or first room if no stairs)
-        if hasattr(self.level, 'stairs_up_pos') and self.level.stairs_up_pos:
-            start_x, start_y = self.level.stairs_up_pos
-        elif hasattr(self.level, 'rooms') and len(self.level.rooms) > 0:
-            start_x, start_y = self.level.rooms[0].center()
-        else:
-            start_x, start_y = 10, 10
-        
-        self.player = Player(x=start_x, y=start_y)
-        
-        # Initialize FOV for starting position
-        self.level.update_fov(self.player.x, self.player.y, self.player.get_total_fov())
-        
         # Reset game state flags
         self.player_turn = True
         self.just_changed_level = False
@@ -1499,8 +1432,9 @@ class Game:
             self.render_victory_screen()
         elif self.game_state == 'SHOP':
             # Render shop interface
-            self.level.render(self.console)
-            self.player.render(self.console, self.level.fov)
+            self.camera.center_on(self.player.x, self.player.y, self.level.width, self.level.height)
+            self.level.render(self.console, self.camera)
+            self.player.render(self.console, self.level.fov, self.camera)
             self.shop_manager.render(self.console)
             self.ui.render(self.console, self.player, self.level_manager.get_display_name(), self.level)
         elif self.game_state == 'INVENTORY':
@@ -1518,11 +1452,12 @@ class Game:
                                     game_state=self.game_state, pending_boon=self.pending_boon_item)
         else:
             # Normal game rendering
-            # Render the level
-            self.level.render(self.console)
+            # Render the camera's view of the level
+            self.camera.center_on(self.player.x, self.player.y, self.level.width, self.level.height)
+            self.level.render(self.console, self.camera)
             
             # Render the player
-            self.player.render(self.console, self.level.fov)
+            self.player.render(self.console, self.level.fov, self.camera)
             
             # Render the UI
             self.ui.render(self.console, self.player, self.level_manager.get_display_name(), self.level)
\ No newline at end of file
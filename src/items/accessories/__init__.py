@@ -2,64 +2,7 @@
 Accessory items module - all accessories imported and exported.
 """
 
-# Base classes
-from .accessory import Accessory
-from .ring import Ring
-from .card import Card
-from .artifact import Artifact
-from .necklace import Necklace
-from .hat import Hat
-
-# Ring accessories
-from .power_ring import PowerRing
-from .protection_ring import ProtectionRing
-from .shadow_ring import ShadowRing
-from .ring_of_precision import RingOfPrecision
-from .greater_power_ring import GreaterPowerRing
-from .greater_protection_ring import GreaterProtectionRing
-
-# Necklace accessories
-from .rosary import Rosary
-from .brutality_amulet import BrutalityAmulet
-
-# Hat accessories
-from .head_lamp import HeadLamp
-from .barons_crown import BaronsCrown
-from .jewelers_cap import JewelersCap
-from .assassins_mask import AssassinsMask
-from .psychics_turban import PsychicsTurban
-from .grave_pact import GravePact
-from .strike_bonus import StrikeBonus
-from .slash_bonus import SlashBonus
-
-# Card accessories
-from .ace_of_spades import AceOfSpades
-from .ace_of_diamonds import AceOfDiamonds
-from .ace_of_clubs import AceOfClubs
-from .ace_of_hearts import AceOfHearts
-from .ace_of_wands import AceOfWands
-from .ace_of_cups import AceOfCups
-from .ace_of_swords import AceOfSwords
-from .ace_of_coins import AceOfCoins
-from .joker import Joker
-
-# Specialty accessories
-from .punish_the_weak import PunishTheWeak
-from .elemental_mayhem import ElementalMayhem
-from .gods_eye import GodsEye
-from .anaglyph import Anaglyph
-from .mall_ninja import MallNinja
-from .righteous_fury import RighteousFury
-from .song_of_ice_and_fire import SongOfIceAndFire
-
-# Event-driven accessories
-from .healing_dodge import HealingDodge
-from .vampires_pendant import VampiresPendant
-from .wardens_tome import WardensTome
-from .protective_level import ProtectiveLevel
-from .black_belt import BlackBelt
-from .brutality_expertise import BrutalityExpertise
-from .dodge_master_ring import DodgeMasterRing
+from ..registry import lazy_exports
 
 __all__ = [
     # Base classes
@@ -120,4 +63,7 @@ __all__ = [
     'BlackBelt',
     'BrutalityExpertise',
     'DodgeMasterRing',
-]
\ No newline at end of file
+]
+
+# Item classes are imported from their own modules on first access
+__getattr__ = lazy_exports(__name__)
@@ -2,29 +2,7 @@
 Armor package for the roguelike game.
 """
 
-from .base import Armor
-from .white_tshirt import WhiteTShirt
-from .leather_armor import LeatherArmor
-from .safety_vest import SafetyVest
-from .cloak import Cloak
-from .night_cloak import NightCloak
-from .shadow_cloak import ShadowCloak
-from .gamblers_vest import GamblersVest
-from .skin_suit import SkinSuit
-from .minimal_suit import MinimalSuit
-from .chain_mail import ChainMail
-from .plate_armor import PlateArmor
-from .dragon_scale import DragonScale
-from .spiked_armor import SpikedArmor
-from .coated_plate import CoatedPlate
-from .anti_angel_technology import AntiAngelTechnology
-from .spiked_cuirass import SpikedCuirass
-from .utility_belt import UtilityBelt
-from .sos_armor import SOSArmor
-from .stone_armor import StoneArmor
-from .anti_devil_technology import AntiDevilTechnology
-from .turtle_shell import TurtleShell
-from .saving_throw import SavingThrow
+from ..registry import lazy_exports
 
 __all__ = [
     'Armor',
@@ -50,4 +28,7 @@ __all__ = [
     'AntiDevilTechnology',
     'StoneArmor',
     'SavingThrow'
-]
\ No newline at end of file
+]
+
+# Item classes are imported from their own modules on first access
+__getattr__ = lazy_exports(__name__)
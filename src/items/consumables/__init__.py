@@ -2,45 +2,7 @@
 Consumables package - exports all consumable classes.
 """
 
-# Food consumables
-from .health_potion import HealthPotion
-from .elixir import Elixir
-from .beef import Beef
-from .chicken import Chicken
-from .carrot import Carrot
-from .antidote import Antidote
-from .shell_potion import ShellPotion
-from .mezzo_forte import MezzoForte
-from .magic_mushroom import MagicMushroom
-
-# Catalyst consumables
-from .catalyst import Catalyst
-from .power_catalyst import PowerCatalyst
-from .defense_catalyst import DefenseCatalyst
-from .baron_catalyst import BaronCatalyst
-from .warden_catalyst import WardenCatalyst
-from .jeweler_catalyst import JewelerCatalyst
-from .reapers_catalyst import ReapersCatalyst
-from .shadows_catalyst import ShadowsCatalyst
-
-# Boon consumables
-from .boon import Boon
-from .barons_boon import BaronsBoon
-from .jewelers_boon import JewelersBoon
-from .miners_boon import MinersBoon
-from .clerics_boon import ClericsBoon
-from .jokers_boon import JokersBoon
-from .reapers_boon import ReapersBoon
-from .fire_boon import FireBoon
-from .ice_boon import IceBoon
-from .holy_boon import HolyBoon
-from .dark_boon import DarkBoon
-
-# Miscellaneous consumables
-from .d6 import D6
-from .mayhems_boon import MayhemsBoon
-from .swords_to_plowshares import SwordsToPlowshares
-from .transmutation import Transmutation
+from ..registry import lazy_exports
 
 __all__ = [
     # Food consumables
@@ -82,4 +44,7 @@ __all__ = [
     'MayhemsBoon',
     'SwordsToPlowshares',
     'Transmutation',
-]
\ No newline at end of file
+]
+
+# Item classes are imported from their own modules on first access
+__getattr__ = lazy_exports(__name__)
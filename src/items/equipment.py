@@ -4,6 +4,8 @@ Equipment item class for the roguelike game.
 
 from .item import Item
 from typing import Set, TYPE_CHECKING
+from traits import TraitList, traits_to_mask
+from stat_modifiers import StatModifier
 
 if TYPE_CHECKING:
     from event_type import EventType
@@ -45,9 +47,9 @@ class Equipment(Item):
         self.market_value = market_value
         
         # Traits system
-        self.attack_traits = attack_traits or []
-        self.weaknesses = weaknesses or []
-        self.resistances = resistances or []
+        self.attack_traits = TraitList(attack_traits or [])
+        self.weaknesses = TraitList(weaknesses or [])
+        self.resistances = TraitList(resistances or [])
         
         # Event system
         self.event_subscriptions: Set['EventType'] = set()  # Events this equipment listens to
@@ -82,6 +84,30 @@ class Equipment(Item):
     def get_crit_multiplier_bonus(self, player):
         return self.crit_multiplier_bonus
     
+    def get_stat_modifiers(self):
+        """Get the StatModifiers this item applies while equipped.
+
+        Each bonus getter becomes a modifier, so overriding a getter (or adding
+        modifiers here) changes what the player gets. Cleanup items add no
+        defense and instead rework the finished attack and defense.
+        """
+        modifiers = [
+            StatModifier.flat('attack', self.get_attack_bonus),
+            StatModifier.flat('fov', self.get_fov_bonus),
+            StatModifier.flat('health_aspect', lambda player: self.health_aspect_bonus),
+            StatModifier.multiplier('attack_multiplier', self.get_attack_multiplier_bonus),
+            StatModifier.multiplier('defense_multiplier', self.get_defense_multiplier_bonus),
+            StatModifier.multiplier('xp_multiplier', self.get_xp_multiplier_bonus),
+            StatModifier.flat('evade', self.get_evade_bonus),
+            StatModifier.flat('crit', self.get_crit_bonus),
+            StatModifier.flat('crit_multiplier', self.get_crit_multiplier_bonus),
+        ]
+        if not self.is_cleanup:
+            modifiers.append(StatModifier.flat('defense', self.get_defense_bonus))
+        elif hasattr(self, 'apply_cleanup_effect'):
+            modifiers.append(StatModifier.final(('attack', 'defense'), self.apply_cleanup_effect))
+        return modifiers
+    
 
     def get_attack_traits(self):
         """Get all attack traits including those from enchantments."""
@@ -120,6 +146,27 @@ class Equipment(Item):
         return resistances
   
     
+    def get_attack_trait_mask(self):
+        """Get the bitmask of attack traits including those from enchantments."""
+        mask = traits_to_mask(self.attack_traits)
+        for enchantment in getattr(self, 'enchantments', ()):
+            mask |= traits_to_mask(getattr(enchantment, 'attack_traits', None))
+        return mask
+    
+    def get_weakness_mask(self):
+        """Get the bitmask of weaknesses including those from enchantments."""
+        mask = traits_to_mask(self.weaknesses)
+        for enchantment in getattr(self, 'enchantments', ()):
+            mask |= traits_to_mask(getattr(enchantment, 'weaknesses', None))
+        return mask
+    
+    def get_resistance_mask(self):
+        """Get the bitmask of resistances including those from enchantments."""
+        mask = traits_to_mask(self.resistances)
+        for enchantment in getattr(self, 'enchantments', ()):
+            mask |= traits_to_mask(getattr(enchantment, 'resistances', None))
+        return mask
+    
     def can_equip(self, player):
         """Check if player can equip this item."""
         # Equipment can always be equipped freely
@@ -21,7 +21,9 @@ class Item:
     def get_market_value(self):
         return self.market_value
 
-    def render(self, console, fov):
-        """Render the item on the console."""
+    def render(self, console, fov, camera=None):
+        """Render the item on the console, offset by the camera if given."""
         if fov[self.x, self.y]:
-            console.print(self.x, self.y, self.char, fg=self.color)
\ No newline at end of file
+            position = camera.to_screen(self.x, self.y) if camera else (self.x, self.y)
+            if position:
+                console.print(*position, self.char, fg=self.color)
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+Generated item manifest - do not edit by hand.
+
+Maps every item class name to the module that defines it (relative to the
+items package) and its item type, so item classes can be looked up without
+importing their modules. Regenerate with `python generate_item_manifest.py`.
+"""
+
+ITEM_MANIFEST = {
+    'AcidDagger': ('weapons.acid_dagger', 'weapon'),
+    'Axe': ('weapons.axe', 'weapon'),
+    'BackhandBlade': ('weapons.backhand_blade', 'weapon'),
+    'Weapon': ('weapons.base', None),
+    'BigStick': ('weapons.big_stick', 'weapon'),
+    'ClairObscur': ('weapons.clair_obscur', 'weapon'),
+    'ClericsStaff': ('weapons.clerics_staff', 'weapon'),
+    'Dagger': ('weapons.dagger', 'weapon'),
+    'Defender': ('weapons.defender', 'weapon'),
+    'DemonSlayer': ('weapons.demon_slayer', 'weapon'),
+    'FeuGlace': ('weapons.feu_glace', 'weapon'),
+    'Gauntlets': ('weapons.gauntlets', 'weapon'),
+    'HolyAvenger': ('weapons.holy_avenger', 'weapon'),
+    'Katana': ('weapons.katana', 'weapon'),
+    'Longsword': ('weapons.longsword', 'weapon'),
+    'MateriaStaff': ('weapons.materia_staff', 'weapon'),
+    'MorningStar': ('weapons.morning_star', 'weapon'),
+    'Pickaxe': ('weapons.pickaxe', 'weapon'),
+    'Rapier': ('weapons.rapier', 'weapon'),
+    'RiversOfBlood': ('weapons.rivers_of_blood', 'weapon'),
+    'Shield': ('weapons.shield', 'weapon'),
+    'SnakesFang': ('weapons.snakes_fang', 'weapon'),
+    'Sword': ('weapons.sword', 'weapon'),
+    'TowerShield': ('weapons.tower_shield', 'weapon'),
+    'Uchigatana': ('weapons.uchigatana', 'weapon'),
+    'WarHammer': ('weapons.war_hammer', 'weapon'),
+    'WarScythe': ('weapons.war_scythe', 'weapon'),
+    'WoodenStick': ('weapons.wooden_stick', 'weapon'),
+    'AntiAngelTechnology': ('armor.anti_angel_technology', 'armor'),
+    'AntiDevilTechnology': ('armor.anti_devil_technology', 'armor'),
+    'Armor': ('armor.base', None),
+    'ChainMail': ('armor.chain_mail', 'armor'),
+    'Cloak': ('armor.cloak', 'armor'),
+    'CoatedPlate': ('armor.coated_plate', 'armor'),
+    'DragonScale': ('armor.dragon_scale', 'armor'),
+    'GamblersVest': ('armor.gamblers_vest', 'armor'),
+    'LeatherArmor': ('armor.leather_armor', 'armor'),
+    'MinimalSuit': ('armor.minimal_suit', 'armor'),
+    'NightCloak': ('armor.night_cloak', 'armor'),
+    'PlateArmor': ('armor.plate_armor', 'armor'),
+    'SafetyVest': ('armor.safety_vest', 'armor'),
+    'SavingThrow': ('armor.saving_throw', 'armor'),
+    'ShadowCloak': ('armor.shadow_cloak', 'armor'),
+    'SkinSuit': ('armor.skin_suit', 'armor'),
+    'SOSArmor': ('armor.sos_armor', 'armor'),
+    'SpikedArmor': ('armor.spiked_armor', 'armor'),
+    'SpikedCuirass': ('armor.spiked_cuirass', 'armor'),
+    'StoneArmor': ('armor.stone_armor', 'armor'),
+    'TurtleShell': ('armor.turtle_shell', 'armor'),
+    'UtilityBelt': ('armor.utility_belt', 'armor'),
+    'WhiteTShirt': ('armor.white_tshirt', 'armor'),
+    'Accessory': ('accessories.accessory', None),
+    'AceOfClubs': ('accessories.ace_of_clubs', 'accessory'),
+    'AceOfCoins': ('accessories.ace_of_coins', 'accessory'),
+    'AceOfCups': ('accessories.ace_of_cups', 'accessory'),
+    'AceOfDiamonds': ('accessories.ace_of_diamonds', 'accessory'),
+    'AceOfHearts': ('accessories.ace_of_hearts', 'accessory'),
+    'AceOfSpades': ('accessories.ace_of_spades', 'accessory'),
+    'AceOfSwords': ('accessories.ace_of_swords', 'accessory'),
+    'AceOfWands': ('accessories.ace_of_wands', 'accessory'),
+    'Anaglyph': ('accessories.anaglyph', 'accessory'),
+    'Artifact': ('accessories.artifact', 'accessory'),
+    'AssassinsMask': ('accessories.assassins_mask', 'accessory'),
+    'BaronsCrown': ('accessories.barons_crown', 'accessory'),
+    'BlackBelt': ('accessories.black_belt', 'accessory'),
+    'BrutalityAmulet': ('accessories.brutality_amulet', 'accessory'),
+    'BrutalityExpertise': ('accessories.brutality_expertise', 'accessory'),
+    'Card': ('accessories.card', 'accessory'),
+    'DodgeMasterRing': ('accessories.dodge_master_ring', 'accessory'),
+    'ElementalMayhem': ('accessories.elemental_mayhem', 'accessory'),
+    'GodsEye': ('accessories.gods_eye', 'accessory'),
+    'GravePact': ('accessories.grave_pact', 'accessory'),
+    'GreaterPowerRing': ('accessories.greater_power_ring', 'accessory'),
+    'GreaterProtectionRing': ('accessories.greater_protection_ring', 'accessory'),
+    'Hat': ('accessories.hat', 'accessory'),
+    'HeadLamp': ('accessories.head_lamp', 'accessory'),
+    'HealingDodge': ('accessories.healing_dodge', 'accessory'),
+    'JewelersCap': ('accessories.jewelers_cap', 'accessory'),
+    'Joker': ('accessories.joker', 'accessory'),
+    'MallNinja': ('accessories.mall_ninja', 'accessory'),
+    'Necklace': ('accessories.necklace', 'accessory'),
+    'PowerRing': ('accessories.power_ring', 'accessory'),
+    'ProtectionRing': ('accessories.protection_ring', 'accessory'),
+    'ProtectiveLevel': ('accessories.protective_level', 'accessory'),
+    'PsychicsTurban': ('accessories.psychics_turban', 'accessory'),
+    'PunishTheWeak': ('accessories.punish_the_weak', 'accessory'),
+    'RighteousFury': ('accessories.righteous_fury', 'accessory'),
+    'Ring': ('accessories.ring', 'accessory'),
+    'RingOfPrecision': ('accessories.ring_of_precision', 'accessory'),
+    'Rosary': ('accessories.rosary', 'accessory'),
+    'ShadowRing': ('accessories.shadow_ring', 'accessory'),
+    'SlashBonus': ('accessories.slash_bonus', 'accessory'),
+    'SongOfIceAndFire': ('accessories.song_of_ice_and_fire', 'accessory'),
+    'StrikeBonus': ('accessories.strike_bonus', 'accessory'),
+    'VampiresPendant': ('accessories.vampires_pendant', 'accessory'),
+    'WardensTome': ('accessories.wardens_tome', 'accessory'),
+    'Antidote': ('consumables.antidote', 'consumable'),
+    'BaronCatalyst': ('consumables.baron_catalyst', 'consumable'),
+    'BaronsBoon': ('consumables.barons_boon', 'consumable'),
+    'Beef': ('consumables.beef', 'consumable'),
+    'Boon': ('consumables.boon', 'consumable'),
+    'Carrot': ('consumables.carrot', 'consumable'),
+    'Catalyst': ('consumables.catalyst', 'consumable'),
+    'Chicken': ('consumables.chicken', 'consumable'),
+    'ClericsBoon': ('consumables.clerics_boon', 'consumable'),
+    'D6': ('consumables.d6', 'consumable'),
+    'DarkBoon': ('consumables.dark_boon', 'consumable'),
+    'DefenseCatalyst': ('consumables.defense_catalyst', 'consumable'),
+    'Elixir': ('consumables.elixir', 'consumable'),
+    'FireBoon': ('consumables.fire_boon', 'consumable'),
+    'HealthPotion': ('consumables.health_potion', 'consumable'),
+    'HolyBoon': ('consumables.holy_boon', 'consumable'),
+    'IceBoon': ('consumables.ice_boon', 'consumable'),
+    'JewelerCatalyst': ('consumables.jeweler_catalyst', 'consumable'),
+    'JewelersBoon': ('consumables.jewelers_boon', 'consumable'),
+    'JokersBoon': ('consumables.jokers_boon', 'consumable'),
+    'MagicMushroom': ('consumables.magic_mushroom', 'consumable'),
+    'MayhemsBoon': ('consumables.mayhems_boon', 'consumable'),
+    'MezzoForte': ('consumables.mezzo_forte', 'consumable'),
+    'MinersBoon': ('consumables.miners_boon', 'consumable'),
+    'PowerCatalyst': ('consumables.power_catalyst', 'consumable'),
+    'ReapersBoon': ('consumables.reapers_boon', 'consumable'),
+    'ReapersCatalyst': ('consumables.reapers_catalyst', 'consumable'),
+    'ShadowsCatalyst': ('consumables.shadows_catalyst', 'consumable'),
+    'ShellPotion': ('consumables.shell_potion', 'consumable'),
+    'SwordsToPlowshares': ('consumables.swords_to_plowshares', 'consumable'),
+    'Transmutation': ('consumables.transmutation', 'consumable'),
+    'WardenCatalyst': ('consumables.warden_catalyst', 'consumable'),
+    'Nickel': ('pickups.nickel', 'pickup'),
+    'Penny': ('pickups.penny', 'pickup'),
+    'Pickup': ('pickups.pickup', None),
+    'ShellToken': ('pickups.shell_token', 'pickup'),
+    'Snackie': ('pickups.snackie', 'pickup'),
+}
@@ -2,10 +2,9 @@
 Pickup items module - instant effect items.
 """
 
-from .pickup import Pickup
-from .snackie import Snackie
-from .nickel import Nickel
-from .penny import Penny
-from .shell_token import ShellToken
+from ..registry import lazy_exports
 
-__all__ = ['Pickup', 'Snackie', 'Nickel', 'Penny', 'ShellToken']
\ No newline at end of file
+__all__ = ['Pickup', 'Snackie', 'Nickel', 'Penny', 'ShellToken']
+
+# Item classes are imported from their own modules on first access
+__getattr__ = lazy_exports(__name__)
@@ -3,40 +3,10 @@ Item pool system for managing item spawning with rarity-based drop rates and uni
 """
 
 import random
+import threading
 from dataclasses import dataclass, field
-from typing import Type, List, Dict, Set, Optional, Tuple
-        # Import all item classes
-from .consumables import (
-    HealthPotion, Beef, Chicken, D6, MagicMushroom, Carrot,
-    Antidote, ShellPotion, MezzoForte, Elixir,
-    SwordsToPlowshares, Transmutation,
-    PowerCatalyst, DefenseCatalyst, JewelerCatalyst, ReapersCatalyst, 
-    ShadowsCatalyst, BaronCatalyst, WardenCatalyst,
-    BaronsBoon, JewelersBoon, MinersBoon, ClericsBoon, JokersBoon, ReapersBoon,
-    FireBoon, IceBoon, HolyBoon, DarkBoon, MayhemsBoon
-)
-from .pickups import Snackie, Nickel, Penny, ShellToken
-from .weapons import (
-    Dagger, Sword, Shield, Katana, Axe, MorningStar, ClericsStaff, Gauntlets,
-    MateriaStaff, Uchigatana, Pickaxe, SnakesFang, Rapier, AcidDagger, BigStick,
-    Longsword, WarHammer, WarScythe, TowerShield, ClairObscur, FeuGlace,
-    RiversOfBlood, DemonSlayer, BackhandBlade, HolyAvenger
-)
-from .armor import (
-    LeatherArmor, SafetyVest, Cloak, SpikedArmor, GamblersVest, MinimalSuit,
-    ChainMail, NightCloak, CoatedPlate, AntiAngelTechnology, SpikedCuirass,
-    UtilityBelt, SOSArmor, PlateArmor, ShadowCloak, DragonScale, StoneArmor, TurtleShell, AntiDevilTechnology,
-    SavingThrow
-)
-from .accessories import (
-    PowerRing, ProtectionRing, GreaterPowerRing, GreaterProtectionRing,
-    BaronsCrown, JewelersCap, Rosary, HeadLamp, ShadowRing, RingOfPrecision,
-    BrutalityAmulet, AssassinsMask, GravePact, PunishTheWeak,
-    StrikeBonus, SlashBonus, ElementalMayhem, GodsEye, Anaglyph,
-    MallNinja, RighteousFury, SongOfIceAndFire, AceOfHearts, AceOfClubs,
-    AceOfDiamonds, AceOfSpades, AceOfWands, AceOfCups, AceOfSwords, AceOfCoins, Joker, HealingDodge, ProtectiveLevel,
-    PsychicsTurban, VampiresPendant, WardensTome, BlackBelt, BrutalityExpertise, DodgeMasterRing
-)
+from typing import Type, List, Dict, Set, Optional, Tuple, Union
+from .registry import load_item_class
 
 
 # Rarity weight constants
@@ -44,10 +14,34 @@ RARITY_COMMON = 1.0
 RARITY_UNCOMMON = 0.6
 RARITY_RARE = 0.3
 
+class _LazyItemClass:
+    """Field descriptor that resolves an item class name to the class on first access."""
+    
+    def __set_name__(self, owner, name):
+        self.attr_name = '_' + name
+    
+    def __get__(self, spec, owner=None):
+        if spec is None:
+            # No default value for the dataclass field
+            raise AttributeError(self.attr_name)
+        item_class = getattr(spec, self.attr_name)
+        if isinstance(item_class, str):
+            item_class = load_item_class(item_class)
+            setattr(spec, self.attr_name, item_class)
+        return item_class
+    
+    def __set__(self, spec, value):
+        setattr(spec, self.attr_name, value)
+
+
 @dataclass
 class ItemSpec:
-    """Specification for an item type including spawn rules."""
-    item_class: Type           # The item class to instantiate
+    """Specification for an item type including spawn rules.
+    
+    item_class may be given as a class name from the item manifest, in which case
+    the item's module is only imported the first time the class is needed.
+    """
+    item_class: Union[Type, str] = _LazyItemClass()  # The item class (or class name) to instantiate
     item_type: str             # 'weapon', 'armor', 'accessory', 'consumable'
     min_level: int            # Earliest level this item can appear
     max_level: Optional[int]  # Latest level (None = no limit)
@@ -55,6 +49,12 @@ class ItemSpec:
     unique_per_floor: bool   # True for weapons/armor
     unique_per_game: bool    # True for accessories
     tags: List[str] = field(default_factory=list)  # Optional tags for special handling
+    
+    @property
+    def class_name(self) -> str:
+        """Name of the item class, without importing it."""
+        item_class = self._item_class
+        return item_class if isinstance(item_class, str) else item_class.__name__
 
 
 class ItemPool:
@@ -84,176 +84,176 @@ class ItemPool:
         # WEAPONS
         self.weapon_specs = [
             # Early game weapons (levels 1-4)
-            ItemSpec(Dagger, 'weapon', 1, 4, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Sword, 'weapon', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Shield, 'weapon', 1, 6, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Katana, 'weapon', 1, 5, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Dagger', 'weapon', 1, 4, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Sword', 'weapon', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Shield', 'weapon', 1, 6, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Katana', 'weapon', 1, 5, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
             
             # Mid game weapons (levels 3-7)
-            ItemSpec(Axe, 'weapon', 3, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(MorningStar, 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(ClericsStaff, 'weapon', 2, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Gauntlets, 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(MateriaStaff, 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Uchigatana, 'weapon', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Pickaxe, 'weapon', 2, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(SnakesFang, 'weapon', 3, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Rapier, 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(AcidDagger, 'weapon', 3, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(BigStick, 'weapon', 2, 6, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Axe', 'weapon', 3, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('MorningStar', 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('ClericsStaff', 'weapon', 2, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Gauntlets', 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('MateriaStaff', 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Uchigatana', 'weapon', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Pickaxe', 'weapon', 2, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('SnakesFang', 'weapon', 3, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Rapier', 'weapon', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('AcidDagger', 'weapon', 3, 7, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('BigStick', 'weapon', 2, 6, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
             
             # Late game weapons (levels 6-9)
-            ItemSpec(Longsword, 'weapon', 6, 9, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(TowerShield, 'weapon', 6, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(WarHammer, 'weapon', 7, None, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(WarScythe, 'weapon', 7, None, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(HolyAvenger, 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(BackhandBlade, 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(ClairObscur, 'weapon', 8, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(FeuGlace, 'weapon', 8, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(RiversOfBlood, 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Longsword', 'weapon', 6, 9, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('TowerShield', 'weapon', 6, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('WarHammer', 'weapon', 7, None, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('WarScythe', 'weapon', 7, None, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('HolyAvenger', 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('BackhandBlade', 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('ClairObscur', 'weapon', 8, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('FeuGlace', 'weapon', 8, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('RiversOfBlood', 'weapon', 7, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
             
             # End game weapons (levels 9-10)
-            ItemSpec(DemonSlayer, 'weapon', 10, 10, RARITY_COMMON, unique_per_floor=True, unique_per_game=False, tags=['boss_weapon']),
+            ItemSpec('DemonSlayer', 'weapon', 10, 10, RARITY_COMMON, unique_per_floor=True, unique_per_game=False, tags=['boss_weapon']),
         ]
         
         # ARMOR
         self.armor_specs = [
             # Early game armor (levels 1-4)
-            ItemSpec(LeatherArmor, 'armor', 1, 4, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(SafetyVest, 'armor', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(Cloak, 'armor', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('LeatherArmor', 'armor', 1, 4, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('SafetyVest', 'armor', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('Cloak', 'armor', 1, 5, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
             
             # Default armor (all levels)
-            ItemSpec(SpikedArmor, 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(GamblersVest, 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(MinimalSuit, 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('SpikedArmor', 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('GamblersVest', 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('MinimalSuit', 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
             
             # Mid game armor (levels 3-7)
-            ItemSpec(ChainMail, 'armor', 3, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(NightCloak, 'armor', 3, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(CoatedPlate, 'armor', 4, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(AntiAngelTechnology, 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(AntiDevilTechnology, 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(TurtleShell, 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(StoneArmor, 'armor', 4, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(SavingThrow, 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(SpikedCuirass, 'armor', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(UtilityBelt, 'armor', 3, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(SOSArmor, 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('ChainMail', 'armor', 3, 7, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('NightCloak', 'armor', 3, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('CoatedPlate', 'armor', 4, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('AntiAngelTechnology', 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('AntiDevilTechnology', 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('TurtleShell', 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('StoneArmor', 'armor', 4, 8, RARITY_COMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('SavingThrow', 'armor', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('SpikedCuirass', 'armor', 3, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('UtilityBelt', 'armor', 3, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('SOSArmor', 'armor', 4, 8, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
             
             # Late game armor (levels 6-10)
-            ItemSpec(PlateArmor, 'armor', 6, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(ShadowCloak, 'armor', 6, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
-            ItemSpec(DragonScale, 'armor', 9, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('PlateArmor', 'armor', 6, None, RARITY_UNCOMMON, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('ShadowCloak', 'armor', 6, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
+            ItemSpec('DragonScale', 'armor', 9, None, RARITY_RARE, unique_per_floor=True, unique_per_game=False),
         ]
         
         # ACCESSORIES (unique per game)
         self.accessory_specs = [
             # Basic rings
-            ItemSpec(PowerRing, 'accessory', 1, 7, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(ProtectionRing, 'accessory', 1, 7, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(GreaterPowerRing, 'accessory', 4, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(GreaterProtectionRing, 'accessory', 4, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('PowerRing', 'accessory', 1, 7, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('ProtectionRing', 'accessory', 1, 7, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('GreaterPowerRing', 'accessory', 4, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('GreaterProtectionRing', 'accessory', 4, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
             
             # Special accessories (available from mid-game)
-            ItemSpec(BaronsCrown, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(JewelersCap, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(Rosary, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(HeadLamp, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(ShadowRing, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(RingOfPrecision, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(BrutalityAmulet, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(AssassinsMask, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(BlackBelt, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(DodgeMasterRing, 'accessory', 2, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(BrutalityExpertise, 'accessory', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(GravePact, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(PunishTheWeak, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(StrikeBonus, 'accessory', 3, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(SlashBonus, 'accessory', 3, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(ElementalMayhem, 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(GodsEye, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['legendary']),
-            ItemSpec(Anaglyph, 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(MallNinja, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(RighteousFury, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(SongOfIceAndFire, 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('BaronsCrown', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('JewelersCap', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('Rosary', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('HeadLamp', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('ShadowRing', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('RingOfPrecision', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('BrutalityAmulet', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('AssassinsMask', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('BlackBelt', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('DodgeMasterRing', 'accessory', 2, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('BrutalityExpertise', 'accessory', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('GravePact', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('PunishTheWeak', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('StrikeBonus', 'accessory', 3, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('SlashBonus', 'accessory', 3, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('ElementalMayhem', 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('GodsEye', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['legendary']),
+            ItemSpec('Anaglyph', 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('MallNinja', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('RighteousFury', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('SongOfIceAndFire', 'accessory', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=True),
             
             # Cards (mid to late game)
-            ItemSpec(AceOfHearts, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfClubs, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfDiamonds, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfSpades, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfWands, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfCups, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfSwords, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(AceOfCoins, 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True, tags=['card']),
-            ItemSpec(Joker, 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfHearts', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfClubs', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfDiamonds', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfSpades', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfWands', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfCups', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfSwords', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('AceOfCoins', 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True, tags=['card']),
+            ItemSpec('Joker', 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True, tags=['card']),
             
             # Additional accessories
-            ItemSpec(HealingDodge, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(ProtectiveLevel, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(PsychicsTurban, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(VampiresPendant, 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
-            ItemSpec(WardensTome, 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('HealingDodge', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('ProtectiveLevel', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('PsychicsTurban', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('VampiresPendant', 'accessory', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=True),
+            ItemSpec('WardensTome', 'accessory', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=True),
         ]
         
         # PICKUPS (instant effect items)
         self.pickup_specs = [
             # Healing pickup
-            ItemSpec(Snackie, 'pickup', 1, None, RARITY_COMMON * 2.0, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Snackie', 'pickup', 1, None, RARITY_COMMON * 2.0, unique_per_floor=False, unique_per_game=False),
             
             # XP pickups
-            ItemSpec(Penny, 'pickup', 1, None, RARITY_COMMON * 1.5, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(Nickel, 'pickup', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Penny', 'pickup', 1, None, RARITY_COMMON * 1.5, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Nickel', 'pickup', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
             
             # Defense pickup
-            ItemSpec(ShellToken, 'pickup', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('ShellToken', 'pickup', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
         ]
         
         # CONSUMABLES (no uniqueness constraints)
         self.consumable_specs = [
             # Basic consumables (all levels)
-            ItemSpec(HealthPotion, 'consumable', 1, None, RARITY_COMMON * 2.5, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(Beef, 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(Chicken, 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(D6, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(MagicMushroom, 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(Carrot, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('HealthPotion', 'consumable', 1, None, RARITY_COMMON * 2.5, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Beef', 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Chicken', 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('D6', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('MagicMushroom', 'consumable', 1, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Carrot', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
             
             # Status consumables
-            ItemSpec(Antidote, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(ShellPotion, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(MezzoForte, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Antidote', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('ShellPotion', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('MezzoForte', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False),
             
             # Special consumables
-            ItemSpec(SwordsToPlowshares, 'consumable', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
-            ItemSpec(Transmutation, 'consumable', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('SwordsToPlowshares', 'consumable', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Transmutation', 'consumable', 3, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
             
             # Catalysts (mid-game+)
-            ItemSpec(PowerCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(DefenseCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(JewelerCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(ReapersCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(ShadowsCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(BaronCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
-            ItemSpec(WardenCatalyst, 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('PowerCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('DefenseCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('JewelerCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('ReapersCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('ShadowsCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('BaronCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
+            ItemSpec('WardenCatalyst', 'consumable', 1, None, RARITY_UNCOMMON, unique_per_floor=False, unique_per_game=False, tags=['catalyst']),
             
             # Boons 
-            ItemSpec(BaronsBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(JewelersBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(MinersBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(ClericsBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(JokersBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(ReapersBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
-            ItemSpec(FireBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
-            ItemSpec(IceBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
-            ItemSpec(HolyBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
-            ItemSpec(DarkBoon, 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
-            ItemSpec(MayhemsBoon, 'consumable', 2, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('BaronsBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('JewelersBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('MinersBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('ClericsBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('JokersBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('ReapersBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon']),
+            ItemSpec('FireBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
+            ItemSpec('IceBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
+            ItemSpec('HolyBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
+            ItemSpec('DarkBoon', 'consumable', 1, None, RARITY_COMMON, unique_per_floor=False, unique_per_game=False, tags=['boon', 'elemental']),
+            ItemSpec('MayhemsBoon', 'consumable', 2, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False, tags=['boon']),
             
             # End game consumable
-            ItemSpec(Elixir, 'consumable', 8, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
+            ItemSpec('Elixir', 'consumable', 8, None, RARITY_RARE, unique_per_floor=False, unique_per_game=False),
         ]
     
     def start_new_floor(self, level: int):
@@ -271,19 +271,25 @@ class ItemPool:
         """
         if item_spec.unique_per_game:
             # Check global uniqueness for accessories
-            return item_spec.item_class not in self.game_spawned_accessories
+            return not self._has_spawned(self.game_spawned_accessories, item_spec)
         elif item_spec.unique_per_floor:
             # Check per-floor uniqueness for weapons/armor
             if item_spec.item_type == 'weapon':
                 floor_weapons = self.floor_spawned_weapons.get(level, set())
-                return item_spec.item_class not in floor_weapons
+                return not self._has_spawned(floor_weapons, item_spec)
             elif item_spec.item_type == 'armor':
                 floor_armor = self.floor_spawned_armor.get(level, set())
-                return item_spec.item_class not in floor_armor
+                return not self._has_spawned(floor_armor, item_spec)
         
         # No uniqueness constraint (consumables)
         return True
     
+    @staticmethod
+    def _has_spawned(spawned_classes: Set[Type], item_spec: ItemSpec) -> bool:
+        """Check a spec against spawned classes by name, so unspawned items stay unimported."""
+        class_name = item_spec.class_name
+        return any(item_class.__name__ == class_name for item_class in spawned_classes)
+    
     def calculate_spawn_weight(self, item_spec: ItemSpec, level: int) -> float:
         """
         Calculate spawn weight considering:
@@ -511,31 +517,36 @@ class ItemPool:
     
     def load_save_data(self, data: dict):
         """Load pool state from save data."""
-        # Build a map of class names to classes
-        class_map = {}
+        # Build a map of class names to specs; only saved classes get imported
+        spec_map = {}
         for spec in self.weapon_specs + self.armor_specs + self.accessory_specs:
-            class_map[spec.item_class.__name__] = spec.item_class
+            spec_map[spec.class_name] = spec
         
         # Restore floor spawned weapons
         self.floor_spawned_weapons = {}
         for level, class_names in data.get('floor_spawned_weapons', {}).items():
             self.floor_spawned_weapons[int(level)] = {
-                class_map[name] for name in class_names if name in class_map
+                spec_map[name].item_class for name in class_names if name in spec_map
             }
         
         # Restore floor spawned armor
         self.floor_spawned_armor = {}
         for level, class_names in data.get('floor_spawned_armor', {}).items():
             self.floor_spawned_armor[int(level)] = {
-                class_map[name] for name in class_names if name in class_map
+                spec_map[name].item_class for name in class_names if name in spec_map
             }
         
         # Restore game spawned accessories
         self.game_spawned_accessories = {
-            class_map[name] for name in data.get('game_spawned_accessories', [])
-            if name in class_map
+            spec_map[name].item_class for name in data.get('game_spawned_accessories', [])
+            if name in spec_map
         }
 
 
 # Global pool instance
-item_pool = ItemPool()
\ No newline at end of file
+item_pool = ItemPool()
+
+# Held while generating levels, which draw from the shared random module and
+# record spawns in item_pool; a world generated in the background (see
+# WorldPrefetcher) then never interleaves with a floor generated in play
+item_pool_lock = threading.RLock()
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+Lazy item class registry backed by the generated item manifest.
+"""
+
+import importlib
+import pkgutil
+import sys
+
+from .manifest import ITEM_MANIFEST
+
+# Subpackages scanned when regenerating the manifest
+ITEM_PACKAGES = ('weapons', 'armor', 'accessories', 'consumables', 'pickups')
+
+_loaded_classes = {}
+
+
+def get_item_module(class_name):
+    """Get the module (relative to the items package) that defines an item class."""
+    return ITEM_MANIFEST[class_name][0]
+
+
+def get_item_class_names(item_type):
+    """Get the names of all item classes of the given item type, in manifest order."""
+    return [name for name, (_, entry_type) in ITEM_MANIFEST.items() if entry_type == item_type]
+
+
+def load_item_class(class_name):
+    """Get an item class by name, importing only the module that defines it."""
+    item_class = _loaded_classes.get(class_name)
+    if item_class is None:
+        module = importlib.import_module(f"{__package__}.{get_item_module(class_name)}")
+        item_class = getattr(module, class_name)
+        _loaded_classes[class_name] = item_class
+    return item_class
+
+
+def lazy_exports(package_name):
+    """Build a module __getattr__ that imports a package's item classes on first access."""
+    subpackage = package_name[len(__package__) + 1:]
+    prefix = f"{subpackage}." if subpackage else ""
+
+    def __getattr__(name):
+        entry = ITEM_MANIFEST.get(name)
+        if entry is None or not entry[0].startswith(prefix):
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        item_class = load_item_class(name)
+        setattr(sys.modules[package_name], name, item_class)
+        return item_class
+
+    return __getattr__
+
+
+def build_item_manifest():
+    """Import every item module and build the manifest of item classes.
+
+    Returns a dict mapping class name to (module, item_type), where item_type is
+    None for the category base classes themselves.
+    """
+    from .item import Item
+    from .consumable import Consumable
+    from .weapons.base import Weapon
+    from .armor.base import Armor
+    from .accessories.accessory import Accessory
+    from .pickups.pickup import Pickup
+
+    item_type_bases = [
+        (Weapon, 'weapon'),
+        (Armor, 'armor'),
+        (Accessory, 'accessory'),
+        (Consumable, 'consumable'),
+        (Pickup, 'pickup'),
+    ]
+
+    manifest = {}
+    for package_name in ITEM_PACKAGES:
+        package = importlib.import_module(f"{__package__}.{package_name}")
+        for module_info in sorted(pkgutil.iter_modules(package.__path__), key=lambda info: info.name):
+            module_name = f"{package_name}.{module_info.name}"
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            for name, obj in vars(module).items():
+                if (not isinstance(obj, type) or not issubclass(obj, Item) or
+                        obj.__module__ != module.__name__ or
+                        name != obj.__name__ or name.startswith('_')):
+                    continue
+                if name in manifest:
+                    raise ValueError(f"Duplicate item class name: {name}")
+                item_type = None
+                for base, base_type in item_type_bases:
+                    if issubclass(obj, base) and obj is not base:
+                        item_type = base_type
+                        break
+                manifest[name] = (module_name, item_type)
+    return manifest
+
+
+def render_item_manifest(manifest):
+    """Render a manifest built by build_item_manifest as the source of manifest.py."""
+    lines = [
+        '"""',
+        'Generated item manifest - do not edit by hand.',
+        '',
+        'Maps every item class name to the module that defines it (relative to the',
+        'items package) and its item type, so item classes can be looked up without',
+        'importing their modules. Regenerate with `python generate_item_manifest.py`.',
+        '"""',
+        '',
+        'ITEM_MANIFEST = {',
+    ]
+    for name, (module_name, item_type) in manifest.items():
+        lines.append(f"    {name!r}: ({module_name!r}, {item_type!r}),")
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
@@ -5,17 +5,26 @@ Base weapon class for the roguelike game.
 from constants import COLOR_YELLOW
 from ..equipment import Equipment
 from enchantments import Enchantment
+from enchantments.enchantment_bonus import NO_BONUS, get_enchantment_bonus_vector, sum_enchantment_bonuses
 from traits import Trait
 
 
 class Weapon(Equipment):
     """Weapon equipment."""
     
+    # False for subclasses that override get_enchantment_bonus
+    _default_enchantment_bonus = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._default_enchantment_bonus = cls.get_enchantment_bonus is Weapon.get_enchantment_bonus
+    
     def __init__(self, x, y, name, char=')', attack_bonus=0, description="", 
                  fov_bonus=0, health_aspect_bonus=0.0, attack_multiplier_bonus=1.0, defense_multiplier_bonus=1.0, xp_multiplier_bonus=1.0,
                  evade_bonus=0.0, crit_bonus=0.0, crit_multiplier_bonus=0.0, market_value=25,
                  attack_traits=None, weaknesses=None, resistances=None):
-        self.enchantments = []
+        self._enchantments = []
+        self._enchantment_vector = NO_BONUS
         self.base_name = name
         
         super().__init__(
@@ -50,43 +59,61 @@ class Weapon(Equipment):
             if existing_enchantment.type == enchantment.type:
                 return False
         
-        self.enchantments.append(enchantment)
+        self._enchantments.append(enchantment)
+        self._enchantment_vector = sum_enchantment_bonuses(self._enchantments, "weapon")
         self._update_display_name()
         return True
     
+    @property
+    def enchantments(self):
+        return self._enchantments
+    
+    @enchantments.setter
+    def enchantments(self, enchantments):
+        self._enchantments = enchantments
+        self._enchantment_vector = sum_enchantment_bonuses(enchantments, "weapon")
+    
+    def get_enchantment_vector(self):
+        """Get the cached sum of this weapon's enchantment bonus vectors."""
+        return self._enchantment_vector
+    
+    def _get_enchantment_total(self, bonus_type, player):
+        """Sum one bonus type over all enchantments, honoring get_enchantment_bonus overrides."""
+        if self._default_enchantment_bonus:
+            return getattr(self._enchantment_vector, bonus_type)
+        total = 0
+        for enchantment in self._enchantments:
+            total += self.get_enchantment_bonus(enchantment, bonus_type, player)
+        return total
+    
     def get_attack_bonus(self, player):
         """Get attack bonus including enchantments."""
         total = super().get_attack_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "attack", player)
+        total += self._get_enchantment_total("attack", player)
         return total
     
     def get_defense_bonus(self, player):
         """Get defense bonus including enchantments."""
         total = super().get_defense_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "defense", player)
+        total += self._get_enchantment_total("defense", player)
         return total
     
     def get_fov_bonus(self, player):
         """Get FOV bonus including enchantments."""
         total = super().get_fov_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "fov", player)
+        total += self._get_enchantment_total("fov", player)
         return total
     
     def get_health_aspect_bonus(self, player):
         """Get health aspect bonus including enchantments."""
         total = super().get_health_aspect_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "health_aspect", player)
+        total += self._get_enchantment_total("health_aspect", player)
         return total
     
     def get_attack_multiplier_bonus(self, player):
         """Get attack multiplier bonus including enchantments."""
         total = super().get_attack_multiplier_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "attack_multiplier", player)
+        total += self._get_enchantment_total("attack_multiplier", player)
         return total
     
     def get_defense_multiplier_bonus(self, player):
@@ -100,8 +127,7 @@ class Weapon(Equipment):
     def get_xp_multiplier_bonus(self, player):
         """Get XP multiplier bonus including enchantments."""
         total = super().get_xp_multiplier_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "xp_multiplier", player)
+        total += self._get_enchantment_total("xp_multiplier", player)
         return total
     
     def get_enchantment_bonus(self, enchantment, bonus_type, player):
@@ -116,15 +142,8 @@ class Weapon(Equipment):
         Returns:
             The bonus value for this enchantment and bonus type
         """
-        # Default behavior - call the appropriate method on the enchantment
-        weapon_method_name = f"get_weapon_{bonus_type}_bonus"
-        shared_method_name = f"get_{bonus_type}_bonus"
-        
-        if hasattr(enchantment, weapon_method_name):
-            return getattr(enchantment, weapon_method_name)()
-        elif hasattr(enchantment, shared_method_name):
-            return getattr(enchantment, shared_method_name)()
-        return 0.0
+        # Default behavior - look up the precomputed bonus table
+        return getattr(get_enchantment_bonus_vector(enchantment.type, "weapon"), bonus_type, 0.0)
     
     def get_evade_bonus(self, player):
         """Get evade bonus including enchantments."""
@@ -135,8 +154,7 @@ class Weapon(Equipment):
     def get_crit_bonus(self, player):
         """Get crit bonus including enchantments."""
         total = super().get_crit_bonus(player)
-        for enchantment in self.enchantments:
-            total += self.get_enchantment_bonus(enchantment, "crit", player)
+        total += self._get_enchantment_total("crit", player)
         return total
     
     def get_crit_multiplier_bonus(self, player):
@@ -0,0 +1,64 @@
+"""
+Spatial index of dormant monsters for activation-zone queries.
+"""
+
+
+class ActivationZones:
+    """Dormant monsters bucketed into square zones of the map.
+
+    Dormant monsters never move, so each stays in the zone it was added to.
+    Radius queries only look at the zones overlapping the query circle, so
+    waking checks cost the same however many monsters sleep elsewhere.
+    """
+
+    ZONE_SIZE = 8
+
+    def __init__(self, zone_size=ZONE_SIZE):
+        """Initialize with no dormant monsters."""
+        self.zone_size = zone_size
+        self._zones = {}  # (zone_x, zone_y) -> list of monsters
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _zone_of(self, x, y):
+        return x // self.zone_size, y // self.zone_size
+
+    def add(self, monster):
+        """Add a dormant monster at its current position."""
+        self._zones.setdefault(self._zone_of(monster.x, monster.y), []).append(monster)
+        self._count += 1
+
+    def remove(self, monster):
+        """Remove a monster added with add()."""
+        zone = self._zone_of(monster.x, monster.y)
+        monsters = self._zones[zone]
+        # Monsters are dataclasses that compare by value, so match by identity
+        for index, other in enumerate(monsters):
+            if other is monster:
+                # Order within a zone does not matter, so swap-remove
+                monsters[index] = monsters[-1]
+                monsters.pop()
+                break
+        else:
+            raise ValueError(f"{monster.name} is not dormant")
+        if not monsters:
+            del self._zones[zone]
+        self._count -= 1
+
+    def __contains__(self, monster):
+        return any(other is monster for other in self._zones.get(self._zone_of(monster.x, monster.y), ()))
+
+    def query(self, x, y, radius):
+        """Get the dormant monsters within radius of (x, y) (Euclidean distance)."""
+        zone_x1, zone_y1 = self._zone_of(x - radius, y - radius)
+        zone_x2, zone_y2 = self._zone_of(x + radius, y + radius)
+        radius_squared = radius * radius
+        found = []
+        for zone_x in range(zone_x1, zone_x2 + 1):
+            for zone_y in range(zone_y1, zone_y2 + 1):
+                for monster in self._zones.get((zone_x, zone_y), ()):
+                    if (monster.x - x) ** 2 + (monster.y - y) ** 2 <= radius_squared:
+                        found.append(monster)
+        return found
@@ -6,10 +6,13 @@ import numpy as np
 import tcod
 from constants import (
     MAP_WIDTH, MAP_HEIGHT,
-    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP,
-    COLOR_DARK_WALL, COLOR_DARK_GROUND, COLOR_LIGHT_WALL, COLOR_LIGHT_GROUND
+    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP
 )
 from shop import Shop
+from turn_scheduler import TurnScheduler
+from .fov_cache import FovCache, fov_window
+from .room_graph import find_grid_path
+from .tile_types import TILE_WALKABLE, TILE_TRANSPARENT, new_tile_map, render_tiles
 
 
 class Base:
@@ -26,12 +29,14 @@ class Base:
         self.height = MAP_HEIGHT
         
         # Initialize the map with walls
-        self.tiles = np.full((MAP_WIDTH, MAP_HEIGHT), TILE_WALL, dtype=int)
+        self.tiles = new_tile_map(TILE_WALL)
         self.explored = np.full((MAP_WIDTH, MAP_HEIGHT), False, dtype=bool)
         self.fov = np.full((MAP_WIDTH, MAP_HEIGHT), False, dtype=bool)
+        self._fov_bounds = (0, 0, 0, 0)  # Region last written by update_fov
         
         # No monsters or random items in bases
         self.monsters = []
+        self.scheduler = TurnScheduler()  # Always empty; shares the Level interface
         self.items = []
         
         # Generate the fixed base layout
@@ -42,6 +47,7 @@ class Base:
         
         # Set up FOV map
         self.fov_map = tcod.map.Map(MAP_WIDTH, MAP_HEIGHT)
+        self.fov_cache = FovCache()
         self.update_fov_map()
     
     def generate_base_layout(self):
@@ -57,9 +63,7 @@ class Base:
         self.room_y2 = room_y + self.ROOM_HEIGHT - 1
         
         # Carve out the room (fill with floor tiles)
-        for x in range(room_x + 1, room_x + self.ROOM_WIDTH - 1):
-            for y in range(room_y + 1, room_y + self.ROOM_HEIGHT - 1):
-                self.tiles[x, y] = TILE_FLOOR
+        self.tiles[room_x + 1:room_x + self.ROOM_WIDTH - 1, room_y + 1:room_y + self.ROOM_HEIGHT - 1] = TILE_FLOOR
         
         # Place entry stairs (bottom center, offset from wall)
         entry_x = room_x + self.ROOM_WIDTH // 2
@@ -93,7 +97,7 @@ class Base:
         """Check if a tile is walkable."""
         if x < 0 or x >= MAP_WIDTH or y < 0 or y >= MAP_HEIGHT:
             return False
-        if self.tiles[x, y] == TILE_WALL:
+        if not TILE_WALKABLE[self.tiles[x, y]]:
             return False
         # No monsters to check in bases (safe zone)
         return True
@@ -120,13 +124,33 @@ class Base:
         """Get the position of stairs down."""
         return self.stairs_down_pos
     
+    def __getstate__(self):
+        """Get a compact snapshot of the base; FOV state is rebuilt on restore."""
+        state = self.__dict__.copy()
+        for name in ('fov', '_fov_bounds', 'fov_map', 'fov_cache'):
+            del state[name]
+        state['explored'] = np.packbits(self.explored)
+        return state
+    
+    def __setstate__(self, state):
+        """Restore the base from a snapshot made by __getstate__."""
+        self.__dict__.update(state)
+        self.explored = np.unpackbits(state['explored'], count=MAP_WIDTH * MAP_HEIGHT).reshape(
+            MAP_WIDTH, MAP_HEIGHT).astype(bool)
+        self.fov = np.full((MAP_WIDTH, MAP_HEIGHT), False, dtype=bool)
+        self._fov_bounds = (0, 0, 0, 0)
+        self.fov_map = tcod.map.Map(MAP_WIDTH, MAP_HEIGHT)
+        self.fov_cache = FovCache()
+        self.update_fov_map()
+    
     def update_fov_map(self):
         """Update the FOV map based on current tiles."""
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                is_transparent = self.tiles[x, y] != TILE_WALL
-                self.fov_map.transparent[y, x] = is_transparent
-                self.fov_map.walkable[y, x] = is_transparent
+        # tcod.map.Map uses (y, x) indexing, opposite of our tiles array
+        self.fov_map.transparent[:] = TILE_TRANSPARENT[self.tiles].T
+        self.fov_map.walkable[:] = TILE_WALKABLE[self.tiles].T
+        
+        # Cached FOV results are only valid for the terrain they were computed on
+        self.fov_cache.clear()
     
     def update_fov(self, player_x, player_y, fov_radius):
         """Update field of view from player position."""
@@ -135,53 +159,41 @@ class Base:
         if player_y < 0 or player_y >= MAP_HEIGHT:
             return
             
-        # Calculate FOV using the FOV map
-        self.fov[:] = False
-        self.fov[player_x, player_y] = True
+        # The base layout is fixed, so every position's FOV is computed at most once
+        fov = self.fov_cache.get_or_compute(player_x, player_y, fov_radius, self._compute_fov)
+        x1, y1, x2, y2 = fov_window(player_x, player_y, fov_radius, MAP_WIDTH, MAP_HEIGHT)
         
+        # Clear the previous visible region, then mark visible areas as explored
+        old_x1, old_y1, old_x2, old_y2 = self._fov_bounds
+        self.fov[old_x1:old_x2, old_y1:old_y2] = False
+        self.fov[x1:x2, y1:y2] = fov
+        self.explored[x1:x2, y1:y2] |= fov
+        self._fov_bounds = (x1, y1, x2, y2)
+    
+    def _compute_fov(self, player_x, player_y, fov_radius):
+        """Compute FOV over the fov_window around a position, in our (x, y) coordinate order."""
+        x1, y1, x2, y2 = fov_window(player_x, player_y, fov_radius, MAP_WIDTH, MAP_HEIGHT)
         # Compute FOV using tcod's algorithm
-        self.fov[:] = tcod.map.compute_fov(
-            transparency=self.fov_map.transparent,
-            pov=(player_y, player_x),
+        return tcod.map.compute_fov(
+            transparency=self.fov_map.transparent[y1:y2, x1:x2],
+            pov=(player_y - y1, player_x - x1),
             radius=fov_radius,
             light_walls=True,
             algorithm=tcod.FOV_BASIC
         ).T
-        
-        # Mark visible areas as explored
-        self.explored |= self.fov
     
-    def render(self, console):
-        """Render the base to the console."""
+    def get_fov_cache_stats(self):
+        """Get FOV cache hit/miss counters for this base."""
+        return self.fov_cache.get_stats()
+    
+    def render(self, console, camera=None):
+        """Render the camera's view of the base to the console."""
         # Render terrain
-        for x in range(min(MAP_WIDTH, console.width)):
-            for y in range(min(MAP_HEIGHT, console.height)):
-                if x < MAP_WIDTH and y < MAP_HEIGHT:
-                    visible = self.fov[x, y]
-                    explored = self.explored[x, y]
-                    
-                    if visible:
-                        if self.tiles[x, y] == TILE_WALL:
-                            console.print(x, y, '#', fg=COLOR_LIGHT_WALL)
-                        elif self.tiles[x, y] == TILE_FLOOR:
-                            console.print(x, y, '.', fg=COLOR_LIGHT_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_DOWN:
-                            console.print(x, y, '>', fg=COLOR_LIGHT_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_UP:
-                            console.print(x, y, '<', fg=COLOR_LIGHT_GROUND)
-                    elif explored:
-                        if self.tiles[x, y] == TILE_WALL:
-                            console.print(x, y, '#', fg=COLOR_DARK_WALL)
-                        elif self.tiles[x, y] == TILE_FLOOR:
-                            console.print(x, y, '.', fg=COLOR_DARK_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_DOWN:
-                            console.print(x, y, '>', fg=COLOR_DARK_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_UP:
-                            console.print(x, y, '<', fg=COLOR_DARK_GROUND)
+        render_tiles(console, self.tiles, self.fov, self.explored, camera)
         
         # Render shop symbol if present
         if self.shop:
-            self.shop.render(console, self.fov)
+            self.shop.render(console, self.fov, camera)
     
     # Stub methods to maintain compatibility with Level interface
     def is_position_occupied(self, x, y):
@@ -192,6 +204,30 @@ class Base:
         """No monsters in bases - always returns None."""
         return None
     
+    def wake_monsters_around_player(self, player_x, player_y):
+        """No monsters in bases - nothing to wake."""
+        pass
+    
+    def make_noise(self, x, y, radius):
+        """No monsters in bases - nothing to wake."""
+        pass
+    
+    def update_scent(self, player_x, player_y, bounds=None):
+        """No monsters in bases - no scent to track."""
+        pass
+    
+    def in_firing_range(self, x, y, player_x, player_y, attack_range):
+        """No monsters in bases - nothing can shoot the player."""
+        return False
+    
+    def spawn_wave_if_due(self):
+        """No monsters in bases - nothing ever respawns."""
+        return []
+    
+    def find_path(self, start, goal):
+        """Find a path of (x, y) steps from start to goal, or None; bases are small enough to search whole."""
+        return find_grid_path(start, goal, TILE_WALKABLE[self.tiles])
+    
     def get_item_at(self, x, y):
         """No random items in bases - always returns None."""
         return None
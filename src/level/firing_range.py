@@ -0,0 +1,61 @@
+"""
+Per-turn map of the cells from which ranged monsters can hit the player.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from .fov_cache import fov_window
+
+
+@lru_cache(maxsize=None)
+def _disk(radius):
+    """Get a (2r+1, 2r+1) boolean mask of the offsets within Euclidean distance radius."""
+    offsets = np.arange(-radius, radius + 1)
+    return offsets[:, None] ** 2 + offsets[None, :] ** 2 <= radius * radius
+
+
+class FiringRange:
+    """Cells within each attack range of the player that the player can see.
+
+    Sight is treated as symmetric, so the player's FOV answers line of sight
+    for every monster at once; masking it with a distance disk gives the cells
+    a monster with that attack range can shoot from. The mask for each range
+    is built once per player position and FOV (the window around the player
+    only), after which each monster's check is a single lookup, so a turn
+    costs the same however many ranged monsters there are. Call clear()
+    whenever the FOV is recomputed.
+    """
+
+    def __init__(self):
+        """Initialize with nothing cached."""
+        self._origin = None
+        self._masks = {}  # attack range -> (x1, y1, window as [column][row] booleans)
+
+    def clear(self):
+        """Forget the cached masks (the FOV changed)."""
+        self._origin = None
+        self._masks.clear()
+
+    def covers(self, fov, player_x, player_y, attack_range, x, y):
+        """Check whether a monster at (x, y) with attack_range can hit the player at (player_x, player_y)."""
+        if self._origin != (player_x, player_y):
+            self._origin = (player_x, player_y)
+            self._masks.clear()
+        entry = self._masks.get(attack_range)
+        if entry is None:
+            entry = self._masks[attack_range] = self._build(fov, player_x, player_y, attack_range)
+        x1, y1, mask = entry
+        column, row = x - x1, y - y1
+        return 0 <= column < len(mask) and 0 <= row < len(mask[0]) and mask[column][row]
+
+    @staticmethod
+    def _build(fov, player_x, player_y, attack_range):
+        """Mask the FOV window around the player with the disk of attack_range, as nested lists for fast lookups."""
+        width, height = fov.shape
+        x1, y1, x2, y2 = fov_window(player_x, player_y, attack_range, width, height)
+        disk = _disk(attack_range)
+        disk_x, disk_y = x1 - (player_x - attack_range), y1 - (player_y - attack_range)
+        mask = fov[x1:x2, y1:y2] & disk[disk_x:disk_x + x2 - x1, disk_y:disk_y + y2 - y1]
+        return x1, y1, mask.tolist()
@@ -0,0 +1,107 @@
+"""
+LRU cache of field-of-view results for a map area.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+def fov_window(x, y, radius, width, height):
+    """Get the map region FOV from (x, y) can reach, as (x1, y1, x2, y2) with x2 and y2 exclusive.
+
+    A radius of 0 means unlimited, which covers the whole map.
+    """
+    if radius <= 0:
+        return 0, 0, width, height
+    return (max(0, x - radius), max(0, y - radius),
+            min(width, x + radius + 1), min(height, y + radius + 1))
+
+
+class FovCache:
+    """Bounded LRU cache of FOV bitmaps keyed by (x, y, radius).
+
+    Terrain never changes after generation, so the FOV from a given position
+    and radius is always the same. Bitmaps (usually just the fov_window around
+    the position) are stored packed, one bit per tile; call clear() whenever
+    the area's terrain changes.
+    """
+
+    DEFAULT_CAPACITY = 256
+
+    # Hit/miss totals across every cache, for profiling a whole session
+    total_hits = 0
+    total_misses = 0
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """Initialize an empty cache."""
+        self.capacity = capacity
+        self._entries = OrderedDict()  # key -> (shape, packed bitmap)
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, x, y, radius, compute):
+        """Get the FOV for a position and radius, calling compute(x, y, radius) on a miss.
+
+        compute must return a 2D boolean array; hits return an array of the same shape.
+        """
+        key = (x, y, radius)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            FovCache.total_hits += 1
+            shape, packed = entry
+            return np.unpackbits(packed, count=shape[0] * shape[1]).reshape(shape).view(bool)
+
+        self.misses += 1
+        FovCache.total_misses += 1
+        fov = compute(x, y, radius)
+        self._entries[key] = (fov.shape, np.packbits(fov))
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return fov
+
+    def clear(self):
+        """Drop all cached results (terrain changed)."""
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the packed bitmaps."""
+        return sum(packed.nbytes for _, packed in self._entries.values())
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self):
+        """Get hit/miss counters for this cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'entries': len(self._entries),
+            'capacity': self.capacity,
+        }
+
+    @classmethod
+    def get_global_stats(cls):
+        """Get hit/miss counters summed over every FOV cache."""
+        lookups = cls.total_hits + cls.total_misses
+        return {
+            'hits': cls.total_hits,
+            'misses': cls.total_misses,
+            'hit_rate': cls.total_hits / lookups if lookups else 0.0,
+        }
+
+    @classmethod
+    def reset_global_stats(cls):
+        """Reset the session-wide counters."""
+        cls.total_hits = 0
+        cls.total_misses = 0
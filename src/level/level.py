@@ -7,77 +7,106 @@ import numpy as np
 import tcod
 
 from constants import (
-    MAP_WIDTH, MAP_HEIGHT,
-    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP,
-    COLOR_DARK_WALL, COLOR_DARK_GROUND, COLOR_LIGHT_WALL, COLOR_LIGHT_GROUND
+    MAP_WIDTH, MAP_HEIGHT, MAX_LEVELS, WAKE_RADIUS, MONSTER_COUNT_RANGES,
+    RESPAWN_WAVES, RESPAWN_WAVE_INTERVAL, RESPAWN_WAVE_SIZE,
+    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP
 )
-from monsters import create_monster_for_level
+from monsters import Monster, create_monster_for_level, recycle_monster
+from turn_scheduler import TurnScheduler
 from items.factory import create_random_item_for_level
-from items.pool import item_pool
+from items.pool import item_pool, item_pool_lock
 from items.weapons.demon_slayer import DemonSlayer
 from .room import Room
+from .activation_zones import ActivationZones
+from .scent_map import ScentMap
+from .room_graph import RoomGraph
+from .fov_cache import FovCache, fov_window
+from .firing_range import FiringRange
+from .tile_types import TILE_WALKABLE, TILE_TRANSPARENT, new_tile_map, render_tiles
 
 
 class Level:
     """Represents a dungeon level."""
     
-    def __init__(self, level_number):
-        """Initialize the level."""
+    # Random cells tried per monster when placing a respawn wave
+    SPAWN_ATTEMPTS = 10
+    
+    def __init__(self, level_number, width=MAP_WIDTH, height=MAP_HEIGHT, respawn_waves=RESPAWN_WAVES):
+        """Initialize the level; maps larger than the viewport are shown through a Camera.
+        
+        With respawn_waves the floor keeps spawning waves of monsters as turns pass
+        (see spawn_wave_if_due); otherwise it stays as placed.
+        """
         self.level_number = level_number
-        self.width = MAP_WIDTH
-        self.height = MAP_HEIGHT
+        self.width = width
+        self.height = height
+        self.respawn_waves = respawn_waves
+        self.next_wave_time = RESPAWN_WAVE_INTERVAL * TurnScheduler.TURN_TIME  # Scheduler time of the next wave
         
         # Initialize the map with walls
-        self.tiles = np.full((MAP_WIDTH, MAP_HEIGHT), TILE_WALL, dtype=int)
-        self.explored = np.full((MAP_WIDTH, MAP_HEIGHT), False, dtype=bool)
-        self.fov = np.full((MAP_WIDTH, MAP_HEIGHT), False, dtype=bool)
-        
-        # Notify item pool about new floor for uniqueness tracking
-        item_pool.start_new_floor(level_number)
+        self.tiles = new_tile_map(TILE_WALL, width, height)
+        self.explored = np.full((width, height), False, dtype=bool)
+        self.fov = np.full((width, height), False, dtype=bool)
+        self._fov_bounds = (0, 0, 0, 0)  # Region last written by update_fov
         
         # Generate the level
         self.rooms = []
         self.monsters = []
+        self.scheduler = TurnScheduler()  # When each awake monster acts next
+        self.dormant = ActivationZones()  # Monsters that have not been woken yet
         self.items = []
         self.shop = None  # Shop for this level (if any)
-        self.generate_level()
-        
-        # Shops no longer spawn on regular floors (moved to bases)
-        self.shop = None
-        
-        # Place monsters and items
-        self.place_monsters()
-        self.place_items()
+        with item_pool_lock:
+            # Notify item pool about new floor for uniqueness tracking
+            item_pool.start_new_floor(level_number)
+            self.generate_level()
+            
+            # Shops no longer spawn on regular floors (moved to bases)
+            self.shop = None
+            
+            # Place monsters and items
+            self._build_free_cells()
+            self.place_monsters()
+            self.place_items()
         
         # Set up FOV map - note tcod uses (width, height) order
-        self.fov_map = tcod.map.Map(MAP_WIDTH, MAP_HEIGHT)
+        self.fov_map = tcod.map.Map(width, height)
+        self.fov_cache = FovCache()
+        self.firing_range = FiringRange()  # Where ranged monsters can hit the player from
         self.update_fov_map()
+        
+        # Player scent for monsters tracking the player out of sight
+        self.scent = ScentMap(self.walkable)
     
     def generate_level(self):
         """Generate the dungeon level."""
-        # Room generation parameters
-        max_rooms = 30
+        # Room generation parameters; room attempts scale with map area
+        max_rooms = 30 * (self.width * self.height) // (MAP_WIDTH * MAP_HEIGHT)
         room_min_size = 6
         room_max_size = 10
         
+        # Cells covered by accepted rooms, walls included; a candidate room
+        # intersects an accepted one exactly when its rectangle covers a claimed cell
+        claimed = np.zeros((self.width, self.height), dtype=bool)
+        
+        # (previous room, new room, corridor cells) for each tunnel, for the room graph
+        self.tunnels = tunnels = []
+        self._room_graph = None  # Built from rooms and tunnels by build_room_graph
+        
         for r in range(max_rooms):
             # Random width and height
             w = random.randint(room_min_size, room_max_size)
             h = random.randint(room_min_size, room_max_size)
             
             # Random position without going out of bounds
-            x = random.randint(0, MAP_WIDTH - w - 1)
-            y = random.randint(0, MAP_HEIGHT - h - 1)
+            x = random.randint(0, self.width - w - 1)
+            y = random.randint(0, self.height - h - 1)
             
             # Create the room
             new_room = Room(x, y, w, h)
             
-            # Check if room intersects with existing rooms
-            failed = False
-            for other_room in self.rooms:
-                if new_room.intersect(other_room):
-                    failed = True
-                    break
+            # Check if room intersects with existing rooms, all at once
+            failed = claimed[new_room.x1:new_room.x2 + 1, new_room.y1:new_room.y2 + 1].any()
             
             if not failed:
                 # Create the room
@@ -90,12 +119,14 @@ class Level:
                     
                     # 50% chance to go horizontal first, then vertical
                     if random.randint(0, 1) == 1:
-                        self.create_h_tunnel(prev_x, new_x, prev_y)
-                        self.create_v_tunnel(prev_y, new_y, new_x)
+                        first = self.create_h_tunnel(prev_x, new_x, prev_y)
+                        second = self.create_v_tunnel(prev_y, new_y, new_x)
                     else:
-                        self.create_v_tunnel(prev_y, new_y, prev_x)
-                        self.create_h_tunnel(prev_x, new_x, new_y)
+                        first = self.create_v_tunnel(prev_y, new_y, prev_x)
+                        second = self.create_h_tunnel(prev_x, new_x, new_y)
+                    tunnels.append((len(self.rooms) - 1, len(self.rooms), np.concatenate((first, second[1:]))))
                 
+                claimed[new_room.x1:new_room.x2 + 1, new_room.y1:new_room.y2 + 1] = True
                 self.rooms.append(new_room)
         
         # Place stairs
@@ -103,19 +134,19 @@ class Level:
     
     def create_room(self, room):
         """Create a room by setting tiles to floor."""
-        for x in range(room.x1 + 1, room.x2):
-            for y in range(room.y1 + 1, room.y2):
-                self.tiles[x, y] = TILE_FLOOR
+        self.tiles[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = TILE_FLOOR
     
     def create_h_tunnel(self, x1, x2, y):
-        """Create a horizontal tunnel."""
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            self.tiles[x, y] = TILE_FLOOR
+        """Create a horizontal tunnel; returns its cells from x1 to x2 as an (N, 2) array of (x, y)."""
+        self.tiles[min(x1, x2):max(x1, x2) + 1, y] = TILE_FLOOR
+        xs = np.arange(x1, x2 + (1 if x2 >= x1 else -1), 1 if x2 >= x1 else -1)
+        return np.column_stack((xs, np.full_like(xs, y)))
     
     def create_v_tunnel(self, y1, y2, x):
-        """Create a vertical tunnel."""
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            self.tiles[x, y] = TILE_FLOOR
+        """Create a vertical tunnel; returns its cells from y1 to y2 as an (N, 2) array of (x, y)."""
+        self.tiles[x, min(y1, y2):max(y1, y2) + 1] = TILE_FLOOR
+        ys = np.arange(y1, y2 + (1 if y2 >= y1 else -1), 1 if y2 >= y1 else -1)
+        return np.column_stack((np.full_like(ys, x), ys))
     
     def place_stairs(self):
         """Place stairs in the level."""
@@ -140,45 +171,47 @@ class Level:
     def place_monsters(self):
         """Place monsters randomly throughout the level."""
         # Number of monsters based on level
-        if self.level_number == 1:
-            monster_count = random.randint(2, 4)  # Few monsters to introduce combat
-        elif self.level_number <= 3:
-            monster_count = random.randint(4, 8)
-        elif self.level_number <= 6:
-            monster_count = random.randint(6, 12)
-        elif self.level_number <= 8:
-            monster_count = random.randint(8, 16)
-        elif self.level_number == 9: # swarm level
-            monster_count = random.randint(12, 20)
-
-        else:  # Level 10 - boss level
-            monster_count = 1  # Just the boss
-        
-        monsters_placed = 0
-        attempts = 0
-        max_attempts = 100
+        fewest, most = MONSTER_COUNT_RANGES[min(self.level_number, MAX_LEVELS)]
+        monster_count = random.randint(fewest, most) if fewest < most else fewest
         
-        while monsters_placed < monster_count and attempts < max_attempts:
-            attempts += 1
-            
-            # Pick a random room
-            if len(self.rooms) == 0:
+        for _ in range(monster_count):
+            # Take a free floor cell (never stairs, never occupied)
+            position = self._take_free_cell()
+            if position is None:
                 break
-                
-            room = random.choice(self.rooms)
             
-            # Pick a random position in the room
-            x = random.randint(room.x1 + 1, room.x2 - 1)
-            y = random.randint(room.y1 + 1, room.y2 - 1)
-            
-            # Check if position is valid (walkable and not occupied)
-            if self.is_walkable(x, y) and not self.is_position_occupied(x, y):
-                # Don't place monsters on stairs or shops
-                if not (self.is_stairs_down(x, y) or self.is_stairs_up(x, y) or self.is_shop_at(x, y)):
-                    # Create appropriate monster for this level
-                    monster = create_monster_for_level(self.level_number, x, y)
-                    self.monsters.append(monster)
-                    monsters_placed += 1
+            # Create appropriate monster for this level
+            x, y = position
+            monster = create_monster_for_level(self.level_number, x, y)
+            self.add_monster(monster)
+    
+    def add_monster(self, monster):
+        """Add a monster to the level; it stays dormant (takes no turns) until woken."""
+        self.monsters.append(monster)
+        self.dormant.add(monster)
+    
+    def wake_monster(self, monster):
+        """Wake a dormant monster and schedule its first action."""
+        self.dormant.remove(monster)
+        self.scheduler.add(monster)
+    
+    def wake_monsters_around_player(self, player_x, player_y):
+        """Wake dormant monsters near the player or in the player's view within sight range.
+        
+        Call after update_fov, so the FOV reflects the player's position.
+        """
+        for monster in self.dormant.query(player_x, player_y, Monster.sight_range):
+            if self.fov[monster.x, monster.y] or monster.distance_to(player_x, player_y) <= WAKE_RADIUS:
+                self.wake_monster(monster)
+    
+    def update_scent(self, player_x, player_y, bounds=None):
+        """Spread and decay the player's scent for one turn, within bounds if given."""
+        self.scent.update(player_x, player_y, bounds)
+    
+    def make_noise(self, x, y, radius):
+        """Wake every dormant monster within radius of a noise."""
+        for monster in self.dormant.query(x, y, radius):
+            self.wake_monster(monster)
     
     def is_position_occupied(self, x, y):
         """Check if a position is occupied by a monster."""
@@ -195,8 +228,76 @@ class Level:
         return None
     
     def remove_dead_monsters(self):
-        """Remove dead monsters from the level."""
-        self.monsters = [monster for monster in self.monsters if monster.is_alive()]
+        """Remove dead monsters from the level and hand them back to the monster pool for reuse.
+        
+        Monsters are swap-removed in place, so the order of the survivors may change.
+        """
+        monsters = self.monsters
+        for index in range(len(monsters) - 1, -1, -1):
+            monster = monsters[index]
+            if not monster.is_alive():
+                # Everything after index has been checked, so the last monster can fill the gap
+                monsters[index] = monsters[-1]
+                monsters.pop()
+                self._retire(monster)
+    
+    def remove_monster(self, monster):
+        """Remove one monster from the level (swap-remove), recycling it if it is dead."""
+        monsters = self.monsters
+        for index, other in enumerate(monsters):
+            # Monsters are dataclasses that compare by value, so match by identity
+            if other is monster:
+                monsters[index] = monsters[-1]
+                monsters.pop()
+                self._retire(monster)
+                return
+        raise ValueError(f"{monster.name} is not on this level")
+    
+    def _retire(self, monster):
+        """Take a removed monster off the schedule and out of the dormant zones, then recycle it."""
+        if not self.scheduler.remove(monster) and monster in self.dormant:
+            self.dormant.remove(monster)
+        recycle_monster(monster)
+    
+    def spawn_wave_if_due(self):
+        """Spawn a wave of dormant monsters if respawn mode is on and the next wave is due.
+        
+        Waves come every RESPAWN_WAVE_INTERVAL player turns of scheduler time, so
+        only turns spent on this floor count. Monsters are placed in room cells
+        out of the player's view (call after update_fov), never beyond the most
+        monsters the floor starts with, and never on the boss floor. Returns the
+        monsters spawned.
+        """
+        if not self.respawn_waves or self.scheduler.time < self.next_wave_time:
+            return []
+        self.next_wave_time += RESPAWN_WAVE_INTERVAL * TurnScheduler.TURN_TIME
+        if self.level_number >= MAX_LEVELS:
+            return []
+        
+        most = MONSTER_COUNT_RANGES[self.level_number][1]
+        alive = sum(1 for monster in self.monsters if monster.is_alive())
+        count = min(random.randint(*RESPAWN_WAVE_SIZE), most - alive)
+        
+        spawned = []
+        for _ in range(count):
+            position = self._find_spawn_cell()
+            if position is None:
+                break
+            monster = create_monster_for_level(self.level_number, *position)
+            self.add_monster(monster)
+            spawned.append(monster)
+        return spawned
+    
+    def _find_spawn_cell(self):
+        """Pick a random room cell that is out of view and free of monsters, or None if none turns up."""
+        spawn_cells = self._spawn_cells
+        if len(spawn_cells) == 0:
+            return None
+        for _ in range(self.SPAWN_ATTEMPTS):
+            x, y = divmod(int(spawn_cells[random.randrange(len(spawn_cells))]), self.height)
+            if not self.fov[x, y] and not self.is_position_occupied(x, y):
+                return x, y
+        return None
     
     def place_items(self):
         """Place items randomly throughout the level."""
@@ -218,74 +319,63 @@ class Level:
         
         items_placed = 0
         pickup_placed = False  # Track if we've placed a pickup
-        attempts = 0
-        max_attempts = 100
         
-        while items_placed < item_count and attempts < max_attempts:
-            attempts += 1
-            
-            # Pick a random room
-            if len(self.rooms) == 0:
+        while items_placed < item_count:
+            # Take a free floor cell (never stairs, monsters or other items)
+            position = self._take_free_cell()
+            if position is None:
                 break
-                
-            room = random.choice(self.rooms)
-            
-            # Pick a random position in the room
-            x = random.randint(room.x1 + 1, room.x2 - 1)
-            y = random.randint(room.y1 + 1, room.y2 - 1)
+            x, y = position
             
-            # Check if position is valid (walkable, not occupied, not on stairs or shops)
-            if (self.is_walkable(x, y) and 
-                not self.is_position_occupied(x, y) and
-                not self.is_item_at(x, y) and
-                not (self.is_stairs_down(x, y) or self.is_stairs_up(x, y)) and
-                not self.is_shop_at(x, y)):
-                
-                # If this is the last item slot and we haven't placed a pickup, force one
-                if items_placed == item_count - 1 and not pickup_placed:
-                    item = item_pool.create_item_for_level(self.level_number, x, y, item_type='pickup')
+            # If this is the last item slot and we haven't placed a pickup, force one
+            if items_placed == item_count - 1 and not pickup_placed:
+                item = item_pool.create_item_for_level(self.level_number, x, y, item_type='pickup')
+                pickup_placed = True
+            else:
+                # Create appropriate item for this level
+                item = create_random_item_for_level(self.level_number, x, y)
+                # Check if we placed a pickup
+                from items.pickups import Pickup
+                if isinstance(item, Pickup):
                     pickup_placed = True
-                else:
-                    # Create appropriate item for this level
-                    item = create_random_item_for_level(self.level_number, x, y)
-                    # Check if we placed a pickup
-                    from items.pickups import Pickup
-                    if isinstance(item, Pickup):
-                        pickup_placed = True
-                
-                if item:  # Only append if item creation succeeded
-                    self.items.append(item)
-                    items_placed += 1
+            
+            if item:  # Only append if item creation succeeded
+                self.items.append(item)
+                items_placed += 1
     
     def _place_demon_slayer(self):
         """Place exactly one DemonSlayer weapon on level 10."""
-        attempts = 0
-        max_attempts = 100
+        position = self._take_free_cell()
+        if position is not None:
+            # Create the DemonSlayer weapon
+            x, y = position
+            demon_slayer = DemonSlayer(x, y)
+            self.items.append(demon_slayer)
+    
+    def _build_free_cells(self):
+        """Index the room floor cells available for placing monsters and items.
         
-        while attempts < max_attempts:
-            attempts += 1
-            
-            # Pick a random room
-            if len(self.rooms) == 0:
-                break
-                
-            room = random.choice(self.rooms)
-            
-            # Pick a random position in the room
-            x = random.randint(room.x1 + 1, room.x2 - 1)
-            y = random.randint(room.y1 + 1, room.y2 - 1)
-            
-            # Check if position is valid (walkable, not occupied, not on stairs or shops)
-            if (self.is_walkable(x, y) and 
-                not self.is_position_occupied(x, y) and
-                not self.is_item_at(x, y) and
-                not (self.is_stairs_down(x, y) or self.is_stairs_up(x, y)) and
-                not self.is_shop_at(x, y)):
-                
-                # Create the DemonSlayer weapon
-                demon_slayer = DemonSlayer(x, y)
-                self.items.append(demon_slayer)
-                break
+        Cells are stored as flat indices into the tiles array. Stairs are excluded
+        up front, and placement removes each cell it fills, so nothing ever needs
+        to be re-checked against monsters, items or stairs.
+        """
+        candidates = np.zeros((self.width, self.height), dtype=bool)
+        for room in self.rooms:
+            candidates[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = True
+        candidates &= self.tiles == TILE_FLOOR
+        self._spawn_cells = np.flatnonzero(candidates)  # Kept whole for respawn waves
+        self._free_cells = self._spawn_cells.tolist()
+    
+    def _take_free_cell(self):
+        """Remove a random free cell from the index and return it as (x, y), or None if full."""
+        free_cells = self._free_cells
+        if not free_cells:
+            return None
+        
+        # Swap the chosen cell with the last one so removal is O(1)
+        index = random.randrange(len(free_cells))
+        free_cells[index], free_cells[-1] = free_cells[-1], free_cells[index]
+        return divmod(free_cells.pop(), self.height)
     
     def is_shop_at(self, x, y):
         """Check if there's a shop at the given position."""
@@ -319,9 +409,9 @@ class Level:
     
     def is_walkable(self, x, y):
         """Check if a tile is walkable."""
-        if x < 0 or x >= MAP_WIDTH or y < 0 or y >= MAP_HEIGHT:
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
             return False
-        if self.tiles[x, y] == TILE_WALL:
+        if not TILE_WALKABLE[self.tiles[x, y]]:
             return False
         # Can't walk through living monsters
         if self.is_position_occupied(x, y):
@@ -344,67 +434,114 @@ class Level:
         """Get the position of stairs down."""
         return self.stairs_down_pos if self.stairs_down_pos else (0, 0)
     
+    def __getstate__(self):
+        """Get a compact snapshot of the level; FOV state is rebuilt on restore."""
+        state = self.__dict__.copy()
+        for name in ('fov', '_fov_bounds', 'fov_map', 'fov_cache', 'firing_range', 'walkable', 'scent'):
+            del state[name]
+        state['explored'] = np.packbits(self.explored)
+        return state
+    
+    def __setstate__(self, state):
+        """Restore the level from a snapshot made by __getstate__."""
+        self.__dict__.update(state)
+        self.explored = np.unpackbits(state['explored'], count=self.width * self.height).reshape(
+            self.width, self.height).astype(bool)
+        self.fov = np.full((self.width, self.height), False, dtype=bool)
+        self._fov_bounds = (0, 0, 0, 0)
+        self.fov_map = tcod.map.Map(self.width, self.height)
+        self.fov_cache = FovCache()
+        self.firing_range = FiringRange()
+        self.update_fov_map()
+        self.scent = ScentMap(self.walkable)
+    
     def update_fov_map(self):
         """Update the FOV map based on current tiles."""
         # tcod.map.Map uses (y, x) indexing, opposite of our tiles array
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                is_transparent = self.tiles[x, y] != TILE_WALL
-                self.fov_map.transparent[y, x] = is_transparent
-                self.fov_map.walkable[y, x] = is_transparent
+        self.fov_map.transparent[:] = TILE_TRANSPARENT[self.tiles].T
+        self.walkable = TILE_WALKABLE[self.tiles]
+        self.fov_map.walkable[:] = self.walkable.T
+        
+        # Cached FOV results are only valid for the terrain they were computed on
+        self.fov_cache.clear()
+    
+    @property
+    def room_graph(self):
+        """The level's RoomGraph, built on first use if build_room_graph was not called."""
+        self.build_room_graph()
+        return self._room_graph
+    
+    def build_room_graph(self):
+        """Build the level's RoomGraph from its rooms and tunnels, unless already built.
+        
+        Generation leaves this out, as many levels never need a path; LevelManager
+        calls it for the floors it creates. Snapshots keep the built graph.
+        """
+        if self._room_graph is None:
+            self._room_graph = RoomGraph(self.rooms, self.tunnels, self.width, self.height)
+            self.tunnels = None  # The graph holds their corridor cells now
+    
+    def find_path(self, start, goal):
+        """Find a path of (x, y) steps from start to goal (ignoring monsters), or None.
+        
+        Searches the room graph first, then walks the chosen route a few rooms
+        at a time, searching only the tiles of those rooms and their tunnels.
+        """
+        return self.room_graph.find_path(start, goal, self.walkable)
     
     def update_fov(self, player_x, player_y, fov_radius):
-        """Update field of view from player position."""
+        """Update field of view from player position.
+        
+        Only the region within fov_radius of the player is computed and written,
+        so the cost does not grow with the map size.
+        """
         # Ensure player is within bounds
-        if (0 <= player_x < MAP_WIDTH and 0 <= player_y < MAP_HEIGHT):
-            # tcod.map.Map.compute_fov expects (x, y) coordinates
-            self.fov_map.compute_fov(player_x, player_y, fov_radius)
+        if (0 <= player_x < self.width and 0 <= player_y < self.height):
+            fov = self.fov_cache.get_or_compute(player_x, player_y, fov_radius, self._compute_fov)
+            x1, y1, x2, y2 = fov_window(player_x, player_y, fov_radius, self.width, self.height)
             
-            # Update explored tiles 
-            for x in range(MAP_WIDTH):
-                for y in range(MAP_HEIGHT):
-                    # Check FOV using our coordinate system
-                    if (0 <= x < MAP_WIDTH and 0 <= y < MAP_HEIGHT and 
-                        self.fov_map.fov[y, x]):
-                        self.explored[x, y] = True
-                        self.fov[x, y] = True
-                    else:
-                        self.fov[x, y] = False
-    
-    def render(self, console):
-        """Render the level to the console."""
-        for x in range(min(MAP_WIDTH, console.width)):
-            for y in range(min(MAP_HEIGHT, console.height)):
-                if x < MAP_WIDTH and y < MAP_HEIGHT:
-                    visible = self.fov[x, y]
-                    explored = self.explored[x, y]
-                    
-                    if visible:
-                        if self.tiles[x, y] == TILE_WALL:
-                            console.print(x, y, '#', fg=COLOR_LIGHT_WALL)
-                        elif self.tiles[x, y] == TILE_FLOOR:
-                            console.print(x, y, '.', fg=COLOR_LIGHT_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_DOWN:
-                            console.print(x, y, '>', fg=COLOR_LIGHT_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_UP:
-                            console.print(x, y, '<', fg=COLOR_LIGHT_GROUND)
-                    elif explored:
-                        if self.tiles[x, y] == TILE_WALL:
-                            console.print(x, y, '#', fg=COLOR_DARK_WALL)
-                        elif self.tiles[x, y] == TILE_FLOOR:
-                            console.print(x, y, '.', fg=COLOR_DARK_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_DOWN:
-                            console.print(x, y, '>', fg=COLOR_DARK_GROUND)
-                        elif self.tiles[x, y] == TILE_STAIRS_UP:
-                            console.print(x, y, '<', fg=COLOR_DARK_GROUND)
+            # Clear the previous visible region, then update visible and explored tiles
+            old_x1, old_y1, old_x2, old_y2 = self._fov_bounds
+            self.fov[old_x1:old_x2, old_y1:old_y2] = False
+            self.fov[x1:x2, y1:y2] = fov
+            self.explored[x1:x2, y1:y2] |= fov
+            self._fov_bounds = (x1, y1, x2, y2)
+            self.firing_range.clear()
+    
+    def in_firing_range(self, x, y, player_x, player_y, attack_range):
+        """Check whether a monster at (x, y) can hit the player from attack_range away.
+        
+        Uses the player's FOV as line of sight (see FiringRange), so call after update_fov.
+        """
+        return self.firing_range.covers(self.fov, player_x, player_y, attack_range, x, y)
+    
+    def _compute_fov(self, player_x, player_y, fov_radius):
+        """Compute FOV over the fov_window around a position, in our (x, y) coordinate order."""
+        x1, y1, x2, y2 = fov_window(player_x, player_y, fov_radius, self.width, self.height)
+        # tcod uses (y, x) indexing, opposite of our tiles array
+        return tcod.map.compute_fov(
+            transparency=self.fov_map.transparent[y1:y2, x1:x2],
+            pov=(player_y - y1, player_x - x1),
+            radius=fov_radius,
+            light_walls=True,
+            algorithm=tcod.FOV_RESTRICTIVE
+        ).T
+    
+    def get_fov_cache_stats(self):
+        """Get FOV cache hit/miss counters for this level."""
+        return self.fov_cache.get_stats()
+    
+    def render(self, console, camera=None):
+        """Render the camera's view of the level to the console."""
+        render_tiles(console, self.tiles, self.fov, self.explored, camera)
         
         # Shops no longer render on regular floors (moved to bases)
         
         # Render items on top of terrain (but below monsters)
         for item in self.items:
-            item.render(console, self.fov)
+            item.render(console, self.fov, camera)
         
         # Render monsters on top of everything
         for monster in self.monsters:
             if monster.is_alive():
-                monster.render(console, self.fov)
\ No newline at end of file
+                monster.render(console, self.fov, camera)
\ No newline at end of file
@@ -0,0 +1,486 @@
+"""
+Room adjacency graph and hierarchical pathfinding for generated levels.
+"""
+
+import heapq
+
+import numpy as np
+import tcod
+
+
+# Offsets of a cell's 3x3 neighbourhood, including itself
+_NEIGHBOURHOOD = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+class RoomGraph:
+    """Rooms of a level and the corridors joining them.
+
+    Nodes are the rooms plus junctions, patches of corridor where tunnels cross,
+    overlap or touch. Each tunnel is split at every room and junction it passes
+    through, and each piece becomes an edge holding its corridor cells; the
+    corridor cells in a room's wall ring are its doors. find_path searches this
+    graph first, then walks the chosen route a stretch of ROUTE_STRIDE nodes
+    at a time, with tile-level A* over only that stretch's rooms, junctions
+    and corridors, so each search stays small however long the route.
+
+    Snapshots leave out the per-cell node_at and edge_at maps, which are
+    repainted from the rooms, junctions and edges on restore.
+    """
+
+    # tcod A* step cost for diagonal moves, relative to 1 for orthogonal ones
+    DIAGONAL_COST = 1.41
+    # Largest junction, in tiles per side
+    JUNCTION_SIZE = 16
+    # Goals this close are searched tile by tile in a window around start and goal
+    LOCAL_RANGE = 16
+    # Route nodes searched tile by tile at once, when walking a route
+    ROUTE_STRIDE = 8
+
+    def __init__(self, rooms, tunnels, width, height):
+        """Build the graph from rooms and (room_a, room_b, corridor_cells) tunnels.
+
+        corridor_cells is an (N, 2) integer array of the (x, y) positions the
+        tunnel carved, in order from room_a to room_b.
+        """
+        self.rooms = rooms
+        self.width = width
+        self.height = height
+        tunnels = [np.asarray(cells, dtype=np.intp).reshape(-1, 2) for _, _, cells in tunnels]
+
+        # Node of every room interior cell and junction cell, -1 elsewhere
+        self.node_at = np.full((width, height), -1, dtype=np.int32)
+        self.positions = [room.center() for room in rooms]  # node -> (x, y)
+        for index, room in enumerate(rooms):
+            self.node_at[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = index
+
+        # Edges as (node_a, node_b, corridor_cells, cost), plus per-node adjacency
+        self.edges = []
+        # edge -> its pieces, shortest first, each the (N, 2) cells walked from a cell of
+        # node_a along the corridor to a cell of node_b
+        self.edge_pieces = []
+        self.neighbours = [[] for _ in rooms]  # node -> [(other node, edge index, cost)]
+        # An edge whose corridor covers each cell, -1 elsewhere
+        self.edge_at = np.full((width, height), -1, dtype=np.int32)
+
+        links, link_cells = self._add_junctions(tunnels)
+        self._add_edges(tunnels, links, link_cells)
+        self._position_array = np.array(self.positions)  # positions as an (N, 2) array, for find_route
+
+    def __getstate__(self):
+        """Get a snapshot of the graph without its per-cell maps, which _paint_cells rebuilds.
+
+        Tens of thousands of small arrays pickle slowly, so the cells of the edges
+        and of their pieces go packed into one array each.
+        """
+        state = self.__dict__.copy()
+        del state['node_at'], state['edge_at']
+        state['edges'] = [(node_a, node_b, cost) for node_a, node_b, _, cost in self.edges]
+        state['edge_cells'] = _pack([cells for _, _, cells, _ in self.edges])
+        state['edge_pieces'] = _pack([piece for pieces in self.edge_pieces for piece in pieces])
+        state['piece_counts'] = [len(pieces) for pieces in self.edge_pieces]
+        return state
+
+    def __setstate__(self, state):
+        """Restore the graph from a snapshot made by __getstate__."""
+        state = dict(state)
+        edge_cells = _unpack(*state.pop('edge_cells'))
+        pieces = iter(_unpack(*state.pop('edge_pieces')))
+        piece_counts = state.pop('piece_counts')
+        self.__dict__.update(state)
+        self.edges = [(node_a, node_b, cells, cost) for (node_a, node_b, cost), cells in zip(self.edges, edge_cells)]
+        self.edge_pieces = [[next(pieces) for _ in range(count)] for count in piece_counts]
+        self._paint_cells()
+
+    def _paint_cells(self):
+        """Fill node_at and edge_at from the rooms, junction cells and edges, as building them did."""
+        self.node_at = np.full((self.width, self.height), -1, dtype=np.int32)
+        for index, room in enumerate(self.rooms):
+            self.node_at[room.x1 + 1:room.x2, room.y1 + 1:room.y2] = index
+        for junction, cells in enumerate(self.junction_cells, start=len(self.rooms)):
+            self.node_at[cells[:, 0], cells[:, 1]] = junction
+        self.edge_at = np.full((self.width, self.height), -1, dtype=np.int32)
+        for index, (_, _, cells, _) in enumerate(self.edges):
+            self.edge_at[cells[:, 0], cells[:, 1]] = index
+
+    def _add_junctions(self, tunnels):
+        """Add junction nodes where tunnels meet (cross, overlap or touch diagonally).
+
+        Shared corridor cells are grouped into junctions by connectivity, split at
+        JUNCTION_SIZE chunk borders so a tangle of corridors becomes many small
+        nodes rather than one huge one. Returns the (node_a, node_b) pairs of
+        junctions that touch across a chunk border, and the (cell_a, cell_b)
+        pairs of touching cells that join them.
+        """
+        width, height = self.width, self.height
+        shared = np.argwhere(_shared_corridor(tunnels, self.node_at))  # (N, 2) cells, in x-major order
+        # Number of each shared cell (its row in shared), -1 elsewhere
+        numbers = np.full((width, height), -1, dtype=np.intp)
+        numbers[shared[:, 0], shared[:, 1]] = np.arange(len(shared))
+        # Chunk column and row of every map column and row
+        chunk_x = np.arange(width) // self.JUNCTION_SIZE
+        chunk_y = np.arange(height) // self.JUNCTION_SIZE
+
+        # Every pair of neighbouring shared cells (as their numbers), split by whether both are in one chunk.
+        # Looking only right, down and along both diagonals finds each pair once.
+        inner, across = [np.empty((0, 2), dtype=np.intp)], [np.empty((0, 2), dtype=np.intp)]
+        for dx, dy in ((1, 0), (0, 1), (1, 1), (1, -1)):
+            # here[i, j] is some cell (x, y) and there[i, j] is (x + dx, y + dy)
+            (here_x, there_x), (here_y, there_y) = _shifted(width, dx), _shifted(height, dy)
+            here, there = numbers[here_x, here_y], numbers[there_x, there_y]
+            both = (here >= 0) & (there >= 0)
+            same_chunk = ((chunk_x[here_x] == chunk_x[there_x])[:, None] &
+                          (chunk_y[here_y] == chunk_y[there_y])[None, :])
+            inner.append(np.column_stack((here[both & same_chunk], there[both & same_chunk])))
+            across.append(np.column_stack((here[both & ~same_chunk], there[both & ~same_chunk])))
+
+        # Connected groups of shared cells within a chunk are the junctions, numbered
+        # 0, 1, ... in the order of their first cell
+        _, labels = np.unique(_label_components(np.concatenate(inner), len(shared)), return_inverse=True)
+        first_node = len(self.rooms)
+        self.node_at[shared[:, 0], shared[:, 1]] = first_node + labels
+
+        # junction - len(rooms) -> (N, 2) cells; a stable sort keeps each junction's cells in x-major order
+        by_junction = shared[np.argsort(labels, kind='stable')]
+        junction_ends = np.cumsum(np.bincount(labels))
+        self.junction_cells = np.split(by_junction, junction_ends[:-1]) if len(shared) else []
+        for cells in self.junction_cells:
+            # Represent the junction by its cell nearest the middle
+            middle = np.abs(cells - cells.mean(axis=0)).max(axis=1).argmin()
+            self.positions.append((int(cells[middle, 0]), int(cells[middle, 1])))
+            self.neighbours.append([])
+
+        # Junctions of the cell pairs across chunk borders (groups never cross a border, so these differ)
+        across = np.concatenate(across)
+        return first_node + labels[across], shared[across]
+
+    def _add_edges(self, tunnels, links, link_cells):
+        """Split tunnels into pieces at the rooms and junctions they pass through, and add the edges.
+
+        Pieces joining the same two nodes share one edge holding all their cells,
+        costed by the shortest piece. links are pairs of touching junctions,
+        joined with no corridor cells between them, through the link_cells pairs.
+        """
+        positions = self.positions
+        pieces = {}  # (lower node, higher node) -> [(cost, walked cells)], in the order found
+
+        def add_piece(node_a, node_b, cost, cells):
+            # Pieces are kept walked from the lower node to the higher one
+            if node_a > node_b:
+                node_a, node_b, cells = node_b, node_a, cells[::-1]
+            pieces.setdefault((node_a, node_b), []).append((cost, cells))
+
+        for (node_a, node_b), cells in zip(links.tolist(), link_cells):
+            add_piece(node_a, node_b, _chebyshev(positions[node_a], positions[node_b]), cells)
+
+        for cells in tunnels:
+            # Where along the tunnel it is in a room or junction, and which
+            nodes = self.node_at[cells[:, 0], cells[:, 1]]
+            stops = np.flatnonzero(nodes >= 0)
+            # Consecutive stops i and j in different nodes bound a piece, walked as cells[i:j + 1]
+            leaves = nodes[stops[:-1]] != nodes[stops[1:]]
+            for i, j in zip(stops[:-1][leaves].tolist(), stops[1:][leaves].tolist()):
+                node_a, node_b = int(nodes[i]), int(nodes[j])
+                if j > i + 1:
+                    # Walk from node_a's position to the piece, along it, then on to node_b's position
+                    first, last = tuple(cells[i + 1].tolist()), tuple(cells[j - 1].tolist())
+                    cost = _chebyshev(positions[node_a], first) + (j - i - 2) + _chebyshev(last, positions[node_b])
+                else:
+                    cost = _chebyshev(positions[node_a], positions[node_b])  # The two nodes touch
+                add_piece(node_a, node_b, cost, cells[i:j + 1])
+
+        for (node_a, node_b), node_pieces in sorted(pieces.items()):
+            node_pieces.sort(key=lambda piece: piece[0])  # Shortest first (stable, so ties keep their order)
+            self._add_edge(node_a, node_b, [cells for _, cells in node_pieces], node_pieces[0][0])
+
+    def _add_edge(self, node_a, node_b, pieces, cost):
+        """Add an edge between two nodes through the given pieces (walked from node_a to node_b)."""
+        index = len(self.edges)
+        # The corridor cells are those of the pieces between their ends in the two nodes
+        cells = np.concatenate([piece[1:-1] for piece in pieces])
+        self.edges.append((node_a, node_b, cells, cost))
+        self.edge_pieces.append(pieces)
+        self.neighbours[node_a].append((node_b, index, cost))
+        self.neighbours[node_b].append((node_a, index, cost))
+        self.edge_at[cells[:, 0], cells[:, 1]] = index
+
+    def is_room(self, node):
+        """Check if a node is a room (rather than a junction)."""
+        return node < len(self.rooms)
+
+    def get_doors(self, room_index):
+        """Get the corridor cells on a room's wall ring, as an (N, 2) array."""
+        room = self.rooms[room_index]
+        ring = np.array([(x, y) for x in range(room.x1, room.x2 + 1) for y in range(room.y1, room.y2 + 1)
+                         if x in (room.x1, room.x2) or y in (room.y1, room.y2)], dtype=np.intp)
+        corridor = ((self.edge_at[ring[:, 0], ring[:, 1]] >= 0) |
+                    (self.node_at[ring[:, 0], ring[:, 1]] >= len(self.rooms)))
+        return ring[corridor]
+
+    def _locate(self, x, y):
+        """Get the nodes a cell belongs to and the corridor edge it lies on, if any.
+
+        Returns (node indices, edge index or None); both empty/None if the cell is in neither.
+        """
+        node = int(self.node_at[x, y])
+        if node >= 0:
+            return [node], None
+        edge = int(self.edge_at[x, y])
+        if edge >= 0:
+            node_a, node_b, _, _ = self.edges[edge]
+            return [node_a, node_b], edge
+        return [], None
+
+    def find_route(self, start_nodes, goal_nodes):
+        """A* over the graph; returns (nodes, edges) on the cheapest route, or None if unconnected.
+
+        start_nodes and goal_nodes are lists of nodes, or dicts of node -> the cost of
+        walking to it from the start (or from it to the goal).
+        """
+        start_costs = start_nodes if isinstance(start_nodes, dict) else dict.fromkeys(start_nodes, 0)
+        goal_costs = goal_nodes if isinstance(goal_nodes, dict) else dict.fromkeys(goal_nodes, 0)
+        # Stand-in node that every goal node steps to, to finish a route
+        finish = len(self.positions)
+
+        # Chebyshev distance from each node to the nearest goal node (0 for finish)
+        positions = self._position_array
+        heuristic = np.abs(positions[:, None, :] - positions[list(goal_costs)][None, :, :]).max(axis=2).min(axis=1)
+        heuristic = heuristic.tolist() + [0]
+
+        best_cost = dict(start_costs)
+        came_from = dict.fromkeys(start_costs)  # node -> (previous node, edge)
+        frontier = [(cost + heuristic[node], cost, node) for node, cost in start_costs.items()]
+        heapq.heapify(frontier)
+        while frontier:
+            _, cost, node = heapq.heappop(frontier)
+            if node == finish:
+                node, _ = came_from[finish]
+                nodes, edges = [node], []
+                while came_from[node] is not None:
+                    node, edge = came_from[node]
+                    nodes.append(node)
+                    edges.append(edge)
+                return nodes[::-1], edges[::-1]
+            if cost > best_cost[node]:
+                continue
+            steps = self.neighbours[node]
+            if node in goal_costs:
+                # The rest of the way to the goal is one more step, so cheaper routes through other goal nodes still win
+                steps = steps + [(finish, None, goal_costs[node])]
+            for neighbour, edge, edge_cost in steps:
+                new_cost = cost + edge_cost
+                if new_cost < best_cost.get(neighbour, new_cost + 1):
+                    best_cost[neighbour] = new_cost
+                    came_from[neighbour] = (node, edge)
+                    heapq.heappush(frontier, (new_cost + heuristic[neighbour], new_cost, neighbour))
+        return None
+
+    def find_path(self, start, goal, walkable):
+        """Find a walkable path from start to goal, as a list of (x, y) steps ending at goal.
+
+        Returns None if no path is found through the rooms and corridors. Cells that are
+        in no room or corridor fall back to a full-grid search.
+        """
+        if max(abs(start[0] - goal[0]), abs(start[1] - goal[1])) <= self.LOCAL_RANGE:
+            # Nearby goals are searched directly, in a window around both ends
+            reach = self.LOCAL_RANGE
+            x1, y1 = max(0, min(start[0], goal[0]) - reach), max(0, min(start[1], goal[1]) - reach)
+            x2 = min(self.width, max(start[0], goal[0]) + reach + 1)
+            y2 = min(self.height, max(start[1], goal[1]) + reach + 1)
+            path = find_grid_path((start[0] - x1, start[1] - y1), (goal[0] - x1, goal[1] - y1),
+                                  walkable[x1:x2, y1:y2])
+            if path is not None:
+                return [(x + x1, y + y1) for x, y in path]
+
+        start_nodes, start_edge = self._locate(*start)
+        goal_nodes, goal_edge = self._locate(*goal)
+        if not start_nodes or not goal_nodes:
+            return find_grid_path(start, goal, walkable)
+
+        # Ends in a corridor are on one of its edge's pieces, and reach the route along it
+        if start_edge is not None:
+            start_piece, start_index = self._find_on_pieces(start_edge, start)
+            start_nodes = self._piece_costs(start_edge, start_piece, start_index)
+        if goal_edge is not None:
+            goal_piece, goal_index = self._find_on_pieces(goal_edge, goal)
+            goal_nodes = self._piece_costs(goal_edge, goal_piece, goal_index)
+            if start_edge is not None and start_piece is goal_piece:
+                # Both in one corridor: walk straight along it
+                if start_index < goal_index:
+                    return _steps(goal_piece[start_index + 1:goal_index + 1])
+                return _steps(goal_piece[goal_index:start_index][::-1])
+
+        route = self.find_route(start_nodes, goal_nodes)
+        if route is None:
+            return None
+        route_nodes, route_edges = route
+
+        # Walk the route ROUTE_STRIDE nodes at a time, each stretch searched over only its rooms and
+        # junctions, the corridors between them, and one piece on into the next stretch
+        path, position = [], start
+        for first in range(0, len(route_nodes), self.ROUTE_STRIDE):
+            last = min(first + self.ROUTE_STRIDE, len(route_nodes)) - 1
+            corridors = [self.edges[edge][2] for edge in route_edges[first:last]]
+            if first == 0 and start_edge is not None:
+                corridors.append(start_piece)
+            if last < len(route_edges):
+                ahead = self.positions[route_nodes[last + 2]] if last + 2 < len(route_nodes) else goal
+                piece, target = self._pick_piece(route_edges[last], route_nodes[last], ahead)
+                corridors.append(piece)
+            else:
+                target = goal
+                if goal_edge is not None:
+                    corridors.append(goal_piece)
+            steps = self._search_stretch(route_nodes[first:last + 1], corridors, position, target, walkable)
+            if steps is None:
+                return None
+            path += steps
+            position = target
+        return path
+
+    def _find_on_pieces(self, edge, cell):
+        """Get (piece, index) for the piece of an edge with cell in its corridor, and cell's index on it."""
+        for piece in self.edge_pieces[edge]:
+            on_piece = np.flatnonzero((piece[1:-1, 0] == cell[0]) & (piece[1:-1, 1] == cell[1]))
+            if len(on_piece):
+                return piece, int(on_piece[0]) + 1
+        raise ValueError(f"{cell} is not in the corridor of edge {edge}")
+
+    def _piece_costs(self, edge, piece, index):
+        """Get find_route costs from cell index of an edge's piece to the edge's two nodes."""
+        node_a, node_b, _, _ = self.edges[edge]
+        first, last = tuple(piece[0].tolist()), tuple(piece[-1].tolist())
+        return {node_a: index + _chebyshev(first, self.positions[node_a]),
+                node_b: len(piece) - 1 - index + _chebyshev(last, self.positions[node_b])}
+
+    def _pick_piece(self, edge, node, ahead):
+        """Pick the piece of an edge to leave node by, heading for the position ahead.
+
+        Returns the piece and its end cell in the edge's other node.
+        """
+        node_a, _, _, _ = self.edges[edge]
+        position = self.positions[node]
+
+        def ends(piece):
+            # (cell in node, cell in the other node)
+            near, far = (piece[0], piece[-1]) if node == node_a else (piece[-1], piece[0])
+            return tuple(near.tolist()), tuple(far.tolist())
+
+        piece = min(self.edge_pieces[edge], key=lambda piece: (
+            _chebyshev(position, ends(piece)[0]) + len(piece) + _chebyshev(ends(piece)[1], ahead)))
+        return piece, ends(piece)[1]
+
+    def _search_stretch(self, nodes, corridors, start, goal, walkable):
+        """Tile-level A* from start to goal over only the given nodes and corridor cells; returns the steps, or None."""
+        # Open areas of the nodes as (x1, y1, x2, y2) rectangles, and corridor cells
+        areas = []
+        corridors = list(corridors)
+        for node in nodes:
+            if self.is_room(node):
+                room = self.rooms[node]
+                areas.append((room.x1 + 1, room.y1 + 1, room.x2, room.y2))
+            else:
+                corridors.append(self.junction_cells[node - len(self.rooms)])
+        corridors = np.concatenate(corridors) if corridors else np.empty((0, 2), dtype=np.intp)
+
+        # Search only the bounding box of the stretch, with everything off it blocked
+        x1 = min([start[0], goal[0]] + [area[0] for area in areas])
+        y1 = min([start[1], goal[1]] + [area[1] for area in areas])
+        x2 = max([start[0] + 1, goal[0] + 1] + [area[2] for area in areas])
+        y2 = max([start[1] + 1, goal[1] + 1] + [area[3] for area in areas])
+        if len(corridors):
+            x1, y1 = min(x1, int(corridors[:, 0].min())), min(y1, int(corridors[:, 1].min()))
+            x2, y2 = max(x2, int(corridors[:, 0].max()) + 1), max(y2, int(corridors[:, 1].max()) + 1)
+        allowed = np.zeros((x2 - x1, y2 - y1), dtype=np.int8)
+        for ax1, ay1, ax2, ay2 in areas:
+            allowed[ax1 - x1:ax2 - x1, ay1 - y1:ay2 - y1] = 1
+        allowed[corridors[:, 0] - x1, corridors[:, 1] - y1] = 1
+        allowed &= walkable[x1:x2, y1:y2]
+
+        path = tcod.path.AStar(allowed, diagonal=self.DIAGONAL_COST).get_path(
+            start[0] - x1, start[1] - y1, goal[0] - x1, goal[1] - y1)
+        if not path and start != goal:
+            return None
+        return [(x + x1, y + y1) for x, y in path]
+
+
+def _steps(cells):
+    """Turn an (N, 2) array of cells into a list of (x, y) steps."""
+    return [tuple(cell) for cell in cells.tolist()]
+
+
+def _pack(arrays):
+    """Join (N, 2) arrays into one, returning it with their lengths (see _unpack)."""
+    cells = np.concatenate(arrays) if arrays else np.empty((0, 2), dtype=np.intp)
+    return cells, np.array([len(array) for array in arrays], dtype=np.intp)
+
+
+def _unpack(cells, lengths):
+    """Split cells packed by _pack back into the list of arrays."""
+    ends = np.cumsum(lengths).tolist()
+    return [cells[start:end] for start, end in zip([0] + ends[:-1], ends)]
+
+
+def _chebyshev(a, b):
+    """Chebyshev distance between two (x, y) positions: the fewest steps between open cells."""
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+
+def _shifted(size, offset):
+    """Slices (here, there) of range(size) such that each index in there is offset past its partner in here."""
+    return slice(max(0, -offset), size - max(0, offset)), slice(max(0, offset), size + min(0, offset))
+
+
+def _shared_corridor(tunnels, node_at):
+    """Mask of corridor cells outside rooms that are on or next to the corridors of two different tunnels."""
+    width, height = node_at.shape
+    # Lowest and highest index of the tunnels with a corridor cell in each cell's 3x3
+    # neighbourhood, with a one-cell border so neighbours of cells at the map edge exist
+    lowest = np.full((width + 2, height + 2), len(tunnels), dtype=np.intp)
+    highest = np.full((width + 2, height + 2), -1, dtype=np.intp)
+    # Every corridor cell outside rooms, and the index of the tunnel that carved it
+    cells = np.concatenate(tunnels) if tunnels else np.empty((0, 2), dtype=np.intp)
+    owners = np.repeat(np.arange(len(tunnels)), [len(tunnel) for tunnel in tunnels])
+    outside = node_at[cells[:, 0], cells[:, 1]] < 0
+    cells, owners = cells[outside], owners[outside]
+    corridor = np.zeros((width, height), dtype=bool)
+    corridor[cells[:, 0], cells[:, 1]] = True
+    for dx, dy in _NEIGHBOURHOOD:
+        around = cells[:, 0] + 1 + dx, cells[:, 1] + 1 + dy
+        # ufunc.at, as one cell is reached from many corridor cells
+        np.minimum.at(lowest, around, owners)
+        np.maximum.at(highest, around, owners)
+    return corridor & (lowest < highest)[1:-1, 1:-1]
+
+
+def _label_components(links, count):
+    """Label count items joined by (a, b) index pairs; returns each item's smallest connected index.
+
+    Every item starts as its own label. Each round, both ends of every link
+    take the smaller of their two labels, then labels are followed to the
+    label's own label until none changes. Labels only ever decrease, and stop
+    once every link joins two items with the same label.
+    """
+    label = np.arange(count)
+    while True:
+        label_a, label_b = label[links[:, 0]], label[links[:, 1]]
+        if np.array_equal(label_a, label_b):
+            return label
+        lower = np.minimum(label_a, label_b)
+        # Relabel the items the two labels name (ufunc.at, as many links can share a label)
+        np.minimum.at(label, label_a, lower)
+        np.minimum.at(label, label_b, lower)
+        # Follow chains of labels so every item points straight at the smallest label it can reach
+        while True:
+            followed = label[label]
+            if np.array_equal(followed, label):
+                break
+            label = followed
+
+
+def find_grid_path(start, goal, walkable):
+    """Full-grid A* over a walkable mask; returns (x, y) steps ending at goal, or None."""
+    path = tcod.path.AStar(walkable.astype(np.int8), diagonal=RoomGraph.DIAGONAL_COST).get_path(
+        start[0], start[1], goal[0], goal[1])
+    if not path and start != goal:
+        return None
+    return path
@@ -0,0 +1,71 @@
+"""
+Player scent map that monsters follow after losing sight of the player.
+"""
+
+import numpy as np
+
+
+class ScentMap:
+    """Level-wide scent field, refreshed at the player's position every turn.
+
+    Each update spreads scent one tile (every tile takes the strongest scent in
+    its 3x3 neighbourhood), decays it, and blocks it at walls, so the field
+    rises along walkable paths toward where the player is. A monster that has
+    lost sight of the player follows it by stepping to its strongest neighbour.
+    """
+
+    PLAYER_SCENT = 1.0
+    DECAY = 0.9
+    # Scent weaker than this (~20 tiles or turns old) is too faint to follow
+    THRESHOLD = 0.1
+
+    def __init__(self, walkable):
+        """Initialize an empty scent field over a boolean (width, height) walkability mask."""
+        self.walkable = walkable
+        self.scent = np.zeros(walkable.shape, dtype=np.float32)
+
+    def update(self, player_x, player_y, bounds=None):
+        """Decay and diffuse the scent one step, then lay fresh scent at the player.
+
+        bounds (x1, y1, x2, y2) limits the update to a region, such as the active region
+        around the player, so the cost does not grow with the map size.
+        """
+        width, height = self.scent.shape
+        x1, y1, x2, y2 = bounds or (0, 0, width, height)
+        x1, y1, x2, y2 = max(0, x1), max(0, y1), min(width, x2), min(height, y2)
+
+        # Region plus a one-tile border of context, zero-padded at the map edges
+        padded = np.zeros((x2 - x1 + 2, y2 - y1 + 2), dtype=np.float32)
+        context_x1, context_y1 = max(0, x1 - 1), max(0, y1 - 1)
+        context = self.scent[context_x1:min(width, x2 + 1), context_y1:min(height, y2 + 1)]
+        offset_x, offset_y = context_x1 - (x1 - 1), context_y1 - (y1 - 1)
+        padded[offset_x:offset_x + context.shape[0], offset_y:offset_y + context.shape[1]] = context
+
+        region_width, region_height = x2 - x1, y2 - y1
+        spread = padded[1:-1, 1:-1].copy()
+        for dx in range(3):
+            for dy in range(3):
+                np.maximum(spread, padded[dx:dx + region_width, dy:dy + region_height], out=spread)
+        spread *= self.DECAY
+        spread *= self.walkable[x1:x2, y1:y2]
+        self.scent[x1:x2, y1:y2] = spread
+
+        if x1 <= player_x < x2 and y1 <= player_y < y2:
+            self.scent[player_x, player_y] = self.PLAYER_SCENT
+
+    def follow(self, x, y):
+        """Get the (dx, dy) step toward the strongest scent next to (x, y), or None if the trail is cold."""
+        width, height = self.scent.shape
+        best_step = None
+        best_scent = max(self.scent[x, y], self.THRESHOLD)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < width and 0 <= ny < height and self.scent[nx, ny] > best_scent:
+                    best_scent = self.scent[nx, ny]
+                    best_step = (dx, dy)
+        return best_step
+
+    def clear(self):
+        """Remove all scent."""
+        self.scent[:] = 0
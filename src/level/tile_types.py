@@ -0,0 +1,69 @@
+"""
+Tile property table shared by all map areas.
+
+Map tiles are stored as uint8 indices (the TILE_* constants) into TILE_PROPERTIES,
+so per-tile properties for a whole map are a single fancy-index lookup, e.g.
+TILE_PROPERTIES["walkable"][tiles].
+"""
+
+import numpy as np
+
+from constants import (
+    MAP_WIDTH, MAP_HEIGHT,
+    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP,
+    COLOR_DARK_WALL, COLOR_DARK_GROUND, COLOR_LIGHT_WALL, COLOR_LIGHT_GROUND
+)
+
+# Storage type for map tile arrays
+TILE_DTYPE = np.uint8
+
+TILE_PROPERTY_DTYPE = np.dtype([
+    ("walkable", np.bool_),
+    ("transparent", np.bool_),
+    ("glyph", np.int32),  # Unicode codepoint
+    ("light", np.uint8, 3),  # Foreground color while in view
+    ("dark", np.uint8, 3),  # Foreground color once explored but out of view
+])
+
+# One row per tile type, indexed by the TILE_* constants
+TILE_PROPERTIES = np.zeros(4, dtype=TILE_PROPERTY_DTYPE)
+TILE_PROPERTIES[TILE_WALL] = (False, False, ord('#'), COLOR_LIGHT_WALL, COLOR_DARK_WALL)
+TILE_PROPERTIES[TILE_FLOOR] = (True, True, ord('.'), COLOR_LIGHT_GROUND, COLOR_DARK_GROUND)
+TILE_PROPERTIES[TILE_STAIRS_DOWN] = (True, True, ord('>'), COLOR_LIGHT_GROUND, COLOR_DARK_GROUND)
+TILE_PROPERTIES[TILE_STAIRS_UP] = (True, True, ord('<'), COLOR_LIGHT_GROUND, COLOR_DARK_GROUND)
+
+# Per-property columns, so single-tile checks skip the field lookup
+TILE_WALKABLE = TILE_PROPERTIES["walkable"]
+TILE_TRANSPARENT = TILE_PROPERTIES["transparent"]
+
+
+def new_tile_map(fill=TILE_WALL, width=MAP_WIDTH, height=MAP_HEIGHT):
+    """Create a width x height tile array filled with one tile type."""
+    return np.full((width, height), fill, dtype=TILE_DTYPE)
+
+
+def render_tiles(console, tiles, visible, explored, camera=None):
+    """Draw terrain for visible (lit) and explored (dark) tiles; other cells are left untouched.
+
+    Only the camera's view of the map is drawn (the top-left of the map if there is no camera),
+    so the cost depends on the viewport size, not the map size.
+    """
+    if camera is None:
+        x1, y1, x2, y2 = 0, 0, console.width, console.height
+    else:
+        x1, y1, x2, y2 = camera.get_bounds()
+    x2 = min(x2, tiles.shape[0], x1 + console.width)
+    y2 = min(y2, tiles.shape[1], y1 + console.height)
+    width = x2 - x1
+    height = y2 - y1
+    tiles = tiles[x1:x2, y1:y2]
+    visible = visible[x1:x2, y1:y2]
+    shown = visible | explored[x1:x2, y1:y2]
+
+    properties = TILE_PROPERTIES[tiles]
+    fg = np.where(visible[..., np.newaxis], properties["light"], properties["dark"])
+
+    # Console is created with order="F", so rgb is indexed [x, y] like the tiles
+    console_rgb = console.rgb[:width, :height]
+    console_rgb["ch"][shown] = properties["glyph"][shown]
+    console_rgb["fg"][shown] = fg[shown]
@@ -2,8 +2,10 @@
 Level Manager for handling floor and base transitions.
 """
 
+from constants import MAP_WIDTH, MAP_HEIGHT, RESPAWN_WAVES
 from level.level import Level
 from level.base import Base
+from floor_store import FloorStore
 from event_emitter import EventEmitter
 from event_type import EventType
 from event_context import FloorContext
@@ -12,14 +14,23 @@ from event_context import FloorContext
 class LevelManager:
     """Manages progression between floors and bases."""
     
-    def __init__(self):
-        """Initialize the level manager."""
+    def __init__(self, map_width=MAP_WIDTH, map_height=MAP_HEIGHT, respawn_waves=RESPAWN_WAVES):
+        """Initialize the level manager; floors are generated at the given map size.
+        
+        respawn_waves turns on respawn mode for every floor (see Level.spawn_wave_if_due).
+        """
+        self.map_width = map_width
+        self.map_height = map_height
+        self.respawn_waves = respawn_waves
         self.current_floor = 1  # The actual floor number (1-10)
         self.current_area = None  # Either a Level or Base instance
         self.in_base = False  # Track if currently in a base
         
+        # Areas left behind, kept so they can be revisited exactly
+        self.floor_store = FloorStore()
+        
         # Start on Floor 1
-        self.current_area = Level(level_number=1)
+        self.current_area = self._new_floor(1)
     
     def get_current_area(self):
         """Return the current area (Level or Base)."""
@@ -47,35 +58,49 @@ class LevelManager:
         
         if self.in_base:
             # Transitioning from base to next floor
-            self.current_area = Level(level_number=self.current_floor)
+            self._store_current_area()
+            revisited = self.floor_store.take(FloorStore.floor_key(self.current_floor))
             self.in_base = False
-            message = f"You enter Floor {self.current_floor}. Danger awaits!"
             
-            # Emit FLOOR_START event
-            event_emitter = EventEmitter()
-            context = FloorContext(
-                player=player,
-                floor_number=self.current_floor,
-                previous_floor=previous_floor - 1  # Previous actual floor
-            )
-            event_emitter.emit(EventType.FLOOR_START, context)
+            if revisited is not None:
+                self.current_area = revisited
+                message = f"You return to Floor {self.current_floor}."
+            else:
+                self.current_area = self._new_floor(self.current_floor)
+                message = f"You enter Floor {self.current_floor}. Danger awaits!"
+                
+                # Emit FLOOR_START event (first visit only)
+                event_emitter = EventEmitter()
+                context = FloorContext(
+                    player=player,
+                    floor_number=self.current_floor,
+                    previous_floor=previous_floor - 1  # Previous actual floor
+                )
+                event_emitter.emit(EventType.FLOOR_START, context)
             
         else:
             # Transitioning from floor to base
             if self.current_floor < 10:  # No base after floor 10
-                self.current_area = Base(base_number=self.current_floor)
+                self._store_current_area()
+                revisited = self.floor_store.take(FloorStore.base_key(self.current_floor))
                 self.in_base = True
                 self.current_floor += 1  # Increment for next floor
-                message = f"You enter Base {previous_floor}. A safe haven with a shop nearby."
                 
-                # Emit FLOOR_END event
-                event_emitter = EventEmitter()
-                context = FloorContext(
-                    player=player,
-                    floor_number=previous_floor,
-                    previous_floor=previous_floor
-                )
-                event_emitter.emit(EventType.FLOOR_END, context)
+                if revisited is not None:
+                    self.current_area = revisited
+                    message = f"You return to Base {previous_floor}."
+                else:
+                    self.current_area = Base(base_number=previous_floor)
+                    message = f"You enter Base {previous_floor}. A safe haven with a shop nearby."
+                    
+                    # Emit FLOOR_END event (first visit only)
+                    event_emitter = EventEmitter()
+                    context = FloorContext(
+                        player=player,
+                        floor_number=previous_floor,
+                        previous_floor=previous_floor
+                    )
+                    event_emitter.emit(EventType.FLOOR_END, context)
             else:
                 # Floor 10 boss defeated - game should end
                 return False
@@ -89,10 +114,52 @@ class LevelManager:
         return (True, message)
     
     def transition_up(self, player):
-        """Handle transition when going up stairs (if implemented)."""
-        # Currently not implemented as per original design
-        # Could be added for future base-to-previous-floor navigation
-        pass
+        """Handle transition when going up stairs, back to the area above.
+        
+        The area above has always been visited already, so it is restored
+        from the floor store exactly as it was left.
+        """
+        if self.in_base:
+            # Transitioning from base back to the floor above it
+            key = FloorStore.floor_key(self.current_floor - 1)
+        else:
+            # Transitioning from floor back to the base above it (none above Floor 1)
+            key = FloorStore.base_key(self.current_floor - 1)
+        
+        if key not in self.floor_store:
+            return False
+        
+        self._store_current_area()
+        self.current_area = self.floor_store.take(key)
+        if self.in_base:
+            self.in_base = False
+            self.current_floor -= 1
+            message = f"You return to Floor {self.current_floor}."
+        else:
+            self.in_base = True
+            message = f"You return to Base {self.current_floor - 1}."
+        
+        # Place player at stairs down position in the area above
+        stairs_down_x, stairs_down_y = self.current_area.get_stairs_down_position()
+        player.x = stairs_down_x
+        player.y = stairs_down_y
+        
+        return (True, message)
+    
+    def _new_floor(self, floor_number):
+        """Generate a floor, building its room graph now so no find_path during play waits on it."""
+        level = Level(level_number=floor_number, width=self.map_width, height=self.map_height,
+                      respawn_waves=self.respawn_waves)
+        level.build_room_graph()
+        return level
+    
+    def _store_current_area(self):
+        """Keep the current area in the floor store so it can be revisited."""
+        if self.in_base:
+            key = FloorStore.base_key(self.current_floor - 1)
+        else:
+            key = FloorStore.floor_key(self.current_floor)
+        self.floor_store.put(key, self.current_area)
     
     def can_attack(self):
         """Check if combat is allowed in current area."""
@@ -12,7 +12,8 @@ from .troll import Troll
 from .horror import Horror
 from .angel import Angel
 from .devil import Devil
-from .pool import create_monster_for_level
+from .monster_prototype import MonsterPrototype, MONSTER_PROTOTYPES, get_monster_prototype
+from .pool import create_monster_for_level, recycle_monster
 
 __all__ = [
     'Monster',
@@ -25,5 +26,9 @@ __all__ = [
     'Horror',
     'Angel',
     'Devil',
-    'create_monster_for_level'
+    'MonsterPrototype',
+    'MONSTER_PROTOTYPES',
+    'get_monster_prototype',
+    'create_monster_for_level',
+    'recycle_monster'
 ]
\ No newline at end of file
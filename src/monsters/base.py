@@ -7,10 +7,37 @@ from status_effects import StatusEffects
 from entity import Entity
 from stats import Stats, StatType
 
+from .monster_prototype import MONSTER_PROTOTYPES
+
 
 class Monster(Entity):
     """Base class for all monsters."""
     
+    # Actions per 100 time units; 100 is one action per player turn (see TurnScheduler)
+    speed = 100
+    
+    # How far a monster can see the player (when both are in the player's FOV)
+    sight_range = 8
+    
+    # How far away a monster can attack the player from; 1 is melee only
+    attack_range = 1
+    
+    is_final_boss = False
+    
+    # The subclass's row of the monster table (None for monsters built from stats directly)
+    prototype = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.prototype = MONSTER_PROTOTYPES.get(cls.__name__)
+    
+    @classmethod
+    def spawn(cls, x, y):
+        """Create a monster of a table subclass at (x, y), cloned from its prototype."""
+        monster = cls.__new__(cls)
+        cls.prototype.initialize(monster, x, y)
+        return monster
+    
     def __init__(self, x, y, name, char, color, hp, attack, defense, xp_value,
                  evade=0.05, crit=0.05, crit_multiplier=2.0, attack_traits=None, weaknesses=None, resistances=None):
         """Initialize a monster."""
@@ -43,11 +70,8 @@ class Monster(Entity):
         self.name = name
         self.xp_value = xp_value
         
-        # AI state
-        self.target_x = None
-        self.target_y = None
+        # AI state; once alerted, a monster that loses sight follows the level's scent map
         self.has_seen_player = False
-        self.turns_since_seen_player = 0
     
     def distance_to(self, x, y):
         """Calculate distance to given coordinates."""
@@ -58,5 +82,5 @@ class Monster(Entity):
         # Monster can see player if player is in its FOV and close enough
         if level_fov[self.x, self.y] and level_fov[player_x, player_y]:
             distance = self.distance_to(player_x, player_y)
-            return distance <= 8  # Monster sight range
+            return distance <= self.sight_range
         return False
@@ -1,21 +1,9 @@
 from .base import Monster
-from constants import COLOR_GRAY
-from traits import Trait
 
 
 class Bat(Monster):
-    """Hard to hit, ephemeral creature."""
+    """Hard to hit, ephemeral creature that acts twice per turn."""
     
     def __init__(self, x, y):
-        super().__init__(
-            x=x, y=y,
-            name="Bat",
-            char='B',
-            color=COLOR_GRAY,
-            hp=6,
-            attack=2,
-            defense=0,
-            xp_value=11,
-            evade=0.4,
-            attack_traits=[Trait.DARK]
-        )
\ No newline at end of file
+        # Stats, traits and spawn rules live in the monster table
+        self.prototype.initialize(self, x, y)
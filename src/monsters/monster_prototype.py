@@ -0,0 +1,115 @@
+"""
+Frozen monster prototypes compiled from the monster table, and cheap cloning from them.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Optional, Tuple
+
+from stats import Stats
+from status_effects import StatusEffects
+from traits import FrozenTraitList, Trait
+
+from .monster_table import MONSTER_DEFAULTS, MONSTER_TABLE
+
+
+@dataclass(frozen=True)
+class MonsterPrototype:
+    """One row of the monster table: a monster's stats, traits and spawn rules.
+
+    initialize() turns a bare instance into a monster by copying prebuilt
+    attribute dicts, so spawning skips rebuilding Stats, trait lists and AI
+    state from keyword arguments. Clones share the prototype's trait lists
+    (FrozenTraitLists, whose masks are worked out once); only Stats and status
+    effects are per monster.
+    """
+
+    key: str  # Name of the Monster subclass
+    name: str
+    description: str
+    char: str
+    color: Tuple[int, int, int]
+    hp: int
+    attack: int
+    defense: int
+    xp_value: int
+    evade: float
+    crit: float
+    crit_multiplier: float
+    attack_traits: Tuple[Trait, ...]
+    weaknesses: Tuple[Trait, ...]
+    resistances: Tuple[Trait, ...]
+    speed: int
+    attack_range: int
+    is_final_boss: bool
+
+    # Spawn rules (see MonsterPool)
+    difficulty_rating: float  # Relative difficulty (1.0 = baseline)
+    min_level: int
+    max_level: Optional[int]
+    rarity: float  # Base spawn weight (higher = more common)
+    boss_only: bool
+
+    _stats: dict = field(init=False, repr=False, compare=False)
+    _state: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        stats = Stats(max_hp=self.hp, hp=self.hp, attack=self.attack, defense=self.defense, evade=self.evade,
+                      crit=self.crit, crit_multiplier=self.crit_multiplier)
+        object.__setattr__(self, '_stats', dict(vars(stats)))
+        object.__setattr__(self, '_state', {
+            'character': self.char,
+            'color': self.color,
+            'name': self.name,
+            'xp_value': self.xp_value,
+            'speed': self.speed,
+            'attack_range': self.attack_range,
+            'is_final_boss': self.is_final_boss,
+            'has_seen_player': False,
+            'attack_traits': FrozenTraitList(self.attack_traits),
+            'weaknesses': FrozenTraitList(self.weaknesses),
+            'resistances': FrozenTraitList(self.resistances),
+        })
+
+    @classmethod
+    def from_row(cls, key, row):
+        """Compile a monster table row, filling in MONSTER_DEFAULTS."""
+        values = {**MONSTER_DEFAULTS, **row}
+        unknown = set(values) - {prototype_field.name for prototype_field in fields(cls)}
+        if unknown:
+            raise ValueError(f"monster table row {key!r} has unknown fields: {', '.join(sorted(unknown))}")
+        for traits in ('attack_traits', 'weaknesses', 'resistances'):
+            values[traits] = tuple(values[traits])
+        return cls(key=key, **values)
+
+    def initialize(self, monster, x, y):
+        """Set up a bare Monster instance at (x, y) as a fresh copy of this prototype."""
+        stats = Stats.__new__(Stats)
+        stats.__dict__.update(self._stats)
+        state = monster.__dict__
+        state.update(self._state)
+        state['x'] = x
+        state['y'] = y
+        state['stats'] = stats
+        state['status_effects'] = StatusEffects()
+
+    def revive(self, monster, x, y):
+        """Turn a dead monster of this prototype's class back into a fresh one at (x, y).
+
+        The monster's Stats and StatusEffects objects are reset and reused, so
+        recycling allocates nothing.
+        """
+        monster.stats.__dict__.update(self._stats)
+        monster.status_effects.clear()
+        state = monster.__dict__
+        state.update(self._state)
+        state['x'] = x
+        state['y'] = y
+
+
+# Every row of the monster table, compiled once, by Monster subclass name in table order
+MONSTER_PROTOTYPES = {key: MonsterPrototype.from_row(key, row) for key, row in MONSTER_TABLE.items()}
+
+
+def get_monster_prototype(key):
+    """Get the prototype of the Monster subclass named key."""
+    return MONSTER_PROTOTYPES[key]
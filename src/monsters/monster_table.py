@@ -0,0 +1,173 @@
+"""
+The monster table - every monster's stats, traits and spawn rules in one place.
+
+Rows are keyed by the name of the Monster subclass they describe and listed in
+spawn pool order. They are compiled once into frozen MonsterPrototypes (see
+monster_prototype.py); spawning, the monster pool, the bestiary and the
+balance tools all read them from there. Stats left out of a row take the
+defaults in MONSTER_DEFAULTS.
+"""
+
+from constants import COLOR_CRIMSON, COLOR_GRAY, COLOR_GREEN, COLOR_RED, COLOR_WHITE, COLOR_YELLOW
+from traits import Trait
+
+
+MONSTER_DEFAULTS = {
+    'evade': 0.05,
+    'crit': 0.05,
+    'crit_multiplier': 2.0,
+    'attack_traits': (),
+    'weaknesses': (),
+    'resistances': (),
+    'speed': 100,  # Actions per 100 time units (see TurnScheduler)
+    'attack_range': 1,  # Above 1, attacks the player from that far away when in view
+    'is_final_boss': False,
+    'max_level': None,  # Latest floor it spawns on (None = no limit)
+    'boss_only': False,
+}
+
+MONSTER_TABLE = {
+    # Early game monsters (levels 1-3)
+    'Bat': {
+        'name': "Bat",
+        'description': "Hard to hit, ephemeral creature that acts twice per turn.",
+        'char': 'B', 'color': COLOR_GRAY,
+        'hp': 6, 'attack': 2, 'defense': 0, 'xp_value': 11,
+        'evade': 0.4,
+        'speed': 200,
+        'attack_traits': (Trait.DARK,),
+        'difficulty_rating': 1.0, 'min_level': 1, 'max_level': 4, 'rarity': 1.0,
+    },
+    'Skeleton': {
+        'name': "Skeleton",
+        'description': "Weak but fast skeleton with higher evade.",
+        'char': 'S', 'color': COLOR_WHITE,
+        'hp': 15, 'attack': 2, 'defense': 0, 'xp_value': 10,
+        'evade': 0.15,  # Skeletons are nimble
+        'weaknesses': (Trait.HOLY,),
+        'difficulty_rating': 1.0, 'min_level': 1, 'max_level': 3, 'rarity': 1.0,
+    },
+    'Zombie': {
+        'name': "Zombie",
+        'description': "Slow but resilient zombie.",
+        'char': 'Z', 'color': COLOR_WHITE,
+        'hp': 12, 'attack': 3, 'defense': 0, 'xp_value': 10,
+        'evade': 0, 'crit': 0,  # Zombies are slow
+        'weaknesses': (Trait.HOLY, Trait.FIRE),
+        'resistances': (Trait.ICE,),
+        'difficulty_rating': 1.2, 'min_level': 1, 'max_level': 5, 'rarity': 0.8,
+    },
+
+    # Mid-early monsters (levels 2-6)
+    'Orc': {
+        'name': "Orc",
+        'description': "Medium strength orc warrior.",
+        'char': 'O', 'color': COLOR_RED,
+        'hp': 45, 'attack': 7, 'defense': 2, 'xp_value': 20,
+        'weaknesses': (Trait.STRIKE,),
+        'resistances': (Trait.FIRE,),
+        'difficulty_rating': 1.8, 'min_level': 3, 'max_level': 7, 'rarity': 0.7,
+    },
+    'Phantom': {
+        'name': "Phantom",
+        'description': "Hard to hit, ephemeral creature.",
+        'char': 'P', 'color': COLOR_WHITE,
+        'hp': 15, 'attack': 9, 'defense': 0, 'xp_value': 25,
+        'evade': 0.4,
+        'attack_traits': (Trait.MYSTIC,),
+        'weaknesses': (Trait.HOLY, Trait.DARK),
+        'resistances': (Trait.ICE, Trait.SLASH, Trait.STRIKE),
+        'difficulty_rating': 2.0, 'min_level': 3, 'max_level': 8, 'rarity': 0.6,
+    },
+    'Goblin': {
+        'name': "Goblin",
+        'description': "Sneaky goblin with higher crit chance.",
+        'char': 'G', 'color': COLOR_GREEN,
+        'hp': 55, 'attack': 9, 'defense': 1, 'xp_value': 25,
+        'evade': 0.1,
+        'crit': 0.15,  # Goblins are sneaky
+        'attack_traits': (Trait.SLASH,),
+        'weaknesses': (Trait.ICE, Trait.HOLY),
+        'resistances': (Trait.FIRE,),
+        'difficulty_rating': 2.2, 'min_level': 4, 'max_level': 9, 'rarity': 0.8,
+    },
+    'Naga': {
+        'name': "Naga",
+        'description': "Poisonous Snake Person",
+        'char': 'N', 'color': COLOR_GREEN,
+        'hp': 80, 'attack': 9, 'defense': 3, 'xp_value': 65,
+        'evade': 0.08, 'crit_multiplier': 1.5,
+        'attack_range': 3,  # Spits venom
+        'attack_traits': (Trait.POISON,),
+        'difficulty_rating': 3.0, 'min_level': 4, 'rarity': 0.5,
+    },
+
+    # Mid-late monsters (levels 5-7)
+    'Umbral': {
+        'name': "Umbral",
+        'description': "Shadow being touched by light and dark",
+        'char': 'U', 'color': COLOR_GRAY,
+        'hp': 110, 'attack': 10, 'defense': 3, 'xp_value': 52,
+        'evade': 0.12, 'crit': 0.08, 'crit_multiplier': 1.8,
+        'attack_traits': (Trait.HOLY, Trait.DARK),
+        'resistances': (Trait.HOLY, Trait.DARK),
+        'difficulty_rating': 3.0, 'min_level': 5, 'rarity': 0.5,
+    },
+    'Troll': {
+        'name': "Troll",
+        'description': "Strong troll with high defense.",
+        'char': 'T', 'color': COLOR_YELLOW,
+        'hp': 140, 'attack': 8, 'defense': 7, 'xp_value': 45,
+        'evade': 0.02,  # Trolls are slow
+        'attack_traits': (Trait.STRIKE,),
+        'weaknesses': (Trait.FIRE, Trait.SLASH),
+        'difficulty_rating': 3.0, 'min_level': 5, 'rarity': 0.5,
+    },
+    'Angel': {
+        'name': "Angel",
+        'description': "Angelic monster",
+        'char': 'A', 'color': COLOR_WHITE,
+        'hp': 200, 'attack': 13, 'defense': 2, 'xp_value': 65,
+        'evade': 0.20,  # Flying creatures evade more
+        'crit_multiplier': 1.5,
+        'attack_traits': (Trait.HOLY,),
+        'weaknesses': (Trait.DARK, Trait.MYSTIC),
+        'difficulty_rating': 3.5, 'min_level': 6, 'rarity': 0.4,
+    },
+    'Horror': {
+        'name': "Horror",
+        'description': "Aggressive abomination with devastating crits",
+        'char': 'H', 'color': COLOR_CRIMSON,
+        'hp': 200, 'attack': 16, 'defense': 3, 'xp_value': 67,
+        'evade': 0.08,
+        'crit_multiplier': 1.5,  # Horrors are dangerous enough without big crits
+        'weaknesses': (Trait.MYSTIC, Trait.ICE),
+        'difficulty_rating': 4.0, 'min_level': 6, 'rarity': 0.4,
+    },
+
+    # Late-game monsters (levels 8-9)
+    'Voidwalker': {
+        'name': "Voidwalker",
+        'description': "Shadow being from nothingness",
+        'char': 'V', 'color': COLOR_GRAY,
+        'hp': 210, 'attack': 13, 'defense': 3, 'xp_value': 104,
+        'evade': 0.12, 'crit': 0.08, 'crit_multiplier': 1.8,
+        'attack_range': 4,
+        'attack_traits': (Trait.FIRE, Trait.MYSTIC, Trait.POISON),
+        'resistances': (Trait.HOLY, Trait.DARK, Trait.MYSTIC),
+        'difficulty_rating': 5.0, 'min_level': 8, 'rarity': 0.3,
+    },
+
+    # Final boss (level 10 only)
+    'Devil': {
+        'name': "Ancient Devil",
+        'description': "Powerful devil - final boss of the dungeon.",
+        'char': 'D', 'color': COLOR_RED,
+        'hp': 1666, 'attack': 30, 'defense': 12, 'xp_value': 666,
+        'evade': 0.06, 'crit': 0.06, 'crit_multiplier': 2.06,
+        'attack_traits': (Trait.DARK, Trait.FIRE),
+        'weaknesses': (Trait.DEMONSLAYER,),
+        'is_final_boss': True,
+        'difficulty_rating': 10.0, 'min_level': 10, 'max_level': 10, 'rarity': 1.0,
+    },
+}
@@ -3,8 +3,9 @@ Monster pool management system for creating monsters based on level difficulty.
 """
 
 from dataclasses import dataclass
-from typing import List, Type, Dict, Optional
+from typing import List, Type, Dict, Optional, Tuple
 import random
+from bisect import bisect_left
 
 from .angel import Angel
 from .bat import Bat
@@ -19,6 +20,12 @@ from .troll import Troll
 from .umbral import Umbral
 from .voidwalker import Voidwalker
 from .zombie import Zombie
+from .monster_prototype import MONSTER_PROTOTYPES
+
+
+# Every Monster subclass with a row in the monster table
+MONSTER_CLASSES = (Angel, Bat, Devil, Horror, Goblin, Naga, Orc, Phantom, Skeleton, Troll, Umbral, Voidwalker,
+                   Zombie)
 
 
 @dataclass
@@ -33,43 +40,62 @@ class MonsterSpec:
 
 
 class MonsterPool:
-    """Manages monster spawning with smooth difficulty curves."""
+    """Manages monster spawning with smooth difficulty curves.
+    
+    Dead monsters handed to recycle() are kept on per-class free lists and
+    revived in place by later spawns, so long sessions with respawning floors
+    do not keep allocating new monsters.
+    """
+    
+    # Most dead monsters kept for reuse per class
+    MAX_FREE_MONSTERS = 32
     
     def __init__(self):
-        """Initialize the monster pool with all available monsters."""
+        """Initialize the monster pool with every monster in the monster table."""
+        classes = {monster_class.__name__: monster_class for monster_class in MONSTER_CLASSES}
         self.monsters: List[MonsterSpec] = [
-            # Early game monsters (levels 1-3)
-            MonsterSpec(Bat, 1.0, 1, 4, 1.0),
-            MonsterSpec(Skeleton, 1.0, 1, 3, 1.0),
-            MonsterSpec(Zombie, 1.2, 1, 5, 0.8),
-            
-            # Mid-early monsters (levels 2-6) 
-            MonsterSpec(Orc, 1.8, 3, 7, 0.7),
-            MonsterSpec(Phantom, 2.0, 3, 8, 0.6),
-            MonsterSpec(Goblin, 2.2, 4, 9, 0.8),
-            MonsterSpec(Naga, 3.0, 4, None, 0.5),
-            
-            # Mid-late monsters (levels 5-7)
-            MonsterSpec(Umbral, 3.0, 5, None, 0.5),
-            MonsterSpec(Troll, 3.0, 5, None, 0.5),
-            MonsterSpec(Angel, 3.5, 6, None, 0.4),
-            MonsterSpec(Horror, 4.0, 6, None, 0.4),
-            
-            # late-game monsnters (levels 8-9)
-            MonsterSpec(Voidwalker, 5.0, 8, None, 0.3),
-
-            
-            # Boss monster (level 10 only)
-            MonsterSpec(Devil, 10.0, 10, 10, 1.0, boss_only=False),
+            MonsterSpec(classes[key], prototype.difficulty_rating, prototype.min_level, prototype.max_level,
+                        prototype.rarity, prototype.boss_only)
+            for key, prototype in MONSTER_PROTOTYPES.items()
         ]
         
         # Cache for performance
-        self._level_pools: Dict[int, List[tuple]] = {}
+        self._level_pools: Dict[object, Tuple[List[Type], List[float]]] = {}
+        
+        # Monster class -> dead monsters waiting to be revived
+        self._free_monsters: Dict[Type, list] = {}
     
     def clear_cache(self):
         """Clear the level pool cache."""
         self._level_pools.clear()
     
+    def recycle(self, monster):
+        """Keep a dead monster for reuse; it must no longer be on any level or schedule."""
+        prototype = type(monster).prototype
+        if prototype is None or monster.is_alive():
+            return
+        free = self._free_monsters.setdefault(type(monster), [])
+        if len(free) < self.MAX_FREE_MONSTERS:
+            free.append(monster)
+    
+    def free_monster_count(self) -> int:
+        """Get the number of dead monsters waiting to be reused."""
+        return sum(len(free) for free in self._free_monsters.values())
+    
+    def spawn(self, monster_class: Type, x: int, y: int):
+        """Create a monster of a table class at (x, y), reviving a recycled one if there is one."""
+        free = self._free_monsters.get(monster_class)
+        if free:
+            monster = free.pop()
+            monster_class.prototype.revive(monster, x, y)
+            return monster
+        return monster_class.spawn(x, y)
+    
+    def get_monster_classes(self, level: Optional[int] = None) -> List[Type]:
+        """Get every monster class in the pool, or those that can spawn on level."""
+        specs = self.monsters if level is None else self.get_available_monsters(level)
+        return [spec.monster_class for spec in specs]
+    
     def get_available_monsters(self, level: int, boss_encounter: bool = False) -> List[MonsterSpec]:
         """Get all monsters that can spawn on the given level."""
         available = []
@@ -155,36 +181,31 @@ class MonsterPool:
             
             if not available_monsters:
                 # Fallback to skeleton if no monsters available (shouldn't happen)
-                return Skeleton(x, y)
+                return self.spawn(Skeleton, x, y)
             
             target_difficulty = self.get_target_difficulty(level)
             
-            # Calculate weighted list
-            weighted_monsters = []
+            # Cumulative weights, so picking a monster is one bisect
+            monster_classes, cumulative_weights = [], []
+            total_weight = 0
             for monster in available_monsters:
-                weight = self.calculate_spawn_weight(monster, level, target_difficulty)
-                weighted_monsters.append((monster.monster_class, weight))
+                total_weight += self.calculate_spawn_weight(monster, level, target_difficulty)
+                monster_classes.append(monster.monster_class)
+                cumulative_weights.append(total_weight)
             
-            self._level_pools[cache_key] = weighted_monsters
+            self._level_pools[cache_key] = (monster_classes, cumulative_weights)
         
         # Select monster using weighted random choice
-        weighted_monsters = self._level_pools[cache_key]
-        total_weight = sum(weight for _, weight in weighted_monsters)
+        monster_classes, cumulative_weights = self._level_pools[cache_key]
+        total_weight = cumulative_weights[-1]
         
         if total_weight <= 0:
             # Fallback
-            return Skeleton(x, y)
+            return self.spawn(Skeleton, x, y)
         
-        random_value = random.random() * total_weight
-        current_weight = 0
-        
-        for monster_class, weight in weighted_monsters:
-            current_weight += weight
-            if random_value <= current_weight:
-                return monster_class(x, y)
-        
-        # Fallback to last monster
-        return weighted_monsters[-1][0](x, y)
+        # First monster whose cumulative weight reaches the roll (the last one if rounding overshoots)
+        index = bisect_left(cumulative_weights, random.random() * total_weight)
+        return self.spawn(monster_classes[min(index, len(monster_classes) - 1)], x, y)
     
     def get_level_monster_distribution(self, level: int) -> Dict[str, float]:
         """Get the probability distribution of monsters for a level (for debugging/testing)."""
@@ -216,6 +237,11 @@ def create_monster_for_level(level_number: int, x: int = 0, y: int = 0, boss_enc
     return _monster_pool.create_monster_for_level(level_number, x, y, boss_encounter)
 
 
+def recycle_monster(monster):
+    """Hand a dead monster back to the monster pool for reuse."""
+    _monster_pool.recycle(monster)
+
+
 def get_monster_pool() -> MonsterPool:
     """Get the global monster pool instance."""
     return _monster_pool
\ No newline at end of file
@@ -4,7 +4,11 @@ Player character implementation.
 
 from constants import COLOR_WHITE
 from entity import Entity
+from traits import traits_to_mask
 from stats import Stats, StatType
+from trait_damage import player_trait_damage
+from stat_modifiers import StatPipeline
+from accessory_slots import AccessorySlots
 from event_emitter import EventEmitter
 from event_type import EventType
 from event_context import HealContext, ConsumeContext, LevelUpContext
@@ -49,6 +53,7 @@ class Player(Entity):
         self.fov = 10  # Field of view radius
         
         # Equipment slots - start with basic equipment
+        self._stat_pipeline = None  # Compiled from the equipment by get_stat_pipeline
         self.weapon = WoodenStick(0, 0)  # Starting weapon
         self.armor = WhiteTShirt(0, 0)   # Starting armor
         self.accessories = [None, None, None]  # List of equipped accessories
@@ -76,19 +81,9 @@ class Player(Entity):
     
     def take_damage_with_traits(self, damage, attack_traits=None):
         """Override to use total resistances/weaknesses and total defense."""
-        if attack_traits is None:
-            attack_traits = []
-        
         # Check for trait interactions
-        final_damage = damage
-        player_resistances = self.get_total_resistances()
-        player_weaknesses = self.get_total_weaknesses()
-        
-        for trait in attack_traits:
-            if trait in player_resistances:
-                final_damage = int(final_damage * 0.5)  # 50% damage if resistant
-            elif trait in player_weaknesses:
-                final_damage = int(final_damage * 2.0)  # 200% damage if weak
+        final_damage = player_trait_damage(damage, attack_traits or [], self.get_total_weakness_mask(),
+                                           self.get_total_resistance_mask())
         
         # Apply normal damage calculation
         actual_damage = max(1, final_damage - self.get_total_defense())
@@ -170,157 +165,101 @@ class Player(Entity):
             return True
         return False
     
+    @property
+    def weapon(self):
+        return self._weapon
+    
+    @weapon.setter
+    def weapon(self, weapon):
+        self._weapon = weapon
+        self._stat_pipeline = None
+    
+    @property
+    def armor(self):
+        return self._armor
+    
+    @armor.setter
+    def armor(self, armor):
+        self._armor = armor
+        self._stat_pipeline = None
+    
+    @property
+    def accessories(self):
+        return self._accessories
+    
+    @accessories.setter
+    def accessories(self, accessories):
+        if not isinstance(accessories, AccessorySlots):
+            accessories = AccessorySlots(accessories)
+        accessories.on_change = self._equipment_changed
+        self._accessories = accessories
+        self._stat_pipeline = None
+    
+    def _equipment_changed(self):
+        """Drop the compiled stat pipeline after an accessory slot changes."""
+        self._stat_pipeline = None
+    
+    def get_stat_pipeline(self):
+        """Get the StatPipeline for the equipment being worn, compiled when it was equipped."""
+        if self._stat_pipeline is None:
+            items = [item for item in (self.weapon, self.armor, *self.accessories) if item is not None]
+            self._stat_pipeline = StatPipeline(items)
+        return self._stat_pipeline
+    
+    def get_total(self, stat):
+        """Get any registered stat (see stat_modifiers.registry) including equipment modifiers."""
+        return (self._stat_pipeline or self.get_stat_pipeline()).evaluate(stat, self)
+    
     def get_attack_bonus(self): 
-        total = 0
-        if self.weapon:
-            total += self.weapon.get_attack_bonus(self)
-        if self.armor and hasattr(self.armor, 'attack_bonus'):
-            total += self.armor.get_attack_bonus(self)
-        for accessory in self.equipped_accessories():
-            total += accessory.get_attack_bonus(self)
-        return total
+        return self.get_stat_pipeline().bonus('attack', self)
     
     def get_total_attack(self):
-        """Get total attack power including equipment and multipliers."""
-        # Calculate base attack with all bonuses except cleanup
-        attack = self._get_total_attack_without_cleanup()
-        defense = self._get_total_defense_without_cleanup()
-        
-        # Apply cleanup effects (like Anaglyph) after all other calculations
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'is_cleanup') and accessory.is_cleanup:
-                if hasattr(accessory, 'apply_cleanup_effect'):
-                    attack, defense = accessory.apply_cleanup_effect(self, attack, defense)
-        
-        return attack
+        """Get total attack power including equipment, multipliers and cleanup effects (like Anaglyph)."""
+        return self.get_total('attack')
     
     def get_total_defense(self):
-        """Get total defense including equipment and multipliers."""
-        # Calculate base defense with all bonuses except cleanup
-        attack = self._get_total_attack_without_cleanup()
-        defense = self._get_total_defense_without_cleanup()
-        
-        # Apply cleanup effects (like Anaglyph) after all other calculations
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'is_cleanup') and accessory.is_cleanup:
-                if hasattr(accessory, 'apply_cleanup_effect'):
-                    attack, defense = accessory.apply_cleanup_effect(self, attack, defense)
-        
-        return defense
+        """Get total defense including equipment, multipliers and cleanup effects (like Anaglyph)."""
+        return self.get_total('defense')
     
     def _get_total_attack_without_cleanup(self):
         """Get total attack without cleanup effects (internal use)."""
-        total = self.attack + self.get_attack_bonus()
-        return max(1, int(total * self.get_total_attack_multiplier()))
+        return self.get_stat_pipeline().before_finals('attack', self)
     
     def _get_total_defense_without_cleanup(self):
         """Get total defense without cleanup effects (internal use)."""
-        total = self.defense
-        if self.weapon:
-            total += self.weapon.get_defense_bonus(self)
-        if self.armor:
-            total += self.armor.get_defense_bonus(self)
-        for accessory in self.equipped_accessories():
-            # Don't include cleanup accessories' defense bonus here
-            if not (hasattr(accessory, 'is_cleanup') and accessory.is_cleanup):
-                total += accessory.get_defense_bonus(self)
-        return int(total * self.get_total_defense_multiplier())
+        return self.get_stat_pipeline().before_finals('defense', self)
     
     def get_total_fov(self):
         """Get total field of view including equipment bonuses."""
-        total = self.fov
-        if self.weapon and hasattr(self.weapon, 'fov_bonus'):
-            total += self.weapon.get_fov_bonus(self)
-        if self.armor and hasattr(self.armor, 'fov_bonus'):
-            total += self.armor.get_fov_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'fov_bonus'):
-                total += accessory.get_fov_bonus(self)
-        return total
+        return self.get_total('fov')
     
     def get_total_health_aspect(self):
         """Get total health aspect including equipment bonuses."""
-        total = self.health_aspect
-        if self.weapon and hasattr(self.weapon, 'health_aspect_bonus'):
-            total += self.weapon.health_aspect_bonus
-        if self.armor and hasattr(self.armor, 'health_aspect_bonus'):
-            total += self.armor.health_aspect_bonus
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'health_aspect_bonus'):
-                total += accessory.health_aspect_bonus
-        return total
+        return self.get_total('health_aspect')
     
     def get_total_attack_multiplier(self):
         """Get total attack multiplier including equipment bonuses."""
-        total = self.attack_multiplier
-        if self.weapon and hasattr(self.weapon, 'attack_multiplier_bonus'):
-            total *= self.weapon.get_attack_multiplier_bonus(self)
-        if self.armor and hasattr(self.armor, 'attack_multiplier_bonus'):
-            total *= self.armor.get_attack_multiplier_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'attack_multiplier_bonus'):
-                total *= accessory.get_attack_multiplier_bonus(self)
-        return total
+        return self.get_total('attack_multiplier')
     
     def get_total_defense_multiplier(self):
         """Get total defense multiplier including equipment bonuses."""
-        total = self.defense_multiplier
-        if self.weapon and hasattr(self.weapon, 'defense_multiplier_bonus'):
-            total *= self.weapon.get_defense_multiplier_bonus(self)
-        if self.armor and hasattr(self.armor, 'defense_multiplier_bonus'):
-            total *= self.armor.get_defense_multiplier_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'defense_multiplier_bonus'):
-                total *= accessory.get_defense_multiplier_bonus(self)
-        return total
+        return self.get_total('defense_multiplier')
     
     def get_total_xp_multiplier(self):
         """Get total XP multiplier including equipment bonuses."""
-        total = self.xp_multiplier
-        if self.weapon and hasattr(self.weapon, 'xp_multiplier_bonus'):
-            total *= self.weapon.get_xp_multiplier_bonus(self)
-        if self.armor and hasattr(self.armor, 'xp_multiplier_bonus'):
-            total *= self.armor.get_xp_multiplier_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'xp_multiplier_bonus'):
-                total *= accessory.get_xp_multiplier_bonus(self)
-        return total
+        return self.get_total('xp_multiplier')
     
     def get_total_evade(self):
         """Get total evade chance including equipment bonuses."""
-        total = self.evade
-        if self.weapon and hasattr(self.weapon, 'get_evade_bonus'):
-            total += self.weapon.get_evade_bonus(self)
-        if self.armor and hasattr(self.armor, 'get_evade_bonus'):
-            total += self.armor.get_evade_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'get_evade_bonus'):
-                total += accessory.get_evade_bonus(self)
-        return min(0.99, total)
+        return self.get_total('evade')
     
     def get_total_crit(self):
         """Get total crit chance including equipment bonuses."""
-        total = self.crit
-        if self.weapon and hasattr(self.weapon, 'get_crit_bonus'):
-            total += self.weapon.get_crit_bonus(self)
-        if self.armor and hasattr(self.armor, 'get_crit_bonus'):
-            total += self.armor.get_crit_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'get_crit_bonus'):
-                total += accessory.get_crit_bonus(self)
-        return min(0.99, total)
+        return self.get_total('crit')
     
     def get_total_crit_multiplier(self):
         """Get total crit multiplier including equipment bonuses."""
-        total = self.crit_multiplier
-        if self.weapon and hasattr(self.weapon, 'get_crit_multiplier_bonus'):
-            total += self.weapon.get_crit_multiplier_bonus(self)
-        if self.armor and hasattr(self.armor, 'get_crit_multiplier_bonus'):
-            total += self.armor.get_crit_multiplier_bonus(self)
-        for accessory in self.equipped_accessories():
-            if hasattr(accessory, 'get_crit_multiplier_bonus'):
-                total += accessory.get_crit_multiplier_bonus(self)
-        return total
+        return self.get_total('crit_multiplier')
     
     def equipped_accessories(self):
         return [acc for acc in self.accessories if acc is not None]
@@ -372,6 +311,41 @@ class Player(Entity):
         
         return final_resistances
     
+    def get_total_attack_trait_mask(self):
+        """Get the bitmask of all attack traits including equipment bonuses."""
+        mask = traits_to_mask(self.attack_traits)
+        for item in self._equipped_items():
+            mask |= item.get_attack_trait_mask()
+        return mask
+    
+    def get_total_weakness_mask(self):
+        """Get the bitmask of weaknesses after cancellation with resistances."""
+        weakness_mask, resistance_mask = self._get_raw_trait_masks()
+        return weakness_mask & ~resistance_mask
+    
+    def get_total_resistance_mask(self):
+        """Get the bitmask of resistances after cancellation with weaknesses."""
+        weakness_mask, resistance_mask = self._get_raw_trait_masks()
+        return resistance_mask & ~weakness_mask
+    
+    def _get_raw_trait_masks(self):
+        """Get (weakness, resistance) bitmasks before cancellation."""
+        weakness_mask = traits_to_mask(self.weaknesses)
+        resistance_mask = traits_to_mask(self.resistances)
+        for item in self._equipped_items():
+            weakness_mask |= item.get_weakness_mask()
+            resistance_mask |= item.get_resistance_mask()
+        return weakness_mask, resistance_mask
+    
+    def _equipped_items(self):
+        """Get weapon, armor and accessories that are currently equipped."""
+        items = [acc for acc in self.accessories if acc is not None]
+        if self.armor:
+            items.append(self.armor)
+        if self.weapon:
+            items.append(self.weapon)
+        return items
+    
     def _get_all_resistances(self):
         """Get all resistances before cancellation."""
         total_resistances = self.resistances.copy()
@@ -394,10 +368,12 @@ class Player(Entity):
             total_weaknesses.extend(accessory.get_weaknesses())
         return total_weaknesses
     
-    def render(self, console, fov):
-        """Render the player on the console."""
+    def render(self, console, fov, camera=None):
+        """Render the player on the console, offset by the camera if given."""
         # Player should always be visible (they're the center of vision)
-        console.print(self.x, self.y, self.character, fg=self.color)
+        position = camera.to_screen(self.x, self.y) if camera else (self.x, self.y)
+        if position:
+            console.print(*position, self.character, fg=self.color)
     
     @property
     def xp(self):
@@ -163,8 +163,10 @@ class Shop:
         """Get the sell price of an item (50% of market value)."""
         return item.market_value // 2
     
-    def render(self, console, fov):
-        """Render the shop symbol on the console."""
+    def render(self, console, fov, camera=None):
+        """Render the shop symbol on the console, offset by the camera if given."""
         if self.x is not None and self.y is not None:
             if fov[self.x, self.y]:
-                console.print(self.x, self.y, self.symbol, fg=self.color)
\ No newline at end of file
+                position = camera.to_screen(self.x, self.y) if camera else (self.x, self.y)
+                if position:
+                    console.print(*position, self.symbol, fg=self.color)
\ No newline at end of file
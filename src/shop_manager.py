@@ -5,6 +5,7 @@ Shop UI manager for handling shop interface and transactions.
 from typing import Optional
 import tcod.event
 from shop import Shop
+from equipment_preview import EquipmentPreview
 
 
 class ShopManager:
@@ -253,9 +254,16 @@ class ShopManager:
             if current_line:
                 lines.append(current_line)
             
-            # Display description lines (max 3 lines)
-            for i, line in enumerate(lines[:3]):
+            # Display description lines (max 3 lines, 2 when there is a stat comparison)
+            change = ""
+            if self.ui_mode == 'buy' and hasattr(selected_item, 'equipment_slot'):
+                change = EquipmentPreview(self.player).describe_change(selected_item)
+            shown = lines[:2] if change else lines[:3]
+            for i, line in enumerate(shown):
                 console.print(x + 2, description_y + i, line, fg=(200, 200, 200))
+            if change:
+                console.print(x + 2, description_y + len(shown), f"If equipped: {change}"[:max_width],
+                              fg=(255, 215, 0))
         else:
             console.print(x + 2, description_y + 1, "Select an item to see its description", fg=(128, 128, 128))
         
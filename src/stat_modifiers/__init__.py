@@ -0,0 +1,12 @@
+"""
+Declarative stat modifiers and the per-stat pipelines they compile into.
+"""
+
+from .modifier_kind import ModifierKind
+from .stat_modifier import StatModifier
+from .stat_definition import StatDefinition
+from .registry import STAT_DEFINITIONS, register_stat, get_stat_definition
+from .stat_pipeline import StatPipeline, get_item_modifiers
+
+__all__ = ['ModifierKind', 'StatModifier', 'StatDefinition', 'STAT_DEFINITIONS', 'register_stat',
+           'get_stat_definition', 'StatPipeline', 'get_item_modifiers']
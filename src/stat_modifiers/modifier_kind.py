@@ -0,0 +1,13 @@
+"""
+Kinds of stat modifier and how they combine with a stat's running total.
+"""
+
+from enum import Enum, auto
+
+
+class ModifierKind(Enum):
+    """How a StatModifier changes its stat."""
+
+    FLAT = auto()        # Added to the running total
+    MULTIPLIER = auto()  # Multiplied into the running total
+    FINAL = auto()       # Rewrites finished stats together, after everything else (cleanup items)
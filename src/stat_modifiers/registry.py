@@ -0,0 +1,53 @@
+"""
+Registry of the stats the StatPipeline knows how to work out.
+"""
+
+from operator import attrgetter
+
+from .stat_definition import StatDefinition
+
+# Evade and crit chances never reach certainty
+MAX_CHANCE = 0.99
+
+STAT_DEFINITIONS = {}
+
+
+def register_stat(definition):
+    """Add (or replace) a stat definition; items can then modify it by name."""
+    STAT_DEFINITIONS[definition.name] = definition
+    return definition
+
+
+def get_stat_definition(name):
+    """Get a registered stat definition by name."""
+    return STAT_DEFINITIONS[name]
+
+
+def _finish_attack(total, player):
+    """Scale attack by the attack multiplier, truncate it and keep it at least 1."""
+    return max(1, int(total * player.get_total('attack_multiplier')))
+
+
+def _finish_defense(total, player):
+    """Scale defense by the defense multiplier and truncate it."""
+    return int(total * player.get_total('defense_multiplier'))
+
+
+def _cap_chance(total, player):
+    """Cap a chance stat at MAX_CHANCE."""
+    return min(MAX_CHANCE, total)
+
+
+for _definition in (
+    StatDefinition('attack', attrgetter('attack'), _finish_attack),
+    StatDefinition('defense', attrgetter('defense'), _finish_defense),
+    StatDefinition('fov', attrgetter('fov')),
+    StatDefinition('health_aspect', attrgetter('health_aspect')),
+    StatDefinition('attack_multiplier', attrgetter('attack_multiplier')),
+    StatDefinition('defense_multiplier', attrgetter('defense_multiplier')),
+    StatDefinition('xp_multiplier', attrgetter('xp_multiplier')),
+    StatDefinition('evade', attrgetter('evade'), _cap_chance),
+    StatDefinition('crit', attrgetter('crit'), _cap_chance),
+    StatDefinition('crit_multiplier', attrgetter('crit_multiplier')),
+):
+    register_stat(_definition)
@@ -0,0 +1,20 @@
+"""
+How a player stat is built up from its base value.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+@dataclass(frozen=True)
+class StatDefinition:
+    """A stat the StatPipeline can work out.
+
+    base(player) gives the starting value before any modifiers, and
+    finish(total, player), if given, turns the modified total into the stat
+    (rounding, caps, scaling by another stat) before FINAL modifiers run.
+    """
+
+    name: str
+    base: Callable
+    finish: Optional[Callable] = None
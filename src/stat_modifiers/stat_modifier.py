@@ -0,0 +1,44 @@
+"""
+One change an equipped item makes to the player's stats.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Optional, Tuple
+
+from .modifier_kind import ModifierKind
+
+
+@dataclass(frozen=True)
+class StatModifier:
+    """A typed change to one or more stats, compiled into a StatPipeline at equip time.
+
+    value is a number or a callable taking the player. FLAT and MULTIPLIER
+    modifiers change the single stat in stats; a FINAL modifier's value is
+    called as value(player, *finished values) and returns the new values of
+    all its stats. With a condition, the modifier only applies while
+    condition(player) is true.
+    """
+
+    stats: Tuple[str, ...]
+    kind: ModifierKind
+    value: Any
+    condition: Optional[Callable] = None
+
+    @classmethod
+    def flat(cls, stat, value):
+        """Add value to stat."""
+        return cls((stat,), ModifierKind.FLAT, value)
+
+    @classmethod
+    def multiplier(cls, stat, value):
+        """Multiply stat by value."""
+        return cls((stat,), ModifierKind.MULTIPLIER, value)
+
+    @classmethod
+    def final(cls, stats, apply):
+        """Rewrite stats once they are finished: apply(player, *values) -> new values."""
+        return cls(tuple(stats), ModifierKind.FINAL, apply)
+
+    def when(self, condition):
+        """Get this modifier applying only while condition(player) is true."""
+        return replace(self, condition=condition)
@@ -0,0 +1,155 @@
+"""
+Per-stat modifier pipelines compiled from the equipment a player wears.
+"""
+
+from .modifier_kind import ModifierKind
+from .registry import get_stat_definition
+from .stat_modifier import StatModifier
+
+
+# (stat, kind, attribute probed for, getter) for items without get_stat_modifiers, as Player used to probe them
+PROBED_BONUSES = (
+    ('attack', ModifierKind.FLAT, 'get_attack_bonus', 'get_attack_bonus'),
+    ('defense', ModifierKind.FLAT, 'get_defense_bonus', 'get_defense_bonus'),
+    ('fov', ModifierKind.FLAT, 'fov_bonus', 'get_fov_bonus'),
+    ('attack_multiplier', ModifierKind.MULTIPLIER, 'attack_multiplier_bonus', 'get_attack_multiplier_bonus'),
+    ('defense_multiplier', ModifierKind.MULTIPLIER, 'defense_multiplier_bonus', 'get_defense_multiplier_bonus'),
+    ('xp_multiplier', ModifierKind.MULTIPLIER, 'xp_multiplier_bonus', 'get_xp_multiplier_bonus'),
+    ('evade', ModifierKind.FLAT, 'get_evade_bonus', 'get_evade_bonus'),
+    ('crit', ModifierKind.FLAT, 'get_crit_bonus', 'get_crit_bonus'),
+    ('crit_multiplier', ModifierKind.FLAT, 'get_crit_multiplier_bonus', 'get_crit_multiplier_bonus'),
+)
+
+
+class StatPipeline:
+    """The StatModifiers of a set of equipped items, compiled into one ordered list of steps per stat.
+
+    Steps run in item order (weapon, armor, then accessories). A stat is its
+    definition's base value run through its steps and finish; FINAL
+    modifiers then rewrite the finished stats they cover, in item order. All
+    probing of items happens here at compile time, so evaluating a stat is a
+    single loop over plain callables. The player compiles a new pipeline
+    whenever its equipment changes.
+    """
+
+    def __init__(self, items):
+        """Compile the modifiers of items, which are in the order the player wears them."""
+        self.items = tuple(items)
+        self._steps = {}
+        self._finals = []
+        for item in self.items:
+            steps, finals = compile_item(item)
+            for stat, step in steps:
+                self._steps.setdefault(stat, []).append(step)
+            self._finals.extend(finals)
+        # Stats the FINAL modifiers rewrite, in the order they are first worked out
+        self._final_stats = tuple(dict.fromkeys(stat for stats, _ in self._finals for stat in stats))
+        self._evaluators = {}  # stat -> evaluate(player) without FINAL modifiers, compiled on first use
+
+    def evaluate(self, stat, player):
+        """Work out a stat for player."""
+        if stat not in self._final_stats:
+            return self.before_finals(stat, player)
+        values = {name: self.before_finals(name, player) for name in self._final_stats}
+        for stats, apply in self._finals:
+            values.update(zip(stats, apply(player, values)))
+        return values[stat]
+
+    def before_finals(self, stat, player):
+        """Work out a stat without its FINAL modifiers."""
+        evaluator = self._evaluators.get(stat)
+        if evaluator is None:
+            evaluator = self._evaluators[stat] = _compile_evaluator(get_stat_definition(stat),
+                                                                    self._steps.get(stat, ()))
+        return evaluator(player)
+
+    def bonus(self, stat, player):
+        """Get what the modifiers add to a stat on their own (its steps run from 0)."""
+        total = 0
+        for multiply, value in self._steps.get(stat, ()):
+            total = total * value(player) if multiply else total + value(player)
+        return total
+
+
+def get_item_modifiers(item):
+    """Get an item's StatModifiers, probing its bonuses if it does not list them itself."""
+    get_stat_modifiers = getattr(item, 'get_stat_modifiers', None)
+    if get_stat_modifiers is not None:
+        return get_stat_modifiers()
+    modifiers = [StatModifier((stat,), kind, getattr(item, getter))
+                 for stat, kind, attribute, getter in PROBED_BONUSES if hasattr(item, attribute)]
+    if hasattr(item, 'health_aspect_bonus'):
+        modifiers.append(StatModifier.flat('health_aspect', lambda player: item.health_aspect_bonus))
+    return modifiers
+
+
+def compile_item(item):
+    """Compile an item's modifiers into ([(stat, step)], [final]) in the item's own order."""
+    return compile_modifiers(get_item_modifiers(item))
+
+
+def compile_modifiers(modifiers):
+    """Compile a list of StatModifiers into ([(stat, step)], [final]) in their order."""
+    steps, finals = [], []
+    for modifier in modifiers:
+        if modifier.kind is ModifierKind.FINAL:
+            finals.append(_compile_final(modifier))
+        else:
+            stat, = modifier.stats
+            steps.append((stat, compile_step(modifier)))
+    return steps, finals
+
+
+def compile_step(modifier):
+    """Turn a FLAT or MULTIPLIER modifier into (multiply, value(player))."""
+    multiply = modifier.kind is ModifierKind.MULTIPLIER
+    value, condition = modifier.value, modifier.condition
+    if not callable(value):
+        constant = value
+        value = lambda player: constant
+    if condition is not None:
+        unconditional, neutral = value, 1 if multiply else 0
+        value = lambda player: unconditional(player) if condition(player) else neutral
+    return multiply, value
+
+
+def _compile_evaluator(definition, steps):
+    """Build evaluate(player) for one stat: its base, then one loop over its steps, then its finish."""
+    base, finish = definition.base, definition.finish
+    values = tuple(value for _, value in steps)
+    kinds = {multiply for multiply, _ in steps}
+
+    if kinds == {True}:
+        def unfinished(player):
+            total = base(player)
+            for value in values:
+                total *= value(player)
+            return total
+    elif kinds == {True, False}:
+        def unfinished(player):
+            total = base(player)
+            for multiply, value in steps:
+                total = total * value(player) if multiply else total + value(player)
+            return total
+    else:
+        def unfinished(player):
+            total = base(player)
+            for value in values:
+                total += value(player)
+            return total
+
+    if finish is None:
+        return unfinished
+    return lambda player: finish(unfinished(player), player)
+
+
+def _compile_final(modifier):
+    """Turn a FINAL modifier into (stats, apply(player, values) -> new values)."""
+    stats, value, condition = modifier.stats, modifier.value, modifier.condition
+
+    def apply(player, values):
+        current = [values[stat] for stat in stats]
+        if condition is not None and not condition(player):
+            return current
+        return value(player, *current)
+    return stats, apply
@@ -0,0 +1,69 @@
+"""
+The player's total stats for one set of equipment.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from traits import Trait
+
+
+# (stat, label, shown as a percentage) in the order the inventory summary lists them
+STAT_LABELS = (
+    ('attack', 'ATK', False),
+    ('defense', 'DEF', False),
+    ('crit', 'CRT', True),
+    ('evade', 'EVD', True),
+    ('fov', 'FOV', False),
+    ('health_aspect', 'Healing', True),
+    ('attack_multiplier', 'ATK-X', True),
+    ('defense_multiplier', 'DEF-X', True),
+    ('xp_multiplier', 'XP-X', True),
+    ('crit_multiplier', 'CRT-X', True),
+)
+
+
+@dataclass(frozen=True)
+class StatTotals:
+    """Every Player.get_total_* value, as EquipmentPreview works them out."""
+
+    attack: int
+    defense: int
+    fov: int
+    health_aspect: float
+    attack_multiplier: float
+    defense_multiplier: float
+    xp_multiplier: float
+    evade: float
+    crit: float
+    crit_multiplier: float
+    attack_traits: Tuple[Trait, ...]
+    weaknesses: Tuple[Trait, ...]   # After cancellation with resistances
+    resistances: Tuple[Trait, ...]  # After cancellation with weaknesses
+    attack_trait_mask: int
+    weakness_mask: int
+    resistance_mask: int
+    # Every registered stat by name, including any added with register_stat
+    stats: Dict[str, float] = field(default_factory=dict)
+
+    def difference(self, before):
+        """Get {stat: change} for the numeric stats that differ from before."""
+        changes = {}
+        for stat, _, _ in STAT_LABELS:
+            change = getattr(self, stat) - getattr(before, stat)
+            if change:
+                changes[stat] = change
+        return changes
+
+    def describe_change(self, before):
+        """Describe the change from before like "+3 ATK / -1 DEF" ("" if nothing visible changes)."""
+        parts = []
+        for stat, label, percentage in STAT_LABELS:
+            change = getattr(self, stat) - getattr(before, stat)
+            if percentage:
+                change = round(change * 100)
+                if change:
+                    parts.append(f"{change:+d}% {label}")
+            elif change:
+                parts.append(f"{change:+g} {label}")
+        return " / ".join(parts)
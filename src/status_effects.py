@@ -6,6 +6,9 @@ Status effects system for the roguelike game.
 class StatusEffects:
     """Manages status effect counters for players and monsters."""
     
+    # Attack change while frightened
+    FRIGHTENED_ATTACK_MODIFIER = -2
+    
     def __init__(self):
         """Initialize all status effects to 0."""
         # Negative status effects
@@ -36,6 +39,10 @@ class StatusEffects:
         self.immobilized = 0
         self.off_guard = 0
     
+    def clear(self):
+        """Reset every status effect to 0, as when first created."""
+        self.__init__()
+    
     def apply_status(self, effect_name, amount, entity=None):
         """Apply a status effect with the given amount, checking for immunities."""
         # Check for immunity from accessories
@@ -100,7 +107,7 @@ class StatusEffects:
         """Get attack modifier from status effects."""
         modifier = 0
         if self.frightened > 0:
-            modifier -= 2
+            modifier += self.FRIGHTENED_ATTACK_MODIFIER
             self.remove_status('frightened', 1)
         return modifier
     
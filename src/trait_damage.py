@@ -0,0 +1,78 @@
+"""
+Damage rules for attack traits against weaknesses and resistances.
+
+Kept apart from the combat package, which entities would otherwise have to
+load (with all its analysis tools) just to take damage.
+"""
+
+from traits import traits_to_mask
+
+
+# Aspect multipliers for attack traits against weaknesses and resistances
+WEAKNESS_MULTIPLIER = 1.5
+RESISTANCE_MULTIPLIER = 0.5
+# Trait multiplier taken by the player when hit on a weakness (monsters take WEAKNESS_MULTIPLIER)
+PLAYER_WEAKNESS_MULTIPLIER = 2.0
+
+
+def aspect_multiplier(attack_traits, weakness_mask, resistance_mask):
+    """Get the damage multiplier of attack traits against weakness and resistance masks.
+
+    Each trait hitting a weakness multiplies damage by WEAKNESS_MULTIPLIER; each
+    hitting only a resistance by RESISTANCE_MULTIPLIER.
+    """
+    # Single bitwise test for the common no-interaction case
+    if not (traits_to_mask(attack_traits) & (weakness_mask | resistance_mask)):
+        return 1.0
+
+    multiplier = 1.0
+    for trait in attack_traits:
+        if trait & weakness_mask:
+            multiplier *= WEAKNESS_MULTIPLIER
+        elif trait & resistance_mask:
+            multiplier *= RESISTANCE_MULTIPLIER
+    return multiplier
+
+
+def get_trait_interaction(attack_traits, weakness_mask, resistance_mask):
+    """Get "weakness" or "resistance" if only one applies to the attack traits, else None."""
+    attack_mask = traits_to_mask(attack_traits)
+    weakness_exploited = bool(attack_mask & weakness_mask)
+    resistance_applied = bool(attack_mask & resistance_mask)
+    if weakness_exploited and not resistance_applied:
+        return 'weakness'
+    if resistance_applied and not weakness_exploited:
+        return 'resistance'
+    return None
+
+
+def monster_trait_damage(damage, attack_traits, weakness_mask, resistance_mask):
+    """Apply a monster's one weakness or resistance to damage it takes.
+
+    If the traits hit both, the first interacting trait in attack order decides.
+    """
+    attack_mask = traits_to_mask(attack_traits)
+    resistance_hits = attack_mask & resistance_mask
+    weakness_hits = attack_mask & weakness_mask
+    if resistance_hits and weakness_hits:
+        for trait in attack_traits:
+            if trait & resistance_hits:
+                return int(damage * RESISTANCE_MULTIPLIER)
+            if trait & weakness_hits:
+                return int(damage * WEAKNESS_MULTIPLIER)
+    elif resistance_hits:
+        return int(damage * RESISTANCE_MULTIPLIER)
+    elif weakness_hits:
+        return int(damage * WEAKNESS_MULTIPLIER)
+    return damage
+
+
+def player_trait_damage(damage, attack_traits, weakness_mask, resistance_mask):
+    """Apply the player's weaknesses and resistances to damage taken, once per attack trait."""
+    if traits_to_mask(attack_traits) & (resistance_mask | weakness_mask):
+        for trait in attack_traits:
+            if trait & resistance_mask:
+                damage = int(damage * RESISTANCE_MULTIPLIER)
+            elif trait & weakness_mask:
+                damage = int(damage * PLAYER_WEAKNESS_MULTIPLIER)
+    return damage
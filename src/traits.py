@@ -1,14 +1,15 @@
-from enum import Enum, auto
+from enum import IntFlag, auto
+from functools import lru_cache
 
 
-class Trait(Enum):
+class Trait(IntFlag):
     # elemental types
     FIRE = auto()
     ICE = auto()
     HOLY = auto()
     DARK = auto()
     POISON = auto()
-    # physical 
+    # physical
     STRIKE = auto()
     SLASH = auto()
     THWACK = auto()
@@ -18,27 +19,133 @@ class Trait(Enum):
     DEMONSLAYER = auto()
 
     def __str__(self):
-        return self.name.lower()
-    
+        return (self.name or "").lower()
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
     @property
     def is_elemental(self):
         """Return True if this trait is elemental (fire, ice, holy, dark, poison)."""
         return self in {Trait.FIRE, Trait.ICE, Trait.HOLY, Trait.DARK, Trait.POISON}
-    
+
     @property
     def is_physical(self):
         return self in {Trait.SLASH, Trait.STRIKE, Trait.THWACK}
-    
+
     @property
     def opposing_element(self):
         """Return the opposing elemental trait if this is elemental."""
         if not self.is_elemental:
             return None
-        
+
         opposites = {
             Trait.FIRE: Trait.ICE,
             Trait.ICE: Trait.FIRE,
             Trait.HOLY: Trait.DARK,
             Trait.DARK: Trait.HOLY
         }
-        return opposites.get(self)
\ No newline at end of file
+        return opposites.get(self)
+
+
+@lru_cache(maxsize=None)
+def _fold_traits(traits):
+    """Fold a tuple of traits into a mask (shared across identical trait tuples)."""
+    mask = 0
+    for trait in traits:
+        mask |= trait
+    return mask
+
+
+class TraitList(list):
+    """A list of traits that keeps a cached bitmask of its contents.
+
+    Behaves exactly like a regular list (order and duplicates are kept), but
+    `mask` is only recomputed after the list is mutated.
+    """
+
+    __slots__ = ('_mask',)
+
+    def __init__(self, traits=()):
+        super().__init__(traits)
+        self._mask = None
+
+    @property
+    def mask(self):
+        if self._mask is None:
+            self._mask = _fold_traits(tuple(self))
+        return self._mask
+
+    def append(self, trait):
+        super().append(trait)
+        self._mask = None
+
+    def extend(self, traits):
+        super().extend(traits)
+        self._mask = None
+
+    def insert(self, index, trait):
+        super().insert(index, trait)
+        self._mask = None
+
+    def remove(self, trait):
+        super().remove(trait)
+        self._mask = None
+
+    def pop(self, *args):
+        trait = super().pop(*args)
+        self._mask = None
+        return trait
+
+    def clear(self):
+        super().clear()
+        self._mask = None
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._mask = None
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._mask = None
+
+    def __iadd__(self, traits):
+        result = super().__iadd__(traits)
+        self._mask = None
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self._mask = None
+        return result
+
+    def copy(self):
+        return TraitList(self)
+
+
+class FrozenTraitList(TraitList):
+    """A TraitList that cannot be mutated, for traits shared between objects."""
+
+    __slots__ = ()
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("FrozenTraitList cannot be modified")
+
+    append = extend = insert = remove = pop = clear = _frozen
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    sort = reverse = _frozen
+
+    def __reduce__(self):
+        # Lists unpickle by extending an empty instance, which a frozen list refuses
+        return FrozenTraitList, (list(self),)
+
+
+def traits_to_mask(traits):
+    """Return the bitmask for a trait collection (TraitList, list, Trait or int)."""
+    if traits is None:
+        return 0
+    if isinstance(traits, TraitList):
+        return traits.mask
+    if isinstance(traits, int):
+        return int(traits)
+    return _fold_traits(tuple(traits))
@@ -0,0 +1,74 @@
+"""
+Energy-based turn scheduler for monsters.
+"""
+
+import heapq
+
+
+class TurnScheduler:
+    """Priority queue of (next_action_time, entity) for entities that act on their own.
+
+    Time is measured in units where one player turn is TURN_TIME. An entity with
+    speed NORMAL_SPEED acts once per player turn; speed 200 acts twice, speed 50
+    every other turn. Each advance only touches entities whose time has come, so
+    the cost scales with the number of actions, not the number of entities.
+    """
+
+    TURN_TIME = 100
+    NORMAL_SPEED = 100
+
+    def __init__(self):
+        """Initialize an empty schedule at time 0."""
+        self.time = 0
+        self._heap = []
+        # Tie-breaker so entities due at the same time act in the order they were scheduled
+        # (the number the next entry gets; a plain int so pickling leaves it untouched)
+        self._sequence = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def action_delay(self, entity):
+        """Get the time between an entity's actions, from its speed."""
+        speed = getattr(entity, 'speed', self.NORMAL_SPEED)
+        return max(1, self.TURN_TIME * self.NORMAL_SPEED // speed)
+
+    def add(self, entity):
+        """Schedule an entity's first action one action delay from now."""
+        self._push(entity, self.time + self.action_delay(entity))
+
+    def advance(self, act, duration=TURN_TIME):
+        """Advance time and call act(entity) for each action that comes due, in time order.
+
+        act returns True to keep the entity scheduled or False to drop it (e.g. it died).
+        """
+        self.time += duration
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            action_time, _, entity = heapq.heappop(heap)
+            if act(entity):
+                self._push(entity, action_time + self.action_delay(entity))
+
+    def remove(self, entity):
+        """Drop an entity's scheduled action, if it has one; returns whether it was scheduled.
+
+        The entry is swapped with the last one and the heap is repaired in place.
+        """
+        heap = self._heap
+        for index, entry in enumerate(heap):
+            if entry[2] is entity:
+                last = heap.pop()
+                if index < len(heap):
+                    heap[index] = last
+                    heapq.heapify(heap)
+                return True
+        return False
+
+    def clear(self):
+        """Drop every scheduled entity."""
+        self._heap.clear()
+
+    def _push(self, entity, action_time):
+        """Schedule an entity to act at the given time."""
+        heapq.heappush(self._heap, (action_time, self._sequence, entity))
+        self._sequence += 1
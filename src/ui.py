@@ -3,9 +3,10 @@ User interface rendering and management.
 """
 
 from constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, MAP_HEIGHT,
+    SCREEN_WIDTH, SCREEN_HEIGHT, VIEWPORT_HEIGHT,
     COLOR_WHITE, COLOR_RED, COLOR_GREEN, COLOR_YELLOW, COLOR_GRAY, COLOR_CYAN
 )
+from equipment_preview import EquipmentPreview
 
 
 class UI:
@@ -26,8 +27,8 @@ class UI:
     
     def render(self, console, player, current_level_display, level=None):
         """Render the UI elements."""
-        # UI panel starts below the map
-        ui_y = MAP_HEIGHT
+        # UI panel starts below the map viewport
+        ui_y = VIEWPORT_HEIGHT
         
         # Draw a horizontal line to separate the map from UI
         if ui_y < SCREEN_HEIGHT:
@@ -273,6 +274,12 @@ class UI:
             elif hasattr(selected_item, 'description'):
                 desc_lines.append(selected_item.description)
             
+            # What equipping an inventory item would change
+            if selected_item in player.inventory and hasattr(selected_item, 'equipment_slot'):
+                change = EquipmentPreview(player).describe_change(selected_item)
+                if change:
+                    desc_lines.append(f"If equipped: {change}")
+            
             # Equipment bonuses
             if hasattr(selected_item, 'attack_bonus') and selected_item.attack_bonus > 0:
                 desc_lines.append(f"Attack Bonus: +{selected_item.get_attack_bonus(player)}")
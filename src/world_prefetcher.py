@@ -0,0 +1,90 @@
+"""
+World prefetching so starting a new game does not block on level generation.
+"""
+
+import threading
+
+from items.pool import item_pool_lock
+from level_manager import LevelManager
+from player import Player
+
+
+def create_world():
+    """Generate Floor 1 and a new player standing at its starting position.
+
+    Returns a (level_manager, player) tuple with the player's FOV already computed.
+    """
+    level_manager = LevelManager()
+    level = level_manager.get_current_area()
+
+    # Place player at stairs up position (or first room if no stairs)
+    if hasattr(level, 'stairs_up_pos') and level.stairs_up_pos:
+        start_x, start_y = level.stairs_up_pos
+    elif hasattr(level, 'rooms') and len(level.rooms) > 0:
+        start_x, start_y = level.rooms[0].center()
+    else:
+        start_x, start_y = 10, 10
+
+    player = Player(x=start_x, y=start_y)
+
+    # Initialize FOV for starting position
+    level.update_fov(player.x, player.y, player.get_total_fov())
+
+    return level_manager, player
+
+
+class WorldPrefetcher:
+    """Generates the next world on a background thread while the main menu is shown.
+
+    The worker holds item_pool_lock for the whole world, as every Level does
+    while it generates, so floors generated on the main thread wait for it
+    instead of sharing the item pool's spawn tracking and the random module
+    with it mid-generation.
+    """
+
+    def __init__(self):
+        """Initialize with no world generated or in progress."""
+        self._thread = None
+        self._world = None
+        self._error = None
+
+    def is_prefetching(self):
+        """Check if a world is being generated or is ready to be taken."""
+        return self._thread is not None or self._world is not None
+
+    def start(self):
+        """Start generating the next world in the background, if not already started."""
+        if self.is_prefetching():
+            return
+
+        # Daemon thread so quitting from the menu never waits on generation
+        self._thread = threading.Thread(target=self._run, name="world-prefetch", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Worker thread body."""
+        try:
+            with item_pool_lock:
+                self._world = create_world()
+        except Exception as error:
+            self._error = error
+
+    def take(self):
+        """Return the prefetched world, generating one now if none was started.
+
+        Each world is only handed out once; the next call generates a fresh one.
+        """
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        world, error = self._world, self._error
+        self._world = None
+        self._error = None
+
+        if world is None:
+            if error is not None:
+                # Generation failed off-thread; retry here so any error surfaces normally
+                print(f"[WORLD] Background world generation failed: {error}")
+            world = create_world()
+        return world
@@ -0,0 +1,89 @@
+"""
+Unit tests for dormant monsters and activation zones.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+from level.level import Level
+from level.activation_zones import ActivationZones
+from monsters import Skeleton
+from constants import WAKE_RADIUS
+
+
+class TestActivationZones(unittest.TestCase):
+    """Test the spatial index of dormant monsters."""
+
+    def test_query_returns_monsters_within_radius(self):
+        """Test that queries find monsters within the radius across zone borders only."""
+        zones = ActivationZones(zone_size=4)
+        near = Skeleton(7, 8)
+        edge = Skeleton(10, 5)
+        far = Skeleton(20, 20)
+        for monster in (near, edge, far):
+            zones.add(monster)
+
+        self.assertCountEqual(zones.query(8, 8, 3), [near])
+        self.assertCountEqual(zones.query(8, 8, 4), [near, edge])
+        self.assertEqual(len(zones), 3)
+
+    def test_remove(self):
+        """Test that removed monsters are no longer found."""
+        zones = ActivationZones()
+        monster = Skeleton(3, 3)
+        zones.add(monster)
+        self.assertIn(monster, zones)
+        zones.remove(monster)
+        self.assertNotIn(monster, zones)
+        self.assertEqual(zones.query(3, 3, 5), [])
+        self.assertEqual(len(zones), 0)
+
+
+class TestDormantMonsters(unittest.TestCase):
+    """Test that level monsters sleep until woken."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(1234)
+        self.level = Level(5)
+
+    def test_monsters_start_dormant(self):
+        """Test that placed monsters are dormant and unscheduled."""
+        self.assertGreater(len(self.level.monsters), 0)
+        self.assertEqual(len(self.level.dormant), len(self.level.monsters))
+        self.assertEqual(len(self.level.scheduler), 0)
+
+    def test_wake_by_proximity_without_sight(self):
+        """Test that a monster right next to the player wakes even out of view."""
+        monster = self.level.monsters[0]
+        self.level.fov[:] = False
+        self.level.wake_monsters_around_player(monster.x + WAKE_RADIUS, monster.y)
+        self.assertNotIn(monster, self.level.dormant)
+        self.assertEqual(len(self.level.scheduler), 1)
+
+    def test_wake_by_line_of_sight(self):
+        """Test that monsters in the player's view within sight range wake, others sleep."""
+        monster = self.level.monsters[0]
+        self.level.fov[:] = False
+        self.level.wake_monsters_around_player(monster.x + monster.sight_range, monster.y)
+        self.assertIn(monster, self.level.dormant)
+
+        self.level.fov[monster.x, monster.y] = True
+        self.level.wake_monsters_around_player(monster.x + monster.sight_range, monster.y)
+        self.assertNotIn(monster, self.level.dormant)
+
+    def test_wake_by_noise(self):
+        """Test that a noise wakes every dormant monster within its radius."""
+        monster = self.level.monsters[0]
+        self.level.make_noise(monster.x, monster.y, 0)
+        self.assertNotIn(monster, self.level.dormant)
+        self.level.make_noise(monster.x, monster.y, 1000)
+        self.assertEqual(len(self.level.dormant), 0)
+        self.assertEqual(len(self.level.scheduler), len(self.level.monsters))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Unit tests for the camera and maps larger than the viewport.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+import numpy as np
+import tcod
+from camera import Camera
+from game import Game
+from level.level import Level
+from level.scent_map import ScentMap
+from level.tile_types import TILE_FLOOR, TILE_WALL
+from level_manager import LevelManager
+from constants import ACTIVE_RADIUS, MAP_WIDTH, MAP_HEIGHT, VIEWPORT_WIDTH, VIEWPORT_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from monsters import Skeleton
+
+
+class TestCamera(unittest.TestCase):
+    """Test camera positioning and coordinate conversion."""
+
+    def test_default_map_fills_viewport(self):
+        """Test that a default-size map never scrolls."""
+        camera = Camera()
+        camera.center_on(70, 40, MAP_WIDTH, MAP_HEIGHT)
+        self.assertEqual((camera.x, camera.y), (0, 0))
+        self.assertEqual(camera.to_screen(70, 40), (70, 40))
+
+    def test_center_on_clamps_to_map_edges(self):
+        """Test that the view centers on the target but stays inside the map."""
+        camera = Camera(20, 10)
+        camera.center_on(50, 50, 512, 512)
+        self.assertEqual(camera.get_bounds(), (40, 45, 60, 55))
+        camera.center_on(2, 2, 512, 512)
+        self.assertEqual(camera.get_bounds(), (0, 0, 20, 10))
+        camera.center_on(510, 510, 512, 512)
+        self.assertEqual(camera.get_bounds(), (492, 502, 512, 512))
+
+    def test_to_screen_outside_view(self):
+        """Test that positions outside the view have no screen position."""
+        camera = Camera(20, 10)
+        camera.center_on(50, 50, 512, 512)
+        self.assertEqual(camera.to_screen(40, 45), (0, 0))
+        self.assertIsNone(camera.to_screen(39, 45))
+        self.assertIsNone(camera.to_screen(50, 55))
+
+
+class TestLargeMaps(unittest.TestCase):
+    """Test generating, viewing and exploring a map larger than the viewport."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(1234)
+        self.level = Level(3, width=512, height=512)
+
+    def test_large_level_generation(self):
+        """Test that a large level is generated at its configured size with stairs."""
+        self.assertEqual(self.level.tiles.shape, (512, 512))
+        self.assertGreater(len(self.level.rooms), 30)
+        self.assertTrue(self.level.is_stairs_up(*self.level.get_stairs_up_position()))
+        for entity in self.level.monsters + self.level.items:
+            self.assertTrue(self.level.tiles[entity.x, entity.y])
+
+    def test_fov_only_touches_region_around_player(self):
+        """Test that FOV updates stay within the radius window and clear the previous one."""
+        x, y = self.level.rooms[-1].center()
+        self.level.update_fov(x, y, 8)
+        visible = np.argwhere(self.level.fov)
+        self.assertTrue((np.abs(visible - (x, y)) <= 8).all())
+
+        x2, y2 = self.level.rooms[0].center()
+        self.level.update_fov(x2, y2, 8)
+        self.assertFalse(self.level.fov[x, y])
+        self.assertTrue(self.level.fov[x2, y2])
+        self.assertTrue(self.level.explored[x, y])
+
+    def test_render_draws_camera_view(self):
+        """Test that rendering offsets the map by the camera and leaves the UI panel alone."""
+        x, y = self.level.rooms[-1].center()
+        self.level.update_fov(x, y, 8)
+        camera = Camera()
+        camera.center_on(x, y, self.level.width, self.level.height)
+        console = tcod.console.Console(SCREEN_WIDTH, SCREEN_HEIGHT, order="F")
+
+        self.level.render(console, camera)
+
+        screen_x, screen_y = camera.to_screen(x, y)
+        self.assertNotEqual(console.rgb["ch"][screen_x, screen_y], ord(' '))
+        self.assertTrue((console.rgb["ch"][:, VIEWPORT_HEIGHT:] == ord(' ')).all())
+        self.assertLessEqual(camera.width, VIEWPORT_WIDTH)
+
+    def test_level_manager_map_size(self):
+        """Test that the level manager generates floors at its map size."""
+        level_manager = LevelManager(map_width=200, map_height=100)
+        self.assertEqual(level_manager.get_current_area().tiles.shape, (200, 100))
+
+
+class TestOffscreenMonsters(unittest.TestCase):
+    """Test that monster activity does not depend on what the camera shows."""
+
+    def setUp(self):
+        """Set up a 200x200 floor that is one long north-south corridor, with the player in it."""
+        random.seed(1234)
+        self.game = Game()
+        level = Level(3, width=200, height=200)
+        level.tiles[:, :] = TILE_WALL
+        level.tiles[100, 50:150] = TILE_FLOOR
+        level.update_fov_map()
+        level.scent = ScentMap(level.walkable)
+        level.fov[:, :] = False
+        for monster in list(level.monsters):
+            level.remove_monster(monster)
+        self.game.level = level
+        self.level = level
+
+    def test_offscreen_monster_follows_scent(self):
+        """Test that an alerted monster below the camera's view keeps following the player's trail."""
+        player = self.game.player
+        player.x = 100
+        for player.y in range(130, 99, -1):  # The player walks north up the corridor
+            self.level.update_scent(player.x, player.y)
+        self.game.camera.center_on(player.x, player.y, self.level.width, self.level.height)
+        x1, y1, x2, y2 = self.game.camera.get_bounds()
+
+        skeleton = Skeleton(100, y2)  # Just past the bottom edge of the view
+        skeleton.has_seen_player = True
+        self.level.add_monster(skeleton)
+        self.level.wake_monster(skeleton)
+        self.assertIsNone(self.game.camera.to_screen(skeleton.x, skeleton.y))
+
+        for turn in range(3):
+            self.game.process_monster_turns()
+        self.assertEqual((skeleton.x, skeleton.y), (100, y2 - 3))
+
+    def test_status_effects_tick_outside_active_region(self):
+        """Test that a monster beyond ACTIVE_RADIUS still takes poison damage, but does not move."""
+        player = self.game.player
+        player.x, player.y = 100, 50
+        skeleton = Skeleton(100, 50 + ACTIVE_RADIUS + 5)
+        skeleton.has_seen_player = True
+        self.level.add_monster(skeleton)
+        self.level.wake_monster(skeleton)
+        skeleton.status_effects.apply_status('poison', 3)
+        hp = skeleton.hp
+
+        for turn in range(2):
+            self.game.process_monster_turns()
+        self.assertLess(skeleton.hp, hp)
+        self.assertEqual(skeleton.status_effects.poison, 1)
+        self.assertEqual((skeleton.x, skeleton.y), (100, 50 + ACTIVE_RADIUS + 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
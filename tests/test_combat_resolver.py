@@ -0,0 +1,196 @@
+"""
+Unit tests for the side-effect-free combat resolver.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import subprocess
+import unittest
+import numpy as np
+from combat import CombatResolver, CombatantSnapshot, CombatantArrays
+from monsters import Skeleton
+from player import Player
+from traits import Trait, traits_to_mask
+
+
+class ScriptedRandom:
+    """Stand-in for the random module that returns scripted rolls in order."""
+
+    def __init__(self, *rolls):
+        self.rolls = list(rolls)
+
+    def random(self):
+        return self.rolls.pop(0)
+
+
+class ConstantGenerator:
+    """Stand-in for a numpy Generator whose every roll is the same value."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def random(self, shape, dtype=np.float64):
+        return np.full(shape, self.value, dtype=dtype)
+
+
+def make_snapshot(is_player, **stats):
+    """Build a snapshot with plain stats that tests override as needed."""
+    values = dict(attack=10, defense=2, evade=0.0, crit=0.0, crit_multiplier=2.0)
+    values.update(stats)
+    return CombatantSnapshot(is_player=is_player, **values)
+
+
+class TestCombatResolver(unittest.TestCase):
+    """Test resolving single attacks between snapshots."""
+
+    def setUp(self):
+        self.resolver = CombatResolver()
+
+    def test_player_miss(self):
+        """Test that a low first roll misses without touching the defender."""
+        outcome = self.resolver.resolve(make_snapshot(True), make_snapshot(False), ScriptedRandom(0.01))
+        self.assertTrue(outcome.missed)
+        self.assertFalse(outcome.landed)
+        self.assertEqual(outcome.damage, 0)
+
+    def test_player_critical_weakness_hit(self):
+        """Test crit, aspect and monster weakness multipliers, then defense."""
+        attacker = make_snapshot(True, crit=0.5, attack_traits=(Trait.HOLY,))
+        defender = make_snapshot(False, weakness_mask=traits_to_mask([Trait.HOLY]))
+        # Hit, not evaded, critical, HOLY status roll fails
+        outcome = self.resolver.resolve(attacker, defender, ScriptedRandom(0.9, 0.9, 0.1, 0.9))
+        self.assertTrue(outcome.critical)
+        self.assertEqual(outcome.trait_interaction, 'weakness')
+        # 10 * 2.0 crit * 1.5 aspect * 1.5 weakness - 2 defense
+        self.assertEqual(outcome.damage, 43)
+        self.assertEqual(outcome.statuses, ())
+
+    def test_blinded_player_cannot_crit(self):
+        """Test that a blinded player skips the crit roll."""
+        attacker = make_snapshot(True, crit=1.0, blinded=3)
+        outcome = self.resolver.resolve(attacker, make_snapshot(False), ScriptedRandom(0.9, 0.9))
+        self.assertFalse(outcome.critical)
+        self.assertEqual(outcome.damage, 8)
+
+    def test_shields_absorb(self):
+        """Test that shields absorb the hit and are spent."""
+        defender = make_snapshot(False, shields=1)
+        outcome = self.resolver.resolve(make_snapshot(True), defender, ScriptedRandom(0.9, 0.9, 0.9))
+        self.assertTrue(outcome.absorbed)
+        self.assertEqual(outcome.defender_spent, ('shields',))
+
+    def test_immobilized_player_cannot_dodge(self):
+        """Test that immobilized removes the player's second evade chance."""
+        defender = make_snapshot(True, evade=0.5, immobilized=2, off_guard=1)
+        outcome = self.resolver.resolve(make_snapshot(False), defender, ScriptedRandom(0.9, 0.9, 0.0))
+        self.assertTrue(outcome.landed)
+        self.assertEqual(outcome.defender_spent, ('off_guard', 'immobilized'))
+
+    def test_statuses_respect_resistance(self):
+        """Test that resisted traits inflict no status and certain ones need no roll."""
+        traits = (Trait.DARK, Trait.FIRE)
+        statuses = self.resolver.roll_statuses(traits, 0, ScriptedRandom(0.1))
+        self.assertEqual(statuses, (('frightened', 2), ('burn', 4)))
+        statuses = self.resolver.roll_statuses(traits, traits_to_mask([Trait.FIRE]), ScriptedRandom())
+        self.assertEqual(statuses, (('frightened', 2),))
+
+    def test_snapshots_do_not_change_entities(self):
+        """Test that snapshotting and resolving leave the player and monster untouched."""
+        player = Player(0, 0)
+        monster = Skeleton(1, 0)
+        player.status_effects.shields = 1
+        player_snapshot = CombatantSnapshot.from_player(player, monster)
+        monster_snapshot = CombatantSnapshot.from_monster(monster)
+        self.resolver.resolve(player_snapshot, monster_snapshot, ScriptedRandom(0.9, 0.9, 0.9))
+        self.resolver.resolve(monster_snapshot, player_snapshot, ScriptedRandom(0.9, 0.9))
+        self.assertEqual(player.status_effects.shields, 1)
+        self.assertEqual(player.hp, player.max_hp)
+        self.assertEqual(monster.hp, monster.max_hp)
+
+    def test_every_status_has_a_message(self):
+        """Test that the game can announce every status an attack inflicts."""
+        from game import STATUS_MESSAGES
+        for status, _, _ in CombatResolver.ELEMENTAL_STATUSES.values():
+            self.assertIn(status, STATUS_MESSAGES)
+
+
+class TestResolveBatch(unittest.TestCase):
+    """Test that batch resolution follows the same rules as single attacks."""
+
+    def setUp(self):
+        self.resolver = CombatResolver()
+        self.players = [
+            make_snapshot(True, attack=8, crit=0.6, attack_traits=(Trait.HOLY, Trait.FIRE)),
+            make_snapshot(True, attack=12, crit=0.6, blinded=2, frightened=1),
+            make_snapshot(True, attack=6, crit=0.2, evade=0.7, damage_multipliers=(1.5,)),
+        ]
+        self.monsters = [
+            make_snapshot(False, attack=5, crit=0.6, weakness_mask=traits_to_mask([Trait.HOLY])),
+            make_snapshot(False, attack=7, crit=0.6, attack_traits=(Trait.DARK,), shields=1,
+                          resistance_mask=traits_to_mask([Trait.FIRE])),
+            make_snapshot(False, attack=9, evade=0.7, attack_traits=(Trait.ICE, Trait.POISON),
+                          weakness_mask=traits_to_mask([Trait.ICE])),
+        ]
+
+    def assert_matches_scalar(self, attackers, defenders, roll):
+        """Assert each batch outcome equals the scalar outcome with every roll set to roll."""
+        batch = self.resolver.resolve_batch(CombatantArrays.from_snapshots(attackers),
+                                            CombatantArrays.from_snapshots(defenders),
+                                            ConstantGenerator(roll))
+        self.assertEqual(len(batch), len(attackers))
+        for index, (attacker, defender) in enumerate(zip(attackers, defenders)):
+            rng = ScriptedRandom(*[roll] * 8)
+            expected = self.resolver.resolve(attacker, defender, rng)
+            outcome = batch[index]
+            self.assertEqual(outcome.missed, expected.missed)
+            self.assertEqual(outcome.evaded, expected.evaded)
+            self.assertEqual(outcome.critical, expected.critical)
+            self.assertEqual(outcome.absorbed, expected.absorbed)
+            self.assertEqual(outcome.dodged, expected.dodged)
+            self.assertEqual(outcome.damage, expected.damage)
+            self.assertEqual(outcome.trait_interaction, expected.trait_interaction)
+            self.assertEqual(sorted(outcome.statuses), sorted(expected.statuses))
+            self.assertEqual(set(outcome.defender_spent), set(expected.defender_spent))
+
+    def test_player_attacks_match_scalar(self):
+        """Test player-to-monster batches against resolve."""
+        for roll in (0.0, 0.3, 0.55, 0.99):
+            self.assert_matches_scalar(self.players, self.monsters, roll)
+
+    def test_monster_attacks_match_scalar(self):
+        """Test monster-to-player batches against resolve."""
+        for roll in (0.0, 0.3, 0.55, 0.99):
+            self.assert_matches_scalar(self.monsters, self.players, roll)
+
+    def test_single_attacker_broadcasts(self):
+        """Test that a batch of one attacker is resolved against every defender."""
+        attackers = CombatantArrays.from_snapshots(self.players[:1])
+        defenders = CombatantArrays.from_snapshots(self.monsters)
+        batch = self.resolver.resolve_batch(attackers, defenders, np.random.default_rng(41))
+        self.assertEqual(len(batch), 3)
+
+    def test_mixed_snapshots_rejected(self):
+        """Test that a batch cannot mix players and monsters."""
+        with self.assertRaises(ValueError):
+            CombatantArrays.from_snapshots([self.players[0], self.monsters[0]])
+
+
+
+class TestTraitDamageImports(unittest.TestCase):
+    """Test that entities apply trait damage without the combat package."""
+
+    def test_entities_do_not_import_combat(self):
+        code = (
+            "import sys\n"
+            "import monsters, player\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] == 'combat'))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=os.path.join(os.path.dirname(__file__), '..', 'src'),
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Unit tests for the batch duel simulator.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from dataclasses import replace
+import numpy as np
+from combat import CombatantArrays, CombatantSnapshot, DuelSimulator, ExpectedDamage
+from monsters import Orc, Skeleton
+from player import Player
+from traits import Trait
+
+
+class TestDuelSimulator(unittest.TestCase):
+    """Test simulated duels against the expected damage model and the status rules."""
+
+    def setUp(self):
+        self.simulator = DuelSimulator()
+        self.build = replace(CombatantSnapshot.from_player(Player(0, 0)), attack=10, defense=3, hp=80)
+        self.rng = np.random.default_rng(44)
+
+    def test_results_cover_every_fight(self):
+        """Test that every fight ends with exactly one side at 0 HP."""
+        results = self.simulator.simulate(self.build, Orc(0, 0), 5000, self.rng)
+        self.assertEqual(len(results), 5000)
+        self.assertTrue(results.finished.all())
+        dead_monster = results.monster_hp == 0
+        self.assertTrue((results.player_won == dead_monster).all())
+        self.assertTrue((dead_monster != (results.player_hp == 0)).all())
+
+    def test_fight_length_matches_expected_damage(self):
+        """Test that the mean fight length agrees with the closed-form model."""
+        monster = Orc(0, 0)
+        results = self.simulator.simulate(self.build, monster, 100000, self.rng)
+        self.assertEqual(results.win_rate, 1.0)
+        expected = ExpectedDamage().swings_to_kill(
+            CombatantArrays.from_snapshots([self.build]),
+            CombatantArrays.from_snapshots([CombatantSnapshot.from_monster(monster)]))[0]
+        self.assertAlmostEqual(results.turns.mean(), expected, delta=expected * 0.02)
+
+    def test_poison_ticks_shorten_fights(self):
+        """Test that poison inflicted by the player's attacks damages the monster each turn."""
+        plain = self.simulator.simulate(self.build, Orc(0, 0), 20000, self.rng)
+        poisoner = replace(self.build, attack_traits=self.build.attack_traits + (Trait.POISON,))
+        poisoned = self.simulator.simulate(poisoner, Orc(0, 0), 20000, self.rng)
+        self.assertLess(poisoned.turns.mean(), plain.turns.mean())
+
+    def test_undecided_fights(self):
+        """Test that fights nobody can win stop at MAX_TURNS."""
+        self.simulator.MAX_TURNS = 20
+        monster = Skeleton(0, 0)
+        monster.evade = 1.0
+        results = self.simulator.simulate(replace(self.build, evade=1.0), monster, 100, self.rng)
+        self.assertFalse(results.finished.any())
+        self.assertTrue((results.turns == 20).all())
+        self.assertTrue((results.player_hp == self.build.hp).all())
+        self.assertTrue((results.hp_lost(self.build.hp) == 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from enchantments import (
+    EnchantmentType, ENCHANTMENT_BONUS_TABLE, get_enchantment_bonus_vector,
+    get_weapon_enchantment_by_type, get_armor_enchantment_by_type
+)
+from items.weapons.sword import Sword
+from items.weapons.clerics_staff import ClericsStaff
+from items.armor.leather_armor import LeatherArmor
+from player import Player
+
+
+class TestEnchantmentBonusTable(unittest.TestCase):
+    """Test the precomputed enchantment bonus table."""
+
+    def test_table_covers_every_type_and_target(self):
+        for enchantment_type in EnchantmentType:
+            for target_type in ("weapon", "armor"):
+                self.assertIn((enchantment_type, target_type), ENCHANTMENT_BONUS_TABLE)
+
+    def test_table_values(self):
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.QUALITY, "weapon").attack, 3)
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.QUALITY, "armor").defense, 3)
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.BALANCED, "armor").attack, 1)
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.GLOWING, "armor").fov, 3)
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.SHADOW, "armor").evade, 0.05)
+        self.assertEqual(get_enchantment_bonus_vector(EnchantmentType.RENDING, "weapon").crit, 0.05)
+
+    def test_weapon_caches_summed_vector(self):
+        sword = Sword(0, 0)
+        sword.add_enchantment(get_weapon_enchantment_by_type(EnchantmentType.QUALITY))
+        sword.add_enchantment(get_weapon_enchantment_by_type(EnchantmentType.GLOWING))
+        vector = sword.get_enchantment_vector()
+        self.assertEqual(vector.attack, 3)
+        self.assertEqual(vector.fov, 3)
+
+        player = Player(0, 0)
+        self.assertEqual(sword.get_attack_bonus(player), sword.attack_bonus + 3)
+        self.assertEqual(sword.get_fov_bonus(player), sword.fov_bonus + 3)
+
+    def test_reassigning_enchantments_resets_cache(self):
+        armor = LeatherArmor(0, 0)
+        armor.add_enchantment(get_armor_enchantment_by_type(EnchantmentType.QUALITY))
+        armor.enchantments = []
+        self.assertEqual(armor.get_defense_bonus(Player(0, 0)), armor.defense_bonus)
+
+    def test_override_is_still_honored(self):
+        staff = ClericsStaff(0, 0)
+        staff.add_enchantment(get_weapon_enchantment_by_type(EnchantmentType.HOLY))
+        self.assertEqual(staff.get_attack_bonus(Player(0, 0)), staff.attack_bonus + 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
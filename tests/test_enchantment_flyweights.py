@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import copy
+import pickle
+import unittest
+import sys
+import os
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from enchantments import (
+    Enchantment, EnchantmentType, get_weapon_enchantment_by_type,
+    get_armor_enchantment_by_type, get_random_weapon_enchantment,
+    get_enchantment_from_code
+)
+
+
+class TestEnchantmentFlyweights(unittest.TestCase):
+    """Test that enchantments are interned, immutable and serializable."""
+
+    def test_same_type_and_target_is_same_instance(self):
+        self.assertIs(Enchantment(EnchantmentType.FIRE, "weapon"),
+                      get_weapon_enchantment_by_type(EnchantmentType.FIRE))
+        self.assertIsNot(get_weapon_enchantment_by_type(EnchantmentType.FIRE),
+                         get_armor_enchantment_by_type(EnchantmentType.FIRE))
+
+    def test_random_enchantment_is_interned(self):
+        enchantment = get_random_weapon_enchantment()
+        self.assertIs(enchantment, Enchantment(enchantment.type, "weapon"))
+
+    def test_enchantments_are_immutable(self):
+        enchantment = get_armor_enchantment_by_type(EnchantmentType.ICE)
+        with self.assertRaises(AttributeError):
+            enchantment.name = "warm"
+        with self.assertRaises(TypeError):
+            enchantment.resistances.append(EnchantmentType.FIRE)
+
+    def test_code_round_trip(self):
+        codes = set()
+        for enchantment_type in EnchantmentType:
+            for target_type in ("weapon", "armor"):
+                enchantment = Enchantment(enchantment_type, target_type)
+                code = enchantment.to_code()
+                codes.add(code)
+                self.assertIs(get_enchantment_from_code(code), enchantment)
+        self.assertEqual(codes, set(range(len(EnchantmentType) * 2)))
+
+    def test_copy_and_pickle_preserve_identity(self):
+        enchantment = get_weapon_enchantment_by_type(EnchantmentType.QUALITY)
+        self.assertIs(copy.deepcopy(enchantment), enchantment)
+        self.assertIs(pickle.loads(pickle.dumps(enchantment)), enchantment)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Unit tests for previewing stats with hypothetical equipment.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import functools
+import random
+import unittest
+from unittest.mock import patch
+from equipment_preview import EquipmentPreview
+from items.accessories import Accessory, Anaglyph, GravePact, PowerRing, ProtectionRing, VampiresPendant
+from items.armor import ChainMail, GamblersVest, SOSArmor
+from items.consumables import HealthPotion
+from items.weapons import Katana, WarHammer, Weapon
+from player import Player
+from stat_modifiers import STAT_DEFINITIONS, StatDefinition, StatModifier, register_stat
+
+
+# StatTotals field -> the Player method it must agree with
+TOTALS = {
+    'attack': 'get_total_attack', 'defense': 'get_total_defense', 'fov': 'get_total_fov',
+    'health_aspect': 'get_total_health_aspect', 'attack_multiplier': 'get_total_attack_multiplier',
+    'defense_multiplier': 'get_total_defense_multiplier', 'xp_multiplier': 'get_total_xp_multiplier',
+    'evade': 'get_total_evade', 'crit': 'get_total_crit', 'crit_multiplier': 'get_total_crit_multiplier',
+    'attack_traits': 'get_total_attack_traits', 'weaknesses': 'get_total_weaknesses',
+    'resistances': 'get_total_resistances', 'attack_trait_mask': 'get_total_attack_trait_mask',
+    'weakness_mask': 'get_total_weakness_mask', 'resistance_mask': 'get_total_resistance_mask',
+}
+
+
+class FocusCharm(Accessory):
+    """An accessory that only lists StatModifiers: flat attack, more while hurt, and a stat Player lacks."""
+
+    def __init__(self):
+        super().__init__(0, 0, "Focus Charm", '=')
+
+    def get_stat_modifiers(self):
+        return [
+            StatModifier.flat('attack', 5),
+            StatModifier.multiplier('attack_multiplier', 2).when(lambda player: player.hp < 10),
+            StatModifier.flat('focus', 4),
+        ]
+
+
+class TestEquipmentPreview(unittest.TestCase):
+    """Test previews against really equipping items."""
+
+    def setUp(self):
+        self.player = Player(0, 0)
+        self.player.accessories[0] = GravePact(0, 0)
+        self.player.accessories[1] = Anaglyph(0, 0)
+
+    def assert_matches_player(self, totals):
+        """Check every previewed stat against the player's own get_total_* methods."""
+        for field, method in TOTALS.items():
+            expected = getattr(self.player, method)()
+            self.assertEqual(getattr(totals, field), tuple(expected) if isinstance(expected, list) else expected,
+                             field)
+
+    def test_current_matches_player(self):
+        """Test the preview of the equipment being worn."""
+        self.assert_matches_player(EquipmentPreview(self.player).current())
+
+    def test_swaps_match_equipping(self):
+        """Test swaps, including conditional bonuses that depend on the rest of the loadout."""
+        self.player.hp = 5  # SOSArmor's low HP bonus
+        for item in (WarHammer(0, 0), Katana(0, 0), ChainMail(0, 0), SOSArmor(0, 0), VampiresPendant(0, 0)):
+            with self.subTest(item=item.name):
+                totals = EquipmentPreview(self.player).with_item(item)
+                weapon, armor, accessories = self.player.weapon, self.player.armor, list(self.player.accessories)
+                if item.equipment_slot == 'weapon':
+                    self.player.weapon = item
+                elif item.equipment_slot == 'armor':
+                    self.player.armor = item
+                else:
+                    self.player.accessories[2] = item
+                self.assert_matches_player(totals)
+                self.player.weapon, self.player.armor, self.player.accessories = weapon, armor, accessories
+
+    def test_player_untouched(self):
+        """Test that previews leave the player's equipment and the random state alone."""
+        weapon, armor, accessories = self.player.weapon, self.player.armor, list(self.player.accessories)
+        state = random.getstate()
+        preview = EquipmentPreview(self.player)
+        for item in (WarHammer(0, 0), GamblersVest(0, 0), PowerRing(0, 0)):
+            preview.with_item(item)
+        self.assertEqual(random.getstate(), state)
+        self.assertIs(self.player.weapon, weapon)
+        self.assertIs(self.player.armor, armor)
+        self.assertEqual(self.player.accessories, accessories)
+
+    def test_full_accessory_slots(self):
+        """Test that accessories need a slot once all slots are full."""
+        self.player.accessories[2] = PowerRing(0, 0)
+        preview = EquipmentPreview(self.player)
+        self.assertIsNone(preview.with_item(ProtectionRing(0, 0)))
+        self.assertEqual(preview.describe_change(ProtectionRing(0, 0)), "")
+        self.assertIsNotNone(preview.with_item(ProtectionRing(0, 0), slot=2))
+        self.assertIsNone(preview.with_item(HealthPotion(0, 0)))
+
+    def test_describe_change(self):
+        """Test the "+3 ATK / -1 DEF" summary."""
+        self.player.accessories = [None, None, None]
+        preview = EquipmentPreview(self.player)
+        self.assertEqual(preview.describe_change(PowerRing(0, 0)), "+3 ATK")
+        self.assertEqual(preview.with_item(PowerRing(0, 0)).difference(preview.current()), {'attack': 3})
+
+    def test_items_listing_stat_modifiers(self):
+        """Test that items' own StatModifiers, conditions and new stats preview as equipping them does."""
+        register_stat(StatDefinition('focus', lambda player: 1))
+        self.addCleanup(STAT_DEFINITIONS.pop, 'focus')
+        self.player.accessories = [None, None, None]
+        for hp in (self.player.max_hp, 5):
+            with self.subTest(hp=hp):
+                self.player.hp = hp
+                totals = EquipmentPreview(self.player).with_item(FocusCharm())
+                self.player.accessories[0] = FocusCharm()
+                self.assert_matches_player(totals)
+                self.assertEqual(totals.stats['focus'], self.player.get_total('focus'))
+                self.player.accessories[0] = None
+        self.assertEqual(totals.stats['focus'], 5)
+
+    def test_plain_getters_evaluated_once(self):
+        """Test that getters ignoring the player run once per preview, and player-dependent ones per comparison."""
+        calls = []
+
+        def counting(getter):
+            @functools.wraps(getter)
+            def counted(item, player):
+                calls.append((getter.__qualname__, item))
+                return getter(item, player)
+            return counted
+
+        inventory = [WarHammer(0, 0), Katana(0, 0), ChainMail(0, 0), SOSArmor(0, 0), PowerRing(0, 0)]
+        self.player.accessories[2] = None
+        with patch.object(Weapon, 'get_attack_bonus', counting(Weapon.get_attack_bonus)), \
+                patch.object(SOSArmor, 'get_defense_bonus', counting(SOSArmor.get_defense_bonus)):
+            preview = EquipmentPreview(self.player)
+            for _ in range(3):
+                for item in inventory:
+                    preview.describe_change(item)
+        weapons = [item for name, item in calls if name == 'Weapon.get_attack_bonus']
+        self.assertCountEqual(weapons, [self.player.weapon, inventory[0], inventory[1]])
+        self.assertEqual([item for name, item in calls if name == 'SOSArmor.get_defense_bonus'], [inventory[3]] * 3)
+
+if __name__ == '__main__':
+    unittest.main()
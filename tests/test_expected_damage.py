@@ -0,0 +1,89 @@
+"""
+Unit tests for the closed-form expected damage model.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+import numpy as np
+from combat import CombatResolver, CombatantSnapshot, CombatantArrays, ExpectedDamage
+from monsters import Orc, Skeleton
+from player import Player
+
+
+class TestExpectedDamage(unittest.TestCase):
+    """Test expected damage against exact cases and simulated fights."""
+
+    def setUp(self):
+        self.model = ExpectedDamage()
+        self.player = CombatantSnapshot.from_player(Player(0, 0))
+        self.orc = CombatantSnapshot.from_monster(Orc(0, 0))
+
+    def test_hits_to_kill_without_crits(self):
+        """Test that with no crits the hits needed is hp / damage rounded up."""
+        hits = self.model.hits_to_kill(np.array([10, 11, 0]), np.array([5, 5, 5]), 10, 0.0)
+        np.testing.assert_allclose(hits, [2, 3, 0])
+
+    def test_hits_to_kill_with_crits(self):
+        """Test a case small enough to work out by hand."""
+        # 2 HP: a crit (2) kills in one hit, a normal hit (1) needs another
+        hits = self.model.hits_to_kill(np.array([2]), 1, 2, 0.25)
+        np.testing.assert_allclose(hits, [0.25 * 1 + 0.75 * 2])
+
+    def test_per_swing_matches_simulation(self):
+        """Test expected damage per swing in both directions against resolve_batch."""
+        resolver = CombatResolver()
+        rng = np.random.default_rng(42)
+        count = 200000
+        player = CombatantArrays.from_snapshots([self.player])
+        orc = CombatantArrays.from_snapshots([self.orc])
+        for attacker, defender in ((player, orc), (orc, player)):
+            simulated = resolver.resolve_batch(attacker, defender.take(np.zeros(count, dtype=int)), rng)
+            expected = self.model.per_swing(attacker, defender)[0]
+            self.assertAlmostEqual(simulated.damage.mean(), expected, delta=expected * 0.02)
+
+    def test_swings_to_kill_matches_simulation(self):
+        """Test expected fight length against simulated fights, shields included."""
+        resolver = CombatResolver()
+        rng = np.random.default_rng(7)
+        orc = CombatantArrays.from_snapshots([self.orc])
+        player = CombatantArrays.from_snapshots([self.player])
+        player.shields[:] = 2
+        fights = 20000
+        hp = np.full(fights, self.player.hp)
+        shields = np.full(fights, 2)
+        swings = np.zeros(fights)
+        while (hp > 0).any():
+            alive = hp > 0
+            defenders = player.take(np.zeros(alive.sum(), dtype=int))
+            defenders.shields = shields[alive]
+            outcome = resolver.resolve_batch(orc, defenders, rng)
+            hp[alive] -= outcome.damage
+            shields[alive] -= outcome.absorbed
+            swings[alive] += 1
+        expected = self.model.swings_to_kill(orc, player)[0]
+        self.assertAlmostEqual(swings.mean(), expected, delta=expected * 0.02)
+
+    def test_unhittable_defender(self):
+        """Test that a defender who always evades takes no damage and never dies."""
+        player = CombatantArrays.from_snapshots([self.player])
+        ghost = CombatantArrays.from_snapshots([CombatantSnapshot.from_monster(Skeleton(0, 0))])
+        ghost.evade[:] = 1.0
+        self.assertEqual(self.model.per_swing(player, ghost)[0], 0.0)
+        self.assertEqual(self.model.swings_to_kill(player, ghost)[0], np.inf)
+
+    def test_matchups_grid(self):
+        """Test that every build is paired with every monster."""
+        builds = self.model.build_grid(self.player, attack=[3, 6, 9], defense=[0, 4])
+        table = self.model.matchups(builds, [Orc(0, 0), Skeleton(0, 0)])
+        self.assertEqual(table.turns_to_kill.shape, (6, 2))
+        self.assertEqual(table.monster_names, ['Orc', 'Skeleton'])
+        # More attack never makes a fight longer; more defense never makes taken damage larger
+        self.assertTrue((np.diff(table.turns_to_kill[::2], axis=0) <= 0).all())
+        self.assertTrue((table.damage_taken_per_turn[1::2] <= table.damage_taken_per_turn[::2]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
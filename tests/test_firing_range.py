@@ -0,0 +1,76 @@
+"""
+Unit tests for ranged monsters and the per-turn firing range.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from game import Game
+from level.firing_range import FiringRange
+from monsters import Skeleton
+from monsters.naga import Naga
+
+
+class TestFiringRange(unittest.TestCase):
+    """Test the cached firing range against per-monster checks."""
+
+    def test_matches_fov_and_distance(self):
+        """Test every cell, including windows clipped at the map edge."""
+        rng = np.random.default_rng(7)
+        fov = rng.random((20, 12)) < 0.6
+        firing_range = FiringRange()
+        for player_x, player_y in ((10, 6), (0, 0), (19, 11), (2, 10)):
+            for attack_range in (2, 3, 5):
+                for x in range(20):
+                    for y in range(12):
+                        expected = bool(fov[x, y]) and (x - player_x) ** 2 + (y - player_y) ** 2 <= attack_range ** 2
+                        self.assertEqual(firing_range.covers(fov, player_x, player_y, attack_range, x, y), expected,
+                                         (player_x, player_y, attack_range, x, y))
+
+    def test_cached_until_cleared(self):
+        """Test that the mask is reused until the FOV changes."""
+        fov = np.ones((10, 10), dtype=bool)
+        firing_range = FiringRange()
+        self.assertTrue(firing_range.covers(fov, 5, 5, 3, 5, 3))
+        fov[5, 3] = False
+        self.assertTrue(firing_range.covers(fov, 5, 5, 3, 5, 3))
+        firing_range.clear()
+        self.assertFalse(firing_range.covers(fov, 5, 5, 3, 5, 3))
+
+
+class TestRangedMonsters(unittest.TestCase):
+    """Test ranged monsters taking their turns."""
+
+    def setUp(self):
+        self.game = Game()
+        self.level = self.game.level
+        self.player = self.game.player
+        self.level.fov[:, :] = False
+        self.level.fov[self.player.x - 3:self.player.x + 4, self.player.y - 3:self.player.y + 4] = True
+        self.level.firing_range.clear()
+
+    def test_ranged_monster_attacks_from_range(self):
+        """Test that a ranged monster in view and in range attacks without moving."""
+        naga = Naga(self.player.x + 3, self.player.y)
+        with patch.object(self.game, 'monster_attack_player') as attack:
+            self.game.monster_take_turn(naga)
+        attack.assert_called_once_with(naga)
+        self.assertEqual((naga.x, naga.y), (self.player.x + 3, self.player.y))
+        self.assertTrue(naga.has_seen_player)
+
+    def test_out_of_view_or_range(self):
+        """Test that ranged monsters out of view or range do not attack, and melee monsters never shoot."""
+        for monster in (Naga(self.player.x + 4, self.player.y), Skeleton(self.player.x + 2, self.player.y)):
+            with self.subTest(monster=monster.name), patch.object(self.game, 'monster_attack_player') as attack:
+                self.game.monster_take_turn(monster)
+                attack.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
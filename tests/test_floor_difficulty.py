@@ -0,0 +1,62 @@
+"""
+Unit tests for the per-floor difficulty estimator.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+from dataclasses import replace
+import numpy as np
+from combat import CombatantSnapshot, FloorDifficulty
+from constants import MAX_LEVELS, MONSTER_COUNT_RANGES
+from level.level import Level
+from player import Player
+
+
+class TestFloorDifficulty(unittest.TestCase):
+    """Test floor estimates for reference builds; a regression gate for MonsterPool changes."""
+
+    def setUp(self):
+        self.estimator = FloorDifficulty()
+        self.new_player = CombatantSnapshot.from_player(Player(0, 0))
+        self.veteran = replace(self.new_player, hp=150, attack=20, defense=8)
+
+    def test_every_floor_estimated(self):
+        """Test that all floors are estimated with sensible values."""
+        estimate = self.estimator.estimate(self.new_player)
+        self.assertEqual(list(estimate.floors), list(range(1, MAX_LEVELS + 1)))
+        self.assertTrue((estimate.hp_loss > 0).all())
+        self.assertTrue((estimate.xp > 0).all())
+        self.assertTrue(((estimate.death_chance >= 0) & (estimate.death_chance <= 1)).all())
+
+    def test_first_floor_is_survivable(self):
+        """Test that a new player is not expected to die on floor 1."""
+        estimate = self.estimator.estimate(self.new_player, floors=[1])
+        self.assertLess(estimate.death_chance[0], 0.01)
+        self.assertLess(estimate.hp_loss[0], self.new_player.hp / 2)
+
+    def test_floors_get_harder(self):
+        """Test that HP loss grows from floor to floor up to the swarm floor."""
+        estimate = self.estimator.estimate(self.veteran, floors=range(1, 10))
+        self.assertTrue((np.diff(estimate.hp_loss) > 0).all())
+
+    def test_defense_lowers_hp_loss(self):
+        """Test that a sturdier build never loses more HP (damage is at least 1 per hit)."""
+        weak = self.estimator.estimate(self.veteran)
+        sturdy = self.estimator.estimate(replace(self.veteran, defense=12))
+        self.assertTrue((sturdy.hp_loss <= weak.hp_loss).all())
+        self.assertLess(sturdy.hp_loss.sum(), weak.hp_loss.sum())
+
+    def test_count_ranges_match_levels(self):
+        """Test that generated floors place monsters within MONSTER_COUNT_RANGES."""
+        random.seed(43)
+        for floor in (1, 5, 9):
+            fewest, most = MONSTER_COUNT_RANGES[floor]
+            self.assertTrue(fewest <= len(Level(floor).monsters) <= most)
+
+
+if __name__ == '__main__':
+    unittest.main()
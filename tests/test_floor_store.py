@@ -0,0 +1,114 @@
+"""
+Unit tests for the floor store and revisiting floors.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import tempfile
+import unittest
+from floor_store import FloorStore
+from level_manager import LevelManager
+from level.level import Level
+from level.base import Base
+from player import Player
+
+
+class TestFloorStore(unittest.TestCase):
+    """Test keeping areas in memory and spilling them to disk."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(1234)
+        self.level = Level(3)
+        self.level.update_fov(*self.level.rooms[0].center(), 8)
+
+    def assert_same_area(self, restored, original):
+        """Assert that a restored level matches the original exactly."""
+        self.assertTrue((restored.tiles == original.tiles).all())
+        self.assertTrue((restored.explored == original.explored).all())
+        self.assertEqual(restored.stairs_down_pos, original.stairs_down_pos)
+        self.assertEqual([(type(m).__name__, m.x, m.y, m.hp) for m in restored.monsters],
+                         [(type(m).__name__, m.x, m.y, m.hp) for m in original.monsters])
+        self.assertEqual([(type(i).__name__, i.x, i.y) for i in restored.items],
+                         [(type(i).__name__, i.x, i.y) for i in original.items])
+
+    def test_take_from_memory_returns_same_object(self):
+        """Test that an area still in memory is handed back as-is."""
+        store = FloorStore()
+        store.put(FloorStore.floor_key(3), self.level)
+        self.assertIs(store.take(FloorStore.floor_key(3)), self.level)
+        self.assertNotIn(FloorStore.floor_key(3), store)
+        self.assertEqual(store.memory_bytes, 0)
+
+    def test_over_budget_spills_oldest_to_disk(self):
+        """Test that going over the memory budget spills the least recent area."""
+        with tempfile.TemporaryDirectory() as spill_dir:
+            store = FloorStore(memory_budget=1, spill_dir=spill_dir)
+            store.put(FloorStore.floor_key(3), self.level)
+            store.put(FloorStore.base_key(3), Base(3))
+
+            self.assertTrue(store.is_on_disk(FloorStore.floor_key(3)))
+            self.assertFalse(store.is_on_disk(FloorStore.base_key(3)))
+            self.assertEqual(len(os.listdir(spill_dir)), 1)
+
+            restored = store.take(FloorStore.floor_key(3))
+            self.assert_same_area(restored, self.level)
+            self.assertEqual(len(os.listdir(spill_dir)), 0)
+            self.assertEqual(store.get_stats()['restores'], 1)
+
+    def test_restored_level_is_playable(self):
+        """Test that a restored level rebuilds its FOV state."""
+        store = FloorStore(memory_budget=1)
+        store.put(FloorStore.floor_key(3), self.level)
+        store.put(FloorStore.floor_key(4), Level(4))
+        restored = store.take(FloorStore.floor_key(3))
+
+        x, y = self.level.rooms[0].center()
+        restored.update_fov(x, y, 8)
+        self.assertTrue(restored.fov[x, y])
+        self.assertTrue(((restored.tiles != 0).T == restored.fov_map.transparent).all())
+
+
+class TestRevisitingFloors(unittest.TestCase):
+    """Test going back up through LevelManager."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.level_manager = LevelManager()
+        self.player = Player(5, 5)
+
+    def test_nothing_above_first_floor(self):
+        """Test that going up from Floor 1 fails."""
+        self.assertFalse(self.level_manager.transition_up(self.player))
+        self.assertEqual(self.level_manager.get_display_name(), "Floor 1")
+
+    def test_ascend_restores_previous_areas(self):
+        """Test that going up returns the exact floor and base left behind."""
+        floor_1 = self.level_manager.get_current_area()
+        self.level_manager.transition_down(self.player)
+        base_1 = self.level_manager.get_current_area()
+        self.level_manager.transition_down(self.player)
+        floor_2 = self.level_manager.get_current_area()
+
+        self.level_manager.transition_up(self.player)
+        self.assertIs(self.level_manager.get_current_area(), base_1)
+        self.assertEqual(self.level_manager.get_display_name(), "Base 1")
+        self.assertEqual((self.player.x, self.player.y), base_1.get_stairs_down_position())
+
+        self.level_manager.transition_up(self.player)
+        self.assertIs(self.level_manager.get_current_area(), floor_1)
+        self.assertEqual(self.level_manager.get_display_name(), "Floor 1")
+
+        # Going back down restores rather than regenerates
+        self.level_manager.transition_down(self.player)
+        self.assertIs(self.level_manager.get_current_area(), base_1)
+        self.level_manager.transition_down(self.player)
+        self.assertIs(self.level_manager.get_current_area(), floor_2)
+        self.assertEqual(self.level_manager.get_current_floor_number(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit tests for the FOV result cache.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+import numpy as np
+from level.level import Level
+from level.base import Base
+from level.fov_cache import FovCache, fov_window
+from constants import MAP_WIDTH, MAP_HEIGHT
+
+
+class TestFovCache(unittest.TestCase):
+    """Test LRU caching of FOV bitmaps."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(1234)
+        self.level = Level(1)
+
+    def test_cached_fov_matches_computed(self):
+        """Test that a cache hit returns the same bitmap as a fresh computation."""
+        x, y = self.level.rooms[0].center()
+        self.level.update_fov(x, y, 8)
+        computed = self.level.fov.copy()
+        self.level.update_fov(x, y, 8)
+
+        self.assertTrue((self.level.fov == computed).all())
+        x1, y1, x2, y2 = fov_window(x, y, 8, self.level.width, self.level.height)
+        self.assertTrue((self.level.fov[x1:x2, y1:y2] == self.level._compute_fov(x, y, 8)).all())
+        self.assertEqual(self.level.get_fov_cache_stats()['hits'], 1)
+        self.assertEqual(self.level.get_fov_cache_stats()['misses'], 1)
+
+    def test_radius_is_part_of_key(self):
+        """Test that the same position with a different radius is a separate entry."""
+        x, y = self.level.rooms[0].center()
+        self.level.update_fov(x, y, 8)
+        self.level.update_fov(x, y, 2)
+        self.assertEqual(self.level.fov_cache.misses, 2)
+        self.assertEqual(len(self.level.fov_cache), 2)
+
+    def test_terrain_update_invalidates(self):
+        """Test that refreshing the FOV map from the tiles drops cached results."""
+        x, y = self.level.rooms[0].center()
+        self.level.update_fov(x, y, 8)
+        self.level.update_fov_map()
+        self.assertEqual(len(self.level.fov_cache), 0)
+
+    def test_least_recently_used_is_evicted(self):
+        """Test that the cache stays within capacity by evicting the oldest entry."""
+        cache = FovCache(capacity=2)
+        compute = lambda x, y, radius: np.zeros((MAP_WIDTH, MAP_HEIGHT), dtype=bool)
+        cache.get_or_compute(1, 1, 8, compute)
+        cache.get_or_compute(2, 2, 8, compute)
+        cache.get_or_compute(1, 1, 8, compute)
+        cache.get_or_compute(3, 3, 8, compute)
+
+        self.assertEqual(len(cache), 2)
+        cache.get_or_compute(1, 1, 8, compute)
+        self.assertEqual(cache.hits, 2)
+        cache.get_or_compute(2, 2, 8, compute)
+        self.assertEqual(cache.misses, 4)
+
+    def test_base_fov_is_cached(self):
+        """Test that repeated FOV updates in the base are served from the cache."""
+        base = Base(1)
+        x, y = base.stairs_down_pos
+        for _ in range(3):
+            base.update_fov(x, y, 8)
+        self.assertEqual(base.get_fov_cache_stats()['hits'], 2)
+        self.assertTrue(base.fov[x, y])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import unittest
+import subprocess
+import sys
+import os
+
+# Add the src directory to the path so we can import our modules
+SRC_PATH = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_PATH)
+
+from items.manifest import ITEM_MANIFEST
+from items.registry import build_item_manifest, load_item_class, get_item_class_names
+from items.pool import ItemPool, ItemSpec
+from items.weapons.dagger import Dagger
+
+
+class TestItemManifest(unittest.TestCase):
+    """Test the generated item manifest and lazy item class loading."""
+
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(build_item_manifest(), ITEM_MANIFEST,
+                         "Item manifest is stale, run generate_item_manifest.py")
+
+    def test_every_spec_is_in_manifest(self):
+        pool = ItemPool()
+        for specs in [pool.weapon_specs, pool.armor_specs, pool.accessory_specs,
+                      pool.consumable_specs, pool.pickup_specs]:
+            for spec in specs:
+                self.assertEqual(ITEM_MANIFEST[spec.class_name][1], spec.item_type)
+
+    def test_load_item_class(self):
+        self.assertIs(load_item_class('Dagger'), Dagger)
+        self.assertIn('Dagger', get_item_class_names('weapon'))
+        self.assertNotIn('Weapon', get_item_class_names('weapon'))
+
+    def test_spec_resolves_class_name(self):
+        spec = ItemSpec('Dagger', 'weapon', 1, 4, 1.0, unique_per_floor=True, unique_per_game=False)
+        self.assertEqual(spec.class_name, 'Dagger')
+        self.assertIs(spec.item_class, Dagger)
+
+    def test_pool_import_does_not_import_item_modules(self):
+        code = (
+            "import sys\n"
+            "from items.pool import item_pool\n"
+            "item_pool.calculate_spawn_weight(item_pool.weapon_specs[0], 1)\n"
+            "print(sorted(m for m in sys.modules if m.startswith('items.weapons.')))\n"
+            "from items.weapons import Dagger\n"
+            "print(sorted(m for m in sys.modules if m.startswith('items.weapons.')))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], cwd=SRC_PATH,
+                                capture_output=True, text=True, check=True)
+        before, after = result.stdout.splitlines()
+        self.assertEqual(before, "[]")
+        self.assertEqual(after, "['items.weapons.base', 'items.weapons.dagger']")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 Comprehensive tests for the item pool system.
 """
 
+import random
 import unittest
 from collections import defaultdict
 from src.items.pool import ItemPool, ItemSpec, RARITY_COMMON, RARITY_UNCOMMON, RARITY_RARE
@@ -21,6 +22,8 @@ class TestItemPoolSystem(unittest.TestCase):
     
     def setUp(self):
         """Set up test cases."""
+        # Statistical tests below should not depend on RNG state left by other tests
+        random.seed(0)
         self.pool = ItemPool()
     
     def test_item_spec_creation(self):
@@ -0,0 +1,76 @@
+"""
+Unit tests for Level generation.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+from level.level import Level
+from constants import TILE_WALL, TILE_FLOOR
+
+
+class TestLevelGeneration(unittest.TestCase):
+    """Test room carving and room placement in Level generation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        random.seed(1234)
+        self.levels = [Level(level_number) for level_number in range(1, 11)]
+
+    def test_rooms_do_not_intersect(self):
+        """Test that no two accepted rooms intersect."""
+        for level in self.levels:
+            for i, room in enumerate(level.rooms):
+                for other in level.rooms[i + 1:]:
+                    self.assertFalse(room.intersect(other))
+
+    def test_room_interiors_are_carved(self):
+        """Test that every room interior is walkable."""
+        for level in self.levels:
+            for room in level.rooms:
+                interior = level.tiles[room.x1 + 1:room.x2, room.y1 + 1:room.y2]
+                self.assertFalse((interior == TILE_WALL).any())
+
+    def test_rooms_are_connected_by_tunnels(self):
+        """Test that consecutive room centers are joined by walkable tiles."""
+        for level in self.levels:
+            for previous, room in zip(level.rooms, level.rooms[1:]):
+                (x1, y1), (x2, y2) = previous.center(), room.center()
+                horizontal_first = (level.tiles[min(x1, x2):max(x1, x2) + 1, y1] != TILE_WALL).all() and \
+                    (level.tiles[x2, min(y1, y2):max(y1, y2) + 1] != TILE_WALL).all()
+                vertical_first = (level.tiles[x1, min(y1, y2):max(y1, y2) + 1] != TILE_WALL).all() and \
+                    (level.tiles[min(x1, x2):max(x1, x2) + 1, y2] != TILE_WALL).all()
+                self.assertTrue(horizontal_first or vertical_first)
+
+    def test_placement_uses_distinct_free_room_cells(self):
+        """Test that monsters and items land on distinct room floor cells, never stairs."""
+        for level in self.levels:
+            positions = [(entity.x, entity.y) for entity in level.monsters + level.items]
+            self.assertEqual(len(positions), len(set(positions)))
+            for x, y in positions:
+                self.assertEqual(level.tiles[x, y], TILE_FLOOR)
+                self.assertTrue(any(room.x1 < x < room.x2 and room.y1 < y < room.y2
+                                    for room in level.rooms))
+
+    def test_free_cells_are_taken_without_replacement(self):
+        """Test that the free-cell index hands out every remaining cell exactly once."""
+        level = self.levels[0]
+        remaining = len(level._free_cells)
+        taken = set()
+        for _ in range(remaining):
+            taken.add(level._take_free_cell())
+        self.assertEqual(len(taken), remaining)
+        self.assertIsNone(level._take_free_cell())
+
+    def test_fov_map_matches_tiles(self):
+        """Test that the FOV map treats exactly the non-wall tiles as transparent."""
+        for level in self.levels:
+            self.assertTrue(((level.tiles != TILE_WALL).T == level.fov_map.transparent).all())
+            self.assertTrue(((level.tiles != TILE_WALL).T == level.fov_map.walkable).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
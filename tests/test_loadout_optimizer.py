@@ -0,0 +1,110 @@
+"""
+Unit tests for the equipment loadout optimizer.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import itertools
+import unittest
+from combat import CombatantArrays, CombatantSnapshot, ExpectedDamage, LoadoutOptimizer
+from combat.loadout_optimizer import TRAINING_DUMMY
+from items.accessories import Accessory, Anaglyph, GravePact, PowerRing, ProtectionRing, VampiresPendant
+from items.armor import ChainMail, LeatherArmor
+from items.consumables import HealthPotion
+from items.weapons import Dagger, Katana, WarHammer
+from player import Player
+from shop import Shop
+from stat_modifiers import StatModifier
+
+
+class WhetstoneCharm(Accessory):
+    """An accessory that only lists StatModifiers, with no bonus attributes to read."""
+
+    def __init__(self):
+        super().__init__(0, 0, "Whetstone Charm", '=')
+
+    def get_stat_modifiers(self):
+        return [StatModifier.flat('attack', 30), StatModifier.multiplier('defense_multiplier', 0.5)]
+
+
+class TestLoadoutOptimizer(unittest.TestCase):
+    """Test the optimizer against an exhaustive search and the player's own stat rules."""
+
+    def setUp(self):
+        self.optimizer = LoadoutOptimizer()
+        self.player = Player(0, 0)
+        self.player.inventory = [WarHammer(0, 0), Katana(0, 0), ChainMail(0, 0), LeatherArmor(0, 0),
+                                 Anaglyph(0, 0), GravePact(0, 0), VampiresPendant(0, 0), PowerRing(0, 0),
+                                 ProtectionRing(0, 0), HealthPotion(0, 0)]
+
+    def brute_force(self, damage_weight, hp_weight):
+        """Get the best score over every loadout, equipping each one for real."""
+        weapons, armors, accessories = self.optimizer.candidates(self.player)
+        foe = CombatantArrays.from_snapshots([TRAINING_DUMMY])
+        model = ExpectedDamage()
+        best = None
+        for weapon, armor in itertools.product(weapons, armors):
+            for size in range(self.player.accessory_slots + 1):
+                for chosen in itertools.combinations(accessories, size):
+                    self.player.weapon, self.player.armor = weapon, armor
+                    self.player.accessories = list(chosen) + [None] * (self.player.accessory_slots - size)
+                    build = CombatantArrays.from_snapshots([CombatantSnapshot.from_player(self.player)])
+                    score = damage_weight * model.per_swing(build, foe)[0]
+                    if hp_weight:
+                        taken = model.per_swing(foe, build)[0]
+                        score += hp_weight * build.hp[0] * foe.attack[0] / taken
+                    best = score if best is None else max(best, score)
+        return best
+
+    def test_candidates(self):
+        """Test that equipped, carried and shop equipment is grouped by slot, skipping consumables."""
+        shop = Shop(1)
+        shop.inventory = [None, HealthPotion(0, 0), Dagger(0, 0)]
+        weapons, armors, accessories = self.optimizer.candidates(self.player, shop)
+        self.assertEqual([type(item) for item in weapons], [type(self.player.weapon), WarHammer, Katana, Dagger])
+        self.assertEqual(len(armors), 3)
+        self.assertEqual(len(accessories), 5)
+
+    def test_matches_exhaustive_search(self):
+        """Test that the best loadout scores the same as trying every combination."""
+        for damage_weight, hp_weight in ((1.0, 0.0), (0.0, 1.0), (1.0, 0.5)):
+            with self.subTest(damage_weight=damage_weight, hp_weight=hp_weight):
+                loadout = self.optimizer.optimize(self.player, damage_weight=damage_weight, hp_weight=hp_weight)
+                self.assertAlmostEqual(loadout.score, self.brute_force(damage_weight, hp_weight))
+
+    def test_grave_pact_with_trait_accessory(self):
+        """Test that GravePact is counted with the DARK trait another accessory grants."""
+        loadout = self.optimizer.optimize(self.player)
+        names = {type(accessory) for accessory in loadout.accessories}
+        self.assertEqual(type(loadout.weapon), WarHammer)
+        self.assertTrue({GravePact, VampiresPendant} <= names)
+
+    def test_anaglyph_balances_defensive_build(self):
+        """Test that Anaglyph is worn when defense is worth more as attack."""
+        self.player.attack, self.player.defense = 1, 40
+        loadout = self.optimizer.optimize(self.player)
+        self.assertIn(Anaglyph, {type(accessory) for accessory in loadout.accessories})
+
+    def test_items_listing_stat_modifiers(self):
+        """Test that items are weighed by their StatModifiers, matching the exhaustive search."""
+        self.player.inventory.append(WhetstoneCharm())
+        loadout = self.optimizer.optimize(self.player)
+        self.assertIn(WhetstoneCharm, {type(accessory) for accessory in loadout.accessories})
+        self.assertAlmostEqual(loadout.score, self.brute_force(1.0, 0.0))
+        loadout = self.optimizer.optimize(self.player, damage_weight=0.0, hp_weight=1.0)
+        self.assertAlmostEqual(loadout.score, self.brute_force(0.0, 1.0))
+
+    def test_equipment_restored(self):
+        """Test that searching leaves the player's equipment as it was."""
+        weapon, armor, accessories = self.player.weapon, self.player.armor, self.player.accessories
+        self.optimizer.optimize(self.player, hp_weight=1.0)
+        self.assertIs(self.player.weapon, weapon)
+        self.assertIs(self.player.armor, armor)
+        self.assertIs(self.player.accessories, accessories)
+        self.assertEqual(accessories, [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Unit tests for monster prototypes compiled from the monster table.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pickle
+import unittest
+from monsters import Devil, Goblin, Monster, MonsterPrototype, MONSTER_PROTOTYPES
+from monsters.pool import MONSTER_CLASSES, get_monster_pool
+from monsters.bat import Bat
+from traits import Trait
+
+
+class TestMonsterPrototypes(unittest.TestCase):
+    """Test spawning monsters by cloning their prototypes."""
+
+    def test_every_row_has_a_class(self):
+        """Test that the table and the monster classes match one to one."""
+        self.assertEqual({monster_class.__name__ for monster_class in MONSTER_CLASSES}, set(MONSTER_PROTOTYPES))
+        for monster_class in MONSTER_CLASSES:
+            self.assertIs(monster_class.prototype, MONSTER_PROTOTYPES[monster_class.__name__])
+
+    def test_clone_matches_table(self):
+        """Test that spawned monsters carry the table's stats, traits and class attributes."""
+        goblin = Goblin.spawn(3, 4)
+        self.assertIsInstance(goblin, Goblin)
+        self.assertEqual((goblin.x, goblin.y, goblin.name, goblin.character), (3, 4, "Goblin", 'G'))
+        self.assertEqual((goblin.hp, goblin.max_hp, goblin.attack, goblin.defense), (55, 55, 9, 1))
+        self.assertEqual((goblin.evade, goblin.crit, goblin.xp_value), (0.1, 0.15, 25))
+        self.assertEqual(goblin.weaknesses, [Trait.ICE, Trait.HOLY])
+        self.assertEqual(goblin.resistance_mask, Trait.FIRE.value)
+        self.assertFalse(goblin.has_seen_player)
+        self.assertEqual(Bat(0, 0).speed, 200)
+        self.assertTrue(Devil(0, 0).is_final_boss)
+        self.assertFalse(goblin.is_final_boss)
+
+    def test_clones_are_independent(self):
+        """Test that stats and status effects are per monster."""
+        first, second = Goblin(0, 0), Goblin.spawn(0, 0)
+        first.hp -= 10
+        first.status_effects.burn = 3
+        first.has_seen_player = True
+        self.assertEqual(second.hp, 55)
+        self.assertEqual(second.status_effects.burn, 0)
+        self.assertFalse(second.has_seen_player)
+        self.assertEqual(MONSTER_PROTOTYPES['Goblin'].hp, 55)
+
+    def test_clones_pickle(self):
+        """Test that clones sharing frozen trait lists survive saving a floor."""
+        goblin = pickle.loads(pickle.dumps(Goblin.spawn(2, 2)))
+        self.assertEqual((goblin.hp, goblin.attack_traits, goblin.weakness_mask), (55, [Trait.SLASH],
+                                                                                   Trait.ICE | Trait.HOLY))
+
+    def test_unknown_table_field(self):
+        """Test that misspelled table fields are caught when the table is compiled."""
+        row = {'name': "Rat", 'description': "", 'char': 'r', 'color': (1, 2, 3), 'hp': 5, 'attack': 1,
+               'defense': 0, 'xp_value': 1, 'difficulty_rating': 1.0, 'min_level': 1, 'rarity': 1.0}
+        self.assertEqual(MonsterPrototype.from_row('Rat', row).evade, 0.05)
+        with self.assertRaises(ValueError):
+            MonsterPrototype.from_row('Rat', {**row, 'defence': 1})
+
+    def test_pool_reads_table(self):
+        """Test that spawn rules come from the table and ad hoc monsters still work."""
+        specs = {spec.monster_class: spec for spec in get_monster_pool().monsters}
+        self.assertEqual((specs[Goblin].min_level, specs[Goblin].max_level, specs[Goblin].rarity), (4, 9, 0.8))
+        monster = Monster(1, 1, "Rat", 'r', (255, 0, 0), 10, 2, 0, 2)
+        self.assertEqual((monster.name, monster.hp, monster.prototype), ("Rat", 10, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
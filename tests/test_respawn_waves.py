@@ -0,0 +1,140 @@
+"""
+Unit tests for monster recycling and timed respawn waves.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import random
+import unittest
+from constants import MONSTER_COUNT_RANGES, RESPAWN_WAVE_INTERVAL
+from level.level import Level
+from monsters import Goblin
+from monsters.pool import MonsterPool
+from turn_scheduler import TurnScheduler
+
+
+WAVE_TIME = RESPAWN_WAVE_INTERVAL * TurnScheduler.TURN_TIME
+
+
+class TestMonsterRecycling(unittest.TestCase):
+    """Test that dead monsters are revived instead of reallocated."""
+
+    def test_revived_monster_is_fresh(self):
+        """Test that a recycled monster comes back with full stats and no statuses."""
+        pool = MonsterPool()
+        goblin = Goblin(1, 1)
+        stats, status_effects = goblin.stats, goblin.status_effects
+        goblin.hp = 0
+        goblin.status_effects.burn = 2
+        goblin.has_seen_player = True
+        pool.recycle(goblin)
+        self.assertEqual(pool.free_monster_count(), 1)
+
+        revived = pool.spawn(Goblin, 5, 6)
+        self.assertIs(revived, goblin)
+        self.assertIs(revived.stats, stats)
+        self.assertIs(revived.status_effects, status_effects)
+        self.assertEqual((revived.x, revived.y, revived.hp, revived.status_effects.burn), (5, 6, 55, 0))
+        self.assertFalse(revived.has_seen_player)
+        self.assertEqual(pool.free_monster_count(), 0)
+
+    def test_living_monsters_are_not_recycled(self):
+        """Test that only dead monsters go on the free list."""
+        pool = MonsterPool()
+        pool.recycle(Goblin(1, 1))
+        self.assertEqual(pool.free_monster_count(), 0)
+
+
+class TestLevelMonsterRemoval(unittest.TestCase):
+    """Test swap-removal of dead monsters from a level."""
+
+    def setUp(self):
+        random.seed(4321)
+        self.level = Level(5)
+
+    def test_remove_dead_monsters_in_place(self):
+        """Test that dead monsters leave the list, the schedule and the dormant zones."""
+        monsters = self.level.monsters
+        awake = monsters[0]
+        self.level.wake_monster(awake)
+        dead = [awake, monsters[-1]]
+        survivors = [monster for monster in monsters if all(monster is not other for other in dead)]
+        for monster in dead:
+            monster.hp = 0
+
+        self.level.remove_dead_monsters()
+        self.assertIs(self.level.monsters, monsters)
+        self.assertCountEqual([id(monster) for monster in monsters], [id(monster) for monster in survivors])
+        self.assertEqual(len(self.level.scheduler), 0)
+        self.assertEqual(len(self.level.dormant), len(survivors))
+
+    def test_remove_monster(self):
+        """Test removing a single monster by identity."""
+        monster = self.level.monsters[1]
+        count = len(self.level.monsters)
+        self.level.remove_monster(monster)
+        self.assertEqual(len(self.level.monsters), count - 1)
+        self.assertFalse(any(other is monster for other in self.level.monsters))
+        with self.assertRaises(ValueError):
+            self.level.remove_monster(monster)
+
+
+class TestRespawnWaves(unittest.TestCase):
+    """Test that floors in respawn mode spawn waves as turns pass."""
+
+    def setUp(self):
+        random.seed(99)
+
+    def test_static_by_default(self):
+        """Test that floors stay as placed unless respawn mode is on."""
+        level = Level(3)
+        level.scheduler.advance(lambda monster: True, WAVE_TIME * 3)
+        self.assertEqual(level.spawn_wave_if_due(), [])
+
+    def test_waves_follow_turns_elapsed(self):
+        """Test that waves come every interval, out of view, dormant and capped at the floor's most."""
+        level = Level(3, respawn_waves=True)
+        for monster in level.monsters:
+            monster.hp = 0
+        level.remove_dead_monsters()
+        level.fov[:, :] = False
+        level.fov[:level.width // 2, :] = True  # The player can see the left half
+
+        level.scheduler.advance(lambda monster: True, WAVE_TIME - TurnScheduler.TURN_TIME)
+        self.assertEqual(level.spawn_wave_if_due(), [])
+        level.scheduler.advance(lambda monster: True)
+        wave = level.spawn_wave_if_due()
+        self.assertGreater(len(wave), 0)
+        for monster in wave:
+            self.assertGreaterEqual(monster.x, level.width // 2)
+            self.assertIn(monster, level.dormant)
+        self.assertEqual(level.spawn_wave_if_due(), [])
+
+        most = MONSTER_COUNT_RANGES[3][1]
+        for _ in range(most * 2):
+            level.scheduler.advance(lambda monster: True, WAVE_TIME)
+            level.spawn_wave_if_due()
+        self.assertEqual(len(level.monsters), most)
+
+    def test_no_spawn_cells(self):
+        """Test that a floor with no room cells to spawn in gives up instead of raising."""
+        level = Level(3, respawn_waves=True)
+        for monster in level.monsters:
+            monster.hp = 0
+        level.remove_dead_monsters()
+        level._spawn_cells = level._spawn_cells[:0]
+        self.assertIsNone(level._find_spawn_cell())
+        level.scheduler.advance(lambda monster: True, WAVE_TIME)
+        self.assertEqual(level.spawn_wave_if_due(), [])
+
+    def test_no_waves_on_boss_floor(self):
+        """Test that the boss floor never respawns."""
+        level = Level(10, respawn_waves=True)
+        level.scheduler.advance(lambda monster: True, WAVE_TIME)
+        self.assertEqual(level.spawn_wave_if_due(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+Unit tests for the room graph and hierarchical pathfinding.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pickle
+import random
+import unittest
+import numpy as np
+from level.level import Level
+from level.room_graph import RoomGraph, find_grid_path
+from level_manager import LevelManager
+
+
+class TestRoomGraph(unittest.TestCase):
+    """Test the room graph built during level generation."""
+
+    def setUp(self):
+        """Generate a reproducible level."""
+        random.seed(40)
+        self.level = Level(1)
+        self.graph = self.level.room_graph
+
+    def assert_valid_path(self, path, start, goal):
+        """Assert that path steps one walkable tile at a time from start to goal."""
+        self.assertEqual(path[-1], goal)
+        previous = start
+        for x, y in path:
+            self.assertLessEqual(max(abs(x - previous[0]), abs(y - previous[1])), 1)
+            self.assertTrue(self.level.walkable[x, y])
+            previous = (x, y)
+
+    def test_rooms_are_connected(self):
+        """Test that every room has an edge and a route to every other room."""
+        for index in range(len(self.level.rooms)):
+            self.assertTrue(self.graph.neighbours[index])
+            self.assertIsNotNone(self.graph.find_route([0], [index]))
+
+    def test_edges_are_walkable_corridors(self):
+        """Test that edge cells are walkable and outside the rooms."""
+        for _, _, cells, _ in self.graph.edges:
+            self.assertTrue(self.level.walkable[cells[:, 0], cells[:, 1]].all())
+            self.assertTrue((self.graph.node_at[cells[:, 0], cells[:, 1]] < 0).all())
+
+    def test_doors_lie_on_room_walls(self):
+        """Test that every door is a floor tile on its room's wall ring."""
+        for index, room in enumerate(self.level.rooms):
+            doors = self.graph.get_doors(index)
+            self.assertGreater(len(doors), 0)
+            for x, y in doors:
+                self.assertTrue(x in (room.x1, room.x2) or y in (room.y1, room.y2))
+                self.assertTrue(self.level.walkable[x, y])
+
+    def test_paths_between_rooms_are_valid(self):
+        """Test paths between every pair of room centers, which a full-grid search also connects."""
+        centers = [room.center() for room in self.level.rooms]
+        for start in centers:
+            for goal in centers:
+                path = self.level.find_path(start, goal)
+                self.assertIsNotNone(path)
+                if start == goal:
+                    self.assertEqual(path, [])
+                    continue
+                self.assert_valid_path(path, start, goal)
+                self.assertIsNotNone(find_grid_path(start, goal, self.level.walkable))
+
+    def test_paths_stay_close_to_shortest(self):
+        """Test that paths between room centers, some over several stretches, are near full-grid length."""
+        def length(start, path):
+            return sum(RoomGraph.DIAGONAL_COST if a[0] != b[0] and a[1] != b[1] else 1
+                       for a, b in zip([start] + path, path))
+        centers = [room.center() for room in self.level.rooms]
+        pairs = [(start, goal) for start in centers for goal in centers if start != goal]
+        longest_route = max(len(self.graph.find_route([self.graph.node_at[start]], [self.graph.node_at[goal]])[0])
+                            for start, goal in pairs)
+        self.assertGreater(longest_route, RoomGraph.ROUTE_STRIDE)
+        found = sum(length(start, self.level.find_path(start, goal)) for start, goal in pairs)
+        shortest = sum(length(start, find_grid_path(start, goal, self.level.walkable)) for start, goal in pairs)
+        self.assertLess(found, 1.05 * shortest)
+
+    def test_paths_from_corridors(self):
+        """Test paths that start in a tunnel rather than a room."""
+        _, _, cells, _ = max(self.graph.edges, key=lambda edge: len(edge[2]))
+        start = tuple(cells[len(cells) // 2].tolist())
+        goal = self.level.rooms[-1].center()
+        self.assert_valid_path(self.level.find_path(start, goal), start, goal)
+
+    def test_paths_between_corridors(self):
+        """Test paths between tunnel cells, along one corridor and on to every other corridor."""
+        edge = max(range(len(self.graph.edges)), key=lambda edge: len(self.graph.edges[edge][2]))
+        piece = self.graph.edge_pieces[edge][0]
+        start, goal = tuple(piece[1].tolist()), tuple(piece[-2].tolist())
+        self.assert_valid_path(self.level.find_path(start, goal), start, goal)
+        for _, _, cells, _ in self.graph.edges:
+            if len(cells):
+                goal = tuple(cells[len(cells) // 2].tolist())
+                self.assert_valid_path(self.level.find_path(start, goal), start, goal)
+
+    def test_unreachable_goal(self):
+        """Test that a wall goal gives no path."""
+        start = self.level.rooms[0].center()
+        walls = np.argwhere(~self.level.walkable)
+        self.assertIsNone(self.level.find_path(start, tuple(walls[0])))
+
+    def test_graph_built_on_first_use(self):
+        """Test that generating a level leaves the graph unbuilt until a path is needed."""
+        random.seed(40)
+        level = Level(1)
+        self.assertIsNone(level._room_graph)
+        level.find_path(level.rooms[0].center(), level.rooms[-1].center())
+        self.assertIsNotNone(level._room_graph)
+
+    def test_level_manager_builds_graph(self):
+        """Test that floors made by the level manager come with their graph built."""
+        self.assertIsNotNone(LevelManager().get_current_area()._room_graph)
+
+    def test_snapshots_keep_graph(self):
+        """Test that snapshots carry the graph but not its per-cell maps, which are repainted on restore."""
+        self.assertNotIn('node_at', self.graph.__getstate__())
+        restored = pickle.loads(pickle.dumps(self.level))._room_graph
+        self.assertIsNotNone(restored)
+        np.testing.assert_array_equal(restored.node_at, self.graph.node_at)
+        np.testing.assert_array_equal(restored.edge_at, self.graph.edge_at)
+
+    def test_graph_survives_pickling(self):
+        """Test that a restored level keeps its room graph."""
+        restored = pickle.loads(pickle.dumps(self.level))
+        start, goal = self.level.rooms[0].center(), self.level.rooms[-1].center()
+        self.assertEqual(restored.find_path(start, goal), self.level.find_path(start, goal))
+
+
+if __name__ == '__main__':
+    unittest.main()
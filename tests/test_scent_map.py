@@ -0,0 +1,73 @@
+"""
+Unit tests for the player scent map.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+import numpy as np
+from level.scent_map import ScentMap
+
+
+class TestScentMap(unittest.TestCase):
+    """Test scent diffusion and gradient following."""
+
+    def setUp(self):
+        """Set up an L-shaped corridor: along y=1 from x=1..8, then down x=8 to y=6."""
+        self.walkable = np.zeros((10, 8), dtype=bool)
+        self.walkable[1:9, 1] = True
+        self.walkable[8, 1:7] = True
+        self.scent_map = ScentMap(self.walkable)
+
+    def test_scent_spreads_one_tile_per_turn_and_decays(self):
+        """Test that scent reaches one tile further each turn, weaker with distance."""
+        for _ in range(3):
+            self.scent_map.update(1, 1)
+        scent = self.scent_map.scent
+        self.assertEqual(scent[1, 1], ScentMap.PLAYER_SCENT)
+        self.assertGreater(scent[2, 1], scent[3, 1])
+        self.assertGreater(scent[3, 1], 0)
+        self.assertEqual(scent[4, 1], 0)
+
+    def test_scent_does_not_cross_walls(self):
+        """Test that walls hold no scent."""
+        for _ in range(10):
+            self.scent_map.update(1, 1)
+        self.assertTrue((self.scent_map.scent[~self.walkable] == 0).all())
+
+    def test_follow_leads_around_corners_to_player(self):
+        """Test that following the gradient walks the corridor to the player."""
+        for _ in range(15):
+            self.scent_map.update(1, 1)
+
+        x, y = 8, 6
+        for _ in range(20):
+            step = self.scent_map.follow(x, y)
+            if step is None:
+                break
+            x, y = x + step[0], y + step[1]
+            self.assertTrue(self.walkable[x, y])
+        self.assertEqual((x, y), (1, 1))
+
+    def test_cold_trail(self):
+        """Test that faint or missing scent cannot be followed."""
+        self.assertIsNone(self.scent_map.follow(5, 1))
+        self.scent_map.update(1, 1)
+        for _ in range(30):
+            self.scent_map.update(-10, -10)  # Player gone from the region
+        self.assertIsNone(self.scent_map.follow(2, 1))
+
+    def test_bounded_update_matches_full_update_inside_region(self):
+        """Test that updating a region leaves the outside untouched and diffuses across its edge."""
+        full = ScentMap(self.walkable)
+        for _ in range(4):
+            full.update(1, 1)
+            self.scent_map.update(1, 1, bounds=(0, 0, 5, 8))
+        self.assertTrue(np.allclose(full.scent[:5], self.scent_map.scent[:5]))
+        self.assertTrue((self.scent_map.scent[5:] == 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
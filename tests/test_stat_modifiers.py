@@ -0,0 +1,96 @@
+"""
+Unit tests for stat modifiers and the player's compiled stat pipeline.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+from items.accessories import Anaglyph, PowerRing
+from items.accessories.accessory import Accessory
+from items.weapons import WarHammer
+from player import Player
+from stat_modifiers import STAT_DEFINITIONS, StatDefinition, StatModifier, register_stat
+
+
+class LuckyCharm(Accessory):
+    """An accessory with a stat Player knows nothing about, and a bonus while hurt."""
+
+    def __init__(self):
+        super().__init__(0, 0, "Lucky Charm", '=')
+
+    def get_stat_modifiers(self):
+        return super().get_stat_modifiers() + [
+            StatModifier.flat('luck', 2),
+            StatModifier.multiplier('luck', 3).when(lambda player: player.hp < 10),
+        ]
+
+
+class Swapper(Accessory):
+    """A cleanup accessory that swaps attack and defense."""
+
+    def __init__(self):
+        super().__init__(0, 0, "Swapper", '=', defense_bonus=5, is_cleanup=True)
+
+    def apply_cleanup_effect(self, player, attack, defense):
+        return defense, attack
+
+
+class TestStatModifiers(unittest.TestCase):
+    """Test the pipeline against the player's stat rules."""
+
+    def setUp(self):
+        self.player = Player(0, 0)
+        self.player.attack, self.player.defense = 10, 4
+        register_stat(StatDefinition('luck', lambda player: 1))
+
+    def tearDown(self):
+        del STAT_DEFINITIONS['luck']
+
+    def test_equipping_recompiles(self):
+        """Test that every way of changing equipment is picked up."""
+        attack = self.player.get_total_attack()
+        self.player.accessories[1] = PowerRing(0, 0)
+        self.assertEqual(self.player.get_total_attack(), attack + 3)
+        self.player.accessories = [None, None, None]
+        self.assertEqual(self.player.get_total_attack(), attack)
+        self.player.weapon = WarHammer(0, 0)
+        self.assertEqual(self.player.get_total_attack(), 10 + 12)
+        self.player.weapon = None
+        self.assertEqual(self.player.get_total_attack(), 10)
+
+    def test_new_stat_and_conditional_modifier(self):
+        """Test a stat registered outside Player, with a modifier that only applies at low HP."""
+        self.assertEqual(self.player.get_total('luck'), 1)
+        self.player.accessories[0] = LuckyCharm()
+        self.assertEqual(self.player.get_total('luck'), 3)
+        self.player.hp = 5
+        self.assertEqual(self.player.get_total('luck'), 9)
+
+    def test_cleanup_runs_last_in_slot_order(self):
+        """Test that FINAL modifiers rework the finished stats one after another."""
+        self.player.weapon = self.player.armor = None
+        self.player.accessories = [Anaglyph(0, 0), None, Swapper()]
+        # The cleanup accessory's own defense bonus is left out
+        self.assertEqual(self.player._get_total_defense_without_cleanup(), 4)
+        self.assertEqual((self.player.get_total_attack(), self.player.get_total_defense()), (7, 7))
+        self.player.accessories = [Swapper(), PowerRing(0, 0), None]
+        self.assertEqual((self.player.get_total_attack(), self.player.get_total_defense()), (4, 13))
+
+    def test_probed_items(self):
+        """Test that items without get_stat_modifiers still count through the bonuses they have."""
+        class Trinket:
+            health_aspect_bonus = 0.2
+            fov_bonus = 2
+
+            def get_fov_bonus(self, player):
+                return self.fov_bonus
+
+        self.player.accessories[0] = Trinket()
+        self.assertEqual(self.player.get_total_fov(), self.player.fov + 2)
+        self.assertAlmostEqual(self.player.get_total_health_aspect(), self.player.health_aspect + 0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit tests for the tile property table.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import unittest
+import numpy as np
+import tcod
+from level.level import Level
+from level.base import Base
+from level.tile_types import TILE_PROPERTIES, render_tiles
+from constants import (
+    TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP,
+    COLOR_LIGHT_WALL, COLOR_DARK_GROUND, COLOR_LIGHT_GROUND
+)
+
+
+class TestTileTypes(unittest.TestCase):
+    """Test compact tile storage and table-driven tile properties."""
+
+    def test_tiles_are_uint8(self):
+        """Test that level and base tiles use one byte per tile."""
+        self.assertEqual(Level(1).tiles.dtype, np.uint8)
+        self.assertEqual(Base(1).tiles.dtype, np.uint8)
+
+    def test_only_walls_block(self):
+        """Test that walls are the only non-walkable, non-transparent tile."""
+        for tile in (TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP):
+            self.assertTrue(TILE_PROPERTIES["walkable"][tile])
+            self.assertTrue(TILE_PROPERTIES["transparent"][tile])
+        self.assertFalse(TILE_PROPERTIES["walkable"][TILE_WALL])
+        self.assertFalse(TILE_PROPERTIES["transparent"][TILE_WALL])
+
+    def test_render_tiles(self):
+        """Test that visible tiles are lit, explored tiles are dark and others untouched."""
+        tiles = np.array([[TILE_WALL, TILE_FLOOR, TILE_STAIRS_DOWN]], dtype=np.uint8)
+        visible = np.array([[True, False, False]])
+        explored = np.array([[True, True, False]])
+        console = tcod.console.Console(1, 3, order="F")
+
+        render_tiles(console, tiles, visible, explored)
+
+        self.assertEqual(chr(console.rgb["ch"][0, 0]), '#')
+        self.assertEqual(tuple(console.rgb["fg"][0, 0]), COLOR_LIGHT_WALL)
+        self.assertEqual(chr(console.rgb["ch"][0, 1]), '.')
+        self.assertEqual(tuple(console.rgb["fg"][0, 1]), COLOR_DARK_GROUND)
+        self.assertEqual(console.rgb["ch"][0, 2], ord(' '))
+        self.assertNotEqual(tuple(console.rgb["fg"][0, 2]), COLOR_LIGHT_GROUND)
+
+
+if __name__ == '__main__':
+    unittest.main()
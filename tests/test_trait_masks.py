@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import unittest
+import sys
+import os
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from traits import Trait, TraitList, traits_to_mask
+from player import Player
+from monsters import Goblin, Phantom
+from items.accessories.rosary import Rosary
+from enchantments import EnchantmentType, get_armor_enchantment_by_type
+
+
+class TestTraitMasks(unittest.TestCase):
+    """Test the bitmask representation of traits."""
+
+    def test_traits_are_distinct_bits(self):
+        mask = 0
+        for trait in Trait:
+            self.assertEqual(bin(int(trait)).count('1'), 1)
+            self.assertFalse(mask & trait)
+            mask |= trait
+
+    def test_str_is_unchanged(self):
+        self.assertEqual(str(Trait.FIRE), "fire")
+        self.assertEqual(f"{Trait.DEMONSLAYER}", "demonslayer")
+
+    def test_trait_list_mask_tracks_mutation(self):
+        traits = TraitList([Trait.FIRE])
+        self.assertEqual(traits.mask, Trait.FIRE)
+        traits.append(Trait.ICE)
+        self.assertEqual(traits.mask, Trait.FIRE | Trait.ICE)
+        traits.remove(Trait.FIRE)
+        self.assertEqual(traits.mask, Trait.ICE)
+        traits.clear()
+        self.assertEqual(traits.mask, 0)
+
+    def test_traits_to_mask_accepts_plain_lists(self):
+        self.assertEqual(traits_to_mask([Trait.HOLY, Trait.HOLY]), Trait.HOLY)
+        self.assertEqual(traits_to_mask(None), 0)
+
+    def test_monster_masks(self):
+        goblin = Goblin(0, 0)
+        self.assertEqual(goblin.weakness_mask, Trait.ICE | Trait.HOLY)
+        self.assertEqual(goblin.resistance_mask, Trait.FIRE)
+        self.assertEqual(goblin.attack_mask, Trait.SLASH)
+
+    def test_monster_mask_follows_reassignment(self):
+        phantom = Phantom(0, 0)
+        phantom.weaknesses = [Trait.FIRE]
+        self.assertEqual(phantom.weakness_mask, Trait.FIRE)
+
+    def test_player_masks_match_lists(self):
+        player = Player(0, 0)
+        player.accessories[0] = Rosary(0, 0)
+        player.armor.add_enchantment(get_armor_enchantment_by_type(EnchantmentType.FIRE))
+        player.weaknesses.append(Trait.FIRE)
+
+        self.assertEqual(player.get_total_weakness_mask(),
+                         traits_to_mask(player.get_total_weaknesses()))
+        self.assertEqual(player.get_total_resistance_mask(),
+                         traits_to_mask(player.get_total_resistances()))
+        self.assertEqual(player.get_total_attack_trait_mask(),
+                         traits_to_mask(player.get_total_attack_traits()))
+
+
+if __name__ == '__main__':
+    unittest.main()
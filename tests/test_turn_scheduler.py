@@ -0,0 +1,117 @@
+"""
+Unit tests for the energy-based turn scheduler.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pickle
+import unittest
+from turn_scheduler import TurnScheduler
+from monsters import Skeleton, Zombie
+from monsters.bat import Bat
+
+
+class Actor:
+    """Minimal scheduled entity with a speed."""
+
+    def __init__(self, name, speed=TurnScheduler.NORMAL_SPEED):
+        self.name = name
+        self.speed = speed
+
+
+class TestTurnScheduler(unittest.TestCase):
+    """Test scheduling of entity actions by speed."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.scheduler = TurnScheduler()
+        self.actions = []
+
+    def act(self, entity):
+        """Record an action and keep the entity scheduled."""
+        self.actions.append(entity.name)
+        return True
+
+    def test_normal_speed_acts_once_per_turn_in_order(self):
+        """Test that equal-speed entities act once per turn, in the order they were added."""
+        for name in ('a', 'b', 'c'):
+            self.scheduler.add(Actor(name))
+        self.scheduler.advance(self.act)
+        self.scheduler.advance(self.act)
+        self.assertEqual(self.actions, ['a', 'b', 'c', 'a', 'b', 'c'])
+
+    def test_speed_sets_action_rate(self):
+        """Test that fast entities act more often and slow ones less often."""
+        self.scheduler.add(Actor('fast', speed=200))
+        self.scheduler.add(Actor('slow', speed=50))
+        for _ in range(4):
+            self.scheduler.advance(self.act)
+        self.assertEqual(self.actions.count('fast'), 8)
+        self.assertEqual(self.actions.count('slow'), 2)
+
+    def test_dropped_entities_stop_acting(self):
+        """Test that returning False from act removes the entity from the schedule."""
+        self.scheduler.add(Actor('a'))
+        self.scheduler.advance(lambda entity: False)
+        self.assertEqual(len(self.scheduler), 0)
+        self.scheduler.advance(self.act)
+        self.assertEqual(self.actions, [])
+
+    def test_only_due_entities_are_touched(self):
+        """Test that an advance pops only the entities whose time has come."""
+        self.scheduler.add(Actor('slow', speed=25))
+        self.scheduler.advance(self.act)
+        self.scheduler.advance(self.act)
+        self.scheduler.advance(self.act)
+        self.assertEqual(self.actions, [])
+        self.scheduler.advance(self.act)
+        self.assertEqual(self.actions, ['slow'])
+
+    def test_pickle_keeps_schedule(self):
+        """Test that a pickled schedule (as in the floor store) resumes where it left off."""
+        self.scheduler.add(Skeleton(1, 1))
+        self.scheduler.add(Bat(2, 2))
+        restored = pickle.loads(pickle.dumps(self.scheduler))
+        restored.add(Zombie(3, 3))
+        names = []
+        restored.advance(lambda monster: names.append(monster.name) or True)
+        self.assertEqual(names, ['Bat', 'Skeleton', 'Zombie', 'Bat'])
+
+    def test_pickling_leaves_order_alone(self):
+        """Test that pickling a schedule does not change who goes first among later ties."""
+        self.scheduler.add(Actor('a'))
+        pickle.dumps(self.scheduler)
+        restored = pickle.loads(pickle.dumps(self.scheduler))
+        for scheduler in (self.scheduler, restored):
+            scheduler.add(Actor('b'))
+        self.assertEqual(restored._heap[1][1], self.scheduler._heap[1][1])
+
+    def test_remove_keeps_order(self):
+        """Test that removing entities from anywhere in the schedule leaves the rest acting in order."""
+        actors = [Actor(str(index), speed=speed) for index, speed in enumerate((50, 200, 100, 25, 100, 75, 200, 60))]
+        for actor in actors:
+            self.scheduler.add(actor)
+        for actor in actors[2::3]:
+            self.assertTrue(self.scheduler.remove(actor))
+        self.assertFalse(self.scheduler.remove(actors[2]))
+
+        expected = TurnScheduler()
+        for actor in actors:
+            if actor not in actors[2::3]:
+                expected.add(actor)
+        expected_actions = []
+        for _ in range(4):
+            self.scheduler.advance(self.act)
+            expected.advance(lambda entity: expected_actions.append(entity.name) or True)
+        self.assertEqual(self.actions, expected_actions)
+
+    def test_monster_speeds(self):
+        """Test that monsters declare their speed, with bats faster than normal."""
+        self.assertEqual(Skeleton(0, 0).speed, TurnScheduler.NORMAL_SPEED)
+        self.assertGreater(Bat(0, 0).speed, TurnScheduler.NORMAL_SPEED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+import threading
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add the src directory to the path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from game import Game
+from items.pool import item_pool, item_pool_lock
+from level.level import Level
+from player import Player
+from world_prefetcher import WorldPrefetcher
+
+
+class TestWorldPrefetch(unittest.TestCase):
+    """Test that world creation is deferred and prefetched."""
+
+    def test_game_init_does_not_generate_world(self):
+        game = Game()
+        self.assertEqual(game.game_state, 'MENU')
+        self.assertIsNone(game._level_manager)
+        self.assertIsNone(game._player)
+
+    def test_world_is_created_on_first_access(self):
+        game = Game()
+        player = game.player
+        self.assertIs(game.level, game.level_manager.get_current_area())
+        self.assertEqual((player.x, player.y), game.level.stairs_up_pos)
+
+    def test_assigned_player_is_kept(self):
+        game = Game()
+        player = Player(5, 5)
+        game.player = player
+        game.level.monsters = []
+        self.assertIs(game.player, player)
+
+    def test_start_new_game_uses_prefetched_world(self):
+        game = Game()
+        game.world_prefetcher.start()
+        self.assertTrue(game.world_prefetcher.is_prefetching())
+        game.world_prefetcher._thread.join()
+        level_manager, player = game.world_prefetcher._world
+
+        game.start_new_game()
+        self.assertIs(game.level_manager, level_manager)
+        self.assertIs(game.player, player)
+        self.assertEqual(game.game_state, 'PLAYING')
+        self.assertFalse(game.world_prefetcher.is_prefetching())
+
+    def test_take_without_start_generates_fresh_worlds(self):
+        prefetcher = WorldPrefetcher()
+        first_manager, first_player = prefetcher.take()
+        second_manager, second_player = prefetcher.take()
+        self.assertIsNot(first_manager, second_manager)
+        self.assertIsNot(first_player, second_player)
+        self.assertEqual(first_manager.get_current_floor_number(), 1)
+
+    def test_floor_generation_waits_for_background_world(self):
+        """Test that a floor generated on the main thread never touches the item pool mid-prefetch."""
+        generating, finish = threading.Event(), threading.Event()
+        events = []
+
+        def create_world():
+            generating.set()
+            finish.wait(5)
+            events.append('world')
+            return 'world'
+
+        prefetcher = WorldPrefetcher()
+        with patch('world_prefetcher.create_world', create_world):
+            prefetcher.start()
+            self.assertTrue(generating.wait(5))
+            start_new_floor = item_pool.start_new_floor
+            with patch.object(item_pool, 'start_new_floor',
+                              lambda level: (events.append('floor'), start_new_floor(level))):
+                floor = threading.Thread(target=Level, args=(2,))
+                floor.start()
+                floor.join(0.2)
+                self.assertTrue(floor.is_alive())  # Waiting on item_pool_lock
+                finish.set()
+                self.assertEqual(prefetcher.take(), 'world')
+                floor.join(5)
+        self.assertEqual(events, ['world', 'floor'])
+        self.assertTrue(item_pool_lock.acquire(blocking=False))
+        item_pool_lock.release()
+
+
+if __name__ == '__main__':
+    unittest.main()